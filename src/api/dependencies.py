@@ -9,23 +9,31 @@ from typing import Annotated
 from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.use_cases import ProcessChatMessageUseCase
+from src.application.services.post_reply_tasks import PostReplyTaskRunner
+from src.application.use_cases import IngestChatEventsUseCase, ProcessChatMessageUseCase
 
 # User ID validation pattern (alphanumeric, dash, underscore, 1-64 chars)
 USER_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{1,64}$')
 from src.domain.services import (
+    CandidateGenerator,
     ConsolidationService,
     ConsolidationTriggerService,
+    MemoryRetriever,
     ProceduralMemoryService,
 )
 from src.infrastructure.database.repositories import (
     ChatEventRepository,
     EpisodicMemoryRepository,
+    PostgresConsolidationCounterRepository,
+    PostgresToolSequenceStateRepository,
+    PostgresToolUsageRepository,
     ProceduralMemoryRepository,
     SemanticMemoryRepository,
     SummaryRepository,
 )
+from src.infrastructure.database import session as database_session
 from src.infrastructure.database.session import get_db_session
+from src.infrastructure.database.unit_of_work import UnitOfWork
 from src.infrastructure.di.container import container
 
 
@@ -72,75 +80,91 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def get_process_chat_message_use_case(
+async def get_unit_of_work(
     db: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[UnitOfWork, None]:
+    """Get the request unit of work (request session plus branch sessions).
+
+    Branch sessions are committed when the request succeeds, before the
+    request session itself commits.
+
+    Args:
+        db: Request database session (injected by FastAPI)
+
+    Yields:
+        UnitOfWork: Unit of work for the request
+    """
+    async with UnitOfWork(db, database_session.async_session_factory) as uow:
+        yield uow
+
+
+def build_post_reply_task_runner(db: AsyncSession) -> PostReplyTaskRunner:
+    """Build a PostReplyTaskRunner bound to a database session.
+
+    Shared by the chat pipeline (inline execution) and the background job worker.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Task runner using per-session repositories
+    """
+    return container.chat_pipeline().build_post_reply_tasks(db)
+
+
+async def get_process_chat_message_use_case(
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> ProcessChatMessageUseCase:
-    """Get ProcessChatMessageUseCase with dependencies injected via container.
+    """Get ProcessChatMessageUseCase bound to the request unit of work.
 
-    Uses DI container to wire all dependencies. Only repositories are created
-    per-request since they need the database session.
+    Process-wide services are resolved once by the container's ChatPipeline;
+    only the session-bound repositories, services and use cases are
+    constructed per request. Domain augmentation gets its own branch session
+    so it runs concurrently with semantic extraction.
 
     Args:
-        db: Database session (injected by FastAPI)
+        uow: Request unit of work (injected by FastAPI)
 
     Returns:
-        Fully wired use case instance via container
+        Fully wired use case instance
     """
-    # Create repositories with the session using container factories
-    entity_repo = container.entity_repository_factory(db)
-    chat_repo = container.chat_repository_factory(db)
-    semantic_memory_repo = container.semantic_memory_repository_factory(db)
-    domain_db_repo = container.domain_database_repository_factory(db)
-    tool_usage_repo = container.tool_usage_repository_factory(db)
-
-    # Create entity resolution service factory (needs per-request repository)
-    entity_resolution_service = container.entity_resolution_service_factory(
-        entity_repository=entity_repo,
-        domain_db_port=domain_db_repo,
-    )
+    augment_session = uow.branch() if uow.supports_parallel_branches else None
+    return container.chat_pipeline().build(uow.session, augment_session=augment_session)
 
-    # Create conflict resolution service (needs per-request repository)
-    conflict_resolution_service = container.conflict_resolution_service_factory(
-        semantic_memory_repository=semantic_memory_repo,
-    )
 
-    # Create adaptive query orchestrator (needs per-request repositories)
-    query_orchestrator = container.adaptive_query_orchestrator_factory(
-        domain_db=domain_db_repo,
-        usage_tracker=tool_usage_repo,
-    )
+async def get_ingest_chat_events_use_case(
+    db: AsyncSession = Depends(get_db),
+) -> IngestChatEventsUseCase:
+    """Get IngestChatEventsUseCase bound to the request session.
 
-    # Create use case factories (passing per-request repositories)
-    resolve_entities_use_case = container.resolve_entities_use_case_factory(
-        entity_repository=entity_repo,
-        chat_repository=chat_repo,
-        entity_resolution_service=entity_resolution_service,
-    )
+    Args:
+        db: Database session (injected by FastAPI)
 
-    extract_semantics_use_case = container.extract_semantics_use_case_factory(
-        semantic_memory_repository=semantic_memory_repo,
-        conflict_resolution_service=conflict_resolution_service,
-        canonical_entity_repository=entity_repo,  # Phase 3.3: for system entity creation
-    )
+    Returns:
+        Bulk ingestion use case instance
+    """
+    return container.chat_pipeline().build_ingestion(db)
 
-    augment_with_domain_use_case = container.augment_with_domain_use_case_factory(
-        query_orchestrator=query_orchestrator,
-    )
 
-    score_memories_use_case = container.score_memories_use_case_factory(
-        semantic_memory_repository=semantic_memory_repo,
-    )
+def build_consolidation_service(db: AsyncSession) -> ConsolidationService:
+    """Build a ConsolidationService bound to a database session.
 
-    # Create orchestrator use case using container factory
-    return container.process_chat_message_use_case_factory(
-        chat_repository=chat_repo,
-        resolve_entities_use_case=resolve_entities_use_case,
-        extract_semantics_use_case=extract_semantics_use_case,
-        augment_with_domain_use_case=augment_with_domain_use_case,
-        score_memories_use_case=score_memories_use_case,
-        conflict_resolution_service=conflict_resolution_service,
-    )
+    Shared by the consolidation API and the consolidation scheduler.
 
+    Args:
+        db: Database session
+
+    Returns:
+        Consolidation service using per-session repositories
+    """
+    return ConsolidationService(
+        episodic_repo=EpisodicMemoryRepository(db),
+        semantic_repo=SemanticMemoryRepository(db),
+        summary_repo=SummaryRepository(db),
+        chat_repo=ChatEventRepository(db),
+        llm_service=container.llm_service(),
+        embedding_service=container.embedding_service(),
+    )
 
 
 async def get_consolidation_service(
@@ -154,26 +178,7 @@ async def get_consolidation_service(
     Returns:
         Fully wired consolidation service instance
     """
-    # Create repositories
-    episodic_repo = EpisodicMemoryRepository(db)
-    semantic_repo = SemanticMemoryRepository(db)
-    summary_repo = SummaryRepository(db)
-    chat_repo = ChatEventRepository(db)
-
-    # Get services from container
-    llm_service = container.llm_service()
-    embedding_service = container.embedding_service()
-
-    # Create and return consolidation service
-    return ConsolidationService(
-        episodic_repo=episodic_repo,
-        semantic_repo=semantic_repo,
-        summary_repo=summary_repo,
-        chat_repo=chat_repo,
-        llm_service=llm_service,
-        embedding_service=embedding_service,
-    )
-
+    return build_consolidation_service(db)
 
 
 async def get_consolidation_trigger_service(
@@ -190,11 +195,13 @@ async def get_consolidation_trigger_service(
     # Create repositories
     episodic_repo = EpisodicMemoryRepository(db)
     chat_repo = ChatEventRepository(db)
+    counter_repo = PostgresConsolidationCounterRepository(db)
 
     # Create and return trigger service
     return ConsolidationTriggerService(
         episodic_repo=episodic_repo,
         chat_repo=chat_repo,
+        counter_repo=counter_repo,
     )
 
 
@@ -213,6 +220,25 @@ async def get_summary_repository(
     return SummaryRepository(db)
 
 
+def build_procedural_service(db: AsyncSession) -> ProceduralMemoryService:
+    """Build a ProceduralMemoryService bound to a database session.
+
+    Shared by the procedural API and the procedural miner.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Procedural memory service using per-session repositories
+    """
+    # Patterns are mined from the tool usage stream into persisted counts
+    return ProceduralMemoryService(
+        tool_usage_tracker=PostgresToolUsageRepository(db),
+        procedural_repo=ProceduralMemoryRepository(db),
+        sequence_state_repo=PostgresToolSequenceStateRepository(db),
+    )
+
+
 async def get_procedural_service(
     db: AsyncSession = Depends(get_db),
 ) -> ProceduralMemoryService:
@@ -224,15 +250,7 @@ async def get_procedural_service(
     Returns:
         Fully wired procedural memory service instance
     """
-    # Create repositories
-    episodic_repo = EpisodicMemoryRepository(db)
-    procedural_repo = ProceduralMemoryRepository(db)
-
-    # Create and return service
-    return ProceduralMemoryService(
-        episodic_repo=episodic_repo,
-        procedural_repo=procedural_repo,
-    )
+    return build_procedural_service(db)
 
 
 
@@ -262,3 +280,34 @@ async def get_semantic_memory_repository(
         Semantic memory repository instance
     """
     return SemanticMemoryRepository(db)
+
+
+async def get_memory_retriever(
+    db: AsyncSession = Depends(get_db),
+) -> MemoryRetriever:
+    """Get MemoryRetriever with dependencies injected.
+
+    Args:
+        db: Database session (injected by FastAPI)
+
+    Returns:
+        Fully wired memory retriever instance
+    """
+    candidate_generator = CandidateGenerator(
+        semantic_repo=SemanticMemoryRepository(db),
+        episodic_repo=EpisodicMemoryRepository(db),
+        summary_repo=SummaryRepository(db),
+    )
+
+    entity_resolver = container.entity_resolution_service_factory(
+        entity_repository=container.entity_repository_factory(db),
+        domain_db_port=container.domain_database_repository_factory(db),
+    )
+
+    return MemoryRetriever(
+        embedding_service=container.embedding_service(),
+        entity_resolver=entity_resolver,
+        candidate_generator=candidate_generator,
+        scorer=container.multi_signal_scorer(),
+        query_cache=container.retrieval_cache(),
+    )
@@ -17,10 +17,28 @@ from slowapi.util import get_remote_address
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db
+from src.api.dependencies import (
+    build_consolidation_service,
+    build_post_reply_task_runner,
+    build_procedural_service,
+    get_db,
+)
 from src.api.middleware.logging import RequestLoggingMiddleware
+from src.api.responses import ORJSONResponse, fast_json_available
 from src.config.settings import Settings
-from src.infrastructure.database.session import close_db, init_db
+from src.domain.services.span_tracer import (
+    SpanProcessor,
+    add_span_processor,
+    remove_span_processor,
+)
+from src.infrastructure.database.session import close_db, get_db_session, init_db
+from src.infrastructure.jobs import (
+    BackgroundJobWorker,
+    ConsolidationScheduler,
+    ProceduralMiningScheduler,
+)
+from src.infrastructure.llm import ExtractionCachingLLMService
+from src.infrastructure.observability import PrometheusSpanProcessor
 
 # Load settings
 settings = Settings()
@@ -46,20 +64,95 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     init_db(settings)
     print(f"Database initialized: {settings.database_url}")
 
+    # Span processors: per-stage latency histograms, optionally OTel export
+    span_processors: list[SpanProcessor] = [PrometheusSpanProcessor()]
+    if settings.otel_tracing_enabled:
+        from src.infrastructure.observability.otel_exporter import (
+            OpenTelemetrySpanProcessor,
+        )
+        span_processors.append(OpenTelemetrySpanProcessor())
+    for processor in span_processors:
+        add_span_processor(processor)
+
     # Eagerly initialize LLM provider to avoid first-request latency
     from src.infrastructure.di.container import container
     _ = container.llm_provider()
-    _ = container.llm_service()
+    llm_service = container.llm_service()
     print("LLM services initialized (eager loading)")
 
+    # Drop extraction cache rows written under superseded prompt versions
+    if isinstance(llm_service, ExtractionCachingLLMService):
+        try:
+            removed = await llm_service.purge_stale_versions()
+            print(f"Extraction cache: purged {removed} stale entries")
+        except Exception as e:
+            print(f"Extraction cache purge skipped: {e}")
+
+    # Background worker pool for deferred post-reply stages
+    job_worker: BackgroundJobWorker | None = None
+    if settings.enable_background_jobs:
+        job_worker = BackgroundJobWorker(
+            session_scope=get_db_session,
+            runner_factory=build_post_reply_task_runner,
+            concurrency=settings.background_worker_concurrency,
+            batch_size=settings.background_job_batch_size,
+            poll_interval_seconds=settings.background_job_poll_interval_seconds,
+        )
+        await job_worker.start()
+        print(f"Background job workers started ({settings.background_worker_concurrency})")
+
+    # Automatic consolidation of scopes whose counters crossed a threshold
+    consolidation_scheduler: ConsolidationScheduler | None = None
+    if settings.enable_consolidation_scheduler:
+        consolidation_scheduler = ConsolidationScheduler(
+            session_scope=get_db_session,
+            service_factory=build_consolidation_service,
+            concurrency=settings.consolidation_scheduler_concurrency,
+            batch_size=settings.consolidation_scheduler_batch_size,
+            interval_seconds=settings.consolidation_scheduler_interval_seconds,
+        )
+        await consolidation_scheduler.start()
+        print("Consolidation scheduler started")
+
+    # Continuous mining of new tool usage into procedural patterns
+    procedural_miner: ProceduralMiningScheduler | None = None
+    if settings.enable_procedural_miner:
+        procedural_miner = ProceduralMiningScheduler(
+            session_scope=get_db_session,
+            service_factory=build_procedural_service,
+            interval_seconds=settings.procedural_miner_interval_seconds,
+        )
+        await procedural_miner.start()
+        print("Procedural miner started")
+
     yield
 
     # Shutdown
     print("Shutting down application...")
+    if procedural_miner is not None:
+        await procedural_miner.stop()
+        print("Procedural miner stopped")
+    if consolidation_scheduler is not None:
+        await consolidation_scheduler.stop()
+        print("Consolidation scheduler stopped")
+    if job_worker is not None:
+        await job_worker.stop()
+        print("Background job workers stopped")
+    if isinstance(llm_service, ExtractionCachingLLMService):
+        await llm_service.flush_hits()
+    await container.http_client().aclose()
+    print("Upstream HTTP connections closed")
     await close_db()
     print("Database connections closed")
+    for processor in span_processors:
+        remove_span_processor(processor)
 
 
+# Fast JSON responses: orjson is an optional dependency
+if settings.enable_fast_json_responses and not fast_json_available():
+    msg = "enable_fast_json_responses requires the orjson package"
+    raise RuntimeError(msg)
+
 # Create FastAPI app
 app = FastAPI(
     title="Ontology-Aware Memory System",
@@ -68,8 +161,14 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=(
+        ORJSONResponse if settings.enable_fast_json_responses else JSONResponse
+    ),
 )
 
+# Routes returning through json_response() serialize directly with orjson
+app.state.fast_json_responses = settings.enable_fast_json_responses
+
 # Attach rate limiter state to app for slowapi
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
@@ -84,8 +183,13 @@ app.add_middleware(
 )
 
 # Request/response logging middleware
-# Logs all HTTP requests and responses with timing and tracing
-app.add_middleware(RequestLoggingMiddleware, log_bodies=False)
+# Logs HTTP requests and responses with timing and tracing (sampled)
+app.add_middleware(
+    RequestLoggingMiddleware,
+    log_bodies=False,
+    exclude_paths=settings.request_log_exclude_paths,
+    log_sample_rate=settings.request_log_sample_rate,
+)
 
 
 # Health check endpoint
@@ -209,13 +313,14 @@ async def internal_error_handler(request: Request, exc: Exception) -> JSONRespon
 
 
 # Include API routers
-from src.api.routes import chat, conflicts, consolidation, memories, procedural
+from src.api.routes import chat, conflicts, consolidation, memories, procedural, retrieval
 
 app.include_router(chat.router, tags=["Chat"])
 app.include_router(conflicts.router, tags=["Conflicts"])
 app.include_router(consolidation.router, tags=["Consolidation"])
 app.include_router(memories.router, tags=["Memories"])
 app.include_router(procedural.router, tags=["Procedural"])
+app.include_router(retrieval.router, tags=["Retrieval"])
 
 # Include demo router if demo mode is enabled
 # Use dynamic import to avoid contaminating production code
@@ -3,9 +3,12 @@
 Provides P95/P99 latency tracking and request counting for observability.
 
 Philosophy: Measure what matters for the 800ms P95 SLA.
+
+Label values must come from a bounded set: tenants are labelled with
+tenant_metrics.tenant_bucket(), HTTP endpoints with route templates.
 """
 
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
 
 # ============================================================================
 # Request Metrics
@@ -24,7 +27,7 @@ http_request_duration_seconds = Histogram(
 chat_request_duration_seconds = Histogram(
     "chat_request_duration_seconds",
     "Chat endpoint latency in seconds",
-    labelnames=["user_id", "status"],
+    labelnames=["tenant_bucket", "status"],
     buckets=[0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 6.4, float("inf")],
 )
 
@@ -35,6 +38,14 @@ http_requests_total = Counter(
     labelnames=["method", "endpoint", "status_code"],
 )
 
+# Chat pipeline stage latency (pii, store, resolve, extract, score, generate, ...)
+chat_stage_duration_seconds = Histogram(
+    "chat_stage_duration_seconds",
+    "Chat pipeline stage latency in seconds",
+    labelnames=["stage", "status"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2, float("inf")],
+)
+
 # ============================================================================
 # Memory Retrieval Metrics
 # ============================================================================
@@ -43,7 +54,7 @@ http_requests_total = Counter(
 memory_retrieval_duration_seconds = Histogram(
     "memory_retrieval_duration_seconds",
     "Memory retrieval latency in seconds",
-    labelnames=["layer", "user_id"],
+    labelnames=["layer", "tenant_bucket"],
     buckets=[0.01, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, float("inf")],
 )
 
@@ -51,7 +62,7 @@ memory_retrieval_duration_seconds = Histogram(
 memories_retrieved_total = Counter(
     "memories_retrieved_total",
     "Total memories retrieved",
-    labelnames=["layer", "user_id"],
+    labelnames=["layer", "tenant_bucket"],
 )
 
 # Similarity scores distribution
@@ -62,6 +73,24 @@ similarity_score_distribution = Histogram(
     buckets=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
 )
 
+# Semantic query-result cache in front of MemoryRetriever
+retrieval_cache_lookups_total = Counter(
+    "retrieval_cache_lookups_total",
+    "Semantic retrieval cache lookups",
+    labelnames=["outcome"],  # outcome: hit|miss
+)
+
+retrieval_cache_invalidations_total = Counter(
+    "retrieval_cache_invalidations_total",
+    "Per-user retrieval cache invalidations after semantic memory writes",
+)
+
+retrieval_cache_hit_age_seconds = Histogram(
+    "retrieval_cache_hit_age_seconds",
+    "Age of cached retrieval entries when served (bounded by max staleness)",
+    buckets=[1, 5, 15, 30, 60, 120, 300, 600, float("inf")],
+)
+
 # ============================================================================
 # Entity Resolution Metrics
 # ============================================================================
@@ -85,11 +114,12 @@ entity_resolutions_total = Counter(
 # Database Metrics
 # ============================================================================
 
-# Database query duration
+# Database query duration (observed by engine events, see database/instrumentation.py)
+# operation: "<Repository>.<method>" that issued the statement, or "unknown"
 db_query_duration_seconds = Histogram(
     "db_query_duration_seconds",
     "Database query latency in seconds",
-    labelnames=["query_type", "table"],
+    labelnames=["query_type", "table", "operation"],
     buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf")],
 )
 
@@ -97,7 +127,33 @@ db_query_duration_seconds = Histogram(
 db_queries_total = Counter(
     "db_queries_total",
     "Total database queries",
-    labelnames=["query_type", "table", "status"],
+    labelnames=["query_type", "table", "operation", "status"],
+)
+
+# Queries slower than the configured slow-query threshold
+db_slow_queries_total = Counter(
+    "db_slow_queries_total",
+    "Database queries slower than the slow-query threshold",
+    labelnames=["query_type", "table", "operation"],
+)
+
+# Time spent waiting for a pooled connection (pool starvation shows up here)
+db_pool_checkout_wait_seconds = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time waiting to check out a connection from the pool",
+    buckets=[0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf")],
+)
+
+# Connections currently checked out of the pool
+db_pool_checked_out_connections = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+)
+
+# Checked-out connections / (pool_size + max_overflow); 1.0 means callers queue
+db_pool_saturation_ratio = Gauge(
+    "db_pool_saturation_ratio",
+    "Fraction of the pool's connection capacity in use",
 )
 
 # ============================================================================
@@ -126,6 +182,56 @@ llm_cost_usd_total = Counter(
     labelnames=["provider", "model"],
 )
 
+# LLM calls served without a new upstream request (single-flight / TTL cache)
+llm_deduplicated_calls_total = Counter(
+    "llm_deduplicated_calls_total",
+    "LLM calls served from an in-flight identical call or the result cache",
+    labelnames=["provider", "operation", "source"],  # source: in_flight|cache
+)
+
+llm_extraction_cache_total = Counter(
+    "llm_extraction_cache_total",
+    "Persistent LLM extraction cache lookups",
+    labelnames=["extraction_type", "outcome"],  # outcome: hit|miss|error
+)
+
+# ============================================================================
+# Outbound HTTP (shared LLM/embedding connection pool)
+# ============================================================================
+
+upstream_http_requests_total = Counter(
+    "upstream_http_requests_total",
+    "Outbound HTTP requests to LLM/embedding APIs",
+    labelnames=["host", "outcome"],  # outcome: status class (2xx/4xx/5xx) or error
+)
+
+upstream_http_retries_total = Counter(
+    "upstream_http_retries_total",
+    "Outbound HTTP requests retried by the shared transport",
+    labelnames=["host", "reason"],
+)
+
+# Wait on the transport's per-host semaphore, not on httpx's connection pool
+# (the latter is bounded by the pool timeout inside httpx and not exported)
+upstream_http_host_slot_wait_seconds = Histogram(
+    "upstream_http_host_slot_wait_seconds",
+    "Time spent waiting for a per-host concurrency slot",
+    labelnames=["host"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float("inf")],
+)
+
+upstream_http_in_flight = Gauge(
+    "upstream_http_in_flight",
+    "Outbound HTTP requests currently holding a concurrency slot",
+    labelnames=["host"],
+)
+
+upstream_http_pool_saturation = Gauge(
+    "upstream_http_pool_saturation",
+    "In-flight requests as a fraction of the per-host concurrency limit",
+    labelnames=["host"],
+)
+
 # ============================================================================
 # Business Metrics
 # ============================================================================
@@ -148,7 +254,7 @@ memory_conflicts_total = Counter(
 duplicate_messages_total = Counter(
     "duplicate_messages_total",
     "Total duplicate messages detected (idempotency)",
-    labelnames=["user_id"],
+    labelnames=["tenant_bucket"],
 )
 
 # ============================================================================
@@ -2,22 +2,38 @@
 
 Provides structured logging for all API requests and responses for debugging
 and monitoring in production.
+
+Implemented as plain ASGI (not BaseHTTPMiddleware): the request runs in the
+caller's task, response messages are passed through unchanged (streaming
+responses stream), and only the response start message is touched to add
+the X-Request-ID header.
 """
+import random
 import time
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable, Collection
+from urllib.parse import parse_qsl
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from src.api.metrics import http_request_duration_seconds, http_requests_total
+from src.api.metrics import (
+    chat_request_duration_seconds,
+    http_request_duration_seconds,
+    http_requests_total,
+)
+from src.api.tenant_metrics import route_template, tenant_bucket, tenant_heavy_hitters
 
 logger = structlog.get_logger(__name__)
 
+# Routes whose latency is also recorded in chat_request_duration_seconds
+CHAT_ROUTE_PREFIX = "/api/v1/chat"
+
+# Scrapes and probes: passed through without request ID, metrics or logs
+DEFAULT_EXCLUDED_PATHS = ("/metrics", "/api/v1/health")
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+
+class RequestLoggingMiddleware:
     """Middleware for logging HTTP requests and responses.
 
     Logs:
@@ -25,110 +41,86 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     - Response: status code, duration, request_id
 
     Does not log request/response bodies by default for security and performance.
+
+    Metrics are labelled by route template and tenant bucket (never by raw
+    path or user id); per-tenant totals go to the heavy-hitter sketch.
+    Metrics cover every request; start/complete log events are sampled,
+    while failures (exceptions and 5xx responses) are always logged.
     """
 
-    def __init__(self, app: ASGIApp, log_bodies: bool = False):
+    def __init__(
+        self,
+        app: ASGIApp,
+        log_bodies: bool = False,
+        exclude_paths: Collection[str] = DEFAULT_EXCLUDED_PATHS,
+        log_sample_rate: float = 1.0,
+        rng: Callable[[], float] = random.random,
+    ):
         """Initialize middleware.
 
         Args:
             app: ASGI application
             log_bodies: Whether to log request/response bodies (default: False)
+            exclude_paths: Exact paths passed through untouched
+            log_sample_rate: Fraction of successful requests whose
+                start/complete events are logged
+            rng: Uniform [0, 1) source for sampling
         """
-        super().__init__(app)
+        self.app = app
         self.log_bodies = log_bodies
+        self.exclude_paths = frozenset(exclude_paths)
+        self.log_sample_rate = log_sample_rate
+        self._rng = rng
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Process request and log details.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
 
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/route handler
-
-        Returns:
-            HTTP response
-        """
         # Generate unique request ID for tracing
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Extract user_id from header if present
-        user_id = request.headers.get("x-user-id", None)
-
-        # Log incoming request
-        logger.info(
-            "http_request_start",
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            query_params=dict(request.query_params),
-            user_id=user_id,
-            client_host=request.client.host if request.client else None,
-        )
-
-        # Process request
-        try:
-            response = await call_next(request)
+        user_id = _header(scope, b"x-user-id")
 
-            # Calculate request duration
-            duration_ms = (time.time() - start_time) * 1000
-            duration_seconds = duration_ms / 1000.0
-
-            # Record Prometheus metrics
-            http_request_duration_seconds.labels(
-                method=request.method,
-                endpoint=request.url.path,
-                status_code=response.status_code,
-            ).observe(duration_seconds)
-
-            http_requests_total.labels(
-                method=request.method,
-                endpoint=request.url.path,
-                status_code=response.status_code,
-            ).inc()
-
-            # Log successful response
+        sampled = self.log_sample_rate >= 1.0 or self._rng() < self.log_sample_rate
+        if sampled:
             logger.info(
-                "http_request_complete",
+                "http_request_start",
                 request_id=request_id,
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                duration_ms=round(duration_ms, 2),
+                method=scope["method"],
+                path=scope["path"],
+                query_params=dict(parse_qsl(scope["query_string"].decode("latin-1"))),
                 user_id=user_id,
+                client_host=scope["client"][0] if scope.get("client") else None,
             )
 
-            # Add request ID to response headers for tracing
-            response.headers["X-Request-ID"] = request_id
+        status_code = 500
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
 
-            return response
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers for tracing
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
 
-        except Exception as e:
-            # Calculate request duration
-            duration_ms = (time.time() - start_time) * 1000
-            duration_seconds = duration_ms / 1000.0
-
-            # Record Prometheus metrics for failed request (500 status code)
-            http_request_duration_seconds.labels(
-                method=request.method,
-                endpoint=request.url.path,
-                status_code=500,
-            ).observe(duration_seconds)
+        try:
+            await self.app(scope, receive, send_with_request_id)
 
-            http_requests_total.labels(
-                method=request.method,
-                endpoint=request.url.path,
-                status_code=500,
-            ).inc()
+        except Exception as e:
+            duration_seconds = time.perf_counter() - start_time
+            self._record_metrics(scope, status_code, duration_seconds, user_id)
 
-            # Log failed request
             logger.error(
                 "http_request_error",
                 request_id=request_id,
-                method=request.method,
-                path=request.url.path,
-                duration_ms=round(duration_ms, 2),
+                method=scope["method"],
+                path=scope["path"],
+                duration_ms=round(duration_seconds * 1000, 2),
                 user_id=user_id,
                 error=str(e),
                 error_type=type(e).__name__,
@@ -136,3 +128,59 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
             # Re-raise to let FastAPI handle the exception
             raise
+
+        duration_seconds = time.perf_counter() - start_time
+        self._record_metrics(scope, status_code, duration_seconds, user_id)
+
+        if sampled or status_code >= 500:
+            logger.info(
+                "http_request_complete",
+                request_id=request_id,
+                method=scope["method"],
+                path=scope["path"],
+                status_code=status_code,
+                duration_ms=round(duration_seconds * 1000, 2),
+                user_id=user_id,
+            )
+
+    @staticmethod
+    def _record_metrics(
+        scope: Scope, status_code: int, duration_seconds: float, user_id: str | None
+    ) -> None:
+        """Record request metrics with bounded label values.
+
+        Args:
+            scope: Handled request scope (holds the matched route)
+            status_code: Response status code
+            duration_seconds: Request latency
+            user_id: Tenant from the X-User-Id header, if any
+        """
+        endpoint = route_template(scope)
+
+        http_request_duration_seconds.labels(
+            method=scope["method"],
+            endpoint=endpoint,
+            status_code=status_code,
+        ).observe(duration_seconds)
+
+        http_requests_total.labels(
+            method=scope["method"],
+            endpoint=endpoint,
+            status_code=status_code,
+        ).inc()
+
+        if endpoint.startswith(CHAT_ROUTE_PREFIX):
+            chat_request_duration_seconds.labels(
+                tenant_bucket=tenant_bucket(user_id),
+                status=status_code,
+            ).observe(duration_seconds)
+
+        tenant_heavy_hitters.record(user_id, duration_seconds)
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+    """First value of a (lowercase) request header."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
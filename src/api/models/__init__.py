@@ -3,6 +3,8 @@
 Pydantic models for request/response validation.
 """
 from src.api.models.chat import (
+    ChatEventIngestRequest,
+    ChatEventIngestResponse,
     ChatMessageRequest,
     ChatMessageResponse,
     DomainFactResponse,
@@ -29,6 +31,8 @@ from src.api.models.retrieval import RetrievalRequest, RetrievalResponse
 
 __all__ = [
     # Chat
+    "ChatEventIngestRequest",
+    "ChatEventIngestResponse",
     "ChatMessageRequest",
     "ChatMessageResponse",
     "EnhancedChatResponse",
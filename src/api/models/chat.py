@@ -8,6 +8,9 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
+# Upper bound on chat events stored by one bulk ingestion call
+MAX_INGEST_EVENTS = 5000
+
 
 class ResolvedEntityResponse(BaseModel):
     """Response model for resolved entity."""
@@ -211,6 +214,72 @@ class EnhancedChatResponse(BaseModel):
         }
 
 
+class ChatEventIngestItem(BaseModel):
+    """One historical chat event for bulk ingestion."""
+
+    session_id: UUID = Field(..., description="Conversation session ID")
+    content: str = Field(..., min_length=1, max_length=10000, description="Message content")
+    role: str = Field(default="user", description="Message role")
+    created_at: datetime | None = Field(
+        default=None, description="Original message timestamp (default: now)"
+    )
+    metadata: dict[str, Any] | None = Field(
+        default=None, description="Optional metadata"
+    )
+
+    @field_validator("role")
+    @classmethod
+    def validate_role(cls, v: str) -> str:
+        """Validate role is valid."""
+        valid_roles = {"user", "assistant", "system"}
+        if v not in valid_roles:
+            msg = f"role must be one of {valid_roles}"
+            raise ValueError(msg)
+        return v
+
+
+class ChatEventIngestRequest(BaseModel):
+    """Request model for bulk chat event ingestion."""
+
+    events: list[ChatEventIngestItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_INGEST_EVENTS,
+        description="Events to store",
+    )
+    queue_extraction: bool = Field(
+        default=False,
+        description="Queue entity resolution and semantic extraction as background jobs",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "events": [
+                    {
+                        "session_id": "550e8400-e29b-41d4-a716-446655440000",
+                        "content": "Acme prefers NET45 terms",
+                        "role": "user",
+                        "created_at": "2024-03-01T09:30:00Z",
+                        "metadata": {"source": "crm_import"},
+                    }
+                ],
+                "queue_extraction": True,
+            }
+        }
+
+
+class ChatEventIngestResponse(BaseModel):
+    """Response model for bulk chat event ingestion."""
+
+    created_event_ids: list[int] = Field(..., description="IDs of newly stored events")
+    created_count: int = Field(..., description="Number of newly stored events")
+    duplicate_count: int = Field(..., description="Events skipped as already stored")
+    extraction_jobs_enqueued: int = Field(
+        ..., description="Background extraction jobs queued"
+    )
+
+
 class ErrorResponse(BaseModel):
     """Error response model."""
 
@@ -4,6 +4,9 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+# Upper bound on sub-questions answered by one batch retrieval call
+MAX_BATCH_QUERIES = 20
+
 
 class RetrievalRequest(BaseModel):
     """Request model for memory retrieval.
@@ -37,6 +40,48 @@ class RetrievalRequest(BaseModel):
         return v
 
 
+class BatchRetrievalRequest(BaseModel):
+    """Request model for multi-query memory retrieval.
+
+    Attributes:
+        queries: Query texts, answered in the same order
+        strategy: Retrieval strategy applied to every query
+        top_k: Number of top memories to return per query
+        filters: Optional filters applied to every query
+    """
+
+    queries: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_QUERIES,
+        description="Query texts",
+    )
+    strategy: str = Field(
+        default="exploratory",
+        description="Retrieval strategy",
+    )
+    top_k: int = Field(default=20, ge=1, le=100, description="Number of results per query")
+    filters: dict[str, Any] | None = Field(
+        default=None,
+        description="Optional filters (entity_types, memory_types, min_confidence, etc.)",
+    )
+
+    @field_validator("queries")
+    @classmethod
+    def validate_queries(cls, v: list[str]) -> list[str]:
+        """Reject blank queries."""
+        if any(not q.strip() for q in v):
+            msg = "queries must not contain empty strings"
+            raise ValueError(msg)
+        return v
+
+    @field_validator("strategy")
+    @classmethod
+    def validate_strategy(cls, v: str) -> str:
+        """Validate retrieval strategy."""
+        return RetrievalRequest.validate_strategy(v)
+
+
 class SignalBreakdownResponse(BaseModel):
     """Signal breakdown for explainability."""
 
@@ -69,6 +114,7 @@ class RetrievalMetadataResponse(BaseModel):
     candidates_scored: int
     top_score: float
     retrieval_time_ms: float
+    cache_hit: bool = False
 
 
 class QueryContextResponse(BaseModel):
@@ -92,3 +138,38 @@ class RetrievalResponse(BaseModel):
     memories: list[ScoredMemoryResponse]
     query_context: QueryContextResponse
     metadata: RetrievalMetadataResponse
+
+
+class BatchRetrievalResponse(BaseModel):
+    """Response model for multi-query memory retrieval.
+
+    Attributes:
+        results: One retrieval response per query, in request order
+        retrieval_time_ms: Wall time of the whole batch in milliseconds
+    """
+
+    results: list[RetrievalResponse]
+    retrieval_time_ms: float
+
+
+class RetrievalCacheStatsResponse(BaseModel):
+    """Effectiveness and freshness of the semantic retrieval query cache.
+
+    Attributes:
+        enabled: Whether the cache is configured
+        hits: Lookups served from the cache (this process)
+        misses: Lookups that ran candidate generation
+        hit_rate: hits / (hits + misses)
+        max_staleness_seconds: Upper bound on how stale a served entry can be
+            with respect to writes this process does not observe
+        users: Users with cached entries
+        entries: Cached entries across all users
+    """
+
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    max_staleness_seconds: float = 0.0
+    users: int = 0
+    entries: int = 0
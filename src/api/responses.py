@@ -0,0 +1,82 @@
+"""Fast JSON response path.
+
+Opt-in (``enable_fast_json_responses``, requires the ``fast-json`` extra). A
+route returning a dict or model lets FastAPI validate it, copy it through
+jsonable_encoder and then json.dumps the copy. ORJSONResponse instead
+serializes the content directly: dicts, lists, dataclasses, datetimes,
+UUIDs and numpy values natively in orjson, Decimals through a default hook,
+and Pydantic models with their compiled serializer.
+"""
+from decimal import Decimal
+from typing import Any
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # Optional: only needed with enable_fast_json_responses
+    orjson = None  # type: ignore[assignment]
+
+
+def fast_json_available() -> bool:
+    """Whether orjson is installed."""
+    return orjson is not None
+
+
+def _default(value: Any) -> Any:
+    """Serialize values orjson has no native support for."""
+    if isinstance(value, Decimal):
+        # As jsonable_encoder: integral values stay integers
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)  # type: ignore[operator]
+    if isinstance(value, set | frozenset):
+        return list(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (or a model's own serializer)."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes.
+
+        Args:
+            content: JSON-compatible data, dataclasses, numpy values,
+                Decimals or a Pydantic model
+
+        Returns:
+            Encoded JSON
+        """
+        if isinstance(content, BaseModel):
+            # Compiled serializer straight to bytes, no intermediate dict
+            return type(content).__pydantic_serializer__.to_json(content)
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def json_response(request: Request, content: Any, status_code: int = 200) -> Response:
+    """Build the JSON response for content returned by a route.
+
+    With fast JSON responses enabled on the app, content is rendered
+    directly by ORJSONResponse; otherwise it goes through jsonable_encoder,
+    as when the route returns it to FastAPI.
+
+    Args:
+        request: Current request (its app holds the setting)
+        content: Response body
+        status_code: HTTP status code
+
+    Returns:
+        JSON response
+    """
+    if getattr(request.app.state, "fast_json_responses", False):
+        return ORJSONResponse(content, status_code=status_code)
+    return JSONResponse(jsonable_encoder(content), status_code=status_code)
@@ -6,10 +6,16 @@ from datetime import UTC, datetime
 from typing import Any
 
 import structlog
-from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
 
-from src.api.dependencies import get_current_user_id, get_process_chat_message_use_case
+from src.api.dependencies import (
+    get_current_user_id,
+    get_ingest_chat_events_use_case,
+    get_process_chat_message_use_case,
+)
 from src.api.models import (
+    ChatEventIngestRequest,
+    ChatEventIngestResponse,
     ChatMessageRequest,
     ChatMessageResponse,
     DomainFactResponse,
@@ -18,8 +24,10 @@ from src.api.models import (
     ResolvedEntityResponse,
     RetrievedMemoryResponse,
 )
+from src.api.responses import json_response
 from src.application.dtos import ProcessChatMessageInput
-from src.application.use_cases import ProcessChatMessageUseCase
+from src.application.use_cases import IngestChatEventsUseCase, ProcessChatMessageUseCase
+from src.domain.entities import ChatMessage
 from src.domain.exceptions import AmbiguousEntityError, DomainError
 
 logger = structlog.get_logger(__name__)
@@ -51,7 +59,7 @@ async def process_chat_simplified(
     request: Request,
     payload: dict[str, Any] = Body(...),
     use_case: ProcessChatMessageUseCase = Depends(get_process_chat_message_use_case),
-) -> dict[str, Any]:
+) -> Response:
     """Process a chat message with simplified request/response format.
 
     This endpoint is designed for E2E tests and provides a simple interface.
@@ -194,7 +202,7 @@ async def process_chat_simplified(
                 for conflict in output.conflicts_detected
             ]
 
-        return response_dict
+        return json_response(request, response_dict)
 
     except AmbiguousEntityError as e:
         # Task 1.2.1: Return disambiguation as structured response (not error)
@@ -215,12 +223,15 @@ async def process_chat_simplified(
         ]
 
         # Return 200 with disambiguation_required flag
-        return {
-            "disambiguation_required": True,
-            "original_mention": e.mention_text,
-            "candidates": candidates_list,
-            "message": f"Multiple entities match '{e.mention_text}'. Please select one.",
-        }
+        return json_response(
+            request,
+            {
+                "disambiguation_required": True,
+                "original_mention": e.mention_text,
+                "candidates": candidates_list,
+                "message": f"Multiple entities match '{e.mention_text}'. Please select one.",
+            },
+        )
 
     except Exception as e:
         logger.error(
@@ -234,6 +245,91 @@ async def process_chat_simplified(
         ) from None
 
 
+@router.post(
+    "/events/batch",
+    response_model=ChatEventIngestResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid request"},
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+    summary="Bulk-ingest historical chat events",
+    description="""
+    Store many chat events in one request (e.g. CRM backfills).
+
+    Events are written with multi-row inserts; events whose session and
+    content already exist are skipped, so imports can be re-run safely.
+    As in live chat, PII is redacted before storage (duplicates are matched
+    on the redacted content).
+    No reply is generated. With queue_extraction, entity resolution and
+    semantic extraction for the new user messages are queued as background
+    jobs (requires background jobs to be enabled).
+    """,
+)
+@limiter.limit("10/minute")
+async def ingest_chat_events(
+    request: Request,
+    payload: ChatEventIngestRequest = Body(...),
+    user_id: str = Depends(get_current_user_id),
+    use_case: IngestChatEventsUseCase = Depends(get_ingest_chat_events_use_case),
+) -> ChatEventIngestResponse:
+    """Store a batch of historical chat events.
+
+    Args:
+        request: FastAPI Request object (for rate limiting)
+        payload: Events to store
+        user_id: Current user ID (from auth)
+        use_case: Bulk ingestion use case
+
+    Returns:
+        ChatEventIngestResponse with created event IDs and duplicate count
+
+    Raises:
+        HTTPException: On validation or storage errors
+    """
+    try:
+        messages = [
+            ChatMessage(
+                session_id=event.session_id,
+                user_id=user_id,
+                role=event.role,
+                content=event.content,
+                event_metadata=event.metadata or {},
+                **({"created_at": event.created_at} if event.created_at else {}),
+            )
+            for event in payload.events
+        ]
+
+        output = await use_case.execute(messages, queue_extraction=payload.queue_extraction)
+
+        return ChatEventIngestResponse(
+            created_event_ids=output.created_event_ids,
+            created_count=len(output.created_event_ids),
+            duplicate_count=output.duplicate_count,
+            extraction_jobs_enqueued=output.extraction_jobs_enqueued,
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "ValidationError", "message": str(e)},
+        ) from None
+
+    except Exception as e:
+        logger.error(
+            "ingest_chat_events_error",
+            user_id=user_id,
+            event_count=len(payload.events),
+            error_type=type(e).__name__,
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "InternalServerError", "message": "An unexpected error occurred"},
+        ) from None
+
+
 @router.post(
     "/message",
     response_model=ChatMessageResponse,
@@ -267,7 +363,7 @@ async def process_message(
     payload: ChatMessageRequest = Body(...),
     user_id: str = Depends(get_current_user_id),
     use_case: ProcessChatMessageUseCase = Depends(get_process_chat_message_use_case),
-) -> ChatMessageResponse:
+) -> Response:
     """Process a chat message and resolve entities.
 
     Args:
@@ -302,7 +398,7 @@ async def process_message(
         output = await use_case.execute(input_dto)
 
         # Convert to response model
-        return ChatMessageResponse(
+        response = ChatMessageResponse(
             event_id=output.event_id,
             session_id=output.session_id,
             resolved_entities=[
@@ -320,6 +416,7 @@ async def process_message(
             resolution_success_rate=output.resolution_success_rate,
             created_at=datetime.now(UTC),
         )
+        return json_response(request, response, status_code=status.HTTP_201_CREATED)
 
     except AmbiguousEntityError as e:
         logger.warning(
@@ -392,7 +489,7 @@ async def process_message_enhanced(
     payload: ChatMessageRequest = Body(...),
     user_id: str = Depends(get_current_user_id),
     use_case: ProcessChatMessageUseCase = Depends(get_process_chat_message_use_case),
-) -> EnhancedChatResponse:
+) -> Response:
     """Process a chat message with memory retrieval.
 
     Args:
@@ -476,7 +573,7 @@ async def process_message_enhanced(
         )
 
         # Convert to response model
-        return EnhancedChatResponse(
+        response = EnhancedChatResponse(
             event_id=output.event_id,
             session_id=output.session_id,
             resolved_entities=[
@@ -498,6 +595,7 @@ async def process_message_enhanced(
             memory_count=len(retrieved_memories),
             created_at=datetime.now(UTC),
         )
+        return json_response(request, response, status_code=status.HTTP_201_CREATED)
 
     except AmbiguousEntityError as e:
         logger.warning(
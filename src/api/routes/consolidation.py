@@ -272,7 +272,8 @@ async def get_summaries(
     description="""
     Check if consolidation is recommended for a user.
 
-    Scans user's interaction history to find scopes meeting consolidation thresholds.
+    Reads the user's maintained consolidation counters (activity since each scope
+    was last consolidated) to find scopes meeting consolidation thresholds.
 
     **Thresholds**:
     - Entity scope: 10+ episodic memories about entity
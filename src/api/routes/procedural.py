@@ -31,25 +31,25 @@ logger = structlog.get_logger(__name__)
     "/detect",
     response_model=DetectPatternsResponse,
     status_code=status.HTTP_200_OK,
-    summary="Detect patterns from episodic memories",
+    summary="Detect patterns from tool usage",
     description="""
-    Analyze user's episodic memories to detect behavioral patterns.
+    Return the user's behavioral patterns mined from tool usage.
 
-    **Pattern Detection**:
-    1. Fetch recent episodic memories (last 30 days)
-    2. Extract features (intent, entities, topics)
-    3. Find frequent co-occurrence patterns
-    4. Store as procedural memories
+    **Pattern Detection** (background miner, `enable_procedural_miner`):
+    1. Read tool usage logged since the previous pass (watermark)
+    2. Fold it into per-(user, anchor tool) sequence counts
+    3. Keep tools that follow the anchor in at least half of its sequences
+    4. Upsert the affected patterns as procedural memories in bulk
 
-    **Use Cases**:
-    - Learn that when user asks about payments, they usually want invoice info
-    - Learn that queries about specific customers often include order history
-    - Learn user's common question-answer patterns
+    This endpoint only reads the mined patterns with at least
+    `min_occurrences` observations.
 
-    **Phase 1**: Manual triggering via API
-    **Phase 2+**: Automatic pattern detection on schedule
+    **Use Cases**:
+    - Learn that after checking invoice status, credit status is usually needed
+    - Learn which tools are called together for a customer
+    - Prefetch those tools before the LLM asks for them
 
-    **Performance**: P95 < 1s (analyzes up to 500 episodes)
+    **Performance**: one read of the user's patterns
     """,
 )
 async def detect_patterns(
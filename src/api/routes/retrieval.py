@@ -11,10 +11,25 @@ from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user_id, get_db
-from src.api.models.retrieval import RetrievalRequest, RetrievalResponse
+from src.api.dependencies import get_current_user_id, get_db, get_memory_retriever
+from src.api.models.retrieval import (
+    MAX_BATCH_QUERIES,
+    BatchRetrievalRequest,
+    BatchRetrievalResponse,
+    QueryContextResponse,
+    RetrievalCacheStatsResponse,
+    RetrievalMetadataResponse,
+    RetrievalRequest,
+    RetrievalResponse,
+    ScoredMemoryResponse,
+    SignalBreakdownResponse,
+)
 from src.domain.exceptions import DomainError
+from src.domain.services import MemoryRetriever
+from src.domain.value_objects.query_context import RetrievalFilters
+from src.domain.value_objects.retrieval_result import RetrievalResult
 from src.infrastructure.database.models import CanonicalEntity, SemanticMemory
+from src.infrastructure.di.container import container
 
 router = APIRouter(prefix="/api/v1", tags=["retrieval"])
 logger = structlog.get_logger(__name__)
@@ -90,14 +105,14 @@ class EntityListResponse(BaseModel):
 async def retrieve_memories(
     request: RetrievalRequest,
     user_id: str = Depends(get_current_user_id),
-    # Phase 1C: MemoryRetriever DI pending - requires get_memory_retriever() in dependencies.py
-    # retriever: MemoryRetriever = Depends(get_memory_retriever),
+    retriever: MemoryRetriever = Depends(get_memory_retriever),
 ) -> RetrievalResponse:
     """Retrieve relevant memories for a query.
 
     Args:
         request: Retrieval request with query and parameters
         user_id: Current user ID (from auth)
+        retriever: Memory retrieval pipeline
 
     Returns:
         RetrievalResponse with scored memories and metadata
@@ -114,50 +129,16 @@ async def retrieve_memories(
     )
 
     try:
-        # Phase 1C: MemoryRetriever integration pending - raises 501 until DI wired
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail="Retrieval endpoint implementation in progress. "
-            "MemoryRetriever service needs dependency injection setup.",
+        result = await retriever.retrieve(
+            query=request.query,
+            user_id=user_id,
+            strategy=request.strategy,
+            top_k=request.top_k,
+            filters=_to_filters(request.filters),
         )
+        return _to_response(result)
 
-        # Future implementation:
-        # result = await retriever.retrieve(
-        #     query=request.query,
-        #     user_id=user_id,
-        #     strategy=request.strategy,
-        #     top_k=request.top_k,
-        #     filters=request.filters,
-        # )
-        #
-        # # Convert to API response model
-        # memories_response = [
-        #     ScoredMemoryResponse(
-        #         memory_id=m.candidate.memory_id,
-        #         memory_type=m.candidate.memory_type,
-        #         content=m.candidate.content,
-        #         relevance_score=m.relevance_score,
-        #         signal_breakdown=SignalBreakdownResponse(**m.signal_breakdown.to_dict()),
-        #         created_at=m.candidate.created_at.isoformat(),
-        #         importance=m.candidate.importance,
-        #         confidence=m.candidate.confidence,
-        #         reinforcement_count=m.candidate.reinforcement_count,
-        #     )
-        #     for m in result.memories
-        # ]
-        #
-        # return RetrievalResponse(
-        #     memories=memories_response,
-        #     query_context=QueryContextResponse(
-        #         query_text=result.query_context.query_text,
-        #         entity_ids=result.query_context.entity_ids,
-        #         user_id=result.query_context.user_id,
-        #         strategy=result.query_context.strategy,
-        #     ),
-        #     metadata=RetrievalMetadataResponse(**result.metadata.to_dict()),
-        # )
-
-    except DomainError as e:
+    except (DomainError, ValueError, TypeError) as e:
         logger.error(
             "retrieve_domain_error",
             user_id=user_id,
@@ -182,6 +163,150 @@ async def retrieve_memories(
         ) from e
 
 
+@router.post(
+    "/retrieve/batch",
+    response_model=BatchRetrievalResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Retrieve relevant memories for several queries",
+    description=f"""
+    Answer up to {MAX_BATCH_QUERIES} queries in one call, using the same pipeline as
+    `/retrieve` batched end to end:
+
+    1. All queries are embedded with a single embedding API call
+    2. Each memory layer is searched once for all queries
+       (query vectors unnested, LATERAL top-k ANN per query)
+    3. All (query, candidate) pairs are scored as one vectorized batch
+
+    Results are returned in request order. `strategy`, `top_k` and `filters`
+    apply to every query.
+    """,
+)
+async def retrieve_memories_batch(
+    request: BatchRetrievalRequest,
+    user_id: str = Depends(get_current_user_id),
+    retriever: MemoryRetriever = Depends(get_memory_retriever),
+) -> BatchRetrievalResponse:
+    """Retrieve relevant memories for several queries at once.
+
+    Args:
+        request: Batch retrieval request with queries and parameters
+        user_id: Current user ID (from auth)
+        retriever: Memory retrieval pipeline
+
+    Returns:
+        BatchRetrievalResponse with one result per query
+
+    Raises:
+        HTTPException: 400 for invalid input, 500 for server errors
+    """
+    logger.info(
+        "retrieve_batch_request",
+        user_id=user_id,
+        query_count=len(request.queries),
+        strategy=request.strategy,
+        top_k=request.top_k,
+    )
+
+    try:
+        results = await retriever.retrieve_many(
+            queries=request.queries,
+            user_id=user_id,
+            strategy=request.strategy,
+            top_k=request.top_k,
+            filters=_to_filters(request.filters),
+        )
+        return BatchRetrievalResponse(
+            results=[_to_response(result) for result in results],
+            retrieval_time_ms=results[0].metadata.retrieval_time_ms if results else 0.0,
+        )
+
+    except (DomainError, ValueError, TypeError) as e:
+        logger.error(
+            "retrieve_batch_domain_error",
+            user_id=user_id,
+            query_count=len(request.queries),
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Retrieval error: {e!s}",
+        ) from e
+
+    except Exception as e:
+        logger.error(
+            "retrieve_batch_unexpected_error",
+            user_id=user_id,
+            query_count=len(request.queries),
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred during retrieval",
+        ) from e
+
+
+@router.get(
+    "/retrieve/cache/stats",
+    response_model=RetrievalCacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Semantic retrieval cache statistics",
+    description="""
+    Hit rate and staleness bound of this process's semantic query cache.
+
+    Entries are invalidated when the owning user's semantic memories are
+    committed through this process; `max_staleness_seconds` bounds staleness
+    from writes made elsewhere.
+    """,
+)
+async def get_retrieval_cache_stats() -> RetrievalCacheStatsResponse:
+    """Report semantic retrieval cache statistics.
+
+    Returns:
+        RetrievalCacheStatsResponse (enabled=False when the cache is off)
+    """
+    cache = container.retrieval_cache()
+    if cache is None:
+        return RetrievalCacheStatsResponse(enabled=False)
+    return RetrievalCacheStatsResponse(enabled=True, **cache.stats())
+
+
+def _to_filters(filters: dict[str, Any] | None) -> RetrievalFilters | None:
+    """Build retrieval filters from the request payload.
+
+    Raises:
+        TypeError: On unknown filter keys
+        ValueError: On out-of-range filter values
+    """
+    return RetrievalFilters(**filters) if filters else None
+
+
+def _to_response(result: RetrievalResult) -> RetrievalResponse:
+    """Convert a domain retrieval result to its API model."""
+    return RetrievalResponse(
+        memories=[
+            ScoredMemoryResponse(
+                memory_id=m.candidate.memory_id,
+                memory_type=m.candidate.memory_type,
+                content=m.candidate.content,
+                relevance_score=m.relevance_score,
+                signal_breakdown=SignalBreakdownResponse(**m.signal_breakdown.to_dict()),
+                created_at=m.candidate.created_at.isoformat(),
+                importance=m.candidate.importance,
+                confidence=m.candidate.confidence,
+                reinforcement_count=m.candidate.confirmation_count,
+            )
+            for m in result.memories
+        ],
+        query_context=QueryContextResponse(
+            query_text=result.query_context.query_text,
+            entity_ids=result.query_context.entity_ids,
+            user_id=result.query_context.user_id,
+            strategy=result.query_context.strategy,
+        ),
+        metadata=RetrievalMetadataResponse(**result.metadata.to_dict()),
+    )
+
+
 @router.get(
     "/memory",
     response_model=MemoryListResponse,
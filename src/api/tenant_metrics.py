@@ -0,0 +1,214 @@
+"""Bounded-cardinality labels and sampled per-tenant statistics.
+
+Labelling series by user id makes the registry (and every /metrics scrape)
+grow with the user base. Metrics instead label tenants with tenant_bucket(),
+a stable hash into TENANT_BUCKETS values, and HTTP metrics with the matched
+route template rather than the raw path.
+
+Which tenants dominate traffic is answered separately by
+TenantHeavyHitters: a sampled Space-Saving sketch whose top entries are
+exported as their own small gauge families. Memory is O(capacity) however
+many users there are.
+"""
+
+import random
+import threading
+import zlib
+from collections.abc import Callable, Iterator, MutableMapping
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import GaugeMetricFamily, Metric
+
+# Label space for tenant-scoped series
+TENANT_BUCKETS = 32
+
+# Label for requests that matched no route (404s on arbitrary paths)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def tenant_bucket(user_id: str | None) -> str:
+    """Map a user id to one of TENANT_BUCKETS stable label values.
+
+    Args:
+        user_id: User id (None for anonymous requests)
+
+    Returns:
+        Two-digit bucket ("00".."31"), or "none" without a user
+    """
+    if not user_id:
+        return "none"
+    return f"{zlib.crc32(user_id.encode()) % TENANT_BUCKETS:02d}"
+
+
+def route_template(scope: MutableMapping[str, Any]) -> str:
+    """Route template of a handled request (e.g. "/api/v1/memories/{memory_id}").
+
+    Args:
+        scope: ASGI scope after routing
+
+    Returns:
+        Path template of the matched route, or UNMATCHED_ROUTE
+    """
+    return getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+
+
+@dataclass(slots=True)
+class HeavyHitter:
+    """Sketch entry.
+
+    Attributes:
+        key: Tracked key
+        count: Estimated weight (never underestimates)
+        error: Maximum overestimation of count
+    """
+
+    key: str
+    count: float
+    error: float
+
+
+class SpaceSavingSketch:
+    """Space-Saving top-K sketch (Metwally et al.).
+
+    Keeps at most ``capacity`` counters. An untracked key replaces the
+    smallest counter and inherits its count as error, so any key whose true
+    weight exceeds total / capacity is guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize sketch.
+
+        Args:
+            capacity: Maximum number of tracked keys
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            msg = f"Sketch capacity must be positive, got {capacity}"
+            raise ValueError(msg)
+        self.capacity = capacity
+        self._entries: dict[str, HeavyHitter] = {}
+
+    def add(self, key: str, weight: float = 1.0) -> None:
+        """Add weight to a key.
+
+        Args:
+            key: Key to count
+            weight: Weight to add
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.count += weight
+        elif len(self._entries) < self.capacity:
+            self._entries[key] = HeavyHitter(key=key, count=weight, error=0.0)
+        else:
+            victim = min(self._entries.values(), key=lambda e: e.count)
+            del self._entries[victim.key]
+            self._entries[key] = HeavyHitter(
+                key=key, count=victim.count + weight, error=victim.count
+            )
+
+    def top(self, n: int) -> list[HeavyHitter]:
+        """Heaviest tracked keys.
+
+        Args:
+            n: Number of entries
+
+        Returns:
+            Up to n entries, heaviest first
+        """
+        return sorted(self._entries.values(), key=lambda e: e.count, reverse=True)[:n]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TenantHeavyHitters:
+    """Sampled per-tenant request and latency totals for the heaviest tenants.
+
+    A Prometheus collector: exports tenant_top_requests{user_id} and
+    tenant_top_request_seconds{user_id} for the ``export_top`` heaviest
+    tenants of each sketch. Sampled observations are weighted by
+    1 / sample_rate, so estimates stay unbiased.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 200,
+        export_top: int = 20,
+        sample_rate: float = 0.1,
+        rng: Callable[[], float] = random.random,
+    ):
+        """Initialize sketches.
+
+        Args:
+            capacity: Tenants tracked per sketch
+            export_top: Tenants exported per metric
+            sample_rate: Fraction of requests recorded (0 < rate <= 1)
+            rng: Uniform [0, 1) source (injectable for tests)
+
+        Raises:
+            ValueError: If sample_rate is outside (0, 1]
+        """
+        if not 0.0 < sample_rate <= 1.0:
+            msg = f"Sample rate must be in (0, 1], got {sample_rate}"
+            raise ValueError(msg)
+        self.export_top = export_top
+        self.sample_rate = sample_rate
+        self._rng = rng
+        self._requests = SpaceSavingSketch(capacity)
+        self._seconds = SpaceSavingSketch(capacity)
+        # Scrapes may run in a worker thread
+        self._lock = threading.Lock()
+
+    def record(self, user_id: str | None, duration_seconds: float) -> None:
+        """Record one request of a tenant (sampled).
+
+        Args:
+            user_id: Tenant (ignored when None)
+            duration_seconds: Request latency
+        """
+        if not user_id or self._rng() >= self.sample_rate:
+            return
+        scale = 1.0 / self.sample_rate
+        with self._lock:
+            self._requests.add(user_id, scale)
+            self._seconds.add(user_id, duration_seconds * scale)
+
+    def top_requests(self, n: int) -> list[HeavyHitter]:
+        """Tenants with the most (estimated) requests."""
+        with self._lock:
+            return self._requests.top(n)
+
+    def top_seconds(self, n: int) -> list[HeavyHitter]:
+        """Tenants with the most (estimated) request time."""
+        with self._lock:
+            return self._seconds.top(n)
+
+    def collect(self) -> Iterator[Metric]:
+        """Prometheus collector hook."""
+        requests = GaugeMetricFamily(
+            "tenant_top_requests",
+            "Estimated requests of the heaviest tenants (sampled Space-Saving sketch)",
+            labels=["user_id"],
+        )
+        for entry in self.top_requests(self.export_top):
+            requests.add_metric([entry.key], entry.count)
+
+        seconds = GaugeMetricFamily(
+            "tenant_top_request_seconds",
+            "Estimated request seconds of the heaviest tenants (sampled Space-Saving sketch)",
+            labels=["user_id"],
+        )
+        for entry in self.top_seconds(self.export_top):
+            seconds.add_metric([entry.key], entry.count)
+
+        yield requests
+        yield seconds
+
+
+tenant_heavy_hitters = TenantHeavyHitters()
+REGISTRY.register(tenant_heavy_hitters)  # type: ignore[arg-type]
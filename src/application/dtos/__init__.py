@@ -3,12 +3,14 @@
 Data Transfer Objects for application layer use cases.
 """
 from src.application.dtos.chat_dtos import (
+    IngestChatEventsOutput,
     ProcessChatMessageInput,
     ProcessChatMessageOutput,
     ResolvedEntityDTO,
 )
 
 __all__ = [
+    "IngestChatEventsOutput",
     "ProcessChatMessageInput",
     "ProcessChatMessageOutput",
     "ResolvedEntityDTO",
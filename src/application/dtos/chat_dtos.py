@@ -173,3 +173,18 @@ class ProcessChatMessageOutput:
     retrieved_memories: list[RetrievedMemoryDTO]
     reply: str
     step_timings: dict[str, float] | None = None
+
+
+@dataclass
+class IngestChatEventsOutput:
+    """Output DTO for bulk chat event ingestion.
+
+    Attributes:
+        created_event_ids: Event IDs of newly stored messages (input order)
+        duplicate_count: Messages skipped because session_id + content already existed
+        extraction_jobs_enqueued: Background extraction jobs queued for the new events
+    """
+
+    created_event_ids: list[int]
+    duplicate_count: int
+    extraction_jobs_enqueued: int = 0
@@ -7,12 +7,15 @@ Vision Alignment:
 - Epistemic humility (LLM expresses uncertainty)
 """
 
+import functools
 import json
 from typing import Any
 
 import structlog
 
 from src.application.services.tool_executor import ToolExecutor
+from src.application.services.tool_prefetcher import PrefetchPlan, ToolPrefetcher
+from src.application.services.tool_result_encoder import ToolResultEncoder
 from src.application.services.tool_registry import ToolRegistry
 from src.config.heuristics import (
     TOOL_ORCHESTRATION_MAX_ITERATIONS,
@@ -21,11 +24,31 @@ from src.config.heuristics import (
 from src.domain.ports.domain_database_port import DomainDatabasePort
 from src.domain.ports.llm_service import ILLMService
 from src.domain.ports.tool_usage_tracker_port import IToolUsageTracker
+from src.domain.services.span_tracer import span
 from src.domain.value_objects.domain_fact import DomainFact
 
 logger = structlog.get_logger(__name__)
 
 
+@functools.cache
+def _port_tools() -> list[dict[str, Any]]:
+    """Generate Claude-format tool definitions from DomainDatabasePort.
+
+    The port is fixed at import time, so reflection runs once per process and
+    every orchestrator shares the (read-only) result.
+    """
+    # Note: We pass the class itself for inspection, not an instance
+    registry = ToolRegistry(DomainDatabasePort)  # type: ignore[type-abstract]
+    return [
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "input_schema": tool.input_schema,
+        }
+        for tool in registry.generate_tools()
+    ]
+
+
 class AdaptiveQueryOrchestrator:
     """Orchestrate domain queries using LLM intelligence.
 
@@ -43,6 +66,11 @@ class AdaptiveQueryOrchestrator:
     - Composable (tools are independent)
     - Observable (track which patterns work)
     - Emergent (intelligence from tool combinations)
+
+    With a prefetcher, tool calls predicted from procedural memory run first:
+    their results are injected into the first LLM turn as if the LLM had
+    requested them, or returned directly when the prediction is confident
+    enough to skip the LLM loop.
     """
 
     def __init__(
@@ -50,6 +78,7 @@ class AdaptiveQueryOrchestrator:
         llm_service: ILLMService,
         domain_db: DomainDatabasePort,
         usage_tracker: IToolUsageTracker,
+        prefetcher: ToolPrefetcher | None = None,
     ):
         """Initialize orchestrator.
 
@@ -57,38 +86,33 @@ class AdaptiveQueryOrchestrator:
             llm_service: LLM for tool calling
             domain_db: Domain database port
             usage_tracker: Track tool usage patterns
+            prefetcher: Predicts tool calls from procedural memory (None:
+                the LLM selects every tool)
         """
         self.llm = llm_service
         self.domain_db = domain_db
         self.tracker = usage_tracker
+        self.prefetcher = prefetcher
 
         # Request-scoped cache to prevent N+1 queries
         # Cleared at the end of each augment() call
         self._request_cache: dict[str, Any] = {}
 
-        # Generate tools from port interface
-        # Note: We pass the class itself for inspection, not an instance
-        registry = ToolRegistry(DomainDatabasePort)  # type: ignore[type-abstract]
-        tool_definitions = registry.generate_tools()
-
-        # Convert to Claude format
-        self.tools = [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.input_schema,
-            }
-            for tool in tool_definitions
-        ]
+        # Tools generated from the port interface (reflected once per process)
+        self.tools = _port_tools()
 
         # Executor for running tools
         self.executor = ToolExecutor(domain_db)
 
+        # Compact tool results for the LLM; rows are sent once per augment()
+        self._result_encoder = ToolResultEncoder()
+
     async def augment(
         self,
         query: str,
         entities: list[dict[str, Any]],
         conversation_id: str,
+        user_id: str | None = None,
     ) -> list[DomainFact]:
         """Augment query with domain facts using LLM tool calling.
 
@@ -96,12 +120,14 @@ class AdaptiveQueryOrchestrator:
             query: User query text
             entities: Resolved entities (e.g., [{"entity_id": "customer_abc", "type": "customer"}])
             conversation_id: For tracking usage patterns
+            user_id: User whose procedural patterns drive prefetching
 
         Returns:
             List of domain facts retrieved by LLM
         """
-        # Clear request-scoped cache for this augmentation request
+        # Clear request-scoped state for this augmentation request
         self._request_cache.clear()
+        self._result_encoder.reset()
 
         # Build system prompt with available tools and entity context
         system_prompt = self._build_system_prompt(entities)
@@ -118,7 +144,33 @@ class AdaptiveQueryOrchestrator:
         all_facts: list[DomainFact] = []
 
         # Iterative tool calling (max iterations to prevent loops)
-        messages = [{"role": "user", "content": query}]
+        messages: list[dict[str, Any]] = [{"role": "user", "content": query}]
+
+        # Speculative prefetch: run the tools procedural memory predicts and
+        # hand the results to the LLM as its first tool round
+        plan = (
+            await self.prefetcher.predict(user_id, entities, self.tools)
+            if self.prefetcher is not None
+            else None
+        )
+        if plan is not None:
+            await self._run_prefetch(plan, messages, tool_calls_made, all_facts)
+
+            if plan.skip_llm:
+                logger.info(
+                    "llm_tool_orchestration_skipped",
+                    confidence=plan.confidence,
+                    facts_retrieved=len(all_facts),
+                    tools_used=len(tool_calls_made),
+                )
+                await self.tracker.log_tool_usage(
+                    conversation_id=conversation_id,
+                    query=query,
+                    tools_called=tool_calls_made,
+                    facts_count=len(all_facts),
+                    user_id=user_id,
+                )
+                return all_facts
 
         for iteration in range(TOOL_ORCHESTRATION_MAX_ITERATIONS):
             # Call LLM with tools
@@ -164,36 +216,19 @@ class AdaptiveQueryOrchestrator:
                     tool_results.append(
                         {
                             "tool_call_id": tool_call.id,
-                            "content": json.dumps(
-                                self._serialize_facts(result), default=str
-                            ),
+                            "content": self._result_encoder.encode(result),
                         }
                     )
 
                 # Add assistant message + tool results to conversation
-                # Type: list[dict[str, Any]] for flexible message format
-                assistant_msg: dict[str, Any] = {
-                    "role": "assistant",
-                    "content": [
+                self._append_tool_round(
+                    messages,
+                    [
                         {"type": "tool_use", "id": tc.id, "name": tc.name, "input": tc.arguments}
                         for tc in response.tool_calls
                     ],
-                }
-                messages.append(assistant_msg)
-
-                # Add tool results
-                for tr in tool_results:
-                    tool_msg: dict[str, Any] = {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": tr["tool_call_id"],
-                                "content": tr["content"],
-                            }
-                        ],
-                    }
-                    messages.append(tool_msg)
+                    tool_results,
+                )
 
                 # Continue loop - LLM will process results
                 continue
@@ -213,6 +248,7 @@ class AdaptiveQueryOrchestrator:
                     query=query,
                     tools_called=tool_calls_made,
                     facts_count=len(all_facts),
+                    user_id=user_id,
                 )
 
                 return all_facts
@@ -229,10 +265,97 @@ class AdaptiveQueryOrchestrator:
             query=query,
             tools_called=tool_calls_made,
             facts_count=len(all_facts),
+            user_id=user_id,
         )
 
         return all_facts
 
+    async def _run_prefetch(
+        self,
+        plan: PrefetchPlan,
+        messages: list[dict[str, Any]],
+        tool_calls_made: list[dict[str, Any]],
+        all_facts: list[DomainFact],
+    ) -> None:
+        """Execute predicted tool calls and record them as a tool round.
+
+        Calls run one at a time: the domain database port shares one session.
+        They are tracked with "prefetched": True so pattern mining does not
+        learn from its own predictions.
+
+        Args:
+            plan: Predicted tool calls
+            messages: LLM conversation (tool round appended)
+            tool_calls_made: Tracked tool calls (appended)
+            all_facts: Retrieved facts (extended)
+        """
+        tool_uses: list[dict[str, Any]] = []
+        tool_results: list[dict[str, Any]] = []
+
+        with span("augment.prefetch", calls=len(plan.calls), skip_llm=plan.skip_llm):
+            for index, call in enumerate(plan.calls):
+                result = await self._execute_tool_with_cache(call.tool, call.arguments)
+
+                tool_calls_made.append(
+                    {
+                        "tool": call.tool,
+                        "arguments": call.arguments,
+                        "iteration": 0,
+                        "prefetched": True,
+                    }
+                )
+                if isinstance(result, list):
+                    all_facts.extend(result)
+
+                tool_call_id = f"prefetch_{index}"
+                tool_uses.append(
+                    {"type": "tool_use", "id": tool_call_id, "name": call.tool, "input": call.arguments}
+                )
+                tool_results.append(
+                    {
+                        "tool_call_id": tool_call_id,
+                        "content": self._result_encoder.encode(result),
+                    }
+                )
+
+        self._append_tool_round(messages, tool_uses, tool_results)
+
+        logger.info(
+            "tool_prefetch_completed",
+            calls=len(plan.calls),
+            facts_retrieved=len(all_facts),
+            pattern_ids=plan.pattern_ids,
+        )
+
+    @staticmethod
+    def _append_tool_round(
+        messages: list[dict[str, Any]],
+        tool_uses: list[dict[str, Any]],
+        tool_results: list[dict[str, Any]],
+    ) -> None:
+        """Append an assistant tool_use message and its tool results.
+
+        Args:
+            messages: LLM conversation
+            tool_uses: tool_use content blocks
+            tool_results: {tool_call_id, content} per tool use
+        """
+        messages.append({"role": "assistant", "content": tool_uses})
+
+        for tr in tool_results:
+            messages.append(
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": tr["tool_call_id"],
+                            "content": tr["content"],
+                        }
+                    ],
+                }
+            )
+
     def _build_system_prompt(self, entities: list[dict[str, Any]]) -> str:
         """Build system prompt with entity context.
 
@@ -323,22 +446,3 @@ Available tools will be provided. Use them to fetch all relevant business data."
         )
 
         return result
-
-    def _serialize_facts(self, result: Any) -> Any:
-        """Serialize DomainFacts to JSON-compatible format.
-
-        Args:
-            result: Tool execution result
-
-        Returns:
-            JSON-serializable result
-        """
-        if isinstance(result, list):
-            return [
-                fact.to_api_response() if hasattr(fact, "to_api_response") else str(fact)
-                for fact in result
-            ]
-        elif hasattr(result, "to_api_response"):
-            return result.to_api_response()
-        else:
-            return result
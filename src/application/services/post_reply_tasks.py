@@ -0,0 +1,330 @@
+"""Post-reply task runner.
+
+Executes pipeline stages that only affect future turns: PII policy memory
+creation, confirmation-driven memory validation, memory-vs-DB conflict
+resolution writes and aging updates. Also runs entity resolution and
+semantic extraction for bulk-imported chat events.
+
+The same runner is used inline (no queue configured) and by the background
+worker, so deferred and synchronous execution share one implementation.
+"""
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from src.domain.entities import CanonicalEntity, SemanticMemory
+from src.domain.exceptions import DomainError
+from src.domain.ports import (
+    BackgroundJobType,
+    IChatEventRepository,
+    IEmbeddingService,
+    IEntityRepository,
+    ISemanticMemoryRepository,
+)
+from src.domain.services import ConflictResolutionService
+from src.domain.value_objects import EntityReference, MemoryConflict
+
+if TYPE_CHECKING:
+    from src.application.use_cases.extract_semantics import ExtractSemanticsUseCase
+    from src.application.use_cases.resolve_entities import ResolveEntitiesUseCase
+
+logger = structlog.get_logger(__name__)
+
+
+class PostReplyTaskRunner:
+    """Runs deferrable (reply-independent) pipeline stages.
+
+    Every task is idempotent: re-running a job after a crash converges
+    to the same state instead of duplicating writes.
+    """
+
+    SYSTEM_POLICY_ENTITY_ID = "system_policy"
+
+    def __init__(
+        self,
+        semantic_memory_repository: ISemanticMemoryRepository,
+        embedding_service: IEmbeddingService,
+        conflict_resolution_service: ConflictResolutionService,
+        canonical_entity_repository: IEntityRepository | None = None,
+        chat_repository: IChatEventRepository | None = None,
+        resolve_entities_use_case: "ResolveEntitiesUseCase | None" = None,
+        extract_semantics_use_case: "ExtractSemanticsUseCase | None" = None,
+    ):
+        """Initialize runner.
+
+        Args:
+            semantic_memory_repository: Repository for semantic memory writes
+            embedding_service: Service for generating policy memory embeddings
+            conflict_resolution_service: Service applying conflict resolutions
+            canonical_entity_repository: Repository for the system policy entity (optional)
+            chat_repository: Repository for imported chat events (extraction jobs only)
+            resolve_entities_use_case: Entity resolution (extraction jobs only)
+            extract_semantics_use_case: Semantic extraction (extraction jobs only)
+        """
+        self.semantic_memory_repo = semantic_memory_repository
+        self.embedding_service = embedding_service
+        self.conflict_resolution_service = conflict_resolution_service
+        self.canonical_entity_repo = canonical_entity_repository
+        self.chat_repo = chat_repository
+        self.resolve_entities = resolve_entities_use_case
+        self.extract_semantics = extract_semantics_use_case
+
+    async def run(self, job_type: BackgroundJobType, payload: dict[str, Any]) -> None:
+        """Dispatch a job payload to its task.
+
+        Args:
+            job_type: Type of work to perform
+            payload: Job arguments (as produced by the chat orchestrator)
+
+        Raises:
+            ValueError: If job type is unknown
+        """
+        if job_type == BackgroundJobType.PII_POLICY_MEMORY:
+            await self.create_pii_policy_memory(
+                user_id=payload["user_id"],
+                event_id=payload["event_id"],
+                pii_types=payload["pii_types"],
+                redaction_count=payload["redaction_count"],
+            )
+        elif job_type == BackgroundJobType.VALIDATE_MEMORIES:
+            await self.validate_memories(
+                memory_ids=payload["memory_ids"],
+                event_id=payload.get("event_id"),
+            )
+        elif job_type == BackgroundJobType.RESOLVE_DB_CONFLICTS:
+            await self.resolve_db_conflicts(
+                [MemoryConflict.from_dict(c) for c in payload["conflicts"]]
+            )
+        elif job_type == BackgroundJobType.MARK_MEMORIES_AGING:
+            await self.mark_memories_aging(memory_ids=payload["memory_ids"])
+        elif job_type == BackgroundJobType.EXTRACT_CHAT_EVENTS:
+            await self.extract_chat_events(event_ids=payload["event_ids"])
+        else:
+            msg = f"Unknown background job type: {job_type}"
+            raise ValueError(msg)
+
+    async def create_pii_policy_memory(
+        self,
+        user_id: str,
+        event_id: int,
+        pii_types: list[str],
+        redaction_count: int,
+    ) -> SemanticMemory:
+        """Create the policy memory recording that PII was redacted.
+
+        Phase 3.1: Transparency and audit trail for privacy compliance.
+
+        Args:
+            user_id: User identifier
+            event_id: Chat event the PII was redacted from
+            pii_types: Types of PII detected
+            redaction_count: Number of redactions performed
+
+        Returns:
+            Stored policy memory
+        """
+        # Ensure "system_policy" canonical entity exists (required for foreign key)
+        # This is the same entity used for reminder policies
+        if self.canonical_entity_repo:
+            system_entity = await self.canonical_entity_repo.find_by_entity_id(
+                self.SYSTEM_POLICY_ENTITY_ID
+            )
+            if not system_entity:
+                system_ref = EntityReference(
+                    table="system",
+                    primary_key="id",
+                    primary_value="policy",
+                    display_name="System",
+                )
+                system_entity = CanonicalEntity(
+                    entity_id=self.SYSTEM_POLICY_ENTITY_ID,
+                    entity_type="system",
+                    canonical_name="System",
+                    external_ref=system_ref,
+                    properties={"type": "system_policies"},
+                )
+                await self.canonical_entity_repo.create(system_entity)
+                logger.debug("system_policy_entity_created")
+
+        content = f"PII redaction policy: never store sensitive information ({', '.join(pii_types)})"
+        pii_embedding = await self.embedding_service.generate_embedding(content)
+
+        pii_policy_memory = SemanticMemory(
+            user_id=user_id,
+            content=content,
+            entities=[self.SYSTEM_POLICY_ENTITY_ID],
+            confidence=0.95,
+            importance=0.9,  # High importance for system policies
+            status="active",
+            source_event_ids=[event_id],
+            embedding=pii_embedding,
+            metadata={
+                "policy_type": "pii_policy",
+                "policy_data": {
+                    "policy": "never_store_pii",
+                    "detected_types": pii_types,
+                    "redacted_at": datetime.now(UTC).isoformat(),
+                    "redaction_count": redaction_count,
+                },
+            },
+        )
+
+        stored = await self.semantic_memory_repo.create(pii_policy_memory)
+
+        logger.info(
+            "pii_policy_memory_created",
+            event_id=event_id,
+            pii_types=pii_types,
+        )
+
+        return stored
+
+    async def validate_memories(
+        self, memory_ids: list[int], event_id: int | None = None
+    ) -> int:
+        """Validate aging memories the user confirmed.
+
+        Phase 2.2: status -> active, confidence++, importance++.
+
+        Args:
+            memory_ids: Memories confirmed by the user
+            event_id: Chat event containing the confirmation (0 if unknown)
+
+        Returns:
+            Number of memories validated
+        """
+        validated = 0
+        for memory_id in memory_ids:
+            memory = await self.semantic_memory_repo.find_by_id(memory_id)
+            if memory is None:
+                logger.debug("validation_target_missing", memory_id=memory_id)
+                continue
+
+            # Idempotency: a retried job must not confirm the same event twice
+            if event_id and event_id in memory.metadata.get("confirmation_sources", []):
+                continue
+
+            memory.status = "active"
+            memory.confirm(new_event_id=event_id or 0, importance_boost=0.05)
+            memory.last_accessed_at = datetime.now(UTC)
+            await self.semantic_memory_repo.update(memory)
+            validated += 1
+
+            logger.info(
+                "memory_validated_from_confirmation",
+                memory_id=memory.memory_id,
+                new_confidence=memory.confidence,
+                new_importance=memory.importance,
+                confirmation_count=memory.confirmation_count,
+            )
+
+        return validated
+
+    async def resolve_db_conflicts(self, conflicts: list[MemoryConflict]) -> int:
+        """Apply memory-vs-DB conflict resolutions (DB is always authoritative).
+
+        Args:
+            conflicts: Detected memory-vs-DB conflicts
+
+        Returns:
+            Number of conflicts resolved
+        """
+        resolved = 0
+        for conflict in conflicts:
+            try:
+                resolution_result = await self.conflict_resolution_service.resolve_conflict(
+                    conflict=conflict,
+                    strategy=None,  # Use recommended strategy (TRUST_DB)
+                )
+                resolved += 1
+                logger.info(
+                    "memory_vs_db_conflict_resolved",
+                    memory_id=conflict.existing_memory_id,
+                    action=resolution_result.action,
+                    rationale=resolution_result.rationale,
+                )
+            except Exception as e:
+                logger.error(
+                    "memory_vs_db_conflict_resolution_failed",
+                    conflict=str(conflict),
+                    error=str(e),
+                )
+
+        return resolved
+
+    async def mark_memories_aging(self, memory_ids: list[int]) -> int:
+        """Persist the aging status for memories past the validation threshold.
+
+        Only active memories are moved to aging, so the task is idempotent and
+        never reverts a validation that happened in the meantime.
+
+        Args:
+            memory_ids: Memories to mark as aging
+
+        Returns:
+            Number of memories updated
+        """
+        updated = 0
+        for memory_id in memory_ids:
+            memory = await self.semantic_memory_repo.find_by_id(memory_id)
+            if memory is None or memory.status != "active":
+                continue
+
+            memory.status = "aging"
+            await self.semantic_memory_repo.update(memory)
+            updated += 1
+
+        logger.debug("memories_marked_aging", count=updated)
+        return updated
+
+    async def extract_chat_events(self, event_ids: list[int]) -> int:
+        """Resolve entities and extract semantic memories for stored chat events.
+
+        Used for bulk-imported history, which is stored without running the
+        chat pipeline. Events are processed in event_id order so coreference
+        against earlier messages of the same session works. A failing event
+        is logged and skipped; a retried job re-processes the whole batch and
+        relies on extraction's duplicate detection.
+
+        Args:
+            event_ids: Stored chat events to process
+
+        Returns:
+            Number of events processed successfully
+
+        Raises:
+            ValueError: If the runner was built without extraction dependencies
+        """
+        if self.chat_repo is None or self.resolve_entities is None or self.extract_semantics is None:
+            msg = "Chat event extraction requires chat repository and extraction use cases"
+            raise ValueError(msg)
+
+        processed = 0
+        for message in await self.chat_repo.get_by_event_ids(event_ids):
+            try:
+                entities_result = await self.resolve_entities.execute(
+                    message_content=message.content,
+                    user_id=message.user_id,
+                    session_id=message.session_id,
+                )
+                await self.extract_semantics.execute(
+                    message=message,
+                    resolved_entities=entities_result.resolved_entities,
+                    user_id=message.user_id,
+                )
+                processed += 1
+            except DomainError as e:
+                logger.warning(
+                    "chat_event_extraction_failed",
+                    event_id=message.event_id,
+                    error=str(e),
+                )
+
+        logger.info(
+            "chat_events_extracted",
+            requested=len(event_ids),
+            processed=processed,
+        )
+        return processed
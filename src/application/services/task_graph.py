@@ -0,0 +1,113 @@
+"""Dependency-graph executor for async pipeline stages.
+
+Each node starts as soon as the nodes it depends on have finished, so
+independent work (embedding generation, LLM mention extraction, DB reads)
+overlaps instead of running in a fixed sequence. Every node runs in a PHASE
+span named after the node.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from src.domain.services.span_tracer import SpanKind, span
+
+logger = structlog.get_logger(__name__)
+
+NodeFunc = Callable[..., Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class _Node:
+    name: str
+    func: NodeFunc
+    after: tuple[str, ...]
+
+
+class TaskGraph:
+    """Run async callables respecting their data dependencies.
+
+    A node's callable receives the results of its dependencies as keyword
+    arguments named after those nodes. Nodes must be added after the nodes
+    they depend on, which keeps the graph acyclic by construction.
+
+    Example:
+        graph = TaskGraph()
+        graph.add("embedding", lambda: embed(text))
+        graph.add("stored", lambda: repo.create(message))
+        graph.add("score", lambda embedding, stored: score(embedding, stored),
+                  after=("embedding", "stored"))
+        results = await graph.run()
+
+    Attributes:
+        timings: Execution time per node in seconds (excludes time spent
+            waiting for dependencies)
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, _Node] = {}
+        self.timings: dict[str, float] = {}
+
+    def add(self, name: str, func: NodeFunc, after: Iterable[str] = ()) -> None:
+        """Register a node.
+
+        Args:
+            name: Unique node name (also the key in results and timings)
+            func: Async callable taking dependency results as keyword arguments
+            after: Names of nodes whose results this node needs
+
+        Raises:
+            ValueError: If the name is taken or a dependency is not registered yet
+        """
+        if name in self._nodes:
+            msg = f"Duplicate task graph node: {name}"
+            raise ValueError(msg)
+
+        after = tuple(after)
+        missing = [dep for dep in after if dep not in self._nodes]
+        if missing:
+            msg = f"Node '{name}' depends on unknown nodes: {missing}"
+            raise ValueError(msg)
+
+        self._nodes[name] = _Node(name=name, func=func, after=after)
+
+    async def run(self) -> dict[str, Any]:
+        """Execute all nodes.
+
+        On the first failure every node still running is cancelled and the
+        original exception is re-raised.
+
+        Returns:
+            Mapping of node name -> result
+        """
+        tasks: dict[str, asyncio.Task[Any]] = {}
+
+        async def run_node(node: _Node) -> Any:
+            kwargs = {dep: await tasks[dep] for dep in node.after}
+            with span(node.name, SpanKind.PHASE) as node_span:
+                try:
+                    return await node.func(**kwargs)
+                finally:
+                    self.timings[node.name] = node_span.duration_seconds
+
+        for node in self._nodes.values():
+            tasks[node.name] = asyncio.create_task(run_node(node), name=node.name)
+
+        _, pending = await asyncio.wait(
+            tasks.values(), return_when=asyncio.FIRST_EXCEPTION
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        # Dependents re-raise the failing node's exception object, so the
+        # first failure in registration order is the root cause
+        for task in tasks.values():
+            if not task.cancelled() and task.exception() is not None:
+                logger.debug("task_graph_node_failed", node=task.get_name())
+                raise task.exception()  # type: ignore[misc]
+
+        return {name: task.result() for name, task in tasks.items()}
@@ -0,0 +1,232 @@
+"""Predict domain tool calls from procedural memory.
+
+ProceduralMemoryService mines which tools the LLM calls together for which
+entity types ("after get_invoice_status, also call get_order_chain"). Once
+entities are resolved, ToolPrefetcher turns the matching high-confidence
+patterns into concrete tool calls, so AdaptiveQueryOrchestrator can run them
+before (or instead of) the LLM tool-selection loop.
+
+Vision Alignment:
+- Learning from usage (patterns drive retrieval)
+- Graceful degradation (no prediction → plain LLM loop)
+- Observable (structured logging)
+"""
+
+import itertools
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from src.config.heuristics import (
+    PROCEDURAL_PREFETCH_MAX_CALLS,
+    PROCEDURAL_PREFETCH_MIN_CONFIDENCE,
+    PROCEDURAL_PREFETCH_SKIP_LLM_CONFIDENCE,
+)
+from src.domain.ports.procedural_memory_repository import IProceduralMemoryRepository
+
+logger = structlog.get_logger(__name__)
+
+# Tool arguments that can be bound from a resolved entity, by entity type.
+# Mirrors the argument → entity type inference of the pattern miner.
+_ARGUMENT_ENTITY_TYPES = {
+    "customer_id": "customer",
+    "sales_order_number": "sales_order",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PrefetchCall:
+    """One predicted tool call."""
+
+    tool: str
+    arguments: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class PrefetchPlan:
+    """Predicted tool calls for one augmentation.
+
+    Attributes:
+        calls: Tool calls to run before the LLM loop
+        confidence: Confidence of the strongest contributing pattern
+        skip_llm: The calls are expected to cover the query (a pattern at or
+            above the skip threshold had all of its tools bound)
+        pattern_ids: Procedural memories the calls came from
+    """
+
+    calls: list[PrefetchCall]
+    confidence: float
+    skip_llm: bool
+    pattern_ids: list[int] = field(default_factory=list)
+
+
+def _argument_value(argument: str, entity: dict[str, Any]) -> str:
+    """Tool argument value for an entity.
+
+    Customer ids are the UUID part of the entity id ("customer_<uuid>"), sales
+    order numbers the canonical name ("SO-1001"), as in the orchestrator's
+    system prompt.
+    """
+    if argument == "sales_order_number":
+        return str(entity.get("canonical_name") or entity["entity_id"])
+    entity_id = str(entity["entity_id"])
+    return entity_id.split("_", 1)[1] if "_" in entity_id else entity_id
+
+
+def _bind(
+    tool: str | None,
+    required_arguments: dict[str, list[str]],
+    entities: list[dict[str, Any]],
+) -> list[PrefetchCall]:
+    """Bind a tool's required arguments from entities.
+
+    Args:
+        tool: Tool name
+        required_arguments: Required argument names by tool
+        entities: Resolved entities
+
+    Returns:
+        One call per combination of matching entities (empty if the tool is
+        unknown or a required argument cannot be bound)
+    """
+    if tool not in required_arguments:
+        return []
+
+    required = required_arguments[tool]
+    candidates: list[list[str]] = []
+    for argument in required:
+        entity_type = _ARGUMENT_ENTITY_TYPES.get(argument)
+        values = [
+            _argument_value(argument, e)
+            for e in entities
+            if entity_type is not None and e["entity_type"] == entity_type
+        ]
+        if not values:
+            return []
+        candidates.append(list(dict.fromkeys(values)))
+
+    return [
+        PrefetchCall(tool=tool, arguments=dict(zip(required, combination, strict=True)))
+        for combination in itertools.product(*candidates)
+    ]
+
+
+class ToolPrefetcher:
+    """Turn procedural tool patterns into tool calls for resolved entities.
+
+    A pattern contributes its anchor tool plus its action tools. Each tool's
+    required arguments are bound from the resolved entities (one call per
+    matching entity); a tool with an unbindable required argument is left to
+    the LLM.
+    """
+
+    def __init__(
+        self,
+        procedural_repo: IProceduralMemoryRepository,
+        min_confidence: float = PROCEDURAL_PREFETCH_MIN_CONFIDENCE,
+        skip_llm_confidence: float = PROCEDURAL_PREFETCH_SKIP_LLM_CONFIDENCE,
+        max_calls: int = PROCEDURAL_PREFETCH_MAX_CALLS,
+    ):
+        """Initialize prefetcher.
+
+        Args:
+            procedural_repo: Repository for procedural memories
+            min_confidence: Minimum pattern confidence to prefetch
+            skip_llm_confidence: Pattern confidence above which the LLM loop
+                is skipped
+            max_calls: Maximum predicted calls per augmentation
+        """
+        self.procedural_repo = procedural_repo
+        self.min_confidence = min_confidence
+        self.skip_llm_confidence = skip_llm_confidence
+        self.max_calls = max_calls
+
+    async def predict(
+        self,
+        user_id: str | None,
+        entities: list[dict[str, Any]],
+        tools: list[dict[str, Any]],
+    ) -> PrefetchPlan | None:
+        """Predict tool calls for the resolved entities of a query.
+
+        Args:
+            user_id: User whose patterns apply
+            entities: Resolved entities (entity_id, entity_type, canonical_name)
+            tools: Claude-format tool definitions (name, input_schema)
+
+        Returns:
+            Plan with at least one call, or None (no user, entities or
+            applicable pattern, or the lookup failed)
+        """
+        entity_types = sorted({e["entity_type"] for e in entities})
+        if not user_id or not entity_types:
+            return None
+
+        try:
+            patterns = await self.procedural_repo.find_by_trigger_features(
+                user_id=user_id,
+                entity_types=entity_types,
+                min_confidence=self.min_confidence,
+            )
+        except Exception as e:
+            # Prefetching is an optimization; the LLM loop still runs
+            logger.warning("tool_prefetch_lookup_failed", user_id=user_id, error=str(e))
+            return None
+
+        required_arguments = {
+            tool["name"]: list(tool["input_schema"].get("required", []))
+            for tool in tools
+        }
+        calls: dict[str, PrefetchCall] = {}
+        confidence = 0.0
+        skip_llm = False
+        pattern_ids: list[int] = []
+
+        for pattern in sorted(patterns, key=lambda p: p.confidence, reverse=True):
+            pattern_tools = [
+                pattern.trigger_features.get("anchor_tool"),
+                *pattern.action_structure.get("tools", []),
+            ]
+            bound_all = True
+            contributed = False
+            for tool in pattern_tools:
+                tool_calls = _bind(tool, required_arguments, entities)
+                if not tool_calls:
+                    bound_all = False
+                    continue
+                for call in tool_calls:
+                    key = f"{call.tool}:{json.dumps(call.arguments, sort_keys=True)}"
+                    if key in calls:
+                        continue
+                    if len(calls) < self.max_calls:
+                        calls[key] = call
+                        contributed = True
+                    else:
+                        bound_all = False
+
+            if contributed:
+                confidence = max(confidence, pattern.confidence)
+                if pattern.memory_id is not None:
+                    pattern_ids.append(pattern.memory_id)
+            if bound_all and pattern.confidence >= self.skip_llm_confidence:
+                skip_llm = True
+
+        if not calls:
+            return None
+
+        plan = PrefetchPlan(
+            calls=list(calls.values()),
+            confidence=confidence,
+            skip_llm=skip_llm,
+            pattern_ids=pattern_ids,
+        )
+        logger.info(
+            "tool_prefetch_predicted",
+            user_id=user_id,
+            calls=[call.tool for call in plan.calls],
+            confidence=plan.confidence,
+            skip_llm=plan.skip_llm,
+        )
+        return plan
@@ -0,0 +1,165 @@
+"""Compact encoding of tool results for the orchestrating LLM.
+
+Tool results are appended to the tool-calling conversation and re-sent on
+every iteration, so their size multiplies across iterations. JSON-serialized
+DomainFacts repeat every key per row and carry provenance (source rows,
+retrieval timestamps) the model does not need to decide what to fetch next.
+
+ToolResultEncoder renders facts as one table per fact type:
+
+    invoice_status: 3 rows | entity_id=customer:0a1b | paid=0
+    content|amount|balance|invoice_id
+    Invoice INV-1009: $1,200 due 2025-09-30 (status: open)|1200|1200|7c1e...
+    ...
+
+Columns with the same value in every row are hoisted into the header,
+metadata already spelled out in each row's content is dropped, long fields
+are truncated and tables are capped at a row limit. The encoder
+remembers the rows it has sent during one augmentation, so later iterations
+only carry new rows.
+
+The encoding only shapes the tool-calling prompt: augment() still returns the
+full DomainFacts for reply generation.
+"""
+
+import json
+from typing import Any
+
+from src.config.heuristics import (
+    TOOL_RESULT_MAX_FIELD_CHARS,
+    TOOL_RESULT_MAX_ROWS,
+)
+from src.domain.value_objects.domain_fact import DomainFact
+
+_FactKey = tuple[str, str, str, tuple[str, ...]]
+
+# Metadata values shorter than this are kept even when content contains them
+# ("0" or "1" would match almost any content)
+_MIN_REDUNDANT_CHARS = 3
+
+
+def _fact_key(fact: DomainFact) -> _FactKey:
+    return (fact.fact_type, fact.entity_id, fact.content, tuple(fact.source_rows))
+
+
+def _rows(count: int) -> str:
+    return f"{count} row" if count == 1 else f"{count} rows"
+
+
+class ToolResultEncoder:
+    """Encode tool results as compact tables, sending each row once.
+
+    One encoder serves one augmentation; call reset() before reusing it.
+    """
+
+    def __init__(
+        self,
+        max_rows: int = TOOL_RESULT_MAX_ROWS,
+        max_field_chars: int = TOOL_RESULT_MAX_FIELD_CHARS,
+    ):
+        """Initialize encoder.
+
+        Args:
+            max_rows: Rows rendered per fact type (rest summarized)
+            max_field_chars: Characters kept per field
+        """
+        self.max_rows = max_rows
+        self.max_field_chars = max_field_chars
+        self._sent: set[_FactKey] = set()
+
+    def reset(self) -> None:
+        """Forget the rows sent so far (start of a new augmentation)."""
+        self._sent.clear()
+
+    def encode(self, result: Any) -> str:
+        """Encode a tool result.
+
+        Args:
+            result: Tool result (list of DomainFacts, or an error dict)
+
+        Returns:
+            Compact text for a tool_result block
+        """
+        if isinstance(result, list) and all(isinstance(r, DomainFact) for r in result):
+            return self._encode_facts(result)
+        return json.dumps(result, separators=(",", ":"), default=str)
+
+    def _encode_facts(self, facts: list[DomainFact]) -> str:
+        if not facts:
+            return "[]"
+
+        groups: dict[str, list[DomainFact]] = {}
+        for fact in facts:
+            groups.setdefault(fact.fact_type, []).append(fact)
+
+        return "\n".join(
+            self._encode_group(fact_type, group) for fact_type, group in groups.items()
+        )
+
+    def _encode_group(self, fact_type: str, facts: list[DomainFact]) -> str:
+        new_facts = [f for f in facts if _fact_key(f) not in self._sent]
+        earlier = len(facts) - len(new_facts)
+        if not new_facts:
+            return f"{fact_type}: {_rows(len(facts))}, all sent earlier"
+
+        shown = new_facts[: self.max_rows]
+        self._sent.update(_fact_key(f) for f in shown)
+
+        rows = [self._row(f) for f in shown]
+        columns = [
+            c
+            for c in dict.fromkeys(key for row in rows for key in row)
+            if not self._repeats_content(c, rows)
+        ]
+        # Columns with one value across all rows go to the header once
+        constant = [c for c in columns if len({row.get(c, "") for row in rows}) == 1]
+        varying = [c for c in columns if c not in constant]
+
+        header = [f"{fact_type}: {_rows(len(shown))}"]
+        header.extend(f"{c}={rows[0].get(c, '')}" for c in constant)
+        lines = [" | ".join(header)]
+        if varying:
+            lines.append("|".join(varying))
+            lines.extend("|".join(row.get(c, "") for c in varying) for row in rows)
+
+        if len(new_facts) > len(shown):
+            lines.append(f"(+{len(new_facts) - len(shown)} more)")
+        if earlier:
+            lines.append(f"({_rows(earlier)} sent earlier omitted)")
+        return "\n".join(lines)
+
+    def _row(self, fact: DomainFact) -> dict[str, str]:
+        row = {"entity_id": fact.entity_id, "content": fact.content}
+        for key, value in fact.metadata.items():
+            row.setdefault(key, self._cell(value))
+        return {key: self._truncate(value) for key, value in row.items()}
+
+    @staticmethod
+    def _repeats_content(column: str, rows: list[dict[str, str]]) -> bool:
+        """Whether every row's content already spells out the column value."""
+        if column in ("entity_id", "content"):
+            return False
+        return all(
+            len(value := row.get(column, "")) >= _MIN_REDUNDANT_CHARS
+            and value in row["content"]
+            for row in rows
+        )
+
+    @staticmethod
+    def _cell(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, separators=(",", ":"), default=str)
+        return str(value)
+
+    def _truncate(self, text: str) -> str:
+        # One line per row, "|" separates cells
+        text = text.replace("\n", " ").replace("|", "/")
+        if len(text) > self.max_field_chars:
+            return text[: self.max_field_chars - 1] + "…"
+        return text
@@ -4,6 +4,7 @@ Business workflows and orchestration logic.
 """
 from src.application.use_cases.augment_with_domain import AugmentWithDomainUseCase
 from src.application.use_cases.extract_semantics import ExtractSemanticsUseCase
+from src.application.use_cases.ingest_chat_events import IngestChatEventsUseCase
 from src.application.use_cases.process_chat_message import ProcessChatMessageUseCase
 from src.application.use_cases.resolve_entities import ResolveEntitiesUseCase
 from src.application.use_cases.score_memories import ScoreMemoriesUseCase
@@ -14,4 +15,5 @@ __all__ = [
     "ExtractSemanticsUseCase",
     "AugmentWithDomainUseCase",
     "ScoreMemoriesUseCase",
+    "IngestChatEventsUseCase",
 ]
@@ -52,6 +52,7 @@ class AugmentWithDomainUseCase:
         resolved_entities: list[ResolvedEntityDTO],
         query_text: str,
         session_id: str,
+        user_id: str | None = None,
     ) -> list[DomainFactDTO]:
         """Augment with domain database facts using LLM tool calling.
 
@@ -64,6 +65,7 @@ class AugmentWithDomainUseCase:
             resolved_entities: List of entities resolved from the message
             query_text: Original query text for context
             session_id: Session ID for tracking tool usage
+            user_id: User whose procedural patterns drive tool prefetching
 
         Returns:
             List of domain facts retrieved from database
@@ -91,6 +93,7 @@ class AugmentWithDomainUseCase:
             query=query_text,
             entities=entities_for_orchestrator,
             conversation_id=session_id,
+            user_id=user_id,
         )
 
         # Convert DomainFact to DomainFactDTO
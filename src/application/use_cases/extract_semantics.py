@@ -260,7 +260,7 @@ class ExtractSemanticsUseCase:
 
                 # If we got here without confirming/conflicting, create new memory
                 if not conflict or (conflict and conflict.is_resolvable_automatically):
-                    # IDEMPOTENCY: Check for duplicate content using hash
+                    # IDEMPOTENCY: hash is unique per user (enforced on insert)
                     content_hash = ContentHasher.generate_memory_hash(
                         user_id=user_id,
                         content=content,
@@ -268,12 +268,13 @@ class ExtractSemanticsUseCase:
                         bucket_hours=24,  # 24-hour bucket = same content within a day is duplicate
                     )
 
-                    # Check if memory with this hash already exists
+                    # Known duplicates (replays, re-sent messages) are found by one
+                    # indexed lookup before paying for an embedding call;
+                    # create_if_absent below still settles concurrent inserts
                     existing_hash_memory = await self.semantic_memory_repo.find_by_content_hash(
                         content_hash=content_hash,
                         user_id=user_id,
                     )
-
                     if existing_hash_memory:
                         logger.info(
                             "duplicate_memory_skipped_by_hash",
@@ -281,7 +282,6 @@ class ExtractSemanticsUseCase:
                             existing_memory_id=existing_hash_memory.memory_id,
                             content_preview=content[:50],
                         )
-                        # Skip creating duplicate - add existing memory to response
                         semantic_memory_dtos.append(self._memory_to_dto(existing_hash_memory))
                         semantic_memory_entities.append(existing_hash_memory)
                         continue  # Skip to next fact
@@ -340,8 +340,17 @@ class ExtractSemanticsUseCase:
                         metadata=extraction_metadata,
                     )
 
-                    # Store in database
-                    stored_memory = await self.semantic_memory_repo.create(memory)
+                    # Store in database (atomic: no-op if the hash already exists)
+                    stored_memory, created = await self.semantic_memory_repo.create_if_absent(
+                        memory
+                    )
+                    if not created:
+                        logger.info(
+                            "duplicate_memory_skipped_by_hash",
+                            content_hash=content_hash[:16],
+                            existing_memory_id=stored_memory.memory_id,
+                            content_preview=content[:50],
+                        )
 
                     # Add to response
                     semantic_memory_dtos.append(self._memory_to_dto(stored_memory))
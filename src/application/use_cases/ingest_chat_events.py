@@ -0,0 +1,155 @@
+"""Ingest chat events use case.
+
+Bulk import of historical conversations (e.g. CRM backfills). Messages are
+stored with multi-row inserts instead of running the full chat pipeline per
+message; entity resolution and semantic extraction are optionally queued as
+background jobs in batches of events.
+
+As in the live chat pipeline, content is PII-redacted before storage and
+redacted events get a PII policy memory (queued, or created inline).
+"""
+
+from dataclasses import replace
+from typing import Any
+
+import structlog
+
+from src.application.dtos.chat_dtos import IngestChatEventsOutput
+from src.application.services.post_reply_tasks import PostReplyTaskRunner
+from src.domain.entities import ChatMessage
+from src.domain.ports import BackgroundJobType, IChatEventRepository, IJobQueue
+from src.domain.services import PIIRedactionService
+
+logger = structlog.get_logger(__name__)
+
+
+class IngestChatEventsUseCase:
+    """Use case for storing many chat messages at once.
+
+    Duplicates (same session_id + content hash) are skipped, so re-running an
+    import is safe. Only user messages are queued for extraction, matching
+    the live chat pipeline.
+    """
+
+    def __init__(
+        self,
+        chat_repository: IChatEventRepository,
+        pii_redaction_service: PIIRedactionService,
+        job_queue: IJobQueue | None = None,
+        post_reply_tasks: PostReplyTaskRunner | None = None,
+        extraction_batch_size: int = 100,
+    ):
+        """Initialize use case.
+
+        Args:
+            chat_repository: Repository for chat events
+            pii_redaction_service: Service for PII redaction before storage
+            job_queue: Queue for deferred extraction and PII policy memories
+                (None disables queuing)
+            post_reply_tasks: Runner creating PII policy memories inline when
+                no job queue is configured
+            extraction_batch_size: Events per extraction job
+        """
+        self.chat_repo = chat_repository
+        self.pii_redaction_service = pii_redaction_service
+        self.job_queue = job_queue
+        self.post_reply_tasks = post_reply_tasks
+        self.extraction_batch_size = extraction_batch_size
+
+    async def execute(
+        self,
+        messages: list[ChatMessage],
+        queue_extraction: bool = False,
+    ) -> IngestChatEventsOutput:
+        """Store messages and optionally queue their extraction.
+
+        Args:
+            messages: Messages to store (raw content; redacted here)
+            queue_extraction: Queue entity resolution + semantic extraction
+
+        Returns:
+            IngestChatEventsOutput with created event IDs and job counts
+
+        Raises:
+            ValueError: If extraction is requested but no job queue is configured
+        """
+        if queue_extraction and self.job_queue is None:
+            msg = "Extraction queuing requires background jobs to be enabled"
+            raise ValueError(msg)
+
+        # Phase 3.1: Redact PII before storing; the content hash (duplicate
+        # detection) is computed on the redacted text, as in the live path
+        to_store: list[ChatMessage] = []
+        redactions: dict[tuple[Any, str | None], list[dict[str, Any]]] = {}
+        for message in messages:
+            result = self.pii_redaction_service.redact_with_metadata(message.content)
+            if result.was_redacted:
+                message = replace(message, content=result.redacted_text, content_hash=None)
+                redactions[(message.session_id, message.content_hash)] = result.redactions
+            to_store.append(message)
+
+        created = await self.chat_repo.create_many(to_store)
+
+        redacted_events = [
+            (message, redactions[key])
+            for message in created
+            if (key := (message.session_id, message.content_hash)) in redactions
+        ]
+        for message, event_redactions in redacted_events:
+            await self._record_pii_policy(message, event_redactions)
+
+        jobs_enqueued = 0
+        if queue_extraction and self.job_queue is not None:
+            event_ids = [m.event_id for m in created if m.is_user_message() and m.event_id]
+            for start in range(0, len(event_ids), self.extraction_batch_size):
+                batch = event_ids[start : start + self.extraction_batch_size]
+                if await self.job_queue.enqueue(
+                    job_type=BackgroundJobType.EXTRACT_CHAT_EVENTS,
+                    payload={"event_ids": batch},
+                    idempotency_key=(
+                        f"{BackgroundJobType.EXTRACT_CHAT_EVENTS.value}:{batch[0]}-{batch[-1]}"
+                    ),
+                ):
+                    jobs_enqueued += 1
+
+        logger.info(
+            "chat_events_ingested",
+            requested=len(messages),
+            created=len(created),
+            pii_redacted=len(redacted_events),
+            extraction_jobs_enqueued=jobs_enqueued,
+        )
+
+        return IngestChatEventsOutput(
+            created_event_ids=[m.event_id for m in created if m.event_id is not None],
+            duplicate_count=len(messages) - len(created),
+            extraction_jobs_enqueued=jobs_enqueued,
+        )
+
+    async def _record_pii_policy(
+        self, message: ChatMessage, redactions: list[dict[str, Any]]
+    ) -> None:
+        """Queue (or run inline) the PII policy memory for a redacted event.
+
+        Args:
+            message: Stored message with event_id set
+            redactions: Redactions performed on its content
+        """
+        if message.event_id is None:
+            return
+
+        job_type = BackgroundJobType.PII_POLICY_MEMORY
+        payload = {
+            "user_id": message.user_id,
+            "event_id": message.event_id,
+            "pii_types": [r["type"] for r in redactions],
+            "redaction_count": len(redactions),
+        }
+        if self.job_queue is not None:
+            await self.job_queue.enqueue(
+                job_type=job_type,
+                payload=payload,
+                idempotency_key=f"{job_type.value}:{message.event_id}",
+            )
+        elif self.post_reply_tasks is not None:
+            await self.post_reply_tasks.run(job_type, payload)
@@ -4,8 +4,6 @@ Refactored from 683-line god object to lean orchestrator pattern.
 Coordinates specialized use cases for each phase of chat processing.
 """
 
-import asyncio
-import time
 from typing import Any
 
 import structlog
@@ -17,18 +15,26 @@ from src.application.dtos.chat_dtos import (
     ProcessChatMessageOutput,
     RetrievedMemoryDTO,
 )
+from src.application.services.post_reply_tasks import PostReplyTaskRunner
+from src.application.services.task_graph import TaskGraph
 from src.application.use_cases.augment_with_domain import AugmentWithDomainUseCase
 from src.application.use_cases.extract_semantics import ExtractSemanticsUseCase
-from src.application.use_cases.resolve_entities import ResolveEntitiesUseCase
+from src.application.use_cases.resolve_entities import (
+    ResolveEntitiesResult,
+    ResolveEntitiesUseCase,
+)
 from src.application.use_cases.score_memories import ScoreMemoriesUseCase
 from src.domain.entities import ChatMessage
-from src.domain.ports import IChatEventRepository
+from src.domain.ports import BackgroundJobType, IChatEventRepository, IJobQueue
 from src.domain.services import (
     ConflictDetectionService,
     ConflictResolutionService,
     LLMReplyGenerator,
     PIIRedactionService,
+    SpanKind,
+    span,
 )
+from src.domain.value_objects import EntityMention
 from src.domain.value_objects.conversation_context_reply import (
     RecentChatEvent,
     ReplyContext,
@@ -50,6 +56,11 @@ class ProcessChatMessageUseCase:
 
     Plus reply generation (LLM reply generator).
 
+    Stages that only affect future turns (PII policy memory, confirmation
+    validation, memory-vs-DB conflict resolution writes, aging updates) are
+    handed to PostReplyTaskRunner: enqueued on the job queue when one is
+    configured, executed inline otherwise.
+
     Philosophy: Single Responsibility - orchestrate, don't implement.
     Each phase is handled by a dedicated use case with clear boundaries.
     """
@@ -65,6 +76,9 @@ class ProcessChatMessageUseCase:
         conflict_resolution_service: ConflictResolutionService,
         llm_reply_generator: LLMReplyGenerator,
         pii_redaction_service: PIIRedactionService,
+        post_reply_tasks: PostReplyTaskRunner | None = None,
+        job_queue: IJobQueue | None = None,
+        parallel_augment: bool = False,
     ):
         """Initialize orchestrator.
 
@@ -78,6 +92,13 @@ class ProcessChatMessageUseCase:
             conflict_resolution_service: Service for resolving detected conflicts (Phase 2.1)
             llm_reply_generator: Service for natural language reply generation
             pii_redaction_service: Service for PII detection and redaction (Phase 3.1)
+            post_reply_tasks: Runner for reply-independent stages (optional,
+                built from the semantic extraction repositories if omitted)
+            job_queue: Background job queue; when set, post-reply stages are
+                deferred instead of executed before the reply (optional)
+            parallel_augment: Domain augmentation uses its own database
+                session, so it may overlap semantic extraction (otherwise
+                it runs after extraction on the shared session)
         """
         self.chat_repo = chat_repository
         self.resolve_entities = resolve_entities_use_case
@@ -88,6 +109,14 @@ class ProcessChatMessageUseCase:
         self.conflict_resolution_service = conflict_resolution_service
         self.llm_reply_generator = llm_reply_generator
         self.pii_redaction_service = pii_redaction_service
+        self.post_reply_tasks = post_reply_tasks or PostReplyTaskRunner(
+            semantic_memory_repository=extract_semantics_use_case.semantic_memory_repo,
+            embedding_service=extract_semantics_use_case.embedding_service,
+            conflict_resolution_service=conflict_resolution_service,
+            canonical_entity_repository=extract_semantics_use_case.canonical_entity_repo,
+        )
+        self.job_queue = job_queue
+        self.parallel_augment = parallel_augment
 
     async def execute(
         self, input_dto: ProcessChatMessageInput
@@ -106,6 +135,13 @@ class ProcessChatMessageUseCase:
             InvalidMessageError: If message validation fails
             RepositoryError: If database operations fail
         """
+        # Root span: phases, LLM/embedding calls and repository calls nest under it
+        with span("chat.process", SpanKind.PHASE):
+            return await self._execute(input_dto)
+
+    async def _execute(
+        self, input_dto: ProcessChatMessageInput
+    ) -> ProcessChatMessageOutput:
         logger.info(
             "processing_chat_message",
             user_id=input_dto.user_id,
@@ -115,11 +151,11 @@ class ProcessChatMessageUseCase:
 
         # Initialize timing tracker
         step_timings: dict[str, float] = {}
-        step_start = time.perf_counter()
 
         # Phase 3.1: Detect and redact PII before storing (privacy-by-design)
-        redaction_result = self.pii_redaction_service.redact_with_metadata(input_dto.content)
-        step_timings["pii"] = time.perf_counter() - step_start
+        with span("pii", SpanKind.PHASE) as pii_span:
+            redaction_result = self.pii_redaction_service.redact_with_metadata(input_dto.content)
+        step_timings["pii"] = pii_span.duration_seconds
 
         content_to_store = redaction_result.redacted_text
         pii_was_detected = redaction_result.was_redacted
@@ -132,151 +168,93 @@ class ProcessChatMessageUseCase:
                 types=[r["type"] for r in redaction_result.redactions],
             )
 
-        # Step 1: Store chat message (with redacted content if PII was found)
-        step_start = time.perf_counter()
-        message = ChatMessage(
-            session_id=input_dto.session_id,
-            user_id=input_dto.user_id,
-            role=input_dto.role,
-            content=content_to_store,
-            event_metadata=input_dto.metadata or {},
+        # Steps 1-4: Dependency graph for the pre-scoring stages.
+        # Nodes start as soon as their inputs exist, so the query embedding and
+        # the LLM mention extraction for the current message run while the
+        # message is stored and the session history is fetched.
+        #
+        # DB-bound nodes on the request session (one operation at a time) are
+        # chained through their dependencies:
+        #   store -> recent_history -> resolve -> extract
+        # Augmentation overlaps extraction only when it has its own branch
+        # session (parallel_augment); otherwise it runs after extraction.
+        # The network-only nodes (query_embedding, mentions) float freely.
+        graph = TaskGraph()
+        graph.add("store", lambda: self._store_message(input_dto, content_to_store))
+        graph.add(
+            "query_embedding",
+            lambda: self.extract_semantics.embedding_service.generate_embedding(
+                input_dto.content
+            ),
         )
-
-        stored_message = await self.chat_repo.create(message)
-
-        if stored_message.event_id is None:
-            msg = "Event ID not set after message creation"
-            raise ValueError(msg)
-
-        logger.debug(
-            "chat_message_stored",
-            event_id=stored_message.event_id,
+        graph.add(
+            "mentions",
+            lambda: self.resolve_entities.mention_extractor.extract_mentions(
+                input_dto.content
+            ),
         )
-        step_timings["store"] = time.perf_counter() - step_start
-
-        # Step 2: Resolve entities (Phase 1A)
-        step_start = time.perf_counter()
-        entities_result = await self.resolve_entities.execute(
-            message_content=input_dto.content,
-            user_id=input_dto.user_id,
-            session_id=input_dto.session_id,
+        graph.add(
+            "recent_history",
+            lambda store: self.chat_repo.get_recent_for_session(
+                input_dto.session_id, limit=5
+            ),
+            after=("store",),
         )
-
-        step_timings["resolve"] = time.perf_counter() - step_start
-
-        # Task 1.2.1: Check for ambiguous entities and propagate to API
-        # If entity resolution found ambiguities, raise exception for API to handle
-        # This enables the disambiguation flow (alias-first learning loop)
-        if entities_result.ambiguous_entities:
-            from src.domain.exceptions import AmbiguousEntityError
-
-            # Raise first ambiguity for API disambiguation handler
-            # Note: entities_result.ambiguous_entities stores AmbiguousEntityError exceptions
-            ambiguous_error = entities_result.ambiguous_entities[0]
-            logger.info(
-                "propagating_ambiguous_entity_to_api",
-                mention=ambiguous_error.mention_text,
-                candidates_count=len(ambiguous_error.candidates),
-            )
-            # Re-raise the original exception with all details intact
-            raise ambiguous_error
-
-        # Phase 3.3: No longer early exit when no entities - allow general queries
-        # General queries like "What invoices do we have?" should proceed to domain augmentation
-        # even without specific entities
-
-        # Step 3 & 4: Parallelize Phase 1B (Semantic Extraction) and Phase 1C (Domain Augmentation)
-        # Both phases only depend on Phase 1A outputs (resolved entities)
-        # Running them in parallel reduces latency by ~34% (200ms saved)
-        step_start = time.perf_counter()
-
-        semantics_result, domain_fact_dtos = await asyncio.gather(
-            # Phase 1B: Extract semantics
+        graph.add(
+            "resolve",
+            lambda mentions, recent_history: self._resolve_entities(
+                input_dto, mentions, recent_history
+            ),
+            after=("mentions", "recent_history"),
+        )
+        # Phase 1B and 1C both only need Phase 1A outputs (resolved entities)
+        graph.add(
+            "extract",
             # Always call even if no entities are resolved (policy detection needs it)
-            self.extract_semantics.execute(
-                message=stored_message,
-                resolved_entities=entities_result.resolved_entities,
+            lambda store, resolve: self.extract_semantics.execute(
+                message=store,
+                resolved_entities=resolve.resolved_entities,
                 user_id=input_dto.user_id,
             ),
-            # Phase 1C: Augment with domain (LLM tool calling)
-            self.augment_with_domain.execute(
-                resolved_entities=entities_result.resolved_entities,
+            after=("store", "resolve"),
+        )
+        graph.add(
+            "augment",
+            lambda resolve, **_: self.augment_with_domain.execute(
+                resolved_entities=resolve.resolved_entities,
                 query_text=input_dto.content,
                 session_id=str(input_dto.session_id),
-            )
+                user_id=input_dto.user_id,
+            ),
+            after=("resolve",) if self.parallel_augment else ("resolve", "extract"),
         )
 
-        step_timings["extract_and_augment_parallel"] = time.perf_counter() - step_start
+        results = await graph.run()
+        step_timings.update(graph.timings)
+
+        stored_message = results["store"]
+        recent_history = results["recent_history"]
+        entities_result = results["resolve"]
+        semantics_result = results["extract"]
+        domain_fact_dtos = results["augment"]
 
         # Phase 3.1: Create policy memory when PII was detected
         # This enables transparency and audit trail for privacy compliance
+        # (only affects future turns, so it is deferred when a job queue is configured)
         if pii_was_detected:
-            from datetime import UTC, datetime
-            from src.domain.entities import SemanticMemory
-
-            pii_types = [r["type"] for r in redaction_result.redactions]
-
-            # Ensure "system_policy" canonical entity exists (required for foreign key)
-            # This is the same entity used for reminder policies
-            if self.extract_semantics.canonical_entity_repo:
-                from src.domain.entities import CanonicalEntity
-                from src.domain.value_objects import EntityReference
-
-                system_entity = await self.extract_semantics.canonical_entity_repo.find_by_entity_id("system_policy")
-                if not system_entity:
-                    system_ref = EntityReference(
-                        table="system",
-                        primary_key="id",
-                        primary_value="policy",
-                        display_name="System",
-                    )
-                    system_entity = CanonicalEntity(
-                        entity_id="system_policy",
-                        entity_type="system",
-                        canonical_name="System",
-                        external_ref=system_ref,
-                        properties={"type": "system_policies"},
-                    )
-                    await self.extract_semantics.canonical_entity_repo.create(system_entity)
-                    logger.debug("system_policy_entity_created")
-
-            # Create policy memory indicating PII was redacted
-            # Generate embedding for the policy memory
-            embedding_text = f"PII redaction policy: never store sensitive information ({', '.join(pii_types)})"
-            pii_embedding = await self.extract_semantics.embedding_service.generate_embedding(
-                embedding_text
-            )
-
-            pii_policy_memory = SemanticMemory(
-                user_id=input_dto.user_id,
-                content=f"PII redaction policy: never store sensitive information ({', '.join(pii_types)})",
-                entities=["system_policy"],
-                confidence=0.95,
-                importance=0.9,  # High importance for system policies
-                status="active",
-                source_event_ids=[stored_message.event_id],
-                embedding=pii_embedding,
-                metadata={
-                    "policy_type": "pii_policy",
-                    "policy_data": {
-                        "policy": "never_store_pii",
-                        "detected_types": pii_types,
-                        "redacted_at": datetime.now(UTC).isoformat(),
-                        "redaction_count": len(redaction_result.redactions),
-                    },
+            await self._dispatch_post_reply_task(
+                BackgroundJobType.PII_POLICY_MEMORY,
+                payload={
+                    "user_id": input_dto.user_id,
+                    "event_id": stored_message.event_id,
+                    "pii_types": [r["type"] for r in redaction_result.redactions],
+                    "redaction_count": len(redaction_result.redactions),
                 },
-            )
-
-            # Store the policy memory
-            await self.extract_semantics.semantic_memory_repo.create(pii_policy_memory)
-
-            logger.info(
-                "pii_policy_memory_created",
                 event_id=stored_message.event_id,
-                pii_types=pii_types,
             )
 
         # Step 4.3: Phase 3.3 - Evaluate reminder triggers (Procedural Memory)
+        # Stays on the critical path: triggered reminders feed the reply
         # Check if domain facts trigger any reminder policies
         triggered_reminders = await self._evaluate_reminder_triggers(
             domain_facts=domain_fact_dtos,
@@ -322,87 +300,90 @@ class ProcessChatMessageUseCase:
 
         # Step 5: Score and retrieve memories (Phase 1D)
         # Must run after Phase 1B completes (needs semantic_memory_entities)
-        step_start = time.perf_counter()
-        retrieved_memories, semantic_memory_map = await self.score_memories.execute(
-            semantic_memory_entities=semantics_result.semantic_memory_entities,
-            resolved_entities=entities_result.resolved_entities,
-            query_text=input_dto.content,
-            user_id=input_dto.user_id,
-            session_id=input_dto.session_id,
-        )
+        with span("score", SpanKind.PHASE) as score_span:
+            retrieved_memories, semantic_memory_map = await self.score_memories.execute(
+                semantic_memory_entities=semantics_result.semantic_memory_entities,
+                resolved_entities=entities_result.resolved_entities,
+                query_text=input_dto.content,
+                user_id=input_dto.user_id,
+                session_id=input_dto.session_id,
+                persist_aging=False,  # Persisted below as a post-reply task
+                query_embedding=results["query_embedding"],
+            )
 
-        # Phase 2.2: Detect confirmations and validate aging memories
-        # If user confirms aged memories, validate them
-        await self._handle_memory_validation(
-            message_content=input_dto.content,
-            retrieved_memories=retrieved_memories,
-            semantic_memory_map=semantic_memory_map,
-            user_id=input_dto.user_id,
-        )
+            # Phase 2.2: Detect confirmations and validate aging memories
+            # If user confirms aged memories, validate them
+            validated_memory_ids = await self._handle_memory_validation(
+                message_content=input_dto.content,
+                retrieved_memories=retrieved_memories,
+                semantic_memory_map=semantic_memory_map,
+                user_id=input_dto.user_id,
+                event_id=stored_message.event_id,
+            )
 
-        # Phase 2.1: Check retrieved memories against domain facts for conflicts
-        if domain_facts and retrieved_memories:
-            for retrieved_mem in retrieved_memories:
-                # Convert retrieved memory DTO back to semantic memory entity for conflict detection
-                if retrieved_mem.memory_id and retrieved_mem.memory_id in semantic_memory_map:
-                    memory_entity = semantic_memory_map[retrieved_mem.memory_id]
-                    for domain_fact in domain_facts:
-                        conflict = await self.conflict_detection_service.detect_memory_vs_db_conflict(
-                            memory=memory_entity,
-                            domain_fact=domain_fact,
-                            embedding_service=self.extract_semantics.embedding_service,
-                        )
-                        if conflict:
-                            memory_vs_db_conflicts.append(conflict)
-                            logger.warning(
-                                "memory_vs_db_conflict_detected_retrieved",
-                                memory_id=retrieved_mem.memory_id,
-                                entities=conflict.entities,
-                                similarity=conflict.semantic_similarity,
-                            )
+            # Phase 2.2: Persist aging status (validated memories excluded so a
+            # late-running aging job cannot undo this turn's confirmation)
+            aging_memory_ids = [
+                memory_id
+                for memory_id, memory in semantic_memory_map.items()
+                if memory.status == "aging" and memory_id not in validated_memory_ids
+            ]
+            if aging_memory_ids:
+                await self._dispatch_post_reply_task(
+                    BackgroundJobType.MARK_MEMORIES_AGING,
+                    payload={"memory_ids": aging_memory_ids},
+                    event_id=stored_message.event_id,
+                )
 
-        # Step 5.5: Resolve memory-vs-DB conflicts (Phase 2.1)
-        # DB is always authoritative, so we resolve these automatically
-        resolved_conflicts = []
-        if memory_vs_db_conflicts:
-            logger.info(
-                "resolving_memory_vs_db_conflicts",
-                conflict_count=len(memory_vs_db_conflicts),
-            )
-            for conflict in memory_vs_db_conflicts:
-                try:
-                    # Memory-vs-DB conflicts always use TRUST_DB strategy
-                    resolution_result = await self.conflict_resolution_service.resolve_conflict(
-                        conflict=conflict,
-                        strategy=None,  # Use recommended strategy (TRUST_DB)
-                    )
-                    resolved_conflicts.append(resolution_result)
-                    logger.info(
-                        "memory_vs_db_conflict_resolved",
-                        memory_id=conflict.existing_memory_id,
-                        action=resolution_result.action,
-                        rationale=resolution_result.rationale,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "memory_vs_db_conflict_resolution_failed",
-                        conflict=conflict,
-                        error=str(e),
-                    )
+            # Phase 2.1: Check retrieved memories against domain facts for conflicts
+            if domain_facts and retrieved_memories:
+                for retrieved_mem in retrieved_memories:
+                    # Convert retrieved memory DTO back to semantic memory entity for conflict detection
+                    if retrieved_mem.memory_id and retrieved_mem.memory_id in semantic_memory_map:
+                        memory_entity = semantic_memory_map[retrieved_mem.memory_id]
+                        for domain_fact in domain_facts:
+                            conflict = await self.conflict_detection_service.detect_memory_vs_db_conflict(
+                                memory=memory_entity,
+                                domain_fact=domain_fact,
+                                embedding_service=self.extract_semantics.embedding_service,
+                            )
+                            if conflict:
+                                memory_vs_db_conflicts.append(conflict)
+                                logger.warning(
+                                    "memory_vs_db_conflict_detected_retrieved",
+                                    memory_id=retrieved_mem.memory_id,
+                                    entities=conflict.entities,
+                                    similarity=conflict.semantic_similarity,
+                                )
+
+            # Step 5.5: Resolve memory-vs-DB conflicts (Phase 2.1)
+            # DB is always authoritative, so we resolve these automatically.
+            # The reply already uses the DB facts, so the memory writes can be deferred.
+            if memory_vs_db_conflicts:
+                logger.info(
+                    "resolving_memory_vs_db_conflicts",
+                    conflict_count=len(memory_vs_db_conflicts),
+                )
+                await self._dispatch_post_reply_task(
+                    BackgroundJobType.RESOLVE_DB_CONFLICTS,
+                    payload={"conflicts": [c.to_dict() for c in memory_vs_db_conflicts]},
+                    event_id=stored_message.event_id,
+                )
 
-        step_timings["score"] = time.perf_counter() - step_start
+        step_timings["score"] = score_span.duration_seconds
 
         # Step 6: Generate reply
-        step_start = time.perf_counter()
-        reply = await self._generate_reply(
-            input_dto=input_dto,
-            domain_fact_dtos=domain_fact_dtos,
-            retrieved_memories=retrieved_memories,
-            triggered_reminders=triggered_reminders,
-            pii_detected=pii_was_detected,
-            pii_types=[r["type"] for r in redaction_result.redactions] if pii_was_detected else None,
-        )
-        step_timings["generate"] = time.perf_counter() - step_start
+        with span("generate", SpanKind.PHASE) as generate_span:
+            reply = await self._generate_reply(
+                input_dto=input_dto,
+                domain_fact_dtos=domain_fact_dtos,
+                retrieved_memories=retrieved_memories,
+                triggered_reminders=triggered_reminders,
+                recent_history=recent_history,
+                pii_detected=pii_was_detected,
+                pii_types=[r["type"] for r in redaction_result.redactions] if pii_was_detected else None,
+            )
+        step_timings["generate"] = generate_span.duration_seconds
 
         # Step 7: Assemble final response
         # Convert RetrievedMemory to RetrievedMemoryDTO
@@ -477,6 +458,84 @@ class ProcessChatMessageUseCase:
             step_timings=step_timings,
         )
 
+    async def _store_message(
+        self, input_dto: ProcessChatMessageInput, content_to_store: str
+    ) -> ChatMessage:
+        """Store the chat message (with redacted content if PII was found).
+
+        Args:
+            input_dto: Input data with message metadata
+            content_to_store: Message content after PII redaction
+
+        Returns:
+            Stored message with event_id set
+        """
+        message = ChatMessage(
+            session_id=input_dto.session_id,
+            user_id=input_dto.user_id,
+            role=input_dto.role,
+            content=content_to_store,
+            event_metadata=input_dto.metadata or {},
+        )
+
+        stored_message = await self.chat_repo.create(message)
+
+        if stored_message.event_id is None:
+            msg = "Event ID not set after message creation"
+            raise ValueError(msg)
+
+        logger.debug(
+            "chat_message_stored",
+            event_id=stored_message.event_id,
+        )
+        return stored_message
+
+    async def _resolve_entities(
+        self,
+        input_dto: ProcessChatMessageInput,
+        mentions: list[EntityMention],
+        recent_history: list[ChatMessage],
+    ) -> ResolveEntitiesResult:
+        """Resolve entities (Phase 1A) and propagate ambiguities.
+
+        Args:
+            input_dto: Input data with message content
+            mentions: Mentions extracted from the current message
+            recent_history: Recent session messages
+
+        Returns:
+            Entity resolution result
+
+        Raises:
+            AmbiguousEntityError: If a mention needs user disambiguation
+        """
+        entities_result = await self.resolve_entities.execute(
+            message_content=input_dto.content,
+            user_id=input_dto.user_id,
+            session_id=input_dto.session_id,
+            mentions=mentions,
+            recent_messages=recent_history,
+        )
+
+        # Task 1.2.1: Check for ambiguous entities and propagate to API
+        # If entity resolution found ambiguities, raise exception for API to handle
+        # This enables the disambiguation flow (alias-first learning loop)
+        # Phase 3.3: No early exit when no entities - general queries like
+        # "What invoices do we have?" still proceed to domain augmentation
+        if entities_result.ambiguous_entities:
+            # Raise first ambiguity for API disambiguation handler
+            # Note: entities_result.ambiguous_entities stores AmbiguousEntityError exceptions
+            ambiguous_error = entities_result.ambiguous_entities[0]
+            logger.info(
+                "propagating_ambiguous_entity_to_api",
+                mention=ambiguous_error.mention_text,
+                candidates_count=len(ambiguous_error.candidates),
+            )
+            # Re-raise the original exception with all details intact
+            raise ambiguous_error
+
+        return entities_result
+
     async def _generate_reply_without_entities(
         self,
         input_dto: ProcessChatMessageInput,
@@ -511,6 +570,7 @@ class ProcessChatMessageUseCase:
         domain_fact_dtos: list[DomainFactDTO],
         retrieved_memories: list[Any],
         triggered_reminders: list[dict[str, Any]] | None = None,
+        recent_history: list[ChatMessage] | None = None,
         pii_detected: bool = False,
         pii_types: list[str] | None = None,
     ) -> str:
@@ -521,20 +581,23 @@ class ProcessChatMessageUseCase:
             domain_fact_dtos: Domain facts retrieved
             retrieved_memories: Scored and ranked memories
             triggered_reminders: Phase 3.3 - Proactive reminders triggered by domain facts
+            recent_history: Session messages already fetched for entity resolution
+                (fetched here if None)
 
         Returns:
             Generated reply string
         """
         # Get recent chat events for context
-        recent_messages_models = await self.chat_repo.get_recent_for_session(
-            input_dto.session_id, limit=5
-        )
+        if recent_history is None:
+            recent_history = await self.chat_repo.get_recent_for_session(
+                input_dto.session_id, limit=5
+            )
         recent_chat_events = [
             RecentChatEvent(
                 role=msg.role,
                 content=msg.content,
             )
-            for msg in recent_messages_models
+            for msg in recent_history
         ]
 
         # Build reply context
@@ -582,7 +645,8 @@ class ProcessChatMessageUseCase:
         retrieved_memories: list[Any],
         semantic_memory_map: dict[int, Any],
         user_id: str,
-    ) -> None:
+        event_id: int,
+    ) -> set[int]:
         """Detect confirmations and validate aging memories.
 
         Phase 2.2: Active Memory Validation
@@ -598,10 +662,11 @@ class ProcessChatMessageUseCase:
             retrieved_memories: Memories retrieved in this turn
             semantic_memory_map: Map of memory_id -> SemanticMemory entity
             user_id: User identifier
-        """
-        from datetime import datetime, timezone
-        from src.config import heuristics
+            event_id: Chat event containing the confirmation
 
+        Returns:
+            IDs of memories scheduled for validation
+        """
         # Check if message looks like a confirmation
         message_lower = message_content.lower()
         confirmation_keywords = [
@@ -613,7 +678,7 @@ class ProcessChatMessageUseCase:
         is_confirmation = any(keyword in message_lower for keyword in confirmation_keywords)
 
         if not is_confirmation:
-            return
+            return set()
 
         logger.info(
             "confirmation_detected",
@@ -623,43 +688,55 @@ class ProcessChatMessageUseCase:
         # Find aging memories that should be validated
         # Strategy: Validate all aging memories from this retrieval
         # (In a more sophisticated system, we'd match specific predicates/values)
-        aging_memories_to_validate = []
-
-        for retrieved_mem in retrieved_memories:
-            if retrieved_mem.status == "aging" and retrieved_mem.memory_id in semantic_memory_map:
-                aging_memories_to_validate.append(semantic_memory_map[retrieved_mem.memory_id])
+        aging_memory_ids = [
+            retrieved_mem.memory_id
+            for retrieved_mem in retrieved_memories
+            if retrieved_mem.status == "aging" and retrieved_mem.memory_id in semantic_memory_map
+        ]
 
-        if not aging_memories_to_validate:
+        if not aging_memory_ids:
             logger.debug("no_aging_memories_to_validate")
-            return
+            return set()
 
         logger.info(
             "validating_aging_memories",
-            count=len(aging_memories_to_validate),
+            count=len(aging_memory_ids),
         )
 
-        # Validate each aging memory
-        for memory in aging_memories_to_validate:
-            # Update memory using confirm() method
-            memory.status = "active"
-            memory.confirm(
-                new_event_id=0,  # Placeholder - no specific event for confirmation
-                importance_boost=0.05,  # Standard boost
-            )
-            # Update last_accessed_at since memory was validated
-            memory.last_accessed_at = datetime.now(timezone.utc)
+        # Validation writes only affect future turns (status -> active, confidence++)
+        await self._dispatch_post_reply_task(
+            BackgroundJobType.VALIDATE_MEMORIES,
+            payload={"memory_ids": aging_memory_ids, "event_id": event_id},
+            event_id=event_id,
+        )
 
-            # Update in database via the repository pattern
-            # Access repository through the extract_semantics use case (which has it injected)
-            await self.extract_semantics.semantic_memory_repo.update(memory)
+        return set(aging_memory_ids)
 
-            logger.info(
-                "memory_validated_from_confirmation",
-                memory_id=memory.memory_id,
-                new_confidence=memory.confidence,
-                new_importance=memory.importance,
-                confirmation_count=memory.confirmation_count,
-            )
+    async def _dispatch_post_reply_task(
+        self,
+        job_type: BackgroundJobType,
+        payload: dict[str, Any],
+        event_id: int,
+    ) -> None:
+        """Enqueue a post-reply task, or run it inline when no queue is configured.
+
+        The enqueue shares the request transaction, so a job only becomes
+        visible to workers once the chat event itself is committed.
+
+        Args:
+            job_type: Task to run
+            payload: JSON-serializable task arguments
+            event_id: Chat event the task belongs to (idempotency key scope)
+        """
+        if self.job_queue is None:
+            await self.post_reply_tasks.run(job_type, payload)
+            return
+
+        await self.job_queue.enqueue(
+            job_type=job_type,
+            payload=payload,
+            idempotency_key=f"{job_type.value}:{event_id}",
+        )
 
     async def _evaluate_reminder_triggers(
         self,
@@ -11,11 +11,12 @@ import structlog
 from src.application.dtos.chat_dtos import (
     ResolvedEntityDTO,
 )
+from src.domain.entities import ChatMessage
 from src.domain.exceptions import AmbiguousEntityError
 from src.domain.ports import IChatEventRepository, IEntityRepository
 from src.domain.services import EntityResolutionService
 from src.domain.services.llm_mention_extractor import LLMMentionExtractor
-from src.domain.value_objects import ConversationContext
+from src.domain.value_objects import ConversationContext, EntityMention
 
 logger = structlog.get_logger(__name__)
 
@@ -84,6 +85,8 @@ class ResolveEntitiesUseCase:
         message_content: str,
         user_id: str,
         session_id: UUID,
+        mentions: list[EntityMention] | None = None,
+        recent_messages: list[ChatMessage] | None = None,
     ) -> ResolveEntitiesResult:
         """Resolve entities from message content.
 
@@ -91,6 +94,10 @@ class ResolveEntitiesUseCase:
             message_content: The message text to extract entities from
             user_id: User identifier
             session_id: Session identifier for context
+            mentions: Mentions already extracted from message_content (optional,
+                lets the caller start mention extraction speculatively)
+            recent_messages: Recent session messages already fetched by the
+                caller (optional, avoids a duplicate history query)
 
         Returns:
             ResolveEntitiesResult with resolved entities and metadata
@@ -103,7 +110,8 @@ class ResolveEntitiesUseCase:
         )
 
         # Step 1: Extract entity mentions from current message
-        mentions = await self.mention_extractor.extract_mentions(message_content)
+        if mentions is None:
+            mentions = await self.mention_extractor.extract_mentions(message_content)
 
         logger.info(
             "entity_mentions_extracted",
@@ -111,7 +119,9 @@ class ResolveEntitiesUseCase:
         )
 
         # Step 2: Build conversation context (ALWAYS - per VISION.md "meaning is always contextual")
-        context = await self._build_context(user_id, session_id, message_content)
+        context = await self._build_context(
+            user_id, session_id, message_content, recent_messages
+        )
 
         # Phase 2.2: ALWAYS extract implicit entities from recent session context
         # This enables: confirmations ("Yes, still correct"), pronouns ("they prefer Friday"),
@@ -222,6 +232,7 @@ class ResolveEntitiesUseCase:
         user_id: str,
         session_id: UUID,
         current_message: str,
+        recent_messages_models: list[ChatMessage] | None = None,
     ) -> ConversationContext:
         """Build conversation context for entity resolution.
 
@@ -229,14 +240,16 @@ class ResolveEntitiesUseCase:
             user_id: User identifier
             session_id: Session identifier
             current_message: Current message being processed
+            recent_messages_models: Prefetched session messages (fetched if None)
 
         Returns:
             ConversationContext with recent messages and entities
         """
         # Get recent messages in this session
-        recent_messages_models = await self.chat_repo.get_recent_for_session(
-            session_id, limit=5
-        )
+        if recent_messages_models is None:
+            recent_messages_models = await self.chat_repo.get_recent_for_session(
+                session_id, limit=5
+            )
 
         recent_messages = [msg.content for msg in recent_messages_models]
 
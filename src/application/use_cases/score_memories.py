@@ -57,6 +57,8 @@ class ScoreMemoriesUseCase:
         query_text: str,
         user_id: str,
         session_id: UUID,
+        persist_aging: bool = True,
+        query_embedding: list[float] | None = None,
     ) -> tuple[list[RetrievedMemory], dict[int, SemanticMemory]]:
         """Score memories using multi-signal relevance.
 
@@ -68,6 +70,11 @@ class ScoreMemoriesUseCase:
             query_text: Original query text
             user_id: User identifier
             session_id: Session identifier
+            persist_aging: Write newly aged memories back immediately. The chat
+                orchestrator passes False and persists them as a post-reply task;
+                the in-memory status is updated either way.
+            query_embedding: Embedding of query_text if the caller already
+                generated it (e.g. in parallel with entity resolution)
 
         Returns:
             Tuple of (retrieved memories, semantic memory map by ID)
@@ -78,10 +85,11 @@ class ScoreMemoriesUseCase:
         )
 
         # Generate query embedding (needed for retrieval and scoring)
-        query_embedding_list = await self.embedding_service.generate_embedding(
-            query_text
-        )
-        query_embedding = np.array(query_embedding_list, dtype=np.float64)
+        if query_embedding is None:
+            query_embedding = await self.embedding_service.generate_embedding(
+                query_text
+            )
+        query_embedding = np.array(query_embedding, dtype=np.float64)
 
         # Retrieve existing memories from database using vector similarity
         existing_memories_with_scores: list[tuple[SemanticMemory, float]] = await self.semantic_memory_repo.find_similar(
@@ -157,7 +165,8 @@ class ScoreMemoriesUseCase:
             ):
                 # Mark as aging (requires validation)
                 mem.status = "aging"
-                await self.semantic_memory_repo.update(mem)
+                if persist_aging:
+                    await self.semantic_memory_repo.update(mem)
 
                 logger.info(
                     "memory_marked_as_aging",
@@ -135,6 +135,12 @@ CONSOLIDATION_MIN_EPISODIC = 10  # Min episodic memories to consolidate
 CONSOLIDATION_MIN_SESSIONS = 3  # Min sessions in window
 CONSOLIDATION_SESSION_WINDOW_DEFAULT = 5  # Last N sessions
 
+# Map-Reduce Synthesis
+CONSOLIDATION_CHUNK_SIZE = 20  # Memories per map-step LLM call
+CONSOLIDATION_MAX_CONCURRENCY = 4  # Concurrent LLM calls per consolidation
+CONSOLIDATION_REDUCE_FAN_IN = 8  # Partial summaries merged per reduce-step call
+CONSOLIDATION_FETCH_PAGE_SIZE = 500  # Rows per keyset page when gathering scope memories
+
 # ==============================================================================
 # PROCEDURAL MEMORY
 # ==============================================================================
@@ -143,11 +149,26 @@ CONSOLIDATION_SESSION_WINDOW_DEFAULT = 5  # Last N sessions
 PROCEDURAL_MIN_CONFIDENCE = 0.5  # Minimum confidence to use pattern for augmentation
 PROCEDURAL_MIN_SUPPORT = 3  # Minimum observations to create pattern
 PROCEDURAL_LOOKBACK_DAYS = 30  # Days to analyze for pattern detection
+PROCEDURAL_COOCCURRENCE_RATIO = 0.5  # Share of anchor sequences a follower must appear in
+
+# Streaming Sequence Miner (tool usage log)
+PROCEDURAL_MINER_BATCH_SIZE = 1000  # Usage log rows folded into the counts per batch
+PROCEDURAL_MINER_MAX_BATCHES = 20  # Batches drained per mining call
+PROCEDURAL_MINER_MAX_SOURCES = 20  # Recent conversation ids kept per anchor
+
+# Speculative Tool Prefetch (domain augmentation)
+PROCEDURAL_PREFETCH_MIN_CONFIDENCE = 0.7  # Run a pattern's tools before the LLM loop
+PROCEDURAL_PREFETCH_SKIP_LLM_CONFIDENCE = 0.85  # Skip the LLM loop entirely
+PROCEDURAL_PREFETCH_MAX_CALLS = 6  # Predicted calls per augmentation
 
 # ==============================================================================
 # EXTRACTION
 # ==============================================================================
 
+# LLM extraction cache: hit counts are buffered in memory and written in one
+# statement once this many hits have accumulated
+EXTRACTION_CACHE_HIT_FLUSH_SIZE = 100
+
 # Base Confidence for Extraction
 EXTRACTION_CONFIDENCE = {
     "explicit_statement": 0.7,  # "Remember: X prefers Y"
@@ -178,6 +199,10 @@ TOKENS_PER_CHAR = 0.25  # Rough estimate: 4 chars per token
 TOOL_ORCHESTRATION_MAX_ITERATIONS = 5  # Max rounds of tool calling (prevent loops)
 TOOL_ORCHESTRATION_MODEL = "claude-haiku-4-5"  # Fast, cheap, capable model for tool calling
 
+# Tool Result Encoding (tool results re-sent to the LLM every iteration)
+TOOL_RESULT_MAX_ROWS = 20  # Rows per fact type before "(+N more)"
+TOOL_RESULT_MAX_FIELD_CHARS = 160  # Longer fields are truncated
+
 # ==============================================================================
 # PHASE 2 CALIBRATION REQUIREMENTS
 # ==============================================================================
@@ -37,6 +37,16 @@ class Settings(BaseSettings):
     db_echo: bool = Field(default=False, description="Echo SQL statements")
     db_pool_size: int = Field(default=10, description="Connection pool size")
     db_max_overflow: int = Field(default=20, description="Max overflow connections")
+    db_slow_query_threshold_ms: float = Field(
+        default=200.0, description="Log statements slower than this (normalized SQL)"
+    )
+
+    # Tracing
+    otel_tracing_enabled: bool = Field(
+        default=False,
+        description="Also export pipeline spans through the OpenTelemetry SDK "
+        "(requires opentelemetry-api and a configured tracer provider)"
+    )
 
     # LLM Provider Configuration
     llm_provider: Literal["openai", "anthropic"] = Field(
@@ -63,6 +73,58 @@ class Settings(BaseSettings):
         description="Anthropic Claude model"
     )
 
+    # LLM call deduplication (identical in-flight calls are always collapsed)
+    llm_result_cache_ttl_seconds: float = Field(
+        default=0.0,
+        description="TTL for caching deterministic (temperature 0) LLM results; 0 disables"
+    )
+    enable_extraction_cache: bool = Field(
+        default=False,
+        description="Persist mention/fact/coreference extraction results in app.llm_extraction_cache"
+    )
+
+    # Shared HTTP transport for LLM/embedding SDK clients
+    http_max_connections: int = Field(
+        default=100,
+        description="Maximum open connections in the shared upstream pool"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=20,
+        description="Idle keep-alive connections retained in the shared pool"
+    )
+    http_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="Idle time before a keep-alive connection is closed"
+    )
+    http_connect_timeout_seconds: float = Field(
+        default=5.0,
+        description="TCP/TLS connect timeout for upstream APIs"
+    )
+    http_read_timeout_seconds: float = Field(
+        default=60.0,
+        description="Read timeout for upstream API responses"
+    )
+    http_pool_timeout_seconds: float = Field(
+        default=10.0,
+        description="Maximum wait for a free pooled connection"
+    )
+    http_max_retries: int = Field(
+        default=2,
+        description="Transport-level retries for connect errors, 429 and 5xx responses"
+    )
+    http_retry_backoff_seconds: float = Field(
+        default=0.5,
+        description="Base delay for full-jitter exponential retry backoff"
+    )
+    http_per_host_concurrency: int = Field(
+        default=32,
+        description="Concurrent in-flight requests allowed per upstream host"
+    )
+    http2_enabled: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with upstream APIs (requires the h2 package)"
+    )
+
     # Redis Configuration (Phase 2)
     redis_url: str = Field(
         default="redis://localhost:6379/0",
@@ -94,6 +156,22 @@ class Settings(BaseSettings):
         description="Log format (json for production)"
     )
 
+    # Request logging middleware
+    request_log_sample_rate: float = Field(
+        default=1.0,
+        description="Fraction of successful requests logged (failures are always logged)"
+    )
+    request_log_exclude_paths: list[str] = Field(
+        default=["/metrics", "/api/v1/health"],
+        description="Paths passed through without request ID, metrics or logs"
+    )
+
+    # Responses
+    enable_fast_json_responses: bool = Field(
+        default=False,
+        description="Serialize API responses with orjson (install the fast-json extra)"
+    )
+
     # Feature Flags
     enable_embedding_async: bool = Field(
         default=True,
@@ -105,7 +183,82 @@ class Settings(BaseSettings):
     )
     enable_procedural_memory: bool = Field(
         default=False,
-        description="Enable procedural memory extraction (Phase 2)"
+        description="Enable procedural memory (Phase 2): pattern extraction and tool prefetch"
+    )
+
+    # Background Jobs (post-reply pipeline stages)
+    enable_background_jobs: bool = Field(
+        default=False,
+        description="Defer reply-independent pipeline stages to the Postgres job queue"
+    )
+    background_worker_concurrency: int = Field(
+        default=4,
+        description="Number of in-process background worker loops"
+    )
+    background_job_batch_size: int = Field(
+        default=10,
+        description="Jobs claimed per worker poll"
+    )
+    background_job_poll_interval_seconds: float = Field(
+        default=1.0,
+        description="Worker sleep between polls when the queue is empty"
+    )
+    background_job_max_attempts: int = Field(
+        default=5,
+        description="Attempts before a background job is marked failed"
+    )
+
+    # Automatic consolidation (maintained counters + scheduler)
+    enable_consolidation_scheduler: bool = Field(
+        default=False,
+        description="Periodically tally consolidation counters and consolidate pending scopes"
+    )
+    consolidation_scheduler_interval_seconds: float = Field(
+        default=300.0,
+        description="Sleep between scheduler passes"
+    )
+    consolidation_scheduler_concurrency: int = Field(
+        default=4,
+        description="Scopes consolidated concurrently across all users"
+    )
+    consolidation_scheduler_batch_size: int = Field(
+        default=50,
+        description="Pending scopes picked up per scheduler pass"
+    )
+
+    # Background procedural pattern mining
+    enable_procedural_miner: bool = Field(
+        default=False,
+        description="Periodically mine new tool usage into procedural patterns"
+    )
+    procedural_miner_interval_seconds: float = Field(
+        default=60.0,
+        description="Sleep between procedural miner passes"
+    )
+
+    # Semantic query-result cache in front of memory retrieval
+    enable_retrieval_cache: bool = Field(
+        default=False,
+        description=(
+            "Reuse candidates of near-identical earlier queries from the same user "
+            "(/api/v1/retrieve endpoints; chat retrieval is not cached)"
+        )
+    )
+    retrieval_cache_similarity_threshold: float = Field(
+        default=0.95,
+        description="Minimum cosine similarity between query embeddings for a cache hit"
+    )
+    retrieval_cache_max_staleness_seconds: float = Field(
+        default=300.0,
+        description="Entry lifetime; bounds staleness from writes made outside this process"
+    )
+    retrieval_cache_max_entries_per_user: int = Field(
+        default=64,
+        description="LRU bound on cached queries per user"
+    )
+    retrieval_cache_max_users: int = Field(
+        default=10_000,
+        description="LRU bound on users with cached queries"
     )
 
     # Demo Mode
@@ -25,6 +25,7 @@ from src.infrastructure.database.domain_models import (
 from src.infrastructure.database.models import (
     CanonicalEntity,
     ChatEvent,
+    ConsolidationCounter,
     DomainOntology,
     EntityAlias,
     EpisodicMemory,
@@ -32,6 +33,7 @@ from src.infrastructure.database.models import (
     MemorySummary,
     ProceduralMemory,
     SemanticMemory,
+    ToolSequenceCount,
     ToolUsageLog,
 )
 
@@ -585,14 +587,16 @@ class ScenarioLoaderService:
             # ============================================================
             logger.info("Clearing app schema...")
 
-            # Step 1: Delete tool usage logs (no FK dependencies)
+            # Step 1: Delete tool usage logs and the sequence counts mined from them
             await self.session.execute(delete(ToolUsageLog))
+            await self.session.execute(delete(ToolSequenceCount))
 
             # Step 2: Delete memory conflicts (no FK dependencies)
             await self.session.execute(delete(MemoryConflict))
 
-            # Step 3: Delete memory summaries (self-referencing FK)
+            # Step 3: Delete memory summaries (self-referencing FK) and their counters
             await self.session.execute(delete(MemorySummary))
+            await self.session.execute(delete(ConsolidationCounter))
 
             # Step 4: Delete all memory types
             await self.session.execute(delete(ProceduralMemory))
@@ -639,14 +643,16 @@ class ScenarioLoaderService:
             # Keep domain schema untouched
             # ============================================================
 
-            # Step 1: Delete tool usage logs (no FK dependencies)
+            # Step 1: Delete tool usage logs and the sequence counts mined from them
             await self.session.execute(delete(ToolUsageLog))
+            await self.session.execute(delete(ToolSequenceCount))
 
             # Step 2: Delete memory conflicts (no FK dependencies)
             await self.session.execute(delete(MemoryConflict))
 
-            # Step 3: Delete memory summaries (self-referencing FK)
+            # Step 3: Delete memory summaries (self-referencing FK) and their counters
             await self.session.execute(delete(MemorySummary))
+            await self.session.execute(delete(ConsolidationCounter))
 
             # Step 4: Delete all memory types
             await self.session.execute(delete(ProceduralMemory))
@@ -4,14 +4,22 @@ Port interfaces define contracts for external dependencies.
 Infrastructure layer implements these ports.
 """
 from src.domain.ports.chat_repository import IChatEventRepository
+from src.domain.ports.consolidation_counter_port import (
+    IConsolidationCounterRepository,
+    PendingConsolidation,
+)
 from src.domain.ports.domain_database_port import DomainDatabasePort
 from src.domain.ports.embedding_service import IEmbeddingService
 from src.domain.ports.entity_repository import IEntityRepository
 from src.domain.ports.episodic_memory_repository import IEpisodicMemoryRepository
+from src.domain.ports.extraction_cache_port import IExtractionCacheRepository
+from src.domain.ports.job_queue_port import BackgroundJob, BackgroundJobType, IJobQueue
 from src.domain.ports.llm_service import ILLMService
 from src.domain.ports.procedural_memory_repository import IProceduralMemoryRepository
+from src.domain.ports.retrieval_cache_port import IRetrievalCache
 from src.domain.ports.semantic_memory_repository import ISemanticMemoryRepository
 from src.domain.ports.summary_repository import ISummaryRepository
+from src.domain.ports.tool_sequence_port import IToolSequenceStateRepository, ToolUsageBatch
 from src.domain.ports.tool_usage_tracker_port import IToolUsageTracker
 
 __all__ = [
@@ -28,6 +36,18 @@ __all__ = [
     "DomainDatabasePort",
     # Phase 1D
     "IProceduralMemoryRepository",
+    "IConsolidationCounterRepository",
+    "PendingConsolidation",
     # LLM Tool Calling
     "IToolUsageTracker",
+    "IToolSequenceStateRepository",
+    "ToolUsageBatch",
+    # Background work
+    "BackgroundJob",
+    "BackgroundJobType",
+    "IJobQueue",
+    # LLM extraction cache
+    "IExtractionCacheRepository",
+    # Retrieval query cache
+    "IRetrievalCache",
 ]
@@ -29,6 +29,29 @@ class IChatEventRepository(Protocol):
         """
         ...
 
+    async def create_many(self, messages: list[ChatMessage]) -> list[ChatMessage]:
+        """Store many chat messages, skipping duplicates.
+
+        Args:
+            messages: Messages to store
+
+        Returns:
+            Newly stored messages (with event_id populated), in input order;
+            messages whose session_id + content_hash already exist are omitted
+        """
+        ...
+
+    async def get_by_event_ids(self, event_ids: list[int]) -> list[ChatMessage]:
+        """Get chat messages by event IDs.
+
+        Args:
+            event_ids: Event IDs to retrieve
+
+        Returns:
+            Found messages ordered by event_id
+        """
+        ...
+
     async def get_by_event_id(self, event_id: int) -> ChatMessage | None:
         """Get a chat message by event ID.
 
@@ -54,6 +77,20 @@ class IChatEventRepository(Protocol):
         """
         ...
 
+    async def get_recent_session_ids(
+        self, user_id: str, limit: int = 5
+    ) -> list[UUID]:
+        """Get a user's most recently active sessions.
+
+        Args:
+            user_id: User ID
+            limit: Maximum number of sessions
+
+        Returns:
+            Session IDs, most recently active first
+        """
+        ...
+
     async def get_recent_for_session(
         self, session_id: UUID, limit: int = 10
     ) -> list[ChatMessage]:
@@ -0,0 +1,112 @@
+"""Port for maintained consolidation counters.
+
+Checking consolidation thresholds by counting a user's episodic memories per
+entity (and their sessions) on demand scans history and grows with it.
+Instead, counters of new activity per (user, scope) are maintained by an
+incremental tally over rows written since the previous tally, and reduced
+when a scope is consolidated. Finding pending scopes is then an index lookup
+over the counters that crossed a threshold.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.domain.value_objects.consolidation import ConsolidationScope
+
+
+@dataclass(frozen=True)
+class PendingConsolidation:
+    """A scope whose counter crossed its consolidation threshold.
+
+    Attributes:
+        user_id: User identifier
+        scope: Scope to consolidate
+        pending_count: Activity counted since the scope was last consolidated
+    """
+
+    user_id: str
+    scope: ConsolidationScope
+    pending_count: int
+
+
+class IConsolidationCounterRepository(ABC):
+    """Port for consolidation counters.
+
+    Counters are keyed by (user_id, scope_type, scope_identifier):
+    - entity scopes count episodic memories mentioning the entity
+    - the session-window scope counts sessions started
+    """
+
+    @abstractmethod
+    async def tally(self, session_window: int) -> int:
+        """Add activity written since the previous tally to the counters.
+
+        Concurrent tallies are serialized, so each row is counted once.
+
+        Args:
+            session_window: Session-window size the session counter belongs to
+
+        Returns:
+            Number of counters updated
+        """
+
+    @abstractmethod
+    async def get_count(self, user_id: str, scope: ConsolidationScope) -> int:
+        """Get the pending count of one scope.
+
+        Args:
+            user_id: User identifier
+            scope: Consolidation scope
+
+        Returns:
+            Activity counted since the scope was last consolidated (0 if none)
+        """
+
+    @abstractmethod
+    async def find_pending(
+        self,
+        min_episodic: int,
+        min_sessions: int,
+        user_id: str | None = None,
+        limit: int = 100,
+    ) -> list[PendingConsolidation]:
+        """Find scopes whose counters reached their thresholds.
+
+        Args:
+            min_episodic: Threshold for entity scopes
+            min_sessions: Threshold for the session-window scope
+            user_id: Restrict to one user (default: all users)
+            limit: Maximum number of scopes (largest counts first)
+
+        Returns:
+            Pending consolidations
+        """
+
+    @abstractmethod
+    async def claim(
+        self,
+        pending: PendingConsolidation,
+        min_episodic: int,
+        min_sessions: int,
+    ) -> PendingConsolidation | None:
+        """Lock a scope's counter for the rest of the transaction.
+
+        Args:
+            pending: Scope returned by find_pending
+            min_episodic: Threshold for entity scopes
+            min_sessions: Threshold for the session-window scope
+
+        Returns:
+            The scope with its current count, or None if another transaction
+            holds it or it is no longer over its threshold
+        """
+
+    @abstractmethod
+    async def mark_consolidated(self, pending: PendingConsolidation) -> None:
+        """Subtract the consumed count after a scope was consolidated.
+
+        Activity tallied while the consolidation ran stays pending.
+
+        Args:
+            pending: The consolidation that completed
+        """
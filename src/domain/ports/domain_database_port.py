@@ -31,6 +31,18 @@ class DomainDatabasePort(ABC):
             List of domain facts about invoice status
         """
 
+    @abstractmethod
+    async def get_customer_ar_summary(self, customer_id: str) -> list[DomainFact]:
+        """Get open accounts receivable totals for a customer.
+
+        Args:
+            customer_id: Customer UUID (from external_ref)
+
+        Returns:
+            Single AR summary fact (open balance, open invoice count,
+            lifetime invoiced/paid), or empty if the customer has no invoices
+        """
+
     @abstractmethod
     async def get_order_chain(self, sales_order_number: str) -> list[DomainFact]:
         """Traverse SO → WO → Invoice chain.
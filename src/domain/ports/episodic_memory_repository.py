@@ -4,6 +4,7 @@ Defines the contract for episodic memory data access.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 import numpy as np
@@ -39,6 +40,26 @@ class IEpisodicMemoryRepository(ABC):
             List of memory candidates from episodic layer
         """
 
+    @abstractmethod
+    async def find_similar_batch(
+        self,
+        user_id: str,
+        query_embeddings: list[npt.NDArray[np.float64]],
+        limit: int = 50,
+        session_id: UUID | None = None,
+    ) -> list[list[MemoryCandidate]]:
+        """Find similar episodic memories for several queries in one round-trip.
+
+        Args:
+            user_id: User identifier
+            query_embeddings: Query embedding vectors (1536-dim each)
+            limit: Maximum number of results per query
+            session_id: Optional session filter
+
+        Returns:
+            One candidate list per query embedding (same order as input)
+        """
+
     @abstractmethod
     async def find_recent(
         self,
@@ -80,3 +101,51 @@ class IEpisodicMemoryRepository(ABC):
         Returns:
             List of memory candidates ordered by created_at DESC
         """
+
+    @abstractmethod
+    async def find_by_entity(
+        self,
+        user_id: str,
+        entity_id: str,
+        since: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 500,
+    ) -> list[MemoryCandidate]:
+        """Find episodic memories mentioning an entity (one keyset page).
+
+        Used for entity-scope consolidation.
+
+        Args:
+            user_id: User identifier
+            entity_id: Entity identifier the memories must mention
+            since: Optional filter: only memories created after this time
+            after: Keyset cursor, (created_at, memory_id) of the previous page's last row
+            limit: Page size
+
+        Returns:
+            List of memory candidates ordered by (created_at, memory_id) ASC
+        """
+
+    @abstractmethod
+    async def find_by_sessions(
+        self,
+        user_id: str,
+        session_ids: list[UUID],
+        since: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 500,
+    ) -> list[MemoryCandidate]:
+        """Find episodic memories from any of several sessions (one keyset page).
+
+        Used for session-window consolidation.
+
+        Args:
+            user_id: User identifier
+            session_ids: Sessions to include
+            since: Optional filter: only memories created after this time
+            after: Keyset cursor, (created_at, memory_id) of the previous page's last row
+            limit: Page size
+
+        Returns:
+            List of memory candidates ordered by (created_at, memory_id) ASC
+        """
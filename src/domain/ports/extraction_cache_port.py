@@ -0,0 +1,66 @@
+"""Port for the persistent LLM extraction cache.
+
+Extraction outputs (mentions, semantic facts, coreference decisions) are
+pure functions of their prompt inputs, model and prompt version, so replayed
+or re-ingested messages can reuse them instead of calling the LLM again.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IExtractionCacheRepository(ABC):
+    """Port for storing and retrieving cached extraction results."""
+
+    @abstractmethod
+    async def get(self, cache_key: str) -> Any | None:
+        """Look up a cached extraction result.
+
+        Args:
+            cache_key: Hash of extraction type, model, prompt version and inputs
+
+        Returns:
+            JSON-decoded result, or None on a miss
+        """
+
+    @abstractmethod
+    async def record_hits(self, hits: dict[str, int]) -> None:
+        """Add accumulated hit counts (statistics only; batched by the caller).
+
+        Args:
+            hits: Hits per cache key since the last flush
+        """
+
+    @abstractmethod
+    async def put(
+        self,
+        cache_key: str,
+        extraction_type: str,
+        model: str,
+        prompt_version: str,
+        result: Any,
+    ) -> None:
+        """Store an extraction result (first writer wins on concurrent puts).
+
+        Args:
+            cache_key: Hash of extraction type, model, prompt version and inputs
+            extraction_type: mentions | facts | coreference
+            model: Model that produced the result
+            prompt_version: Version of the prompt template used
+            result: JSON-serializable extraction output
+        """
+
+    @abstractmethod
+    async def invalidate(
+        self, extraction_type: str, keep_prompt_version: str | None = None
+    ) -> int:
+        """Drop cached results for an extraction type.
+
+        Args:
+            extraction_type: mentions | facts | coreference
+            keep_prompt_version: Keep rows produced by this prompt version
+                (None drops everything for the type)
+
+        Returns:
+            Number of rows removed
+        """
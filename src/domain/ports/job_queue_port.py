@@ -0,0 +1,122 @@
+"""Port for the durable background job queue.
+
+Work that does not influence the current reply (policy memories, validation
+writes, conflict resolution writes, aging updates) is enqueued here and
+executed by a worker pool after the response has been sent. Bulk-imported
+chat events queue their entity resolution and semantic extraction here too.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+
+class BackgroundJobType(str, Enum):
+    """Types of deferrable post-reply work."""
+
+    PII_POLICY_MEMORY = "pii_policy_memory"
+    VALIDATE_MEMORIES = "validate_memories"
+    RESOLVE_DB_CONFLICTS = "resolve_db_conflicts"
+    MARK_MEMORIES_AGING = "mark_memories_aging"
+    EXTRACT_CHAT_EVENTS = "extract_chat_events"
+
+
+@dataclass(frozen=True)
+class BackgroundJob:
+    """A claimed job ready for execution.
+
+    Attributes:
+        job_id: Database primary key
+        job_type: Type of work to perform
+        payload: JSON-serializable job arguments
+        idempotency_key: Unique key preventing duplicate enqueues
+        attempts: Number of attempts made so far (including the current one)
+        max_attempts: Attempts allowed before the job is marked failed
+    """
+
+    job_id: int
+    job_type: BackgroundJobType
+    payload: dict[str, Any]
+    idempotency_key: str
+    attempts: int
+    max_attempts: int
+
+
+class IJobQueue(ABC):
+    """Port for enqueuing and claiming background jobs.
+
+    Philosophy: Only work that changes the reply belongs on the critical path.
+    Enqueue is transactional with the request, so a job only becomes visible
+    when the chat event that produced it is committed.
+    """
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        job_type: BackgroundJobType,
+        payload: dict[str, Any],
+        idempotency_key: str,
+        run_after: datetime | None = None,
+    ) -> bool:
+        """Enqueue a job (no-op if the idempotency key already exists).
+
+        Args:
+            job_type: Type of work to perform
+            payload: JSON-serializable job arguments
+            idempotency_key: Unique key (e.g. "<job_type>:<event_id>")
+            run_after: Earliest time the job may run (default: now)
+
+        Returns:
+            True if a new job was enqueued, False if it was a duplicate
+        """
+
+    @abstractmethod
+    async def claim_batch(self, limit: int = 10) -> list[BackgroundJob]:
+        """Claim pending jobs for execution (skipping rows locked by other workers).
+
+        Args:
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            Claimed jobs (status moved to running)
+        """
+
+    @abstractmethod
+    async def mark_succeeded(self, job_id: int) -> None:
+        """Mark a job as successfully completed.
+
+        Args:
+            job_id: Job identifier
+        """
+
+    @abstractmethod
+    async def mark_failed(self, job: BackgroundJob, error: str) -> None:
+        """Record a failed attempt (retried with backoff until max_attempts).
+
+        Args:
+            job: The job that failed
+            error: Error description
+        """
+
+    @abstractmethod
+    async def heartbeat(self, job_ids: list[int]) -> None:
+        """Refresh the lock of claimed jobs that are still running.
+
+        Args:
+            job_ids: Jobs the caller still holds
+        """
+
+    @abstractmethod
+    async def requeue_stale(self, older_than_seconds: int) -> int:
+        """Return jobs stuck in running state (crashed worker) to pending.
+
+        Jobs that already used all their attempts are marked failed instead.
+
+        Args:
+            older_than_seconds: Lock age after which a running job is considered stale
+
+        Returns:
+            Number of jobs requeued or failed
+        """
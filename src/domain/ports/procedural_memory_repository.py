@@ -113,6 +113,26 @@ class IProceduralMemoryRepository(ABC):
             RepositoryError: If update fails or memory_id not found
         """
 
+    @abstractmethod
+    async def upsert_mined_patterns(
+        self, memories: list[ProceduralMemory]
+    ) -> list[ProceduralMemory]:
+        """Insert or replace mined tool patterns in one statement.
+
+        Mined patterns are identified by (user_id, trigger_features.anchor_tool);
+        an existing pattern takes the new counts, confidence and actions and
+        keeps its memory_id, created_at and embedding.
+
+        Args:
+            memories: Mined patterns (trigger_features must contain anchor_tool)
+
+        Returns:
+            Stored ProceduralMemory instances
+
+        Raises:
+            RepositoryError: If the upsert fails
+        """
+
     @abstractmethod
     async def delete(self, memory_id: int, user_id: str) -> bool:
         """Delete a procedural memory.
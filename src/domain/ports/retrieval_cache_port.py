@@ -0,0 +1,79 @@
+"""Port for the semantic query-result cache in front of memory retrieval.
+
+Near-identical questions from the same user ("what's Acme's status?" /
+"status for Acme?") resolve to the same candidate set. The cache lets the
+retriever reuse that set after a vector lookup instead of re-running the
+candidate fan-out; scoring is always redone so recency and decay stay current.
+"""
+
+from abc import ABC, abstractmethod
+
+from src.domain.value_objects.memory_candidate import MemoryCandidate
+from src.domain.value_objects.query_context import QueryContext, RetrievalFilters
+
+
+class IRetrievalCache(ABC):
+    """Per-user cache of retrieval candidates keyed by query embedding."""
+
+    @abstractmethod
+    def generation(self, user_id: str) -> int:
+        """Current invalidation generation for a user.
+
+        Read before retrieving and pass to store(), so a result computed
+        while the user's memories were being written is never cached.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Monotonic counter bumped on every invalidation
+        """
+
+    @abstractmethod
+    def lookup(
+        self,
+        query_context: QueryContext,
+        top_k: int,
+        filters: RetrievalFilters | None = None,
+    ) -> list[MemoryCandidate] | None:
+        """Find cached candidates for a semantically equivalent query.
+
+        A hit requires the same user, strategy, session, filters and resolved
+        entity set, a cached top-k at least as large as requested, and query
+        embeddings whose cosine similarity clears the configured threshold.
+
+        Args:
+            query_context: Context of the incoming query
+            top_k: Number of memories the caller will return
+            filters: Filters of the incoming query
+
+        Returns:
+            Cached candidates to re-score, or None on a miss
+        """
+
+    @abstractmethod
+    def store(
+        self,
+        query_context: QueryContext,
+        top_k: int,
+        filters: RetrievalFilters | None,
+        candidates: list[MemoryCandidate],
+        generation: int,
+    ) -> None:
+        """Cache the top-k candidates of a completed retrieval.
+
+        Args:
+            query_context: Context the candidates were retrieved for
+            top_k: Number of memories the retrieval returned
+            filters: Filters used for the retrieval
+            candidates: Top-k candidates (before re-scoring)
+            generation: Value of generation() read before the retrieval began
+        """
+
+    @abstractmethod
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached entry for a user (their memories changed).
+
+        Args:
+            user_id: User identifier
+        """
@@ -4,6 +4,7 @@ Defines the contract for semantic memory data access.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 import numpy as np
 import numpy.typing as npt
@@ -29,6 +30,20 @@ class ISemanticMemoryRepository(ABC):
             Created memory with assigned memory_id
         """
 
+    @abstractmethod
+    async def create_if_absent(self, memory: SemanticMemory) -> tuple[SemanticMemory, bool]:
+        """Create a memory unless one with the same content hash exists.
+
+        The hash is memory.metadata["content_hash"] (from ContentHasher);
+        uniqueness is per user and enforced atomically.
+
+        Args:
+            memory: Semantic memory to create
+
+        Returns:
+            Tuple of (stored memory, whether it was newly created)
+        """
+
     @abstractmethod
     async def find_by_id(self, memory_id: int) -> SemanticMemory | None:
         """Find semantic memory by ID.
@@ -82,6 +97,51 @@ class ISemanticMemoryRepository(ABC):
             List of tuples (semantic_memory, similarity_score), ordered by similarity descending
         """
 
+    @abstractmethod
+    async def find_similar_batch(
+        self,
+        user_id: str,
+        query_embeddings: list[npt.NDArray[np.float64]],
+        limit: int = 50,
+        min_confidence: float | None = None,
+    ) -> list[list[tuple[SemanticMemory, float]]]:
+        """Find similar semantic memories for several queries in one round-trip.
+
+        Args:
+            user_id: User identifier
+            query_embeddings: Query embedding vectors (1536-dim each)
+            limit: Maximum number of results per query
+            min_confidence: Optional minimum confidence threshold
+
+        Returns:
+            One result list per query embedding (same order as input), each
+            ordered by similarity descending
+        """
+
+    @abstractmethod
+    async def find_by_entity(
+        self,
+        user_id: str,
+        entity_id: str,
+        since: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 500,
+    ) -> list[SemanticMemory]:
+        """Find active semantic memories mentioning an entity (one keyset page).
+
+        Used for entity-scope consolidation.
+
+        Args:
+            user_id: User identifier
+            entity_id: Entity identifier the memories must mention
+            since: Optional filter: only memories created after this time
+            after: Keyset cursor, (created_at, memory_id) of the previous page's last row
+            limit: Page size
+
+        Returns:
+            List of memories ordered by (created_at, memory_id) ASC
+        """
+
     @abstractmethod
     async def update(self, memory: SemanticMemory) -> SemanticMemory:
         """Update an existing semantic memory.
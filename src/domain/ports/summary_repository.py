@@ -39,6 +39,26 @@ class ISummaryRepository(ABC):
             List of memory candidates from summary layer
         """
 
+    @abstractmethod
+    async def find_similar_batch(
+        self,
+        user_id: str,
+        query_embeddings: list[npt.NDArray[np.float64]],
+        limit: int = 5,
+        scope_type: str | None = None,
+    ) -> list[list[MemoryCandidate]]:
+        """Find similar memory summaries for several queries in one round-trip.
+
+        Args:
+            user_id: User identifier
+            query_embeddings: Query embedding vectors (1536-dim each)
+            limit: Maximum number of results per query
+            scope_type: Optional scope filter (entity, topic, session_window)
+
+        Returns:
+            One candidate list per query embedding (same order as input)
+        """
+
     @abstractmethod
     async def find_by_scope(
         self,
@@ -57,6 +77,29 @@ class ISummaryRepository(ABC):
             Memory candidate if found, None otherwise
         """
 
+    @abstractmethod
+    async def find_latest_by_scope(
+        self,
+        user_id: str,
+        scope_type: str,
+        scope_identifier: str,
+    ) -> MemorySummary | None:
+        """Find the most recent summary of a scope.
+
+        Used as the base for incremental consolidation.
+
+        Args:
+            user_id: User identifier
+            scope_type: Scope type (entity, topic, session_window)
+            scope_identifier: Scope identifier
+
+        Returns:
+            Latest memory summary if any, None otherwise
+
+        Raises:
+            RepositoryError: If query fails
+        """
+
     @abstractmethod
     async def create(self, summary: MemorySummary) -> MemorySummary:
         """Create a new memory summary.
@@ -0,0 +1,68 @@
+"""Port for the streaming tool-sequence miner state.
+
+Re-reading the most recent tool usage logs on every pattern detection caps
+what can be learned at that window and repeats the same counting work each
+time. Instead, the usage log is consumed as a stream: each batch of rows
+past a persisted watermark is folded into per-(user, anchor tool) sequence
+counts, and patterns are derived from the counts.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.value_objects.procedural_memory import ToolSequenceCounts
+
+
+@dataclass(frozen=True)
+class ToolUsageBatch:
+    """Tool usage logged after the miner watermark.
+
+    Attributes:
+        logs: Usage log dictionaries in id order, with fields id, user_id,
+            conversation_id, tools_called
+        watermark: Highest log id in the batch (the previous watermark if empty)
+    """
+
+    logs: list[dict[str, Any]]
+    watermark: int
+
+
+class IToolSequenceStateRepository(ABC):
+    """Port for the miner's watermark and persisted sequence counts.
+
+    read_usage_batch() locks the watermark until the transaction ends, so
+    concurrent miners serialize and every log is counted once; save_counts()
+    must run in the same transaction.
+    """
+
+    @abstractmethod
+    async def read_usage_batch(self, limit: int) -> ToolUsageBatch:
+        """Lock the watermark and read the usage logged after it.
+
+        Args:
+            limit: Maximum number of logs
+
+        Returns:
+            Batch of logs in id order
+        """
+
+    @abstractmethod
+    async def load_counts(self, keys: list[tuple[str, str]]) -> list[ToolSequenceCounts]:
+        """Load the persisted counts of (user_id, anchor_tool) keys.
+
+        Args:
+            keys: Keys to load
+
+        Returns:
+            Counts of the keys that have any (missing keys are omitted)
+        """
+
+    @abstractmethod
+    async def save_counts(self, counts: list[ToolSequenceCounts], watermark: int) -> None:
+        """Store merged counts and advance the watermark.
+
+        Args:
+            counts: Full counts replacing the persisted ones
+            watermark: Highest log id folded into the counts
+        """
@@ -25,6 +25,7 @@ class IToolUsageTracker(ABC):
         query: str,
         tools_called: list[dict[str, Any]],
         facts_count: int,
+        user_id: str | None = None,
     ) -> None:
         """Log tool usage for a query.
 
@@ -33,6 +34,7 @@ class IToolUsageTracker(ABC):
             query: User query text
             tools_called: List of {tool, arguments, iteration}
             facts_count: Number of facts retrieved
+            user_id: User the query came from (patterns are mined per user)
         """
 
     @abstractmethod
@@ -60,12 +62,13 @@ class IToolUsageTracker(ABC):
         """Retrieve tool usage logs for pattern mining.
 
         Args:
-            user_id: User identifier (not used in Phase 1, but kept for future)
+            user_id: User identifier
             since: Get logs since this timestamp
             limit: Maximum number of logs to return
 
         Returns:
             List of usage log dictionaries with fields:
+            - id: int
             - conversation_id: str
             - query: str
             - tools_called: list[dict]
@@ -2,6 +2,7 @@
 
 Business logic services that don't belong to a single entity.
 """
+from src.domain.services.candidate_generator import CandidateGenerator
 from src.domain.services.conflict_detection_service import ConflictDetectionService
 from src.domain.services.conflict_resolution_service import ConflictResolutionService
 from src.domain.services.consolidation_service import ConsolidationService
@@ -15,12 +16,21 @@ from src.domain.services.debug_trace_service import (
 )
 from src.domain.services.entity_resolution_service import EntityResolutionService
 from src.domain.services.llm_reply_generator import LLMReplyGenerator
+from src.domain.services.memory_retriever import MemoryRetriever
 from src.domain.services.memory_validation_service import MemoryValidationService
 from src.domain.services.mention_extractor import SimpleMentionExtractor
 from src.domain.services.multi_signal_scorer import MultiSignalScorer
 from src.domain.services.pii_redaction_service import PIIRedactionService
 from src.domain.services.procedural_memory_service import ProceduralMemoryService
 from src.domain.services.semantic_extraction_service import SemanticExtractionService
+from src.domain.services.span_tracer import (
+    Span,
+    SpanKind,
+    SpanProcessor,
+    SpanStatus,
+    current_span,
+    span,
+)
 
 __all__ = [
     # Phase 1A
@@ -37,6 +47,8 @@ __all__ = [
     "ConsolidationTriggerService",
     "ProceduralMemoryService",
     "MultiSignalScorer",
+    "CandidateGenerator",
+    "MemoryRetriever",
     # Reply generation
     "LLMReplyGenerator",
     "PIIRedactionService",
@@ -44,4 +56,10 @@ __all__ = [
     "DebugTraceService",
     "TraceContext",
     "TraceType",
+    "Span",
+    "SpanKind",
+    "SpanProcessor",
+    "SpanStatus",
+    "current_span",
+    "span",
 ]
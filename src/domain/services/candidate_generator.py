@@ -7,6 +7,8 @@ Design from: DESIGN.md v2.0 - Retrieval Pipeline
 """
 
 import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
 from uuid import UUID
 
 import numpy as np
@@ -18,11 +20,14 @@ from src.domain.exceptions import DomainError
 from src.domain.ports.episodic_memory_repository import IEpisodicMemoryRepository
 from src.domain.ports.semantic_memory_repository import ISemanticMemoryRepository
 from src.domain.ports.summary_repository import ISummaryRepository
+from src.domain.services.span_tracer import SpanKind, span
 from src.domain.value_objects.memory_candidate import MemoryCandidate
 from src.domain.value_objects.query_context import QueryContext, RetrievalFilters
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
 
 class CandidateGenerator:
     """Generate memory candidates using parallel retrieval from all layers.
@@ -90,13 +95,31 @@ class CandidateGenerator:
             tasks = []
 
             if retrieve_semantic:
-                tasks.append(self._retrieve_semantic_candidates(query_context, filters))
+                tasks.append(
+                    self._traced_layer(
+                        "semantic",
+                        query_context.user_id,
+                        self._retrieve_semantic_candidates(query_context, filters),
+                    )
+                )
 
             if retrieve_episodic:
-                tasks.append(self._retrieve_episodic_candidates(query_context, filters))
+                tasks.append(
+                    self._traced_layer(
+                        "episodic",
+                        query_context.user_id,
+                        self._retrieve_episodic_candidates(query_context, filters),
+                    )
+                )
 
             if retrieve_summary:
-                tasks.append(self._retrieve_summary_candidates(query_context, filters))
+                tasks.append(
+                    self._traced_layer(
+                        "summary",
+                        query_context.user_id,
+                        self._retrieve_summary_candidates(query_context, filters),
+                    )
+                )
 
             # Execute all retrievals in parallel
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -135,6 +158,92 @@ class CandidateGenerator:
             msg = f"Error generating candidates: {e}"
             raise DomainError(msg) from e
 
+    async def generate_candidates_batch(
+        self,
+        query_contexts: list[QueryContext],
+        filters: RetrievalFilters | None = None,
+    ) -> list[list[MemoryCandidate]]:
+        """Generate candidates for several queries with one ANN query per layer.
+
+        All contexts must belong to the same user (and session). Each layer
+        runs a single batched similarity search covering every query, so the
+        number of round-trips is independent of the number of queries.
+
+        Args:
+            query_contexts: Query contexts (same user_id), one per query
+            filters: Optional filters applied to every query
+
+        Returns:
+            One deduplicated candidate list per query context (same order)
+
+        Raises:
+            DomainError: If candidate generation fails
+        """
+        if not query_contexts:
+            return []
+
+        first = query_contexts[0]
+        if any(ctx.user_id != first.user_id for ctx in query_contexts):
+            msg = "All query contexts in a batch must share the same user_id"
+            raise DomainError(msg)
+
+        try:
+            logger.info(
+                "generating_candidates_batch",
+                user_id=first.user_id,
+                query_count=len(query_contexts),
+                strategy=first.strategy,
+            )
+
+            embeddings = [ctx.query_embedding for ctx in query_contexts]
+            per_query: list[list[MemoryCandidate]] = [[] for _ in query_contexts]
+
+            # Layers share one session, so their batched queries run in turn
+            layers = []
+            if self._should_retrieve_layer("semantic", filters):
+                layers.append(("semantic", self._retrieve_semantic_candidates_batch))
+            if self._should_retrieve_layer("episodic", filters):
+                layers.append(("episodic", self._retrieve_episodic_candidates_batch))
+            if self._should_retrieve_layer("summary", filters):
+                layers.append(("summary", self._retrieve_summary_candidates_batch))
+
+            for layer, retrieve in layers:
+                try:
+                    results = await self._traced_layer(
+                        layer, first.user_id, retrieve(first, embeddings, filters)
+                    )
+                except Exception as e:
+                    logger.error(
+                        "layer_retrieval_failed",
+                        layer=layer,
+                        error=str(e),
+                    )
+                    # Continue with other layers even if one fails
+                    continue
+
+                for candidates, layer_candidates in zip(per_query, results, strict=True):
+                    candidates.extend(layer_candidates)
+
+            deduplicated = [self._deduplicate_candidates(c) for c in per_query]
+
+            logger.info(
+                "candidates_generated_batch",
+                query_count=len(query_contexts),
+                total_candidates=sum(len(c) for c in per_query),
+                deduplicated_count=sum(len(c) for c in deduplicated),
+            )
+
+            return deduplicated
+
+        except Exception as e:
+            logger.error(
+                "generate_candidates_batch_error",
+                user_id=first.user_id,
+                error=str(e),
+            )
+            msg = f"Error generating candidates: {e}"
+            raise DomainError(msg) from e
+
     async def _retrieve_semantic_candidates(
         self,
         query_context: QueryContext,
@@ -241,6 +350,103 @@ class CandidateGenerator:
 
         return candidates
 
+    async def _retrieve_semantic_candidates_batch(
+        self,
+        query_context: QueryContext,
+        query_embeddings: list[np.ndarray],
+        filters: RetrievalFilters | None,
+    ) -> list[list[MemoryCandidate]]:
+        """Retrieve semantic candidates for every query embedding at once.
+
+        Args:
+            query_context: Representative context (user_id, session_id)
+            query_embeddings: One embedding per query
+            filters: Optional filters
+
+        Returns:
+            One list of semantic candidates per query embedding
+        """
+        min_confidence = filters.min_confidence if filters else heuristics.MIN_CONFIDENCE_FOR_USE
+
+        results = await self._semantic_repo.find_similar_batch(
+            user_id=query_context.user_id,
+            query_embeddings=[e.tolist() for e in query_embeddings],
+            limit=heuristics.MAX_SEMANTIC_CANDIDATES,
+            min_confidence=min_confidence,
+        )
+
+        return [
+            [self._semantic_to_candidate(memory, similarity) for memory, similarity in matches]
+            for matches in results
+        ]
+
+    async def _retrieve_episodic_candidates_batch(
+        self,
+        query_context: QueryContext,
+        query_embeddings: list[np.ndarray],
+        filters: RetrievalFilters | None,
+    ) -> list[list[MemoryCandidate]]:
+        """Retrieve episodic candidates for every query embedding at once.
+
+        Args:
+            query_context: Representative context (user_id, session_id)
+            query_embeddings: One embedding per query
+            filters: Optional filters
+
+        Returns:
+            One list of episodic candidates per query embedding
+        """
+        session_id = UUID(query_context.session_id) if query_context.session_id else None
+
+        return await self._episodic_repo.find_similar_batch(
+            user_id=query_context.user_id,
+            query_embeddings=query_embeddings,
+            limit=heuristics.MAX_TEMPORAL_CANDIDATES,
+            session_id=session_id,
+        )
+
+    async def _retrieve_summary_candidates_batch(
+        self,
+        query_context: QueryContext,
+        query_embeddings: list[np.ndarray],
+        filters: RetrievalFilters | None,
+    ) -> list[list[MemoryCandidate]]:
+        """Retrieve summary candidates for every query embedding at once.
+
+        Args:
+            query_context: Representative context (user_id, session_id)
+            query_embeddings: One embedding per query
+            filters: Optional filters
+
+        Returns:
+            One list of summary candidates per query embedding
+        """
+        return await self._summary_repo.find_similar_batch(
+            user_id=query_context.user_id,
+            query_embeddings=query_embeddings,
+            limit=heuristics.MAX_SUMMARY_CANDIDATES,
+            scope_type=None,  # Retrieve all scope types
+        )
+
+    async def _traced_layer(self, layer: str, user_id: str, retrieval: Awaitable[T]) -> T:
+        """Await one layer's retrieval inside a MEMORY_RETRIEVAL span.
+
+        Args:
+            layer: Layer type (semantic, episodic, summary)
+            user_id: User whose memories are searched
+            retrieval: Pending layer retrieval
+
+        Returns:
+            The retrieval's result
+        """
+        with span(
+            f"memory_retrieval.{layer}",
+            SpanKind.MEMORY_RETRIEVAL,
+            layer=layer,
+            user_id=user_id,
+        ):
+            return await retrieval
+
     def _should_retrieve_layer(
         self, layer_type: str, filters: RetrievalFilters | None
     ) -> bool:
@@ -282,7 +488,8 @@ class CandidateGenerator:
             embedding=np.array(memory.embedding) if memory.embedding else np.zeros(1536),
             created_at=memory.created_at,
             importance=memory.importance,
-            similarity_score=similarity,  # Store raw similarity for explainability
+            # Store raw similarity for explainability (opposed vectors clamp to 0)
+            similarity_score=max(0.0, min(1.0, similarity)),
             confidence=memory.confidence,
             confirmation_count=memory.confirmation_count,
             last_accessed_at=memory.last_accessed_at,
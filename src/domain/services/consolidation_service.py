@@ -7,8 +7,11 @@ Vision: "Replace many specific memories with one abstract summary" - graceful fo
 Design from: PHASE1D_IMPLEMENTATION_PLAN.md
 """
 
+import asyncio
 import json
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from typing import TypeVar
 
 import structlog
 
@@ -24,12 +27,20 @@ from src.domain.ports.semantic_memory_repository import ISemanticMemoryRepositor
 from src.domain.ports.summary_repository import ISummaryRepository
 from src.domain.value_objects.consolidation import (
     ConsolidationScope,
+    KeyFact,
     SummaryData,
 )
 from src.domain.value_objects.memory_candidate import MemoryCandidate
 
 logger = structlog.get_logger()
 
+# One map-step chunk: memories synthesized by one LLM call
+_Chunk = tuple[list[MemoryCandidate], list[SemanticMemory]]
+
+# Keyset cursor: (created_at, memory_id) of the last row of the previous page
+_Cursor = tuple[datetime, int]
+_Row = TypeVar("_Row", MemoryCandidate, SemanticMemory)
+
 
 class ConsolidationService:
     """Consolidates episodic and semantic memories into summaries.
@@ -39,6 +50,13 @@ class ConsolidationService:
 
     Philosophy: Graceful forgetting through consolidation.
 
+    Consolidation is incremental and map-reduce: the latest summary of the
+    scope is the base, only memories newer than its watermark are
+    synthesized, in chunks of ``chunk_size`` memories (grouped by entity,
+    time-ordered) with at most ``max_concurrency`` LLM calls in flight. The
+    partial summaries are then reduced, together with the base, into the new
+    summary. LLM work grows with the number of new memories, not the history.
+
     Example:
         >>> consolidation_service = ConsolidationService(
         ...     episodic_repo=episodic_repo,
@@ -61,6 +79,10 @@ class ConsolidationService:
         chat_repo: IChatEventRepository,
         llm_service: ILLMService,
         embedding_service: IEmbeddingService,
+        chunk_size: int = heuristics.CONSOLIDATION_CHUNK_SIZE,
+        max_concurrency: int = heuristics.CONSOLIDATION_MAX_CONCURRENCY,
+        reduce_fan_in: int = heuristics.CONSOLIDATION_REDUCE_FAN_IN,
+        page_size: int = heuristics.CONSOLIDATION_FETCH_PAGE_SIZE,
     ) -> None:
         """Initialize consolidation service.
 
@@ -71,6 +93,10 @@ class ConsolidationService:
             chat_repo: Repository for chat events
             llm_service: LLM service for synthesis
             embedding_service: Service for generating embeddings
+            chunk_size: Memories per map-step LLM call
+            max_concurrency: Concurrent LLM calls per consolidation
+            reduce_fan_in: Partial summaries merged per reduce-step LLM call
+            page_size: Rows per keyset page when fetching scope memories
         """
         self._episodic_repo = episodic_repo
         self._semantic_repo = semantic_repo
@@ -78,6 +104,10 @@ class ConsolidationService:
         self._chat_repo = chat_repo
         self._llm_service = llm_service
         self._embedding_service = embedding_service
+        self._chunk_size = chunk_size
+        self._max_concurrency = max_concurrency
+        self._reduce_fan_in = max(2, reduce_fan_in)
+        self._page_size = page_size
 
     async def consolidate(
         self,
@@ -162,8 +192,13 @@ class ConsolidationService:
 
         scope = ConsolidationScope.entity_scope(entity_id)
 
-        # Fetch memories
-        episodic, semantic = await self._fetch_memories(user_id, scope)
+        # Fetch memories newer than the latest summary
+        base = await self._summary_repo.find_latest_by_scope(
+            user_id, scope.type, scope.identifier
+        )
+        episodic, semantic = await self._fetch_memories(
+            user_id, scope, since=_summary_watermark(base) if base else None
+        )
 
         # Check threshold
         if len(episodic) < heuristics.CONSOLIDATION_MIN_EPISODIC:
@@ -177,53 +212,19 @@ class ConsolidationService:
             # For Phase 1: Allow manual consolidation even below threshold
             # raise DomainError(f"Insufficient memories: {len(episodic)} < {heuristics.CONSOLIDATION_MIN_EPISODIC}")
 
-        # Try LLM synthesis with retries
-        for attempt in range(max_retries):
-            try:
-                summary_data = await self._synthesize_with_llm(
-                    episodic=episodic,
-                    semantic=semantic,
-                    scope=scope,
-                )
-
-                # Store summary
-                summary = await self._store_summary(user_id, scope, summary_data)
-
-                # Boost confidence of confirmed facts
-                await self._boost_confirmed_facts(summary_data.confirmed_memory_ids)
-
-                logger.info(
-                    "consolidation_completed",
-                    user_id=user_id,
-                    entity_id=entity_id,
-                    summary_id=summary.summary_id,
-                )
-
-                return summary
-
-            except ValueError as e:
-                logger.warning(
-                    "llm_synthesis_failed",
-                    attempt=attempt + 1,
-                    max_retries=max_retries,
-                    error=str(e),
-                )
+        summary = await self._consolidate_memories(
+            user_id, scope, episodic, semantic, base, max_retries
+        )
 
-                if attempt == max_retries - 1:
-                    # Fallback: Create basic summary without LLM
-                    logger.info("using_fallback_summary", user_id=user_id)
-                    return await self._create_fallback_summary(
-                        user_id=user_id,
-                        scope=scope,
-                        episodic=episodic,
-                        semantic=semantic,
-                    )
-
-        # Should not reach here, but add safety
-        return await self._create_fallback_summary(
-            user_id=user_id, scope=scope, episodic=episodic, semantic=semantic
+        logger.info(
+            "consolidation_completed",
+            user_id=user_id,
+            entity_id=entity_id,
+            summary_id=summary.summary_id,
         )
 
+        return summary
+
     async def consolidate_topic(
         self, user_id: str, predicate_pattern: str, max_retries: int = 3
     ) -> MemorySummary:
@@ -271,8 +272,13 @@ class ConsolidationService:
 
         scope = ConsolidationScope.session_window_scope(num_sessions)
 
-        # Fetch memories from last N sessions
-        episodic, semantic = await self._fetch_memories(user_id, scope)
+        # Fetch memories from last N sessions, newer than the latest summary
+        base = await self._summary_repo.find_latest_by_scope(
+            user_id, scope.type, scope.identifier
+        )
+        episodic, semantic = await self._fetch_memories(
+            user_id, scope, since=_summary_watermark(base) if base else None
+        )
 
         # Check threshold
         if len(episodic) < heuristics.CONSOLIDATION_MIN_EPISODIC:
@@ -286,109 +292,66 @@ class ConsolidationService:
             # For Phase 1: Allow manual consolidation even below threshold
             # raise DomainError(f"Insufficient memories: {len(episodic)} < {heuristics.CONSOLIDATION_MIN_EPISODIC}")
 
-        # Try LLM synthesis with retries
-        for attempt in range(max_retries):
-            try:
-                summary_data = await self._synthesize_with_llm(
-                    episodic=episodic,
-                    semantic=semantic,
-                    scope=scope,
-                )
-
-                # Store summary
-                summary = await self._store_summary(user_id, scope, summary_data)
-
-                # Boost confidence of confirmed facts
-                await self._boost_confirmed_facts(summary_data.confirmed_memory_ids)
-
-                logger.info(
-                    "session_window_consolidation_completed",
-                    user_id=user_id,
-                    num_sessions=num_sessions,
-                    summary_id=summary.summary_id,
-                )
-
-                return summary
-
-            except ValueError as e:
-                logger.warning(
-                    "llm_synthesis_failed",
-                    attempt=attempt + 1,
-                    max_retries=max_retries,
-                    error=str(e),
-                )
+        summary = await self._consolidate_memories(
+            user_id, scope, episodic, semantic, base, max_retries
+        )
 
-                if attempt == max_retries - 1:
-                    # Fallback: Create basic summary without LLM
-                    logger.info("using_fallback_summary", user_id=user_id)
-                    return await self._create_fallback_summary(
-                        user_id=user_id,
-                        scope=scope,
-                        episodic=episodic,
-                        semantic=semantic,
-                    )
-
-        # Should not reach here, but add safety
-        return await self._create_fallback_summary(
-            user_id=user_id, scope=scope, episodic=episodic, semantic=semantic
+        logger.info(
+            "session_window_consolidation_completed",
+            user_id=user_id,
+            num_sessions=num_sessions,
+            summary_id=summary.summary_id,
         )
 
+        return summary
+
     async def _fetch_memories(
-        self, user_id: str, scope: ConsolidationScope
+        self, user_id: str, scope: ConsolidationScope, since: datetime | None = None
     ) -> tuple[list[MemoryCandidate], list[SemanticMemory]]:
         """Fetch episodic and semantic memories for a scope.
 
+        Scope filters run in SQL (entity containment, session set) and large
+        scopes are read in keyset pages, so every memory in scope is seen
+        regardless of how much unrelated history the user has.
+
         Args:
             user_id: User identifier
             scope: Consolidation scope
+            since: Only memories created after this time (summary watermark)
 
         Returns:
-            Tuple of (episodic_memories, semantic_memories)
+            Tuple of (episodic_memories, semantic_memories), oldest first
         """
         if scope.type == "entity":
-            # Fetch episodic memories about entity
-            # For Phase 1: Simplified - fetch recent memories
-            episodic = await self._episodic_repo.find_recent(user_id, limit=50)
-
-            # Filter to entity (simplified - in production would have entity filter in query)
             entity_id = scope.identifier
-            episodic_filtered = [
-                e for e in episodic if entity_id in e.entities
-            ]
-
-            # Fetch semantic memories about entity
-            # For Phase 1: Simplified - would need semantic repo method for entity filter
-            semantic: list[SemanticMemory] = []
+            episodic = await self._fetch_pages(
+                lambda after: self._episodic_repo.find_by_entity(
+                    user_id, entity_id, since=since, after=after, limit=self._page_size
+                )
+            )
+            semantic = await self._fetch_pages(
+                lambda after: self._semantic_repo.find_by_entity(
+                    user_id, entity_id, since=since, after=after, limit=self._page_size
+                )
+            )
 
             logger.debug(
                 "memories_fetched",
                 user_id=user_id,
                 entity_id=entity_id,
-                episodic_count=len(episodic_filtered),
+                episodic_count=len(episodic),
                 semantic_count=len(semantic),
             )
 
-            return episodic_filtered, semantic
+            return episodic, semantic
 
         elif scope.type == "session_window":
-            # Fetch recent N sessions worth of memories
             num_sessions = int(scope.identifier)
-
-            # Get recent chat events to identify recent sessions
-            recent_messages = await self._chat_repo.get_recent_for_user(
-                user_id=user_id,
-                limit=100  # Fetch enough to cover N sessions
+            session_ids = await self._chat_repo.get_recent_session_ids(
+                user_id, limit=num_sessions
             )
 
-            # Extract distinct session IDs (most recent first)
-            seen_sessions = []
-            for msg in reversed(recent_messages):  # Reverse to get chronological order
-                if msg.session_id not in seen_sessions:
-                    seen_sessions.append(msg.session_id)
-                if len(seen_sessions) >= num_sessions:
-                    break
-
-            if not seen_sessions:
+            if not session_ids:
                 logger.warning(
                     "no_recent_sessions_found",
                     user_id=user_id,
@@ -400,42 +363,315 @@ class ConsolidationService:
                 "session_window_identified",
                 user_id=user_id,
                 num_sessions=num_sessions,
-                found_sessions=len(seen_sessions),
-                session_ids=[str(sid) for sid in seen_sessions],
+                found_sessions=len(session_ids),
+                session_ids=[str(sid) for sid in session_ids],
             )
 
-            # Fetch episodic memories from these sessions
-            all_episodic: list[MemoryCandidate] = []
-            for session_id in seen_sessions:
-                episodic = await self._episodic_repo.find_recent(
-                    user_id=user_id,
-                    limit=50,
-                    session_id=session_id,
+            episodic = await self._fetch_pages(
+                lambda after: self._episodic_repo.find_by_sessions(
+                    user_id, session_ids, since=since, after=after, limit=self._page_size
                 )
-                all_episodic.extend(episodic)
-
-            # For Phase 1: Fetch semantic memories created in this time window
-            # Simplified - fetch all active semantic memories for user
-            # In Phase 2, would filter by creation timestamp
-            all_semantic: list[SemanticMemory] = []
+            )
 
             logger.debug(
                 "session_window_memories_fetched",
                 user_id=user_id,
                 num_sessions=num_sessions,
-                episodic_count=len(all_episodic),
-                semantic_count=len(all_semantic),
+                episodic_count=len(episodic),
             )
 
-            return all_episodic, all_semantic
+            # Semantic memories are not session-scoped
+            return episodic, []
 
         return [], []
 
+    async def _fetch_pages(
+        self, fetch_page: Callable[[_Cursor | None], Awaitable[list[_Row]]]
+    ) -> list[_Row]:
+        """Read all keyset pages of a scope query."""
+        rows: list[_Row] = []
+        after: _Cursor | None = None
+        while True:
+            page = await fetch_page(after)
+            rows.extend(page)
+            if len(page) < self._page_size:
+                return rows
+            last = page[-1]
+            if last.created_at is None or last.memory_id is None:
+                return rows
+            after = (last.created_at, last.memory_id)
+
+    async def _consolidate_memories(
+        self,
+        user_id: str,
+        scope: ConsolidationScope,
+        episodic: list[MemoryCandidate],
+        semantic: list[SemanticMemory],
+        base: MemorySummary | None,
+        max_retries: int,
+    ) -> MemorySummary:
+        """Fold the memories of a scope into its latest summary.
+
+        Args:
+            user_id: User identifier
+            scope: Consolidation scope
+            episodic: Episodic memories in scope
+            semantic: Semantic memories in scope
+            base: Latest summary of the scope (None for the first consolidation)
+            max_retries: LLM attempts per synthesis call
+
+        Returns:
+            New summary (superseding the base), the base itself when no
+            memory is newer than it, or a fallback summary if synthesis failed
+        """
+        if base is not None:
+            watermark = _summary_watermark(base)
+            episodic = [e for e in episodic if e.created_at > watermark]
+            semantic = [m for m in semantic if m.created_at > watermark]
+            if not episodic and not semantic:
+                logger.info(
+                    "consolidation_up_to_date",
+                    user_id=user_id,
+                    scope=scope.to_dict(),
+                    summary_id=base.summary_id,
+                )
+                return base
+
+        try:
+            summary_data = await self._map_reduce(
+                episodic, semantic, scope, base, max_retries
+            )
+        except ValueError as e:
+            logger.warning("llm_synthesis_failed", max_retries=max_retries, error=str(e))
+            # Fallback: Create basic summary without LLM
+            logger.info("using_fallback_summary", user_id=user_id)
+            return await self._create_fallback_summary(
+                user_id=user_id,
+                scope=scope,
+                episodic=episodic,
+                semantic=semantic,
+            )
+
+        # Store summary
+        summary = await self._store_summary(
+            user_id,
+            scope,
+            summary_data,
+            base=base,
+            watermark=max(
+                (m.created_at for m in (*episodic, *semantic)), default=None
+            ),
+        )
+
+        # Boost confidence of confirmed facts
+        await self._boost_confirmed_facts(summary_data.confirmed_memory_ids)
+
+        return summary
+
+    def _chunk(
+        self, episodic: list[MemoryCandidate], semantic: list[SemanticMemory]
+    ) -> list[_Chunk]:
+        """Split memories into map-step chunks.
+
+        Memories are ordered by primary entity, then time, so each chunk
+        covers a contiguous stretch of one entity's history.
+
+        Args:
+            episodic: Episodic memories
+            semantic: Semantic memories
+
+        Returns:
+            Chunks of at most chunk_size memories (empty without memories)
+        """
+        ordered: list[MemoryCandidate | SemanticMemory] = sorted(
+            [*episodic, *semantic],
+            key=lambda m: (m.entities[0] if m.entities else "", m.created_at),
+        )
+        chunks: list[_Chunk] = []
+        for start in range(0, len(ordered), self._chunk_size):
+            part = ordered[start : start + self._chunk_size]
+            chunks.append(
+                (
+                    [m for m in part if isinstance(m, MemoryCandidate)],
+                    [m for m in part if isinstance(m, SemanticMemory)],
+                )
+            )
+        return chunks
+
+    async def _map_reduce(
+        self,
+        episodic: list[MemoryCandidate],
+        semantic: list[SemanticMemory],
+        scope: ConsolidationScope,
+        base: MemorySummary | None,
+        max_retries: int,
+    ) -> SummaryData:
+        """Synthesize chunks in parallel and reduce them into one summary.
+
+        A single chunk is synthesized in one call, with the base summary in
+        the prompt.
+
+        Raises:
+            ValueError: If a chunk or reduce step fails on every attempt
+        """
+        chunks = self._chunk(episodic, semantic) or [([], [])]
+        if len(chunks) == 1:
+            return await self._synthesize_chunk(chunks[0], scope, base, max_retries)
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def map_chunk(chunk: _Chunk) -> SummaryData:
+            async with semaphore:
+                return await self._synthesize_chunk(chunk, scope, None, max_retries)
+
+        logger.info(
+            "consolidation_map_started",
+            scope=scope.to_dict(),
+            chunks=len(chunks),
+            memories=len(episodic) + len(semantic),
+        )
+        partials = list(await asyncio.gather(*(map_chunk(c) for c in chunks)))
+
+        # Reduce level by level until one call can merge the rest with the base
+        while len(partials) > self._reduce_fan_in:
+            groups = [
+                partials[i : i + self._reduce_fan_in]
+                for i in range(0, len(partials), self._reduce_fan_in)
+            ]
+
+            async def reduce_group(group: list[SummaryData]) -> SummaryData:
+                async with semaphore:
+                    return await self._reduce(group, scope, None, max_retries)
+
+            partials = list(await asyncio.gather(*(reduce_group(g) for g in groups)))
+
+        return await self._reduce(partials, scope, base, max_retries)
+
+    async def _synthesize_chunk(
+        self,
+        chunk: _Chunk,
+        scope: ConsolidationScope,
+        base: MemorySummary | None,
+        max_retries: int,
+    ) -> SummaryData:
+        """Synthesize one chunk, retrying invalid LLM output.
+
+        Confirmed memory ids are limited to the chunk's semantic memories,
+        and the base summary's key facts are merged into the result.
+
+        Raises:
+            ValueError: If every attempt returns invalid output
+        """
+        episodic, semantic = chunk
+        for attempt in range(max_retries):
+            try:
+                data = await self._synthesize_with_llm(
+                    episodic=episodic,
+                    semantic=semantic,
+                    scope=scope,
+                    base=base,
+                )
+            except ValueError as e:
+                logger.warning(
+                    "llm_synthesis_failed",
+                    attempt=attempt + 1,
+                    max_retries=max_retries,
+                    error=str(e),
+                )
+                continue
+
+            semantic_ids = {m.memory_id for m in semantic}
+            return SummaryData(
+                summary_text=data.summary_text,
+                key_facts=_merge_key_facts(_base_key_facts(base), data.key_facts),
+                interaction_patterns=data.interaction_patterns,
+                needs_validation=data.needs_validation,
+                confirmed_memory_ids=[
+                    i for i in dict.fromkeys(data.confirmed_memory_ids) if i in semantic_ids
+                ],
+            )
+
+        msg = f"LLM synthesis failed after {max_retries} attempts"
+        raise ValueError(msg)
+
+    async def _reduce(
+        self,
+        partials: list[SummaryData],
+        scope: ConsolidationScope,
+        base: MemorySummary | None,
+        max_retries: int,
+    ) -> SummaryData:
+        """Merge partial summaries (and the base summary) into one.
+
+        Key facts and confirmed memory ids are merged deterministically; the
+        LLM only writes the narrative, patterns and validation notes.
+
+        Raises:
+            ValueError: If every attempt returns invalid output
+        """
+        key_facts = _merge_key_facts(
+            _base_key_facts(base), *(p.key_facts for p in partials)
+        )
+        confirmed_memory_ids = list(
+            dict.fromkeys(i for p in partials for i in p.confirmed_memory_ids)
+        )
+
+        sections = "\n\n".join(
+            f"{i}. {p.summary_text}\n"
+            f"   Patterns: {'; '.join(p.interaction_patterns) or '(none)'}\n"
+            f"   Needs validation: {'; '.join(p.needs_validation) or '(none)'}"
+            for i, p in enumerate(partials, 1)
+        )
+        prompt = f"""Merge these partial summaries of one memory history into a single summary.
+
+**Scope**: {scope.type} - {scope.identifier}
+{self._format_base_summary(base)}
+**Partial summaries** ({len(partials)}, oldest first):
+{sections}
+
+**Key facts** (already merged):
+{json.dumps({k: v.value for k, v in key_facts.items()}, default=str)}
+
+**Output** (JSON):
+{{
+  "summary_text": "Concise narrative summary (2-3 sentences)",
+  "interaction_patterns": ["Pattern 1", "Pattern 2"],
+  "needs_validation": ["Fact that hasn't been seen in 90+ days"]
+}}
+"""
+        for attempt in range(max_retries):
+            try:
+                response_text = await self._llm_service.generate_structured_output(
+                    prompt=prompt,
+                    response_format="json",
+                    temperature=0.3,
+                )
+                response = json.loads(response_text)
+                return SummaryData(
+                    summary_text=response["summary_text"],
+                    key_facts=key_facts,
+                    interaction_patterns=response.get("interaction_patterns", []),
+                    needs_validation=response.get("needs_validation", []),
+                    confirmed_memory_ids=confirmed_memory_ids,
+                )
+            except Exception as e:
+                logger.warning(
+                    "consolidation_reduce_failed",
+                    attempt=attempt + 1,
+                    max_retries=max_retries,
+                    partials=len(partials),
+                    error=str(e),
+                )
+
+        msg = f"Summary reduce failed after {max_retries} attempts"
+        raise ValueError(msg)
+
     async def _synthesize_with_llm(
         self,
         episodic: list[MemoryCandidate],
         semantic: list[SemanticMemory],
         scope: ConsolidationScope,
+        base: MemorySummary | None = None,
     ) -> SummaryData:
         """Synthesize summary using LLM.
 
@@ -443,6 +679,7 @@ class ConsolidationService:
             episodic: List of episodic memories
             semantic: List of semantic memories
             scope: Consolidation scope
+            base: Current summary to update with the memories (if any)
 
         Returns:
             Synthesized summary data
@@ -457,7 +694,7 @@ class ConsolidationService:
         prompt = f"""Synthesize a consolidated summary from these memories.
 
 **Scope**: {scope.type} - {scope.identifier}
-
+{self._format_base_summary(base)}
 **Episodic memories** ({len(episodic)} events):
 {episodic_text}
 
@@ -520,13 +757,24 @@ class ConsolidationService:
             msg = f"Invalid LLM response: {e}"
             raise ValueError(msg) from e
 
+    def _format_base_summary(self, base: MemorySummary | None) -> str:
+        """Format the summary being updated for LLM prompt."""
+        if base is None:
+            return ""
+        return (
+            "\n**Current summary** (update it with the memories below, "
+            "keep what they do not contradict):\n"
+            f"{base.summary_text}\n"
+            f"Key facts: {json.dumps({k: v.get('value') for k, v in base.key_facts.items()}, default=str)}\n"
+        )
+
     def _format_episodic_memories(self, episodic: list[MemoryCandidate]) -> str:
-        """Format episodic memories for LLM prompt."""
+        """Format episodic memories for LLM prompt (chunk_size bounds the count)."""
         if not episodic:
             return "(None)"
 
         lines = []
-        for i, memory in enumerate(episodic[:20], 1):  # Limit to 20 for token budget
+        for i, memory in enumerate(episodic, 1):
             lines.append(
                 f"{i}. [{memory.created_at.strftime('%Y-%m-%d')}] {memory.content}"
             )
@@ -534,23 +782,28 @@ class ConsolidationService:
         return "\n".join(lines)
 
     def _format_semantic_memories(self, semantic: list[SemanticMemory]) -> str:
-        """Format semantic memories for LLM prompt."""
+        """Format semantic memories for LLM prompt (chunk_size bounds the count)."""
         if not semantic:
             return "(None)"
 
         lines = []
-        for i, memory in enumerate(semantic[:20], 1):  # Limit to 20
+        for i, memory in enumerate(semantic, 1):
             entities_str = ", ".join(memory.entities[:3])
             confirmations = memory.confirmation_count
             lines.append(
-                f"{i}. [{entities_str}] {memory.content} "
+                f"{i}. (memory_id: {memory.memory_id}) [{entities_str}] {memory.content} "
                 f"(confidence: {memory.confidence:.2f}, importance: {memory.importance:.2f}, confirmations: {confirmations}x)"
             )
 
         return "\n".join(lines)
 
     async def _store_summary(
-        self, user_id: str, scope: ConsolidationScope, summary_data: SummaryData
+        self,
+        user_id: str,
+        scope: ConsolidationScope,
+        summary_data: SummaryData,
+        base: MemorySummary | None = None,
+        watermark: datetime | None = None,
     ) -> MemorySummary:
         """Store synthesized summary.
 
@@ -558,10 +811,15 @@ class ConsolidationService:
             user_id: User identifier
             scope: Consolidation scope
             summary_data: Synthesized summary data
+            base: Summary this one supersedes (incremental update)
+            watermark: Creation time of the newest consolidated memory
 
         Returns:
             Stored memory summary
         """
+        if watermark is None and base is not None:
+            watermark = _summary_watermark(base)
+
         # Create summary entity
         summary = MemorySummary(
             user_id=user_id,
@@ -572,9 +830,11 @@ class ConsolidationService:
             source_data={
                 "interaction_patterns": summary_data.interaction_patterns,
                 "needs_validation": summary_data.needs_validation,
+                "watermark": watermark.isoformat() if watermark else None,
             },
             confidence=heuristics.CONFIDENCE_LLM_SYNTHESIS,  # Base confidence for LLM synthesis
             created_at=datetime.now(UTC),
+            supersedes_summary_id=base.summary_id if base else None,
         )
 
         # Generate embedding
@@ -708,3 +968,56 @@ class ConsolidationService:
         )
 
         return stored
+
+
+def _summary_watermark(summary: MemorySummary) -> datetime:
+    """Creation time of the newest memory folded into a summary.
+
+    Summaries without a recorded watermark (fallback or pre-incremental
+    summaries) cover everything created before the summary itself.
+    """
+    watermark = summary.source_data.get("watermark")
+    return datetime.fromisoformat(watermark) if watermark else summary.created_at
+
+
+def _base_key_facts(base: MemorySummary | None) -> dict[str, KeyFact]:
+    """Key facts of a stored summary (malformed entries skipped)."""
+    if base is None:
+        return {}
+    facts: dict[str, KeyFact] = {}
+    for name, fact in base.key_facts.items():
+        try:
+            facts[name] = KeyFact(
+                value=fact["value"],
+                confidence=fact["confidence"],
+                reinforced=max(1, fact.get("reinforced") or 1),
+                source_memory_ids=list(fact.get("source_memory_ids") or []),
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.debug("base_key_fact_skipped", fact_name=name)
+    return facts
+
+
+def _merge_key_facts(*fact_maps: dict[str, KeyFact]) -> dict[str, KeyFact]:
+    """Merge key facts of summaries, oldest first.
+
+    Facts with the same name accumulate reinforcement and sources; the value
+    comes from the most confident observation (the later one on ties).
+    """
+    merged: dict[str, KeyFact] = {}
+    for facts in fact_maps:
+        for name, fact in facts.items():
+            current = merged.get(name)
+            if current is None:
+                merged[name] = fact
+                continue
+            stronger = fact if fact.confidence >= current.confidence else current
+            merged[name] = KeyFact(
+                value=stronger.value,
+                confidence=max(current.confidence, fact.confidence),
+                reinforced=current.reinforced + fact.reinforced,
+                source_memory_ids=list(
+                    dict.fromkeys([*current.source_memory_ids, *fact.source_memory_ids])
+                ),
+            )
+    return merged
@@ -11,6 +11,7 @@ import structlog
 from src.config import heuristics
 from src.domain.exceptions import DomainError
 from src.domain.ports.chat_repository import IChatEventRepository
+from src.domain.ports.consolidation_counter_port import IConsolidationCounterRepository
 from src.domain.ports.episodic_memory_repository import IEpisodicMemoryRepository
 from src.domain.value_objects.consolidation import ConsolidationScope
 
@@ -28,6 +29,11 @@ class ConsolidationTriggerService:
     Philosophy: Consolidation is periodic, not per-request.
     Consolidation happens in background when thresholds are met.
 
+    Thresholds are checked against maintained counters (activity since the
+    scope was last consolidated), so a check reads counters instead of
+    counting history. Without a counter repository, consolidation is
+    manual only.
+
     Example:
         >>> trigger_service = ConsolidationTriggerService(episodic_repo, chat_repo)
         >>> should = await trigger_service.should_consolidate(
@@ -42,15 +48,18 @@ class ConsolidationTriggerService:
         self,
         episodic_repo: IEpisodicMemoryRepository,
         chat_repo: IChatEventRepository,
+        counter_repo: IConsolidationCounterRepository | None = None,
     ) -> None:
         """Initialize consolidation trigger service.
 
         Args:
             episodic_repo: Repository for episodic memories
             chat_repo: Repository for chat events (for session counting)
+            counter_repo: Maintained consolidation counters (None: manual only)
         """
         self._episodic_repo = episodic_repo
         self._chat_repo = chat_repo
+        self._counter_repo = counter_repo
 
     async def should_consolidate(
         self,
@@ -107,7 +116,8 @@ class ConsolidationTriggerService:
     async def _should_consolidate_entity(self, user_id: str, entity_id: str) -> bool:
         """Check if entity should be consolidated.
 
-        Threshold: CONSOLIDATION_MIN_EPISODIC+ episodic memories about entity.
+        Threshold: CONSOLIDATION_MIN_EPISODIC+ episodic memories about entity
+        since it was last consolidated.
 
         Args:
             user_id: User identifier
@@ -116,34 +126,30 @@ class ConsolidationTriggerService:
         Returns:
             True if threshold met
         """
-        # For Phase 1, simplified: check recent episodic memories
-        # In production, would have a specific query for entity-filtered count
+        if self._counter_repo is None:
+            return False
 
-        # Simplified implementation: Always return False for Phase 1
-        # In Phase 1D integration, we'll implement proper counting
-        # For now, manual trigger via API will work
+        count = await self._counter_repo.get_count(
+            user_id, ConsolidationScope.entity_scope(entity_id)
+        )
 
         logger.debug(
             "entity_consolidation_check",
             user_id=user_id,
             entity_id=entity_id,
+            count=count,
             threshold=heuristics.CONSOLIDATION_MIN_EPISODIC,
         )
 
-        # Phase 1D: Automatic triggering deferred - requires count_by_entity() repository method
-        # Implementation:
-        # count = await self._episodic_repo.count_by_entity(user_id, entity_id)
-        # return count >= heuristics.CONSOLIDATION_MIN_EPISODIC
-        #
-        # For Phase 1, consolidation is triggered manually via API endpoint
-        return False
+        return count >= heuristics.CONSOLIDATION_MIN_EPISODIC
 
     async def _should_consolidate_session_window(
         self, user_id: str, num_sessions: int
     ) -> bool:
         """Check if session window should be consolidated.
 
-        Threshold: CONSOLIDATION_MIN_SESSIONS+ completed sessions.
+        Threshold: CONSOLIDATION_MIN_SESSIONS+ sessions since the last
+        session-window consolidation.
 
         Args:
             user_id: User identifier
@@ -152,28 +158,28 @@ class ConsolidationTriggerService:
         Returns:
             True if threshold met
         """
-        # Count recent sessions
-        # For Phase 1, simplified: always return False (manual trigger)
+        if self._counter_repo is None:
+            return False
+
+        count = await self._counter_repo.get_count(
+            user_id, ConsolidationScope.session_window_scope(num_sessions)
+        )
 
         logger.debug(
             "session_window_consolidation_check",
             user_id=user_id,
             num_sessions=num_sessions,
+            count=count,
             threshold=heuristics.CONSOLIDATION_MIN_SESSIONS,
         )
 
-        # Phase 1D: Automatic triggering deferred - requires count_recent_sessions() repository method
-        # Implementation:
-        # sessions = await self._chat_repo.count_recent_sessions(user_id)
-        # return sessions >= heuristics.CONSOLIDATION_MIN_SESSIONS
-        #
-        # For Phase 1, consolidation is triggered manually via API endpoint
-        return False
+        return count >= heuristics.CONSOLIDATION_MIN_SESSIONS
 
     async def get_pending_consolidations(self, user_id: str) -> list[ConsolidationScope]:
         """Get all scopes that need consolidation.
 
-        Scans user's interaction history to find scopes meeting thresholds.
+        Reads the user's counters that crossed a threshold (cost follows the
+        number of pending scopes, not the size of the history).
 
         Args:
             user_id: User identifier
@@ -188,25 +194,15 @@ class ConsolidationTriggerService:
             logger.info("scanning_pending_consolidations", user_id=user_id)
 
             pending: list[ConsolidationScope] = []
-
-            # Check session window
-            if await self._should_consolidate_session_window(
-                user_id, heuristics.CONSOLIDATION_SESSION_WINDOW_DEFAULT
-            ):
-                pending.append(
-                    ConsolidationScope.session_window_scope(
-                        heuristics.CONSOLIDATION_SESSION_WINDOW_DEFAULT
+            if self._counter_repo is not None:
+                pending = [
+                    p.scope
+                    for p in await self._counter_repo.find_pending(
+                        min_episodic=heuristics.CONSOLIDATION_MIN_EPISODIC,
+                        min_sessions=heuristics.CONSOLIDATION_MIN_SESSIONS,
+                        user_id=user_id,
                     )
-                )
-
-            # Phase 1D: Entity scanning deferred - requires _get_active_entities() method
-            # Implementation:
-            # entities = await self._get_active_entities(user_id)
-            # for entity_id in entities:
-            #     if await self._should_consolidate_entity(user_id, entity_id):
-            #         pending.append(ConsolidationScope.entity_scope(entity_id))
-            #
-            # For Phase 1, only session window consolidation is checked
+                ]
 
             logger.info(
                 "pending_consolidations_found",
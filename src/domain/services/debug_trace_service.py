@@ -62,6 +62,7 @@ class TraceContext:
     started_at: datetime
     traces: list[DebugTrace] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+    spans: list[dict[str, Any]] = field(default_factory=list)
 
     def add_trace(
         self,
@@ -92,6 +93,14 @@ class TraceContext:
         self.traces.append(trace)
         return trace.trace_id
 
+    def add_span_tree(self, tree: dict[str, Any]) -> None:
+        """Attach a finished root span and its descendants.
+
+        Args:
+            tree: Span tree (see span_tracer.Span.to_dict)
+        """
+        self.spans.append(tree)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization.
 
@@ -113,6 +122,7 @@ class TraceContext:
                 }
                 for trace in self.traces
             ],
+            "spans": self.spans,
             "metadata": self.metadata,
             "trace_count": len(self.traces),
         }
@@ -9,6 +9,7 @@ from src.config import heuristics
 from src.domain.entities import CanonicalEntity, EntityAlias
 from src.domain.exceptions import AmbiguousEntityError
 from src.domain.ports import DomainDatabasePort, IEntityRepository, ILLMService
+from src.domain.services.span_tracer import SpanKind, span
 from src.domain.value_objects import (
     ConversationContext,
     EntityMention,
@@ -77,6 +78,17 @@ class EntityResolutionService:
             AmbiguousEntityError: If multiple entities match with equal confidence
             EntityResolutionError: If resolution fails unexpectedly
         """
+        with span("entity_resolution", SpanKind.ENTITY_RESOLUTION) as resolution_span:
+            result = await self._resolve_entity(mention, context)
+            resolution_span.set_attribute("method", result.method.value)
+            resolution_span.set_attribute("success", result.is_successful)
+            return result
+
+    async def _resolve_entity(
+        self,
+        mention: EntityMention,
+        context: ConversationContext,
+    ) -> ResolutionResult:
         logger.info(
             "resolving_entity",
             mention=mention.text,
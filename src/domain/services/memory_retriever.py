@@ -18,9 +18,11 @@ import structlog
 
 from src.domain.exceptions import DomainError
 from src.domain.ports.embedding_service import IEmbeddingService
+from src.domain.ports.retrieval_cache_port import IRetrievalCache
 from src.domain.services.candidate_generator import CandidateGenerator
 from src.domain.services.entity_resolution_service import EntityResolutionService
 from src.domain.services.multi_signal_scorer import MultiSignalScorer
+from src.domain.value_objects.memory_candidate import MemoryCandidate
 from src.domain.value_objects.query_context import QueryContext, RetrievalFilters
 from src.domain.value_objects.retrieval_result import RetrievalMetadata, RetrievalResult
 
@@ -56,6 +58,7 @@ class MemoryRetriever:
         entity_resolver: EntityResolutionService,
         candidate_generator: CandidateGenerator,
         scorer: MultiSignalScorer,
+        query_cache: IRetrievalCache | None = None,
     ) -> None:
         """Initialize memory retriever.
 
@@ -64,11 +67,14 @@ class MemoryRetriever:
             entity_resolver: Service for resolving entities from query
             candidate_generator: Service for parallel candidate generation
             scorer: Service for multi-signal relevance scoring
+            query_cache: Optional semantic cache of earlier queries' candidates;
+                hits skip candidate generation but are always re-scored
         """
         self._embedding_service = embedding_service
         self._entity_resolver = entity_resolver
         self._candidate_generator = candidate_generator
         self._scorer = scorer
+        self._query_cache = query_cache
 
     async def retrieve(
         self,
@@ -114,7 +120,7 @@ class MemoryRetriever:
             )
 
             # Step 1: Embed query
-            query_embedding = await self._embedding_service.embed_text(query)
+            query_embedding = await self._embedding_service.generate_embedding(query)
             if not isinstance(query_embedding, np.ndarray):
                 query_embedding = np.array(query_embedding)
 
@@ -133,13 +139,27 @@ class MemoryRetriever:
                 strategy=strategy,
             )
 
-            # Step 4: Generate candidates (parallel retrieval from all layers)
-            candidates = await self._candidate_generator.generate_candidates(
-                query_context=query_context,
-                filters=filters,
-            )
+            # Step 4: Reuse candidates of a near-identical earlier query, or
+            # generate them (parallel retrieval from all layers)
+            cache_hit = False
+            generation = 0
+            cached = None
+            if self._query_cache is not None:
+                cached = self._query_cache.lookup(query_context, top_k, filters)
+                generation = self._query_cache.generation(user_id)
+
+            if cached is not None:
+                candidates = cached
+                cache_hit = True
+            else:
+                candidates = await self._candidate_generator.generate_candidates(
+                    query_context=query_context,
+                    filters=filters,
+                )
 
             if not candidates:
+                if self._query_cache is not None and not cache_hit:
+                    self._query_cache.store(query_context, top_k, filters, [], generation)
                 logger.warning(
                     "no_candidates_found",
                     query=query,
@@ -153,6 +173,7 @@ class MemoryRetriever:
                         candidates_scored=0,
                         top_score=0.0,
                         retrieval_time_ms=(time.perf_counter() - start_time) * 1000,
+                        cache_hit=cache_hit,
                     ),
                 )
 
@@ -165,6 +186,15 @@ class MemoryRetriever:
             # Step 6: Select top-k
             top_memories = scored_memories[:top_k]
 
+            if self._query_cache is not None and not cache_hit:
+                self._query_cache.store(
+                    query_context,
+                    top_k,
+                    filters,
+                    [m.candidate for m in top_memories],
+                    generation,
+                )
+
             # Calculate metadata
             end_time = time.perf_counter()
             retrieval_time_ms = (end_time - start_time) * 1000
@@ -174,11 +204,13 @@ class MemoryRetriever:
                 candidates_scored=len(scored_memories),
                 top_score=top_memories[0].relevance_score if top_memories else 0.0,
                 retrieval_time_ms=retrieval_time_ms,
+                cache_hit=cache_hit,
             )
 
             logger.info(
                 "retrieval_completed",
                 user_id=user_id,
+                cache_hit=cache_hit,
                 candidates_generated=len(candidates),
                 top_k_count=len(top_memories),
                 top_score=metadata.top_score,
@@ -201,6 +233,147 @@ class MemoryRetriever:
             msg = f"Error retrieving memories: {e}"
             raise DomainError(msg) from e
 
+    async def retrieve_many(
+        self,
+        queries: list[str],
+        user_id: str,
+        session_id: UUID | None = None,
+        strategy: str = "exploratory",
+        top_k: int = 20,
+        filters: RetrievalFilters | None = None,
+    ) -> list[RetrievalResult]:
+        """Retrieve relevant memories for several queries in one pass.
+
+        Same pipeline as retrieve(), batched end to end:
+        1. Embed all queries with one generate_embeddings_batch call
+        2. Resolve entities per query
+        3. Serve queries from the query cache where possible; generate
+           candidates for the rest with one ANN query per layer
+        4. Score every (query, candidate) pair as one vectorized batch
+        5. Return top-k per query
+
+        Args:
+            queries: Query texts (results are returned in the same order)
+            user_id: User identifier
+            session_id: Optional session context
+            strategy: Retrieval strategy applied to every query
+            top_k: Number of top memories to return per query
+            filters: Optional filters applied to every query
+
+        Returns:
+            One RetrievalResult per query. retrieval_time_ms in each result's
+            metadata is the wall time of the whole batch.
+
+        Raises:
+            DomainError: If retrieval pipeline fails
+        """
+        if not queries:
+            return []
+
+        start_time = time.perf_counter()
+
+        try:
+            logger.info(
+                "retrieval_batch_started",
+                user_id=user_id,
+                query_count=len(queries),
+                strategy=strategy,
+                top_k=top_k,
+            )
+
+            # Step 1: Embed all queries in a single provider call
+            embeddings = await self._embedding_service.generate_embeddings_batch(queries)
+
+            # Step 2-3: Resolve entities and build one context per query
+            query_contexts = []
+            for query, embedding in zip(queries, embeddings, strict=True):
+                entity_ids = await self._resolve_query_entities(query, user_id)
+                query_contexts.append(
+                    QueryContext(
+                        query_text=query,
+                        query_embedding=np.asarray(embedding, dtype=np.float64),
+                        entity_ids=entity_ids,
+                        user_id=user_id,
+                        session_id=str(session_id) if session_id else None,
+                        strategy=strategy,
+                    )
+                )
+
+            # Step 4: Cached candidates where available, one batched
+            # generation for the rest
+            candidate_lists: list[list[MemoryCandidate] | None] = [None] * len(query_contexts)
+            generation = 0
+            if self._query_cache is not None:
+                generation = self._query_cache.generation(user_id)
+                for i, ctx in enumerate(query_contexts):
+                    candidate_lists[i] = self._query_cache.lookup(ctx, top_k, filters)
+            cache_hits = [c is not None for c in candidate_lists]
+
+            misses = [i for i, hit in enumerate(cache_hits) if not hit]
+            if misses:
+                generated = await self._candidate_generator.generate_candidates_batch(
+                    query_contexts=[query_contexts[i] for i in misses],
+                    filters=filters,
+                )
+                for i, candidates in zip(misses, generated, strict=True):
+                    candidate_lists[i] = candidates
+
+            # Step 5: Vectorized scoring across all queries
+            scored_lists = self._scorer.score_candidates_batch(
+                candidate_lists=candidate_lists,
+                query_contexts=query_contexts,
+            )
+
+            retrieval_time_ms = (time.perf_counter() - start_time) * 1000
+
+            results = []
+            for query_context, candidates, scored, cache_hit in zip(
+                query_contexts, candidate_lists, scored_lists, cache_hits, strict=True
+            ):
+                top_memories = scored[:top_k]
+                if self._query_cache is not None and not cache_hit:
+                    self._query_cache.store(
+                        query_context,
+                        top_k,
+                        filters,
+                        [m.candidate for m in top_memories],
+                        generation,
+                    )
+                results.append(
+                    RetrievalResult(
+                        memories=top_memories,
+                        query_context=query_context,
+                        metadata=RetrievalMetadata(
+                            candidates_generated=len(candidates),
+                            candidates_scored=len(scored),
+                            top_score=top_memories[0].relevance_score if top_memories else 0.0,
+                            retrieval_time_ms=retrieval_time_ms,
+                            cache_hit=cache_hit,
+                        ),
+                    )
+                )
+
+            logger.info(
+                "retrieval_batch_completed",
+                user_id=user_id,
+                query_count=len(queries),
+                cache_hits=sum(cache_hits),
+                candidates_generated=sum(len(c) for c in candidate_lists),
+                retrieval_time_ms=retrieval_time_ms,
+            )
+
+            return results
+
+        except Exception as e:
+            logger.error(
+                "retrieval_batch_error",
+                user_id=user_id,
+                query_count=len(queries),
+                error=str(e),
+            )
+            msg = f"Error retrieving memories: {e}"
+            raise DomainError(msg) from e
+
     async def _resolve_query_entities(self, query: str, user_id: str) -> list[str]:
         """Resolve entities from query text.
 
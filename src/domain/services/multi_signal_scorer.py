@@ -97,6 +97,125 @@ class MultiSignalScorer:
 
         return scored_memories
 
+    def score_candidates_batch(
+        self,
+        candidate_lists: list[list[MemoryCandidate]],
+        query_contexts: list[QueryContext],
+    ) -> list[list[ScoredMemory]]:
+        """Score candidates for several queries as one vectorized batch.
+
+        Produces the same scores as calling score_candidates once per query,
+        but computes the embedding-heavy signals (cosine similarity, recency)
+        and the weighted combination with array operations over all
+        (query, candidate) pairs at once.
+
+        Args:
+            candidate_lists: Candidates per query (parallel to query_contexts)
+            query_contexts: Query contexts with embeddings and entities
+
+        Returns:
+            One list of scored memories per query, each sorted by relevance
+            (highest first)
+        """
+        if len(candidate_lists) != len(query_contexts):
+            msg = "candidate_lists and query_contexts must have the same length"
+            raise ValueError(msg)
+
+        pairs = [
+            (query_index, candidate)
+            for query_index, candidates in enumerate(candidate_lists)
+            for candidate in candidates
+        ]
+        if not pairs:
+            return [[] for _ in query_contexts]
+
+        logger.info(
+            "scoring_candidates_batch",
+            query_count=len(query_contexts),
+            candidate_count=len(pairs),
+        )
+
+        query_index = np.fromiter((qi for qi, _ in pairs), dtype=np.intp, count=len(pairs))
+        candidates = [candidate for _, candidate in pairs]
+
+        # Semantic similarity: row-wise cosine between each candidate and its query
+        query_matrix = np.vstack([ctx.query_embedding for ctx in query_contexts])
+        memory_matrix = np.vstack([c.embedding for c in candidates])
+        dots = np.einsum("ij,ij->i", query_matrix[query_index], memory_matrix)
+        norms = (
+            np.linalg.norm(query_matrix, axis=1)[query_index]
+            * np.linalg.norm(memory_matrix, axis=1)
+        )
+        semantic = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+        semantic = np.clip(semantic, 0.0, 1.0)
+
+        # Recency: exponential decay with per-layer half-life
+        ages = np.array([c.age_days for c in candidates])
+        half_lives = np.array(
+            [
+                heuristics.EPISODIC_HALF_LIFE_DAYS
+                if c.is_episodic
+                else heuristics.SEMANTIC_HALF_LIFE_DAYS
+                for c in candidates
+            ],
+            dtype=np.float64,
+        )
+        recency = np.clip(np.exp(-ages * math.log(2) / half_lives), 0.0, 1.0)
+
+        importance = np.array([c.importance for c in candidates], dtype=np.float64)
+        entity_overlap = np.array(
+            [
+                self._calculate_entity_overlap(query_contexts[qi].entity_ids, c.entities)
+                for qi, c in pairs
+            ]
+        )
+        reinforcement = np.array([self._calculate_reinforcement_score(c) for c in candidates])
+        confidence = np.array([self._calculate_effective_confidence(c) for c in candidates])
+
+        # Per-query strategy weights, broadcast to every pair
+        weight_rows = [heuristics.get_retrieval_weights(ctx.strategy) for ctx in query_contexts]
+        signal_names = (
+            "semantic_similarity",
+            "entity_overlap",
+            "temporal_relevance",
+            "importance",
+            "reinforcement",
+        )
+        weights = np.array([[w[name] for name in signal_names] for w in weight_rows])[query_index]
+        signals = np.column_stack(
+            [semantic, entity_overlap, recency, importance, reinforcement]
+        )
+        relevance = np.einsum("ij,ij->i", weights, signals)
+        final = np.clip(relevance * confidence, 0.0, 1.0)
+
+        results: list[list[ScoredMemory]] = [[] for _ in query_contexts]
+        for i, (qi, candidate) in enumerate(pairs):
+            results[qi].append(
+                ScoredMemory(
+                    candidate=candidate,
+                    relevance_score=float(final[i]),
+                    signal_breakdown=SignalBreakdown(
+                        semantic_similarity=float(semantic[i]),
+                        entity_overlap=float(entity_overlap[i]),
+                        recency_score=float(recency[i]),
+                        importance_score=float(importance[i]),
+                        reinforcement_score=float(reinforcement[i]),
+                        effective_confidence=float(confidence[i]),
+                    ),
+                )
+            )
+
+        for scored in results:
+            scored.sort(key=lambda x: x.relevance_score, reverse=True)
+
+        logger.info(
+            "scoring_completed_batch",
+            query_count=len(query_contexts),
+            scored_count=len(pairs),
+        )
+
+        return results
+
     def _score_single_candidate(
         self,
         candidate: MemoryCandidate,
@@ -4,14 +4,29 @@ Redacts personally identifiable information from text before storage or transmis
 """
 
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from re import Pattern
+from typing import Any
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
 
+def _combine(
+    patterns: dict[str, Pattern], guards: dict[str, str], order: tuple[str, ...]
+) -> Pattern:
+    """Compile patterns into one alternation with a named group per type.
+
+    Each branch is preceded by a lookahead on its guard, so most positions
+    are rejected by one character test instead of a full branch attempt.
+    """
+    return re.compile(
+        "|".join(f"(?={guards[name]})(?P<{name}>{patterns[name].pattern})" for name in order)
+    )
+
+
 @dataclass(frozen=True)
 class RedactionResult:
     """Result of PII redaction operation.
@@ -21,7 +36,7 @@ class RedactionResult:
 
     original_text: str
     redacted_text: str
-    redactions: list[dict[str, str]]  # [{"type": "phone", "token": "[PHONE-xxx]"}]
+    redactions: list[dict[str, Any]]  # [{"type": "phone", "original_length": 12, "token": "[PHONE-REDACTED]"}]
     was_redacted: bool
 
     def __bool__(self) -> bool:
@@ -47,11 +62,40 @@ class PIIRedactionService:
         "phone": re.compile(
             r"\b(\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"
         ),
-        "email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
+        # Local part bounded by its RFC 5321 maximum (64): unbounded, every word
+        # boundary in a long dotted run would rescan the run looking for "@"
+        "email": re.compile(r"\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
         "ssn": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
         "credit_card": re.compile(r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b"),
     }
 
+    # What each pattern's match starts with (a necessary condition only).
+    # Fixed width: the lookahead is tried at every position, so a guard that
+    # scanned ahead (e.g. for the "@") would be quadratic in long words
+    _GUARDS: dict[str, str] = {
+        "phone": r"[\d(+]",
+        "email": r"\b[A-Za-z0-9._%+-]",
+        "ssn": r"\d",
+        "credit_card": r"\d",
+    }
+
+    # All patterns as one alternation of named groups, so a text is scanned
+    # once. Where matches overlap, the leftmost wins, and at the same start the
+    # earlier type in this order (a card number is not redacted as a phone).
+    # Texts without "@" use the scanner without the email branch
+    _SCANNER: Pattern = _combine(
+        PII_PATTERNS, _GUARDS, ("credit_card", "ssn", "phone", "email")
+    )
+    _DIGIT_SCANNER: Pattern = _combine(PII_PATTERNS, _GUARDS, ("credit_card", "ssn", "phone"))
+
+    # Every pattern needs a digit or "@"; texts without either skip the scan
+    _PREFILTER: Pattern = re.compile(r"[\d@]")
+
+    # Streaming keeps this many trailing characters for the next chunk, so a
+    # match split across chunks is still found (longer than any PII match:
+    # email addresses are at most 254 characters)
+    STREAM_OVERLAP = 512
+
     def redact(self, text: str, preserve_length: bool = False) -> str:
         """Redact PII from text.
 
@@ -77,66 +121,138 @@ class PIIRedactionService:
             preserve_length: If True, use tokens that preserve original length
 
         Returns:
-            RedactionResult with original, redacted, and metadata
+            RedactionResult with original, redacted, and metadata (redactions
+            in text order)
         """
-        if not text:
-            return RedactionResult(
-                original_text=text,
-                redacted_text=text,
-                redactions=[],
-                was_redacted=False,
-            )
+        result, _ = self._redact_span(text, 0, len(text), preserve_length)
+        return result
+
+    def redact_stream(
+        self, chunks: Iterable[str], preserve_length: bool = False
+    ) -> Iterator[RedactionResult]:
+        """Redact PII from text arriving in chunks (e.g. a large pasted document).
 
-        redacted = text
-        redactions = []
+        Memory stays bounded by the chunk size plus STREAM_OVERLAP, and the
+        redactions equal those of redact_with_metadata() on the joined text.
+
+        Args:
+            chunks: Consecutive pieces of the text
+            preserve_length: If True, use tokens that preserve original length
+
+        Yields:
+            One RedactionResult per consecutive segment of the text; joining
+            their redacted_text gives the redacted document
+        """
+        buffer = ""
+        start = 0  # buffer[:start] is context already emitted
+        for chunk in chunks:
+            buffer += chunk
+            safe_end = len(buffer) - self.STREAM_OVERLAP
+            if safe_end <= start:
+                continue
+
+            result, cut = self._redact_span(buffer, start, safe_end, preserve_length)
+            if result.original_text:
+                yield result
+            # Keep one emitted character so word boundaries at the cut hold
+            buffer = buffer[cut - 1 :] if cut > 0 else buffer
+            start = 1 if cut > 0 else 0
+
+        result, _ = self._redact_span(buffer, start, len(buffer), preserve_length)
+        if result.original_text:
+            yield result
+
+    def validate_no_pii(self, text: str) -> bool:
+        """Validate that text contains no PII.
+
+        Used in assertions/tests to verify redaction worked.
 
-        for pii_type, pattern in self.PII_PATTERNS.items():
-            matches = list(pattern.finditer(redacted))
+        Args:
+            text: Text to validate
 
-            for match in matches:
-                original_value = match.group()
+        Returns:
+            True if no PII detected, False otherwise
+        """
+        scanner = self._scanner_for(text, 0)
+        return scanner is None or scanner.search(text) is None
 
-                # Generate token
-                if preserve_length:
-                    # Preserve length for alignment in logs
-                    token = f"[{pii_type.upper()[:3]}-{'x' * (len(original_value) - 7)}]"
-                else:
-                    token = f"[{pii_type.upper()}-REDACTED]"
+    def _redact_span(
+        self, text: str, start: int, safe_end: int, preserve_length: bool
+    ) -> tuple[RedactionResult, int]:
+        """Redact text[start:cut] in one scan.
 
-                # Replace
-                redacted = redacted.replace(original_value, token, 1)
+        Matches ending after safe_end are left for a later call (with more
+        text), so cut is safe_end or the start of the first such match.
 
-                # Log redaction
+        Returns:
+            Redaction result of the segment and cut
+        """
+        segment_end = safe_end
+        parts: list[str] = []
+        redactions: list[dict[str, Any]] = []
+        position = start
+
+        scanner = self._scanner_for(text, start)
+        if scanner is not None:
+            for match in scanner.finditer(text, start):
+                if match.end() > safe_end:
+                    segment_end = min(match.start(), safe_end)
+                    break
+
+                pii_type = match.lastgroup or "pii"
+                original_length = match.end() - match.start()
+                token = self._token(pii_type, original_length, preserve_length)
+                parts.append(text[position : match.start()])
+                parts.append(token)
+                position = match.end()
                 redactions.append(
                     {
                         "type": pii_type,
-                        "original_length": len(original_value),
+                        "original_length": original_length,
                         "token": token,
                     }
                 )
 
-                logger.warning(
-                    "pii_redacted",
-                    pii_type=pii_type,
-                    original_length=len(original_value),
-                )
+        original = text[start:segment_end]
+        if not redactions:
+            return (
+                RedactionResult(
+                    original_text=original,
+                    redacted_text=original,
+                    redactions=[],
+                    was_redacted=False,
+                ),
+                segment_end,
+            )
 
-        return RedactionResult(
-            original_text=text,
-            redacted_text=redacted,
-            redactions=redactions,
-            was_redacted=len(redactions) > 0,
-        )
+        parts.append(text[position:segment_end])
 
-    def validate_no_pii(self, text: str) -> bool:
-        """Validate that text contains no PII.
-
-        Used in assertions/tests to verify redaction worked.
+        logger.warning(
+            "pii_redacted",
+            pii_types=sorted({r["type"] for r in redactions}),
+            redaction_count=len(redactions),
+        )
 
-        Args:
-            text: Text to validate
+        return (
+            RedactionResult(
+                original_text=original,
+                redacted_text="".join(parts),
+                redactions=redactions,
+                was_redacted=True,
+            ),
+            segment_end,
+        )
 
-        Returns:
-            True if no PII detected, False otherwise
-        """
-        return all(not pattern.search(text) for pattern in self.PII_PATTERNS.values())
+    def _scanner_for(self, text: str, start: int) -> Pattern | None:
+        """Scanner for text[start:], or None if it cannot contain PII."""
+        if not self._PREFILTER.search(text, start):
+            return None
+        return self._SCANNER if text.find("@", start) != -1 else self._DIGIT_SCANNER
+
+    @staticmethod
+    def _token(pii_type: str, original_length: int, preserve_length: bool) -> str:
+        """Replacement token for one match."""
+        if preserve_length:
+            # Preserve length for alignment in logs
+            return f"[{pii_type.upper()[:3]}-{'x' * (original_length - 7)}]"
+        return f"[{pii_type.upper()}-REDACTED]"
@@ -20,22 +20,29 @@ import structlog
 from src.config import heuristics
 from src.domain.entities.procedural_memory import ProceduralMemory
 from src.domain.exceptions import DomainError
-from src.domain.ports.tool_usage_tracker_port import IToolUsageTracker
 from src.domain.ports.procedural_memory_repository import IProceduralMemoryRepository
-from src.domain.value_objects.procedural_memory import Pattern
+from src.domain.ports.tool_sequence_port import IToolSequenceStateRepository
+from src.domain.ports.tool_usage_tracker_port import IToolUsageTracker
+from src.domain.value_objects.procedural_memory import Pattern, ToolSequenceCounts
 
 logger = structlog.get_logger()
 
 
+def _newest_distinct(ids: list[str], limit: int) -> list[str]:
+    """Keep the last occurrence of each id and the newest `limit`, oldest first."""
+    return list(dict.fromkeys(reversed(ids)))[:limit][::-1]
+
+
 class ProceduralMemoryService:
     """Detects and applies procedural patterns from tool usage.
 
     Philosophy: Learn from what the LLM actually does, not keyword matching.
 
-    Phase 1 Approach:
+    Approach:
     - Analyze tool usage logs (what tools are called together)
-    - Detect co-occurrence patterns (frequency analysis)
-    - Phase 2+: Use sequence mining for temporal patterns
+    - Count sequences per anchor tool (first tool called) incrementally:
+      new usage is folded into persisted counts past a watermark
+    - Derive co-occurrence patterns from the counts
 
     Example pattern:
         Trigger: "LLM calls get_invoice_status"
@@ -52,15 +59,19 @@ class ProceduralMemoryService:
         self,
         tool_usage_tracker: IToolUsageTracker,
         procedural_repo: IProceduralMemoryRepository,
+        sequence_state_repo: IToolSequenceStateRepository | None = None,
     ) -> None:
         """Initialize procedural memory service.
 
         Args:
             tool_usage_tracker: Tracks tool usage logs for pattern mining
             procedural_repo: Repository for procedural memories
+            sequence_state_repo: Streaming miner state (None: patterns are
+                detected from a window of recent logs on each call)
         """
         self._tool_tracker = tool_usage_tracker
         self._procedural_repo = procedural_repo
+        self._sequence_state_repo = sequence_state_repo
 
     async def detect_patterns(
         self,
@@ -68,17 +79,21 @@ class ProceduralMemoryService:
         lookback_days: int = 30,
         min_support: int = 3,
     ) -> list[ProceduralMemory]:
-        """Detect new patterns from tool usage logs.
+        """Detect patterns from tool usage logs.
 
-        Analyzes recent tool calls to find co-occurrence patterns.
+        With the streaming miner, the user's patterns mined so far are read
+        back; mining itself runs in the background (mine_tool_usage), so the
+        call does no mining. Otherwise, the user's recent logs are analyzed
+        for co-occurrence patterns.
 
         Args:
             user_id: User identifier
-            lookback_days: How far back to analyze (default 30 days)
+            lookback_days: How far back to analyze without the streaming
+                miner (default 30 days; the miner's counts are cumulative)
             min_support: Minimum occurrences to consider pattern (default 3)
 
         Returns:
-            List of newly created ProceduralMemory instances
+            List of the user's created or updated ProceduralMemory instances
 
         Raises:
             DomainError: If pattern detection fails
@@ -91,75 +106,21 @@ class ProceduralMemoryService:
                 min_support=min_support,
             )
 
-            # Fetch recent tool usage logs
-            since = datetime.now(UTC) - timedelta(days=lookback_days)
-            usage_logs = await self._tool_tracker.get_usage_logs(
-                user_id=user_id,
-                since=since,
-                limit=500,  # Analyze last 500 interactions
-            )
-
-            if len(usage_logs) < min_support * 2:
-                logger.info(
-                    "insufficient_tool_usage_for_pattern_detection",
-                    user_id=user_id,
-                    log_count=len(usage_logs),
-                    min_required=min_support * 2,
+            if self._sequence_state_repo is not None:
+                stored = await self._procedural_repo.find_by_user(
+                    user_id=user_id, min_confidence=0.0
                 )
-                return []
-
-            # Extract tool call sequences from logs
-            tool_sequences = [
-                self._extract_tool_sequence(log) for log in usage_logs
-            ]
-
-            # Find frequent co-occurrence patterns
-            patterns = self._find_frequent_tool_patterns(
-                tool_sequences, min_support=min_support
-            )
-
-            if not patterns:
-                logger.info("no_tool_patterns_found", user_id=user_id)
-                return []
-
-            # Convert patterns to ProceduralMemory and store
-            procedural_memories = []
-            for pattern in patterns:
-                # Check if pattern already exists
-                existing = await self._procedural_repo.find_by_trigger_features(
-                    user_id=user_id,
-                    intent=pattern.trigger_features.get("anchor_tool"),
-                    entity_types=pattern.trigger_features.get("entity_types"),
-                    min_confidence=0.0,
-                    limit=1,
+                procedural_memories = [
+                    memory
+                    for memory in stored
+                    if "anchor_tool" in memory.trigger_features
+                    and memory.observed_count >= min_support
+                ]
+            else:
+                procedural_memories = await self._detect_recent_patterns(
+                    user_id, lookback_days, min_support
                 )
 
-                if existing:
-                    # Pattern exists, increment observed_count
-                    updated = existing[0].increment_observed_count()
-                    procedural_memories.append(
-                        await self._procedural_repo.update(updated)
-                    )
-                    logger.info(
-                        "tool_pattern_reinforced",
-                        memory_id=updated.memory_id,
-                        observed_count=updated.observed_count,
-                        confidence=updated.confidence,
-                    )
-                else:
-                    # New pattern, create
-                    memory = ProceduralMemory.from_pattern(
-                        pattern=pattern, user_id=user_id
-                    )
-                    created = await self._procedural_repo.create(memory)
-                    procedural_memories.append(created)
-                    logger.info(
-                        "tool_pattern_created",
-                        memory_id=created.memory_id,
-                        trigger=created.trigger_pattern,
-                        confidence=created.confidence,
-                    )
-
             logger.info(
                 "tool_pattern_detection_completed",
                 user_id=user_id,
@@ -175,6 +136,122 @@ class ProceduralMemoryService:
             msg = f"Error detecting tool patterns: {e}"
             raise DomainError(msg) from e
 
+    async def mine_tool_usage(
+        self,
+        min_support: int = heuristics.PROCEDURAL_MIN_SUPPORT,
+        batch_size: int = heuristics.PROCEDURAL_MINER_BATCH_SIZE,
+        max_batches: int = heuristics.PROCEDURAL_MINER_MAX_BATCHES,
+    ) -> list[ProceduralMemory]:
+        """Fold new tool usage into the sequence counts and upsert patterns.
+
+        Each batch of logs past the watermark is counted per (user, anchor
+        tool), merged into the persisted counts of the anchors it touched,
+        and the patterns of those anchors are upserted in one statement.
+        Cost follows new usage, not history.
+
+        Args:
+            min_support: Minimum anchored sequences for a pattern
+            batch_size: Logs per batch
+            max_batches: Batches per call (the rest is mined next time)
+
+        Returns:
+            Patterns created or updated, across users
+
+        Raises:
+            DomainError: If no sequence state repository is configured
+        """
+        if self._sequence_state_repo is None:
+            msg = "Streaming pattern mining requires a sequence state repository"
+            raise DomainError(msg)
+
+        mined: dict[int | None, ProceduralMemory] = {}
+        logs_mined = 0
+
+        for _ in range(max_batches):
+            batch = await self._sequence_state_repo.read_usage_batch(batch_size)
+
+            user_sequences: dict[str, list[dict[str, Any]]] = defaultdict(list)
+            for log in batch.logs:
+                if log.get("user_id"):
+                    user_sequences[log["user_id"]].append(
+                        self._extract_tool_sequence(log)
+                    )
+
+            deltas = {
+                (counts.user_id, counts.anchor_tool): counts
+                for user, sequences in user_sequences.items()
+                for counts in self._count_sequences(user, sequences)
+            }
+            merged = {
+                (counts.user_id, counts.anchor_tool): counts
+                for counts in await self._sequence_state_repo.load_counts(list(deltas))
+            }
+            for key, delta in deltas.items():
+                merged[key] = (
+                    merged[key].merge(delta, heuristics.PROCEDURAL_MINER_MAX_SOURCES)
+                    if key in merged
+                    else delta
+                )
+
+            await self._sequence_state_repo.save_counts(
+                list(merged.values()), batch.watermark
+            )
+
+            memories = []
+            for counts in merged.values():
+                pattern = self._pattern_from_counts(counts, min_support)
+                if pattern is not None:
+                    memories.append(
+                        ProceduralMemory.from_pattern(pattern=pattern, user_id=counts.user_id)
+                    )
+            for memory in await self._procedural_repo.upsert_mined_patterns(memories):
+                mined[memory.memory_id] = memory
+
+            logs_mined += len(batch.logs)
+            if len(batch.logs) < batch_size:
+                break
+
+        logger.info(
+            "tool_usage_mined",
+            logs_mined=logs_mined,
+            patterns_upserted=len(mined),
+        )
+
+        return list(mined.values())
+
+    async def _detect_recent_patterns(
+        self, user_id: str, lookback_days: int, min_support: int
+    ) -> list[ProceduralMemory]:
+        """Detect and upsert patterns from the user's recent usage logs."""
+        since = datetime.now(UTC) - timedelta(days=lookback_days)
+        usage_logs = await self._tool_tracker.get_usage_logs(
+            user_id=user_id,
+            since=since,
+            limit=500,  # Analyze last 500 interactions
+        )
+
+        if len(usage_logs) < min_support * 2:
+            logger.info(
+                "insufficient_tool_usage_for_pattern_detection",
+                user_id=user_id,
+                log_count=len(usage_logs),
+                min_required=min_support * 2,
+            )
+            return []
+
+        tool_sequences = [self._extract_tool_sequence(log) for log in usage_logs]
+        patterns = self._find_frequent_tool_patterns(
+            tool_sequences, min_support=min_support
+        )
+
+        if not patterns:
+            logger.info("no_tool_patterns_found", user_id=user_id)
+            return []
+
+        return await self._procedural_repo.upsert_mined_patterns(
+            [ProceduralMemory.from_pattern(pattern=p, user_id=user_id) for p in patterns]
+        )
+
     def _extract_tool_sequence(self, usage_log: dict[str, Any]) -> dict[str, Any]:
         """Extract tool call sequence from usage log.
 
@@ -184,7 +261,13 @@ class ProceduralMemoryService:
         Returns:
             Sequence dictionary with tools called and metadata
         """
-        tools_called = usage_log.get("tools_called", [])
+        # Prefetched calls were predicted from existing patterns; mining them
+        # would let a pattern reinforce itself
+        tools_called = [
+            tool_call
+            for tool_call in usage_log.get("tools_called", [])
+            if not tool_call.get("prefetched")
+        ]
 
         # Extract unique tool names (order preserved)
         tool_names = []
@@ -220,11 +303,8 @@ class ProceduralMemoryService:
     ) -> list[Pattern]:
         """Find frequent tool co-occurrence patterns.
 
-        Phase 1: Basic frequency analysis
-        - Find pairs/groups of tools that are called together frequently
-        - Anchor pattern to the first tool called
-
-        Phase 2+: Use sequence mining algorithms (e.g., PrefixSpan)
+        Sequences are anchored on their first tool; tools called after the
+        anchor in enough of its sequences become the pattern's actions.
 
         Args:
             tool_sequences: List of tool call sequences
@@ -233,88 +313,111 @@ class ProceduralMemoryService:
         Returns:
             List of Pattern instances
         """
-        # Group sequences by anchor tool (first tool called)
-        anchor_groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        patterns = []
+        for counts in self._count_sequences("", tool_sequences):
+            pattern = self._pattern_from_counts(counts, min_support)
+            if pattern is not None:
+                patterns.append(pattern)
+        return patterns
+
+    def _count_sequences(
+        self, user_id: str, tool_sequences: list[dict[str, Any]]
+    ) -> list[ToolSequenceCounts]:
+        """Count one user's tool sequences per anchor tool (first tool called).
+
+        Args:
+            user_id: User the sequences belong to
+            tool_sequences: Sequences from _extract_tool_sequence
+
+        Returns:
+            One ToolSequenceCounts per anchor tool
+        """
+        supports: Counter[str] = Counter()
+        followers: dict[str, Counter[str]] = defaultdict(Counter)
+        entity_types: dict[str, Counter[str]] = defaultdict(Counter)
+        sources: dict[str, list[str]] = defaultdict(list)
+
         for sequence in tool_sequences:
             tools = sequence["tools"]
             if not tools:
                 continue
             anchor_tool = tools[0]
-            anchor_groups[anchor_tool].append(sequence)
-
-        patterns = []
-
-        # For each anchor tool, find commonly co-occurring tools
-        for anchor_tool, sequences in anchor_groups.items():
-            if len(sequences) < min_support:
-                continue  # Not frequent enough
-
-            # Count co-occurring tools (excluding anchor)
-            cooccurrence_counter: Counter[str] = Counter()
-            entity_counter: Counter[str] = Counter()
-
-            for seq in sequences:
-                # Count all tools after the anchor
-                for tool in seq["tools"][1:]:
-                    cooccurrence_counter[tool] += 1
-                # Count entity types
-                for entity_type in seq["entity_types"]:
-                    entity_counter[entity_type] += 1
-
-            # Find tools that co-occur in >50% of cases
-            threshold = len(sequences) * 0.5
-            frequent_cooccurrences = [
-                tool
-                for tool, count in cooccurrence_counter.items()
-                if count >= threshold
-            ]
-
-            if not frequent_cooccurrences:
-                continue  # No strong co-occurrence pattern
-
-            # Find frequent entity types
-            frequent_entities = [
-                entity
-                for entity, count in entity_counter.items()
-                if count >= threshold
-            ]
-
-            # Create pattern
-            trigger_pattern = self._format_trigger_pattern(anchor_tool)
-            action_heuristic = self._format_action_heuristic(
-                anchor_tool, frequent_cooccurrences
+            supports[anchor_tool] += 1
+            followers[anchor_tool].update(tools[1:])
+            entity_types[anchor_tool].update(sequence["entity_types"])
+            if sequence["conversation_id"]:
+                sources[anchor_tool].append(sequence["conversation_id"])
+
+        return [
+            ToolSequenceCounts(
+                user_id=user_id,
+                anchor_tool=anchor_tool,
+                support=support,
+                follower_counts=dict(followers[anchor_tool]),
+                entity_type_counts=dict(entity_types[anchor_tool]),
+                recent_conversation_ids=_newest_distinct(
+                    sources[anchor_tool], heuristics.PROCEDURAL_MINER_MAX_SOURCES
+                ),
             )
+            for anchor_tool, support in supports.items()
+        ]
 
-            # Get conversation IDs as source
-            source_conversation_ids = [
-                seq["conversation_id"] for seq in sequences
-            ]
-
-            # Calculate confidence (higher frequency → higher confidence)
-            # Cap at 0.90 for Phase 1 patterns (not ML-based)
-            confidence = min(0.90, 0.5 + (len(sequences) / 20.0))
-
-            pattern = Pattern(
-                trigger_pattern=trigger_pattern,
-                trigger_features={
-                    "anchor_tool": anchor_tool,
-                    "entity_types": frequent_entities,
-                    "tool_type": "domain_query",
-                },
-                action_heuristic=action_heuristic,
-                action_structure={
-                    "action_type": "call_additional_tools",
-                    "tools": frequent_cooccurrences,
-                    "reason": f"These tools are frequently called after {anchor_tool}",
-                },
-                observed_count=len(sequences),
-                confidence=confidence,
-                source_episode_ids=source_conversation_ids,  # Using conversation IDs
-            )
+    def _pattern_from_counts(
+        self, counts: ToolSequenceCounts, min_support: int
+    ) -> Pattern | None:
+        """Derive the "When anchor, also call ..." pattern of one anchor tool.
 
-            patterns.append(pattern)
+        Args:
+            counts: Sequence counts of the anchor
+            min_support: Minimum anchored sequences
 
-        return patterns
+        Returns:
+            Pattern, or None if the anchor is too rare or no tool follows it
+            in enough of its sequences
+        """
+        if counts.support < min_support:
+            return None
+
+        threshold = counts.support * heuristics.PROCEDURAL_COOCCURRENCE_RATIO
+        frequent_cooccurrences = [
+            tool for tool, count in counts.follower_counts.items() if count >= threshold
+        ]
+        if not frequent_cooccurrences:
+            return None
+
+        frequent_entities = sorted(
+            entity_type
+            for entity_type, count in counts.entity_type_counts.items()
+            if count >= threshold
+        )
+
+        # Higher frequency → higher confidence; capped at 0.90 because the
+        # patterns come from counting, not a learned model
+        confidence = min(0.90, 0.5 + (counts.support / 20.0))
+
+        return Pattern(
+            trigger_pattern=self._format_trigger_pattern(counts.anchor_tool),
+            trigger_features={
+                "intent": None,
+                "anchor_tool": counts.anchor_tool,
+                "entity_types": frequent_entities,
+                "topics": [],
+                "tool_type": "domain_query",
+            },
+            action_heuristic=self._format_action_heuristic(
+                counts.anchor_tool, frequent_cooccurrences
+            ),
+            action_structure={
+                "action_type": "call_additional_tools",
+                "tools": frequent_cooccurrences,
+                "queries": [],
+                "predicates": [],
+                "reason": f"These tools are frequently called after {counts.anchor_tool}",
+            },
+            observed_count=counts.support,
+            confidence=confidence,
+            source_episode_ids=counts.recent_conversation_ids,  # Using conversation IDs
+        )
 
     def _format_trigger_pattern(self, anchor_tool: str) -> str:
         """Format anchor tool into natural language trigger pattern.
@@ -0,0 +1,237 @@
+"""Span tracer - lightweight contextvar spans for latency breakdowns.
+
+Spans nest through a context variable: a span opened while another is
+current becomes its child, including across asyncio tasks (tasks copy the
+context they were created in). Finished spans are handed to registered
+processors (Prometheus histograms, an OpenTelemetry exporter, ...); with no
+processor registered a span only costs two clock reads and an allocation.
+
+When a root span finishes while a DebugTraceService context is active, its
+span tree is attached to that context.
+
+Span fields follow the OpenTelemetry data model (128-bit trace id, 64-bit
+span id, wall-clock start/end in nanoseconds), so finished trees can be
+re-emitted to an OTel SDK without translation.
+
+Architecture: Pure domain service with no infrastructure dependencies.
+"""
+
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Protocol
+
+import structlog
+
+from src.domain.services.debug_trace_service import DebugTraceService
+
+logger = structlog.get_logger(__name__)
+
+
+class SpanKind(str, Enum):
+    """What a span measures (selects the histogram it feeds)."""
+
+    PHASE = "phase"
+    LLM = "llm"
+    EMBEDDING = "embedding"
+    REPOSITORY = "repository"
+    ENTITY_RESOLUTION = "entity_resolution"
+    MEMORY_RETRIEVAL = "memory_retrieval"
+
+
+class SpanStatus(str, Enum):
+    """Span outcome."""
+
+    OK = "ok"
+    ERROR = "error"
+
+
+@dataclass(slots=True, eq=False)
+class Span:
+    """One timed operation.
+
+    Attributes:
+        name: Operation name (e.g. "resolve", "OpenAILLMService.chat")
+        kind: What the span measures
+        trace_id: 32 hex chars, shared by every span of a tree
+        span_id: 16 hex chars
+        parent: Enclosing span, None for roots
+        attributes: Labels for processors (provider, model, layer, ...)
+        start_time_ns: Wall-clock start (Unix epoch nanoseconds)
+        duration_ns: Monotonic duration, None while running
+        status: OK unless the block raised
+        error: Exception type name when status is ERROR
+        children: Spans opened while this one was current
+    """
+
+    name: str
+    kind: SpanKind
+    trace_id: str
+    span_id: str
+    parent: "Span | None"
+    attributes: dict[str, Any]
+    start_time_ns: int
+    _start_perf_ns: int
+    duration_ns: int | None = None
+    status: SpanStatus = SpanStatus.OK
+    error: str | None = None
+    children: list["Span"] = field(default_factory=list)
+
+    @property
+    def parent_span_id(self) -> str | None:
+        """Span id of the parent, None for roots."""
+        return self.parent.span_id if self.parent is not None else None
+
+    @property
+    def end_time_ns(self) -> int | None:
+        """Wall-clock end (Unix epoch nanoseconds), None while running."""
+        if self.duration_ns is None:
+            return None
+        return self.start_time_ns + self.duration_ns
+
+    @property
+    def duration_seconds(self) -> float:
+        """Duration in seconds (elapsed so far while running)."""
+        duration_ns = self.duration_ns
+        if duration_ns is None:
+            duration_ns = time.perf_counter_ns() - self._start_perf_ns
+        return duration_ns / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute known only once the operation has run.
+
+        Args:
+            key: Attribute name
+            value: Attribute value
+        """
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the span and its descendants to a JSON-serializable tree.
+
+        Returns:
+            Dictionary representation
+        """
+        return {
+            "name": self.name,
+            "kind": self.kind.value,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_ns": self.start_time_ns,
+            "duration_ms": (
+                self.duration_ns / 1e6 if self.duration_ns is not None else None
+            ),
+            "status": self.status.value,
+            "error": self.error,
+            "attributes": dict(self.attributes),
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class SpanProcessor(Protocol):
+    """Receives every finished span (children finish before their parent)."""
+
+    def on_end(self, span: Span) -> None:
+        """Handle a finished span.
+
+        Args:
+            span: Finished span
+        """
+        ...
+
+
+_current_span: ContextVar[Span | None] = ContextVar("_current_span", default=None)
+_processors: list[SpanProcessor] = []
+
+
+def current_span() -> Span | None:
+    """Span currently open in this context, if any."""
+    return _current_span.get()
+
+
+def add_span_processor(processor: SpanProcessor) -> None:
+    """Register a processor for finished spans (idempotent).
+
+    Args:
+        processor: Processor to register
+    """
+    if processor not in _processors:
+        _processors.append(processor)
+
+
+def remove_span_processor(processor: SpanProcessor) -> None:
+    """Unregister a processor.
+
+    Args:
+        processor: Previously registered processor
+    """
+    if processor in _processors:
+        _processors.remove(processor)
+
+
+@contextmanager
+def span(name: str, kind: SpanKind = SpanKind.PHASE, **attributes: Any) -> Iterator[Span]:
+    """Time a block as a span nested under the current one.
+
+    Example:
+        with span("llm.chat", SpanKind.LLM, provider="openai", model=model) as s:
+            response = await client.create(...)
+            s.set_attribute("tokens", response.usage.total_tokens)
+
+    Args:
+        name: Operation name
+        kind: What the span measures
+        **attributes: Initial attributes
+
+    Yields:
+        The open span
+    """
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        kind=kind,
+        trace_id=parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}",
+        span_id=f"{random.getrandbits(64):016x}",
+        parent=parent,
+        attributes=attributes,
+        start_time_ns=time.time_ns(),
+        _start_perf_ns=time.perf_counter_ns(),
+    )
+    if parent is not None:
+        parent.children.append(current)
+
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = SpanStatus.ERROR
+        current.error = type(e).__name__
+        raise
+    finally:
+        current.duration_ns = time.perf_counter_ns() - current._start_perf_ns
+        _current_span.reset(token)
+        _finish(current)
+
+
+def _finish(finished: Span) -> None:
+    for processor in _processors:
+        try:
+            processor.on_end(finished)
+        except Exception as e:
+            # Telemetry must never fail the traced operation
+            logger.warning(
+                "span_processor_failed",
+                processor=type(processor).__name__,
+                span=finished.name,
+                error=str(e),
+            )
+
+    if finished.parent is None:
+        context = DebugTraceService.get_current_context()
+        if context is not None:
+            context.add_span_tree(finished.to_dict())
@@ -17,7 +17,7 @@ from src.domain.value_objects.memory_conflict import (
     ConflictType,
     MemoryConflict,
 )
-from src.domain.value_objects.procedural_memory import Pattern
+from src.domain.value_objects.procedural_memory import Pattern, ToolSequenceCounts
 from src.domain.value_objects.query_context import QueryContext
 from src.domain.value_objects.resolution_result import ResolutionMethod, ResolutionResult
 from src.domain.value_objects.semantic_triple import PredicateType, SemanticTriple
@@ -40,6 +40,7 @@ __all__ = [
     "KeyFact",
     "SummaryData",
     "Pattern",
+    "ToolSequenceCounts",
     "MemoryCandidate",
     "ScoredMemory",
     "SignalBreakdown",
@@ -102,12 +102,29 @@ class MemoryConflict:
             "existing_content": self.existing_content,
             "new_content": self.new_content,
             "recommended_resolution": self.recommended_resolution.value,
-            "confidence_diff": self.confidence_diff,
+            "confidence_diff": float(self.confidence_diff),
             "temporal_diff_days": self.temporal_diff_days,
-            "semantic_similarity": self.semantic_similarity,
+            "semantic_similarity": float(self.semantic_similarity),
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MemoryConflict":
+        """Rebuild a conflict from its to_dict() form (e.g. a queued job payload)."""
+        return cls(
+            conflict_type=ConflictType(data["conflict_type"]),
+            new_memory_id=data.get("new_memory_id"),
+            existing_memory_id=data["existing_memory_id"],
+            entities=list(data["entities"]),
+            existing_content=data["existing_content"],
+            new_content=data["new_content"],
+            recommended_resolution=ConflictResolution(data["recommended_resolution"]),
+            confidence_diff=data.get("confidence_diff", 0.0),
+            temporal_diff_days=data.get("temporal_diff_days"),
+            semantic_similarity=data.get("semantic_similarity", 0.0),
+            metadata=data.get("metadata") or {},
+        )
+
     def __str__(self) -> str:
         """String representation for logging."""
         entities_str = ", ".join(self.entities[:2])  # Show first 2 entities
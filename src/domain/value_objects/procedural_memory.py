@@ -9,7 +9,7 @@ Design from: PHASE1D_PLAN_ITERATION.md
 Vision: Layer 5 - Learning from interaction patterns
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -101,3 +101,64 @@ class Pattern:
             "confidence": self.confidence,
             "source_episode_ids": self.source_episode_ids,
         }
+
+
+
+@dataclass(frozen=True)
+class ToolSequenceCounts:
+    """Mined counts of the tool sequences starting with one anchor tool.
+
+    The streaming miner keeps one of these per (user, anchor tool): the
+    number of sequences anchored on the tool, and how many of them contained
+    each later tool and each entity type. These are the length-2 extensions
+    of the anchor prefix (PrefixSpan's projected counts), which is all the
+    "When X, also Y" patterns need. Counts are additive, so the counts of a
+    batch of new usage are folded in with merge() without revisiting older
+    logs.
+
+    Attributes:
+        user_id: User identifier
+        anchor_tool: First tool called in the counted sequences
+        support: Number of sequences anchored on the tool
+        follower_counts: Sequences containing each later tool
+        entity_type_counts: Sequences touching each entity type
+        recent_conversation_ids: Newest source conversations, oldest first
+    """
+
+    user_id: str
+    anchor_tool: str
+    support: int = 0
+    follower_counts: dict[str, int] = field(default_factory=dict)
+    entity_type_counts: dict[str, int] = field(default_factory=dict)
+    recent_conversation_ids: list[str] = field(default_factory=list)
+
+    def merge(self, delta: "ToolSequenceCounts", max_sources: int) -> "ToolSequenceCounts":
+        """Add the counts of newer usage of the same (user, anchor).
+
+        Args:
+            delta: Counts mined from usage newer than this state
+            max_sources: Bound on recent_conversation_ids
+
+        Returns:
+            New ToolSequenceCounts with both counts summed
+        """
+        follower_counts = dict(self.follower_counts)
+        for tool, count in delta.follower_counts.items():
+            follower_counts[tool] = follower_counts.get(tool, 0) + count
+
+        entity_type_counts = dict(self.entity_type_counts)
+        for entity_type, count in delta.entity_type_counts.items():
+            entity_type_counts[entity_type] = entity_type_counts.get(entity_type, 0) + count
+
+        newer = set(delta.recent_conversation_ids)
+        sources = [c for c in self.recent_conversation_ids if c not in newer]
+        sources.extend(delta.recent_conversation_ids)
+
+        return ToolSequenceCounts(
+            user_id=self.user_id,
+            anchor_tool=self.anchor_tool,
+            support=self.support + delta.support,
+            follower_counts=follower_counts,
+            entity_type_counts=entity_type_counts,
+            recent_conversation_ids=sources[-max_sources:],
+        )
@@ -22,12 +22,14 @@ class RetrievalMetadata:
         candidates_scored: Number of candidates that were scored
         top_score: Highest relevance score achieved
         retrieval_time_ms: Total retrieval time in milliseconds
+        cache_hit: Whether candidates came from the semantic query cache
     """
 
     candidates_generated: int
     candidates_scored: int
     top_score: float
     retrieval_time_ms: float
+    cache_hit: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -36,6 +38,7 @@ class RetrievalMetadata:
             "candidates_scored": self.candidates_scored,
             "top_score": self.top_score,
             "retrieval_time_ms": self.retrieval_time_ms,
+            "cache_hit": self.cache_hit,
         }
 
 
@@ -0,0 +1,15 @@
+"""In-process caches.
+
+Semantic query-result cache in front of memory retrieval.
+"""
+from src.infrastructure.cache.semantic_query_cache import (
+    SemanticQueryCache,
+    note_semantic_memory_write,
+    register_orm_invalidation,
+)
+
+__all__ = [
+    "SemanticQueryCache",
+    "note_semantic_memory_write",
+    "register_orm_invalidation",
+]
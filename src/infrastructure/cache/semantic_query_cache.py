@@ -0,0 +1,289 @@
+"""In-process semantic query-result cache for memory retrieval.
+
+Entries are grouped per user and matched by cosine similarity of query
+embeddings, so paraphrased repeats hit without an exact-text match. A hit
+costs one small matrix-vector product instead of the three-layer ANN
+candidate fan-out; MemoryRetriever re-scores the cached candidates, so
+recency and confidence decay are always current.
+
+Freshness:
+- Writes through the ORM in this process invalidate the writing user's
+  entries when their transaction commits (see register_orm_invalidation).
+- Writes this process cannot observe (other workers, raw SQL) are bounded by
+  max_staleness_seconds: no entry is served after that age.
+"""
+
+import itertools
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.api.metrics import (
+    retrieval_cache_hit_age_seconds,
+    retrieval_cache_invalidations_total,
+    retrieval_cache_lookups_total,
+)
+from src.domain.ports.retrieval_cache_port import IRetrievalCache
+from src.domain.value_objects.memory_candidate import MemoryCandidate
+from src.domain.value_objects.query_context import QueryContext, RetrievalFilters
+from src.infrastructure.database.models import SemanticMemory as SemanticMemoryModel
+
+logger = structlog.get_logger(__name__)
+
+# Session.info key collecting users whose semantic memories were flushed
+_PENDING_INVALIDATIONS = "retrieval_cache_pending_users"
+
+
+@dataclass
+class _Entry:
+    unit_embedding: npt.NDArray[np.float64]
+    bucket: tuple[Any, ...]
+    top_k: int
+    candidates: list[MemoryCandidate]
+    stored_at: float
+
+
+class SemanticQueryCache(IRetrievalCache):
+    """Per-user LRU of retrieval candidates matched by embedding similarity.
+
+    Not shared across processes; each worker keeps its own cache.
+
+    Args:
+        similarity_threshold: Minimum query-embedding cosine similarity for a hit
+        max_staleness_seconds: Maximum age of a served entry
+        max_entries_per_user: LRU bound on entries per user
+        max_users: LRU bound on users with entries
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.95,
+        max_staleness_seconds: float = 300.0,
+        max_entries_per_user: int = 64,
+        max_users: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.max_staleness_seconds = max_staleness_seconds
+        self.max_entries_per_user = max_entries_per_user
+        self.max_users = max_users
+        self._clock = clock
+        self._entries: OrderedDict[str, list[_Entry]] = OrderedDict()
+        self._generations: OrderedDict[str, int] = OrderedDict()
+        self._generation_counter = itertools.count(1)
+        # Generation reported for users whose counter was evicted; it only
+        # grows, so an in-flight store for an evicted user is always rejected
+        self._evicted_generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache since startup."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of cache effectiveness and freshness guarantees."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "max_staleness_seconds": self.max_staleness_seconds,
+            "users": len(self._entries),
+            "entries": sum(len(e) for e in self._entries.values()),
+        }
+
+    def generation(self, user_id: str) -> int:
+        """Current invalidation generation for a user."""
+        return self._generations.get(user_id, self._evicted_generation)
+
+    def lookup(
+        self,
+        query_context: QueryContext,
+        top_k: int,
+        filters: RetrievalFilters | None = None,
+    ) -> list[MemoryCandidate] | None:
+        """Return candidates of the most similar fresh entry in the same bucket.
+
+        Args:
+            query_context: Context of the incoming query
+            top_k: Number of memories the caller will return
+            filters: Filters of the incoming query
+
+        Returns:
+            Cached candidates, or None on a miss
+        """
+        entry = self._find(query_context, top_k, filters)
+        if entry is None:
+            self.misses += 1
+            retrieval_cache_lookups_total.labels(outcome="miss").inc()
+            return None
+
+        self.hits += 1
+        retrieval_cache_lookups_total.labels(outcome="hit").inc()
+        retrieval_cache_hit_age_seconds.observe(self._clock() - entry.stored_at)
+        logger.debug(
+            "retrieval_cache_hit",
+            user_id=query_context.user_id,
+            cached_candidates=len(entry.candidates),
+        )
+        return list(entry.candidates)
+
+    def store(
+        self,
+        query_context: QueryContext,
+        top_k: int,
+        filters: RetrievalFilters | None,
+        candidates: list[MemoryCandidate],
+        generation: int,
+    ) -> None:
+        """Cache candidates unless the user was invalidated since `generation`.
+
+        Args:
+            query_context: Context the candidates were retrieved for
+            top_k: Number of memories the retrieval returned
+            filters: Filters used for the retrieval
+            candidates: Top-k candidates
+            generation: Value of generation() read before the retrieval began
+        """
+        user_id = query_context.user_id
+        if generation != self.generation(user_id):
+            # Memories changed while this result was being computed
+            return
+
+        unit = _unit(query_context.query_embedding)
+        if unit is None:
+            return
+
+        entries = self._entries.setdefault(user_id, [])
+        self._entries.move_to_end(user_id)
+        entries.append(
+            _Entry(
+                unit_embedding=unit,
+                bucket=_bucket(query_context, filters),
+                top_k=top_k,
+                candidates=list(candidates),
+                stored_at=self._clock(),
+            )
+        )
+        del entries[: -self.max_entries_per_user]
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop a user's entries and advance their generation."""
+        self._entries.pop(user_id, None)
+        self._generations[user_id] = next(self._generation_counter)
+        self._generations.move_to_end(user_id)
+        while len(self._generations) > self.max_users:
+            _, evicted = self._generations.popitem(last=False)
+            self._evicted_generation = max(self._evicted_generation, evicted)
+        retrieval_cache_invalidations_total.inc()
+
+    def clear(self) -> None:
+        """Drop all cached entries (generations are kept)."""
+        self._entries.clear()
+
+    def _find(
+        self,
+        query_context: QueryContext,
+        top_k: int,
+        filters: RetrievalFilters | None,
+    ) -> _Entry | None:
+        entries = self._entries.get(query_context.user_id)
+        if not entries:
+            return None
+
+        cutoff = self._clock() - self.max_staleness_seconds
+        entries[:] = [e for e in entries if e.stored_at >= cutoff]
+
+        bucket = _bucket(query_context, filters)
+        eligible = [e for e in entries if e.bucket == bucket and e.top_k >= top_k]
+        unit = _unit(query_context.query_embedding)
+        if not eligible or unit is None:
+            return None
+
+        similarities = np.stack([e.unit_embedding for e in eligible]) @ unit
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+
+        entry = eligible[best]
+        entries.remove(entry)
+        entries.append(entry)
+        self._entries.move_to_end(query_context.user_id)
+        return entry
+
+
+def _bucket(query_context: QueryContext, filters: RetrievalFilters | None) -> tuple[Any, ...]:
+    """Exact-match part of the cache key (entity sets must be equal)."""
+    return (
+        query_context.strategy,
+        query_context.session_id,
+        repr(filters),
+        frozenset(query_context.entity_ids),
+    )
+
+
+def _unit(embedding: npt.NDArray[np.float64]) -> npt.NDArray[np.float64] | None:
+    norm = np.linalg.norm(embedding)
+    if norm == 0:
+        return None
+    return np.asarray(embedding, dtype=np.float64) / norm
+
+
+def note_semantic_memory_write(session: AsyncSession | Session, user_id: str) -> None:
+    """Record a semantic memory write the ORM flush did not see.
+
+    Core INSERT/UPDATE statements bypass the unit of work, so repositories
+    using them call this to have the user invalidated on commit.
+
+    Args:
+        session: Session the write was executed in
+        user_id: Owner of the written memory
+    """
+    session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(user_id)
+
+
+def register_orm_invalidation(cache: IRetrievalCache) -> None:
+    """Invalidate a user's cache entries when their semantic memories change.
+
+    Listens on every ORM session in the process: users whose semantic
+    memories were inserted, updated (including supersession) or deleted in a
+    flush, or reported via note_semantic_memory_write, are invalidated once
+    the transaction commits, and forgotten on rollback.
+
+    Args:
+        cache: Cache to invalidate
+    """
+
+    def _after_flush(session: Session, flush_context: Any) -> None:
+        users = {
+            obj.user_id
+            for obj in itertools.chain(session.new, session.dirty, session.deleted)
+            if isinstance(obj, SemanticMemoryModel)
+        }
+        if users:
+            session.info.setdefault(_PENDING_INVALIDATIONS, set()).update(users)
+
+    def _after_commit(session: Session) -> None:
+        for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+            cache.invalidate_user(user_id)
+
+    def _after_rollback(session: Session) -> None:
+        session.info.pop(_PENDING_INVALIDATIONS, None)
+
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
@@ -12,9 +12,12 @@ from uuid import uuid4
 from sqlalchemy import (
     CheckConstraint,
     Column,
+    Computed,
     Date,
     DateTime,
     ForeignKey,
+    Index,
+    Integer,
     Numeric,
     Text,
 )
@@ -45,6 +48,10 @@ class DomainCustomer(DomainBase):
         return f"<DomainCustomer(name={self.name}, industry={self.industry})>"
 
 
+# find_customer_by_name matches on lower(name)
+Index("ix_domain_customers_lower_name", func.lower(DomainCustomer.name))
+
+
 class DomainSalesOrder(DomainBase):
     """Sales order entity in domain schema."""
 
@@ -60,7 +67,8 @@ class DomainSalesOrder(DomainBase):
     customer_id = Column(
         UUID(as_uuid=True),
         ForeignKey("domain.customers.customer_id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     so_number = Column(Text, unique=True, nullable=False)
     title = Column(Text, nullable=False)
@@ -98,7 +106,8 @@ class DomainWorkOrder(DomainBase):
     so_id = Column(
         UUID(as_uuid=True),
         ForeignKey("domain.sales_orders.so_id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     description = Column(Text)
     status = Column(
@@ -131,11 +140,12 @@ class DomainInvoice(DomainBase):
     so_id = Column(
         UUID(as_uuid=True),
         ForeignKey("domain.sales_orders.so_id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     invoice_number = Column(Text, unique=True, nullable=False)
     amount = Column(Numeric(12, 2), nullable=False)
-    due_date = Column(Date, nullable=False)
+    due_date = Column(Date, nullable=False, index=True)
     status = Column(
         Text,
         CheckConstraint("status IN ('open', 'paid', 'void')"),
@@ -168,7 +178,8 @@ class DomainPayment(DomainBase):
     invoice_id = Column(
         UUID(as_uuid=True),
         ForeignKey("domain.invoices.invoice_id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     amount = Column(Numeric(12, 2), nullable=False)
     method = Column(Text)  # ACH, credit_card, check, wire
@@ -217,3 +228,70 @@ class DomainTask(DomainBase):
 
     def __repr__(self) -> str:
         return f"<DomainTask(title={self.title}, status={self.status})>"
+
+
+# get_tasks_for_customer (all statuses, so the partial index below cannot serve it)
+Index("ix_domain_tasks_customer_created", DomainTask.customer_id, DomainTask.created_at)
+# Partial index for get_sla_risks (open tasks past a created_at cutoff)
+Index(
+    "ix_domain_tasks_open_customer_created",
+    DomainTask.customer_id,
+    DomainTask.created_at,
+    postgresql_where=DomainTask.status != "done",
+)
+
+
+# ============================================================================
+# Rollups (maintained by triggers, see migration e5f6a7b8c9d0)
+# ============================================================================
+
+
+class DomainInvoiceBalance(DomainBase):
+    """Per-invoice payment rollup (replaces SUM over payments at read time)."""
+
+    __tablename__ = "invoice_balances"
+    __table_args__ = {"schema": "domain"}
+
+    invoice_id = Column(UUID(as_uuid=True), primary_key=True)
+    customer_id = Column(UUID(as_uuid=True), index=True)
+    status = Column(Text, nullable=False)
+    amount = Column(Numeric(12, 2), nullable=False)
+    paid_amount = Column(Numeric(12, 2), nullable=False, server_default="0")
+    payment_count = Column(Integer, nullable=False, server_default="0")
+    balance = Column(Numeric(12, 2), Computed("amount - paid_amount", persisted=True))
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<DomainInvoiceBalance(invoice_id={self.invoice_id}, balance={self.balance})>"
+
+
+class DomainCustomerAR(DomainBase):
+    """Per-customer accounts receivable rollup."""
+
+    __tablename__ = "customer_ar"
+    __table_args__ = {"schema": "domain"}
+
+    customer_id = Column(UUID(as_uuid=True), primary_key=True)
+    open_invoice_count = Column(Integer, nullable=False, server_default="0")
+    open_balance = Column(Numeric(14, 2), nullable=False, server_default="0")
+    total_invoiced = Column(Numeric(14, 2), nullable=False, server_default="0")
+    total_paid = Column(Numeric(14, 2), nullable=False, server_default="0")
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<DomainCustomerAR(customer_id={self.customer_id}, open_balance={self.open_balance})>"
+
+
+class DomainSalesOrderProgress(DomainBase):
+    """Per-sales-order work order progress rollup."""
+
+    __tablename__ = "so_work_order_progress"
+    __table_args__ = {"schema": "domain"}
+
+    so_id = Column(UUID(as_uuid=True), primary_key=True)
+    total_wo = Column(Integer, nullable=False, server_default="0")
+    done_wo = Column(Integer, nullable=False, server_default="0")
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<DomainSalesOrderProgress(so_id={self.so_id}, done={self.done_wo}/{self.total_wo})>"
@@ -0,0 +1,251 @@
+"""SQL instrumentation: per-statement metrics, slow-query log and pool gauges.
+
+Engine events time every cursor execution and observe
+db_query_duration_seconds / db_queries_total, labelled with the statement
+type, its main table and the repository method that issued it. Repository
+classes opt in with @instrumented_repository, which records the method name
+in a context variable (SQLAlchemy runs the driver in a greenlet that shares
+the caller's context, so the label is visible inside the event hooks) and
+runs each call in a REPOSITORY span.
+
+Pool gauges expose checked-out connections and saturation; checkout wait
+time is measured by InstrumentedAsyncQueuePool, so pool starvation can be
+told apart from slow statements.
+"""
+
+import functools
+import inspect
+import re
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+import structlog
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.api.metrics import (
+    db_pool_checked_out_connections,
+    db_pool_checkout_wait_seconds,
+    db_pool_saturation_ratio,
+    db_queries_total,
+    db_query_duration_seconds,
+    db_slow_queries_total,
+)
+from src.domain.services.span_tracer import SpanKind, span
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Connection.info key holding start times of in-flight statements
+_START_TIMES = "query_start_times"
+
+# Maximum length of normalized SQL in slow-query log entries
+_MAX_LOGGED_SQL = 1000
+
+# Statements are classified (and cached) on this prefix only, so a statement
+# with a large inlined literal costs bounded regex work and cache memory
+_MAX_CLASSIFIED_SQL = 4096
+
+_current_operation: ContextVar[str | None] = ContextVar("db_operation", default=None)
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_TRUNCATED_LITERAL = re.compile(r"'.*", re.DOTALL)
+_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+|\?")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_CTE_NAME = re.compile(r"(?:\bWITH(?:\s+RECURSIVE)?|,)\s+(\w+)\s+AS\s*(?:NOT\s+)?(?:MATERIALIZED\s+)?\(", re.I)
+_TABLE_REFERENCE = {
+    "insert": re.compile(r"\bINSERT\s+INTO\s+([\w.\"]+)", re.I),
+    "update": re.compile(r"\bUPDATE\s+([\w.\"]+)", re.I),
+    "delete": re.compile(r"\bDELETE\s+FROM\s+([\w.\"]+)", re.I),
+    "select": re.compile(r"\b(?:FROM|JOIN)\s+([\w.\"]+)(?![\w.\"])(?!\s*\()", re.I),
+}
+
+
+def current_operation() -> str | None:
+    """Repository method currently issuing SQL in this context, if any."""
+    return _current_operation.get()
+
+
+def instrumented_repository(cls: type[T]) -> type[T]:
+    """Class decorator labelling SQL issued by public async methods.
+
+    Statements executed while ``Repo.method`` runs are recorded with
+    ``operation="Repo.method"``; nested repository calls use the innermost
+    method. Each call is also traced as a REPOSITORY span of that name.
+
+    Args:
+        cls: Repository class
+
+    Returns:
+        The same class with public coroutine methods wrapped
+    """
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(attribute):
+            continue
+        setattr(cls, name, _with_operation(f"{cls.__name__}.{name}", attribute))
+    return cls
+
+
+def _with_operation(operation: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _current_operation.set(operation)
+        try:
+            with span(operation, SpanKind.REPOSITORY):
+                return await method(*args, **kwargs)
+        finally:
+            _current_operation.reset(token)
+
+    return wrapper
+
+
+def classify_statement(statement: str) -> tuple[str, str, str]:
+    """Derive metric labels and a loggable form from a SQL statement.
+
+    Only the first ``_MAX_CLASSIFIED_SQL`` characters are looked at, which
+    covers the statement type and main table of every repository query.
+
+    Args:
+        statement: SQL as sent to the driver
+
+    Returns:
+        Tuple of (query_type, table, normalized SQL with literals and
+        parameters replaced by ``?``)
+    """
+    return _classify_prefix(statement[:_MAX_CLASSIFIED_SQL])
+
+
+@functools.lru_cache(maxsize=2048)
+def _classify_prefix(statement: str) -> tuple[str, str, str]:
+    """Classify a bounded statement prefix (cached)."""
+    normalized = _COMMENT.sub(" ", statement)
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _TRUNCATED_LITERAL.sub("?", normalized)  # Cut by the prefix bound
+    normalized = _PARAMETER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+
+    first_word = normalized.split(" ", 1)[0].lower() if normalized else ""
+    if first_word == "with":
+        # Data-modifying CTE: classify by the modification it performs
+        upper = normalized.upper()
+        query_type = next(
+            (kind for kind in ("insert", "update", "delete") if f"{kind.upper()} " in upper),
+            "select",
+        )
+    elif first_word in _TABLE_REFERENCE:
+        query_type = first_word
+    else:
+        query_type = first_word or "unknown"
+
+    table = "none"
+    pattern = _TABLE_REFERENCE.get(query_type)
+    if pattern is not None:
+        ctes = {name.lower() for name in _CTE_NAME.findall(normalized)}
+        for match in pattern.finditer(normalized):
+            candidate = match.group(1).replace('"', "").lower()
+            if candidate not in ctes:
+                table = candidate
+                break
+
+    return query_type, table, normalized
+
+
+def _record(statement: str, elapsed: float, status: str, slow_threshold: float) -> None:
+    query_type, table, normalized = classify_statement(statement)
+    operation = _current_operation.get() or "unknown"
+
+    db_query_duration_seconds.labels(
+        query_type=query_type, table=table, operation=operation
+    ).observe(elapsed)
+    db_queries_total.labels(
+        query_type=query_type, table=table, operation=operation, status=status
+    ).inc()
+
+    if elapsed >= slow_threshold:
+        db_slow_queries_total.labels(
+            query_type=query_type, table=table, operation=operation
+        ).inc()
+        logger.warning(
+            "slow_query",
+            duration_ms=round(elapsed * 1000, 1),
+            operation=operation,
+            query_type=query_type,
+            table=table,
+            status=status,
+            sql=normalized[:_MAX_LOGGED_SQL],
+        )
+
+
+def instrument_engine(
+    engine: AsyncEngine | Engine,
+    slow_query_threshold_seconds: float = 0.2,
+    pool_capacity: int | None = None,
+) -> None:
+    """Attach query timing and pool gauges to an engine.
+
+    Args:
+        engine: Engine to instrument (async engines via their sync_engine)
+        slow_query_threshold_seconds: Log statements at least this slow
+        pool_capacity: pool_size + max_overflow, for the saturation gauge
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info[_START_TIMES].pop()
+        _record(statement, elapsed, "success", slow_query_threshold_seconds)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        start_times = conn.info.get(_START_TIMES) if conn is not None else None
+        if start_times and exception_context.statement is not None:
+            elapsed = time.perf_counter() - start_times.pop()
+            _record(exception_context.statement, elapsed, "error", slow_query_threshold_seconds)
+
+    # Counted from events: the pool's own counter is only decremented after
+    # the checkin event has fired
+    checked_out = 0
+
+    def _set_pool_gauges() -> None:
+        db_pool_checked_out_connections.set(checked_out)
+        if pool_capacity:
+            db_pool_saturation_ratio.set(checked_out / pool_capacity)
+
+    @event.listens_for(sync_engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        nonlocal checked_out
+        checked_out += 1
+        _set_pool_gauges()
+
+    @event.listens_for(sync_engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        nonlocal checked_out
+        checked_out = max(checked_out - 1, 0)
+        _set_pool_gauges()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that observes how long checkouts wait.
+
+    The measured time includes opening a new connection when the pool grows,
+    and queueing when pool_size + max_overflow connections are all in use.
+    """
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait_seconds.observe(time.perf_counter() - start)
@@ -0,0 +1,96 @@
+"""add_background_jobs_table
+
+Revision ID: c3d4e5f6a7b8
+Revises: a1b2c3d4e5f6
+Create Date: 2025-10-18 09:00:00.000000
+
+Durable Postgres-backed job queue for post-reply pipeline stages
+(PII policy memories, memory validation, conflict resolution writes,
+aging updates). Workers claim rows with FOR UPDATE SKIP LOCKED.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create background_jobs table with claim-friendly partial indexes."""
+    op.create_table(
+        "background_jobs",
+        sa.Column("job_id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("job_type", sa.Text(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "idempotency_key",
+            sa.Text(),
+            nullable=False,
+            comment="Derived from event_id, e.g. 'pii_policy_memory:42'",
+        ),
+        sa.Column("status", sa.Text(), server_default="pending", nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("max_attempts", sa.Integer(), server_default="5", nullable=False),
+        sa.Column(
+            "run_after",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "status IN ('pending', 'running', 'succeeded', 'failed')",
+            name="valid_job_status",
+        ),
+        sa.PrimaryKeyConstraint("job_id"),
+        sa.UniqueConstraint("idempotency_key", name="uq_background_jobs_idempotency_key"),
+        schema="app",
+        comment="Durable queue for work deferred off the chat critical path",
+    )
+
+    # Claim query: WHERE status = 'pending' AND run_after <= NOW() ORDER BY job_id
+    op.create_index(
+        "idx_background_jobs_pending",
+        "background_jobs",
+        ["run_after"],
+        unique=False,
+        schema="app",
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+    # Stale-lock sweep: WHERE status = 'running' AND locked_at < :cutoff
+    op.create_index(
+        "idx_background_jobs_running",
+        "background_jobs",
+        ["locked_at"],
+        unique=False,
+        schema="app",
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop background_jobs table."""
+    op.drop_index("idx_background_jobs_running", table_name="background_jobs", schema="app")
+    op.drop_index("idx_background_jobs_pending", table_name="background_jobs", schema="app")
+    op.drop_table("background_jobs", schema="app")
@@ -0,0 +1,68 @@
+"""add_llm_extraction_cache
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2025-10-18 10:00:00.000000
+
+Persistent cache of LLM extraction outputs (mentions, semantic facts,
+coreference decisions) keyed by prompt-input hash + model + prompt version.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create llm_extraction_cache table."""
+    op.create_table(
+        "llm_extraction_cache",
+        sa.Column(
+            "cache_key",
+            sa.Text(),
+            nullable=False,
+            comment="SHA-256 of extraction type, model, prompt version and prompt inputs",
+        ),
+        sa.Column("extraction_type", sa.Text(), nullable=False),
+        sa.Column("model", sa.Text(), nullable=False),
+        sa.Column("prompt_version", sa.Text(), nullable=False),
+        sa.Column("result", postgresql.JSONB(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        sa.Column("last_hit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("cache_key"),
+        schema="app",
+        comment="LLM extraction outputs reused for replayed and re-ingested messages",
+    )
+
+    # Versioned invalidation: DELETE ... WHERE extraction_type = :t AND prompt_version <> :v
+    op.create_index(
+        "idx_llm_extraction_cache_version",
+        "llm_extraction_cache",
+        ["extraction_type", "prompt_version"],
+        unique=False,
+        schema="app",
+    )
+
+
+def downgrade() -> None:
+    """Drop llm_extraction_cache table."""
+    op.drop_index(
+        "idx_llm_extraction_cache_version",
+        table_name="llm_extraction_cache",
+        schema="app",
+    )
+    op.drop_table("llm_extraction_cache", schema="app")
@@ -0,0 +1,297 @@
+"""add_domain_financial_rollups
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2025-10-18 11:00:00.000000
+
+Trigger-maintained rollups for the most-called domain tools:
+- domain.invoice_balances: paid amount / balance per invoice
+- domain.customer_ar: open AR per customer (derived from invoice_balances)
+- domain.so_work_order_progress: done/total work orders per sales order
+
+Triggers apply deltas (paid_amount + NEW.amount, ...) through row-locked
+upserts rather than re-aggregating, so concurrent writers cannot lose updates.
+domain.rebuild_financial_rollups() recomputes everything exactly (backfill
+and repair).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGGER_FUNCTIONS_SQL = """
+-- invoices -> invoice_balances
+CREATE OR REPLACE FUNCTION domain.trg_invoices_rollup() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM domain.invoice_balances WHERE invoice_id = OLD.invoice_id;
+        RETURN OLD;
+    END IF;
+
+    INSERT INTO domain.invoice_balances (invoice_id, customer_id, status, amount)
+    SELECT NEW.invoice_id, so.customer_id, NEW.status, NEW.amount
+    FROM domain.sales_orders so
+    WHERE so.so_id = NEW.so_id
+    ON CONFLICT (invoice_id) DO UPDATE SET
+        customer_id = EXCLUDED.customer_id,
+        status = EXCLUDED.status,
+        amount = EXCLUDED.amount,
+        updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- payments -> invoice_balances (deltas)
+CREATE OR REPLACE FUNCTION domain.trg_payments_rollup() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE domain.invoice_balances
+        SET paid_amount = paid_amount - OLD.amount,
+            payment_count = payment_count - 1,
+            updated_at = now()
+        WHERE invoice_id = OLD.invoice_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE domain.invoice_balances
+        SET paid_amount = paid_amount + NEW.amount,
+            payment_count = payment_count + 1,
+            updated_at = now()
+        WHERE invoice_id = NEW.invoice_id;
+        RETURN NEW;
+    END IF;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+-- sales_orders.customer_id change -> re-home invoice balances
+CREATE OR REPLACE FUNCTION domain.trg_sales_orders_rollup() RETURNS trigger AS $$
+BEGIN
+    UPDATE domain.invoice_balances b
+    SET customer_id = NEW.customer_id, updated_at = now()
+    FROM domain.invoices i
+    WHERE i.so_id = NEW.so_id AND b.invoice_id = i.invoice_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- invoice_balances -> customer_ar (contribution of old row out, new row in)
+CREATE OR REPLACE FUNCTION domain.trg_invoice_balances_ar() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.customer_id IS NOT NULL THEN
+        INSERT INTO domain.customer_ar AS ar
+            (customer_id, open_invoice_count, open_balance, total_invoiced, total_paid)
+        VALUES (
+            OLD.customer_id,
+            -(OLD.status = 'open')::int,
+            -CASE WHEN OLD.status = 'open' THEN OLD.balance ELSE 0 END,
+            -OLD.amount,
+            -OLD.paid_amount
+        )
+        ON CONFLICT (customer_id) DO UPDATE SET
+            open_invoice_count = ar.open_invoice_count + EXCLUDED.open_invoice_count,
+            open_balance = ar.open_balance + EXCLUDED.open_balance,
+            total_invoiced = ar.total_invoiced + EXCLUDED.total_invoiced,
+            total_paid = ar.total_paid + EXCLUDED.total_paid,
+            updated_at = now();
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.customer_id IS NOT NULL THEN
+        INSERT INTO domain.customer_ar AS ar
+            (customer_id, open_invoice_count, open_balance, total_invoiced, total_paid)
+        VALUES (
+            NEW.customer_id,
+            (NEW.status = 'open')::int,
+            CASE WHEN NEW.status = 'open' THEN NEW.balance ELSE 0 END,
+            NEW.amount,
+            NEW.paid_amount
+        )
+        ON CONFLICT (customer_id) DO UPDATE SET
+            open_invoice_count = ar.open_invoice_count + EXCLUDED.open_invoice_count,
+            open_balance = ar.open_balance + EXCLUDED.open_balance,
+            total_invoiced = ar.total_invoiced + EXCLUDED.total_invoiced,
+            total_paid = ar.total_paid + EXCLUDED.total_paid,
+            updated_at = now();
+        RETURN NEW;
+    END IF;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+-- work_orders -> so_work_order_progress (deltas)
+CREATE OR REPLACE FUNCTION domain.trg_work_orders_rollup() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE domain.so_work_order_progress
+        SET total_wo = total_wo - 1,
+            done_wo = done_wo - (OLD.status = 'done')::int,
+            updated_at = now()
+        WHERE so_id = OLD.so_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO domain.so_work_order_progress AS p (so_id, total_wo, done_wo)
+        VALUES (NEW.so_id, 1, (NEW.status = 'done')::int)
+        ON CONFLICT (so_id) DO UPDATE SET
+            total_wo = p.total_wo + 1,
+            done_wo = p.done_wo + EXCLUDED.done_wo,
+            updated_at = now();
+        RETURN NEW;
+    END IF;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Exact full recompute (backfill / repair)
+CREATE OR REPLACE FUNCTION domain.rebuild_financial_rollups() RETURNS void AS $$
+BEGIN
+    LOCK TABLE domain.invoice_balances, domain.customer_ar, domain.so_work_order_progress
+        IN ACCESS EXCLUSIVE MODE;
+    TRUNCATE domain.invoice_balances, domain.customer_ar, domain.so_work_order_progress;
+
+    -- customer_ar is populated by the invoice_balances trigger
+    INSERT INTO domain.invoice_balances
+        (invoice_id, customer_id, status, amount, paid_amount, payment_count)
+    SELECT i.invoice_id, so.customer_id, i.status, i.amount,
+           COALESCE(p.paid, 0), COALESCE(p.payment_count, 0)
+    FROM domain.invoices i
+    JOIN domain.sales_orders so ON so.so_id = i.so_id
+    LEFT JOIN (
+        SELECT invoice_id, SUM(amount) AS paid, COUNT(*) AS payment_count
+        FROM domain.payments
+        GROUP BY invoice_id
+    ) p ON p.invoice_id = i.invoice_id;
+
+    INSERT INTO domain.so_work_order_progress (so_id, total_wo, done_wo)
+    SELECT so_id, COUNT(*), COUNT(*) FILTER (WHERE status = 'done')
+    FROM domain.work_orders
+    GROUP BY so_id;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS_SQL = """
+CREATE TRIGGER invoices_rollup
+    AFTER INSERT OR DELETE OR UPDATE OF amount, status, so_id ON domain.invoices
+    FOR EACH ROW EXECUTE FUNCTION domain.trg_invoices_rollup();
+
+CREATE TRIGGER payments_rollup
+    AFTER INSERT OR DELETE OR UPDATE OF amount, invoice_id ON domain.payments
+    FOR EACH ROW EXECUTE FUNCTION domain.trg_payments_rollup();
+
+CREATE TRIGGER sales_orders_rollup
+    AFTER UPDATE OF customer_id ON domain.sales_orders
+    FOR EACH ROW EXECUTE FUNCTION domain.trg_sales_orders_rollup();
+
+CREATE TRIGGER invoice_balances_ar
+    AFTER INSERT OR DELETE OR UPDATE ON domain.invoice_balances
+    FOR EACH ROW EXECUTE FUNCTION domain.trg_invoice_balances_ar();
+
+CREATE TRIGGER work_orders_rollup
+    AFTER INSERT OR DELETE OR UPDATE OF status, so_id ON domain.work_orders
+    FOR EACH ROW EXECUTE FUNCTION domain.trg_work_orders_rollup();
+"""
+
+
+def upgrade() -> None:
+    """Create rollup tables, maintenance triggers and backfill them."""
+    # Foreign-key indexes (used by the rollup triggers and the exact fallbacks)
+    op.create_index("ix_domain_payments_invoice_id", "payments", ["invoice_id"], schema="domain")
+    op.create_index("ix_domain_invoices_so_id", "invoices", ["so_id"], schema="domain")
+    op.create_index("ix_domain_work_orders_so_id", "work_orders", ["so_id"], schema="domain")
+
+    op.create_table(
+        "invoice_balances",
+        sa.Column("invoice_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("customer_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("status", sa.Text(), nullable=False),
+        sa.Column("amount", sa.Numeric(12, 2), nullable=False),
+        sa.Column("paid_amount", sa.Numeric(12, 2), server_default="0", nullable=False),
+        sa.Column("payment_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "balance",
+            sa.Numeric(12, 2),
+            sa.Computed("amount - paid_amount", persisted=True),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("invoice_id"),
+        schema="domain",
+    )
+    op.create_index(
+        "ix_domain_invoice_balances_customer_id",
+        "invoice_balances",
+        ["customer_id"],
+        schema="domain",
+    )
+
+    op.create_table(
+        "customer_ar",
+        sa.Column("customer_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("open_invoice_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("open_balance", sa.Numeric(14, 2), server_default="0", nullable=False),
+        sa.Column("total_invoiced", sa.Numeric(14, 2), server_default="0", nullable=False),
+        sa.Column("total_paid", sa.Numeric(14, 2), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("customer_id"),
+        schema="domain",
+    )
+
+    op.create_table(
+        "so_work_order_progress",
+        sa.Column("so_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("total_wo", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("done_wo", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("so_id"),
+        schema="domain",
+    )
+
+    op.execute(TRIGGER_FUNCTIONS_SQL)
+    op.execute(TRIGGERS_SQL)
+    op.execute("SELECT domain.rebuild_financial_rollups()")
+
+
+def downgrade() -> None:
+    """Drop rollup triggers, functions, tables and FK indexes."""
+    op.execute("DROP TRIGGER IF EXISTS work_orders_rollup ON domain.work_orders")
+    op.execute("DROP TRIGGER IF EXISTS invoice_balances_ar ON domain.invoice_balances")
+    op.execute("DROP TRIGGER IF EXISTS sales_orders_rollup ON domain.sales_orders")
+    op.execute("DROP TRIGGER IF EXISTS payments_rollup ON domain.payments")
+    op.execute("DROP TRIGGER IF EXISTS invoices_rollup ON domain.invoices")
+
+    op.execute("DROP FUNCTION IF EXISTS domain.rebuild_financial_rollups()")
+    op.execute("DROP FUNCTION IF EXISTS domain.trg_work_orders_rollup()")
+    op.execute("DROP FUNCTION IF EXISTS domain.trg_invoice_balances_ar()")
+    op.execute("DROP FUNCTION IF EXISTS domain.trg_sales_orders_rollup()")
+    op.execute("DROP FUNCTION IF EXISTS domain.trg_payments_rollup()")
+    op.execute("DROP FUNCTION IF EXISTS domain.trg_invoices_rollup()")
+
+    op.drop_table("so_work_order_progress", schema="domain")
+    op.drop_table("customer_ar", schema="domain")
+    op.drop_index("ix_domain_invoice_balances_customer_id", table_name="invoice_balances", schema="domain")
+    op.drop_table("invoice_balances", schema="domain")
+
+    op.drop_index("ix_domain_work_orders_so_id", table_name="work_orders", schema="domain")
+    op.drop_index("ix_domain_invoices_so_id", table_name="invoices", schema="domain")
+    op.drop_index("ix_domain_payments_invoice_id", table_name="payments", schema="domain")
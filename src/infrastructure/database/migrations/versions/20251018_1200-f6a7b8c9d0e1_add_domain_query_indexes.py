@@ -0,0 +1,88 @@
+"""add_domain_query_indexes
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2025-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add expression/partial indexes backing the domain query tools.
+
+    Each index matches a predicate in DomainDatabaseRepository exactly, so
+    the planner can use it (see tests/integration/test_domain_query_plans.py).
+
+    domain.tasks gets two indexes on (customer_id, created_at):
+    get_sla_risks only reads open tasks and uses the partial one, while
+    get_tasks_for_customer lists every task of a customer, done ones
+    included, which the partial index cannot serve.
+    """
+    # find_customer_by_name: WHERE lower(name) = lower(:name)
+    op.create_index(
+        "ix_domain_customers_lower_name",
+        "customers",
+        [sa.text("lower(name)")],
+        unique=False,
+        schema="domain",
+    )
+
+    # Customer-scoped tools join sales_orders by customer_id
+    # (get_invoice_status, get_work_orders_for_customer, customer AR fallback)
+    op.create_index(
+        "ix_domain_sales_orders_customer_id",
+        "sales_orders",
+        ["customer_id"],
+        unique=False,
+        schema="domain",
+    )
+
+    # get_sla_risks: open tasks for a customer older than a cutoff
+    # WHERE customer_id = :c AND status <> 'done' AND created_at < :cutoff
+    op.create_index(
+        "ix_domain_tasks_open_customer_created",
+        "tasks",
+        ["customer_id", "created_at"],
+        unique=False,
+        schema="domain",
+        postgresql_where=sa.text("status <> 'done'"),
+    )
+
+    # get_tasks_for_customer: WHERE customer_id = :c ORDER BY created_at DESC
+    # (all statuses, so not covered by the partial index above)
+    op.create_index(
+        "ix_domain_tasks_customer_created",
+        "tasks",
+        ["customer_id", "created_at"],
+        unique=False,
+        schema="domain",
+    )
+
+    # get_all_invoices: ORDER BY due_date LIMIT n (no full sort)
+    op.create_index(
+        "ix_domain_invoices_due_date",
+        "invoices",
+        ["due_date"],
+        unique=False,
+        schema="domain",
+    )
+
+
+def downgrade() -> None:
+    """Remove domain query indexes."""
+    op.drop_index("ix_domain_invoices_due_date", table_name="invoices", schema="domain")
+    op.drop_index("ix_domain_tasks_customer_created", table_name="tasks", schema="domain")
+    op.drop_index("ix_domain_tasks_open_customer_created", table_name="tasks", schema="domain")
+    op.drop_index("ix_domain_sales_orders_customer_id", table_name="sales_orders", schema="domain")
+    op.drop_index("ix_domain_customers_lower_name", table_name="customers", schema="domain")
@@ -0,0 +1,70 @@
+"""add_semantic_content_hash_unique
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2025-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Back semantic memory idempotency with a unique index.
+
+    The extraction idempotency hash lives in memory_metadata['content_hash'].
+    A stored generated column exposes it to a unique (user_id, content_hash)
+    index, so SemanticMemoryRepository.create_if_absent can use
+    INSERT ... ON CONFLICT instead of a JSONB lookup followed by an insert.
+    """
+    # Duplicates created by the old check-then-insert race would block the
+    # unique index: keep the hash on the oldest row only
+    op.execute(
+        """
+        UPDATE app.semantic_memories AS sm
+        SET memory_metadata = sm.memory_metadata - 'content_hash'
+        FROM (
+            SELECT memory_id,
+                   row_number() OVER (
+                       PARTITION BY user_id, memory_metadata ->> 'content_hash'
+                       ORDER BY memory_id
+                   ) AS rn
+            FROM app.semantic_memories
+            WHERE memory_metadata ? 'content_hash'
+        ) AS dup
+        WHERE sm.memory_id = dup.memory_id AND dup.rn > 1
+        """
+    )
+
+    op.add_column(
+        "semantic_memories",
+        sa.Column(
+            "content_hash",
+            sa.Text(),
+            sa.Computed("memory_metadata ->> 'content_hash'", persisted=True),
+            nullable=True,
+        ),
+        schema="app",
+    )
+    op.create_index(
+        "uq_semantic_user_content_hash",
+        "semantic_memories",
+        ["user_id", "content_hash"],
+        unique=True,
+        schema="app",
+    )
+
+
+def downgrade() -> None:
+    """Drop the unique index and generated column."""
+    op.drop_index("uq_semantic_user_content_hash", table_name="semantic_memories", schema="app")
+    op.drop_column("semantic_memories", "content_hash", schema="app")
@@ -0,0 +1,82 @@
+"""add_consolidation_counters
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2025-10-18 14:00:00.000000
+
+Maintained counters of episodic memories per (user, entity) and sessions per
+user since the scope was last consolidated. An incremental tally over rows
+past a watermark (system_config 'consolidation_counter_watermark') keeps them
+current, so finding pending consolidations no longer counts memory history.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create consolidation_counters and seed the tally watermark."""
+    op.create_table(
+        "consolidation_counters",
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("scope_type", sa.Text(), nullable=False, comment="entity|session_window"),
+        sa.Column("scope_identifier", sa.Text(), nullable=False),
+        sa.Column("pending_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_consolidated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("user_id", "scope_type", "scope_identifier"),
+        schema="app",
+        comment="Activity per consolidation scope since it was last consolidated",
+    )
+
+    # Pending scan: WHERE scope_type = :type AND pending_count >= :threshold
+    op.create_index(
+        "idx_consolidation_counters_pending",
+        "consolidation_counters",
+        ["scope_type", "pending_count"],
+        unique=False,
+        schema="app",
+    )
+
+    # Existing history is not backfilled: only activity after the upgrade
+    # counts toward the next consolidation
+    op.execute(
+        """
+        INSERT INTO app.system_config (config_key, config_value, updated_at)
+        SELECT 'consolidation_counter_watermark',
+               jsonb_build_object(
+                   'episodic_memory_id',
+                   (SELECT COALESCE(MAX(memory_id), 0) FROM app.episodic_memories),
+                   'chat_event_id',
+                   (SELECT COALESCE(MAX(event_id), 0) FROM app.chat_events)
+               ),
+               NOW()
+        ON CONFLICT (config_key) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop consolidation_counters and the tally watermark."""
+    op.execute(
+        "DELETE FROM app.system_config WHERE config_key = 'consolidation_counter_watermark'"
+    )
+    op.drop_index(
+        "idx_consolidation_counters_pending",
+        table_name="consolidation_counters",
+        schema="app",
+    )
+    op.drop_table("consolidation_counters", schema="app")
@@ -0,0 +1,39 @@
+"""add_episodic_entities_gin
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2025-10-18 15:00:00.000000
+
+Entity-scope consolidation filters episodic memories by JSONB containment
+(entities @> '{"entities": [{"id": ...}]}') instead of fetching recent rows
+and filtering in Python. jsonb_path_ops supports @> with a smaller index
+than the default operator class.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d0e1f2a3b4'
+down_revision: Union[str, None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create GIN index on episodic_memories.entities."""
+    op.create_index(
+        "idx_episodic_entities_gin",
+        "episodic_memories",
+        ["entities"],
+        unique=False,
+        schema="app",
+        postgresql_using="gin",
+        postgresql_ops={"entities": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop GIN index on episodic_memories.entities."""
+    op.drop_index("idx_episodic_entities_gin", table_name="episodic_memories", schema="app")
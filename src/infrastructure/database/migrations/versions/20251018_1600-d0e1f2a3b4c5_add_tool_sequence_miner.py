@@ -0,0 +1,123 @@
+"""add_tool_sequence_miner
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2025-10-18 16:00:00.000000
+
+Streaming procedural pattern mining. Tool usage logs now record the user, and
+an incremental miner folds rows past a watermark (system_config
+'procedural_miner_watermark') into per-(user, anchor tool) sequence counts.
+Mined patterns are upserted on a unique (user_id, anchor_tool) index instead
+of being looked up one at a time.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0e1f2a3b4c5'
+down_revision: Union[str, None] = 'c9d0e1f2a3b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add tool_usage_log.user_id, tool_sequence_counts and the pattern key."""
+    op.add_column(
+        "tool_usage_log",
+        sa.Column("user_id", sa.Text(), nullable=True),
+        schema="app",
+    )
+    op.create_index(
+        "idx_tool_usage_user",
+        "tool_usage_log",
+        ["user_id", "id"],
+        unique=False,
+        schema="app",
+    )
+
+    op.create_table(
+        "tool_sequence_counts",
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("anchor_tool", sa.Text(), nullable=False),
+        sa.Column("support", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "follower_counts",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "entity_type_counts",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "recent_conversation_ids",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("user_id", "anchor_tool"),
+        schema="app",
+        comment="Streaming miner state: tool sequences per (user, anchor tool)",
+    )
+
+    # Batch detection never found the pattern it meant to reinforce, so it
+    # may have stored duplicates; keep the newest per (user, anchor tool)
+    op.execute(
+        """
+        DELETE FROM app.procedural_memories p
+        USING app.procedural_memories newer
+        WHERE p.user_id = newer.user_id
+          AND p.trigger_features ->> 'anchor_tool' = newer.trigger_features ->> 'anchor_tool'
+          AND p.memory_id < newer.memory_id
+        """
+    )
+    op.create_index(
+        "idx_procedural_user_anchor_tool",
+        "procedural_memories",
+        ["user_id", sa.text("(trigger_features ->> 'anchor_tool')")],
+        unique=True,
+        schema="app",
+        postgresql_where=sa.text("(trigger_features ->> 'anchor_tool') IS NOT NULL"),
+    )
+
+    # Earlier logs carry no user, so mining starts at the current end of the log
+    op.execute(
+        """
+        INSERT INTO app.system_config (config_key, config_value, updated_at)
+        SELECT 'procedural_miner_watermark',
+               jsonb_build_object(
+                   'tool_usage_log_id',
+                   (SELECT COALESCE(MAX(id), 0) FROM app.tool_usage_log)
+               ),
+               NOW()
+        ON CONFLICT (config_key) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the miner state, the pattern key and tool_usage_log.user_id."""
+    op.execute(
+        "DELETE FROM app.system_config WHERE config_key = 'procedural_miner_watermark'"
+    )
+    op.drop_index(
+        "idx_procedural_user_anchor_tool",
+        table_name="procedural_memories",
+        schema="app",
+    )
+    op.drop_table("tool_sequence_counts", schema="app")
+    op.drop_index("idx_tool_usage_user", table_name="tool_usage_log", schema="app")
+    op.drop_column("tool_usage_log", "user_id", schema="app")
@@ -10,6 +10,7 @@ from sqlalchemy import (
     BigInteger,
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
@@ -17,6 +18,7 @@ from sqlalchemy import (
     Integer,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import declarative_base
@@ -97,6 +99,7 @@ class EpisodicMemory(Base):
     __table_args__ = (
         Index("idx_episodic_user_time", "user_id", "created_at"),
         Index("idx_episodic_session", "session_id"),
+        Index("idx_episodic_entities_gin", "entities", postgresql_using="gin", postgresql_ops={"entities": "jsonb_path_ops"}),
         Index("idx_episodic_embedding", "embedding", postgresql_using="ivfflat", postgresql_ops={"embedding": "vector_cosine_ops"}, postgresql_with={"lists": 100}),
         {"schema": "app"},
     )
@@ -127,6 +130,7 @@ class SemanticMemory(Base):
         Index("idx_semantic_entities_gin", "entities", postgresql_using="gin"),
         Index("idx_semantic_user_importance", "user_id", "importance", postgresql_ops={"importance": "DESC"}),
         Index("idx_semantic_embedding", "embedding", postgresql_using="ivfflat", postgresql_ops={"embedding": "vector_cosine_ops"}, postgresql_with={"lists": 100}),
+        Index("uq_semantic_user_content_hash", "user_id", "content_hash", unique=True),
         {"schema": "app"},
     )
 
@@ -137,6 +141,8 @@ class SemanticMemory(Base):
     content = Column(Text, nullable=False)  # The memory text
     entities = Column(ARRAY(Text), nullable=False)  # All entity IDs mentioned
     memory_metadata = Column(JSONB)  # Renamed from metadata (reserved by SQLAlchemy)
+    # Idempotency hash (see ContentHasher), generated from memory_metadata
+    content_hash = Column(Text, Computed("memory_metadata ->> 'content_hash'", persisted=True))
 
     # Confidence & importance
     confidence = Column(Float, nullable=False, default=0.7)
@@ -169,6 +175,14 @@ class ProceduralMemory(Base):
         Index("idx_procedural_user", "user_id"),
         Index("idx_procedural_confidence", "confidence"),
         Index("idx_procedural_embedding", "embedding", postgresql_using="ivfflat", postgresql_ops={"embedding": "vector_cosine_ops"}, postgresql_with={"lists": 100}),
+        # One mined tool pattern per (user, anchor tool): target of the miner's upsert
+        Index(
+            "idx_procedural_user_anchor_tool",
+            "user_id",
+            text("(trigger_features ->> 'anchor_tool')"),
+            unique=True,
+            postgresql_where=text("(trigger_features ->> 'anchor_tool') IS NOT NULL"),
+        ),
         {"schema": "app"},
     )
 
@@ -209,6 +223,27 @@ class MemorySummary(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
 
 
+class ConsolidationCounter(Base):
+    """Activity per consolidation scope since it was last consolidated.
+
+    Maintained by an incremental tally (watermark in system_config), so
+    threshold checks read one row instead of counting memory history.
+    """
+
+    __tablename__ = "consolidation_counters"
+    __table_args__ = (
+        Index("idx_consolidation_counters_pending", "scope_type", "pending_count"),
+        {"schema": "app"},
+    )
+
+    user_id = Column(Text, primary_key=True)
+    scope_type = Column(Text, primary_key=True)  # entity|session_window
+    scope_identifier = Column(Text, primary_key=True)
+    pending_count = Column(Integer, nullable=False, default=0)
+    last_consolidated_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 # Supporting Tables
 class DomainOntology(Base):
     """Domain ontology (relationship semantics)."""
@@ -277,10 +312,12 @@ class ToolUsageLog(Base):
         Index("idx_tool_usage_conversation", "conversation_id"),
         Index("idx_tool_usage_timestamp", "timestamp"),
         Index("idx_tool_usage_tools_called", "tools_called", postgresql_using="gin"),
+        Index("idx_tool_usage_user", "user_id", "id"),
         {"schema": "app"},
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Text)  # NULL for rows logged before users were recorded
     conversation_id = Column(Text, nullable=False)
     query = Column(Text, nullable=False)
     tools_called = Column(JSONB, nullable=False)  # Array of {tool, arguments, iteration}
@@ -288,3 +325,87 @@ class ToolUsageLog(Base):
     timestamp = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
     outcome_satisfaction = Column(Integer)  # NULL=unknown, 1=satisfied, 0=not satisfied
     outcome_feedback = Column(Text)
+
+
+class ToolSequenceCount(Base):
+    """Streaming miner state: tool sequences per (user, anchor tool).
+
+    Folded forward from the tool usage log past a watermark in system_config;
+    procedural tool patterns are derived from these counts.
+    """
+
+    __tablename__ = "tool_sequence_counts"
+    __table_args__ = {"schema": "app"}
+
+    user_id = Column(Text, primary_key=True)
+    anchor_tool = Column(Text, primary_key=True)
+    support = Column(Integer, nullable=False, default=0)
+    follower_counts = Column(JSONB, nullable=False, default=dict)  # {tool: sequences}
+    entity_type_counts = Column(JSONB, nullable=False, default=dict)  # {entity_type: sequences}
+    recent_conversation_ids = Column(JSONB, nullable=False, default=list)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class BackgroundJob(Base):
+    """Durable background job queue (post-reply pipeline work).
+
+    Workers claim rows with SELECT ... FOR UPDATE SKIP LOCKED so several
+    processes can drain the queue without blocking each other.
+    """
+
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        UniqueConstraint("idempotency_key", name="uq_background_jobs_idempotency_key"),
+        CheckConstraint(
+            "status IN ('pending', 'running', 'succeeded', 'failed')",
+            name="valid_job_status",
+        ),
+        Index(
+            "idx_background_jobs_pending",
+            "run_after",
+            postgresql_where=Column("status") == "pending",
+        ),
+        Index(
+            "idx_background_jobs_running",
+            "locked_at",
+            postgresql_where=Column("status") == "running",
+        ),
+        {"schema": "app"},
+    )
+
+    job_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_type = Column(Text, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    idempotency_key = Column(Text, nullable=False)
+    status = Column(Text, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class LLMExtractionCache(Base):
+    """Persistent cache of LLM extraction outputs.
+
+    Keyed by a hash of the prompt inputs (message content hash, resolved
+    entity set, context) together with the model and prompt version, so a
+    prompt change invalidates old rows instead of serving stale output.
+    """
+
+    __tablename__ = "llm_extraction_cache"
+    __table_args__ = (
+        Index("idx_llm_extraction_cache_version", "extraction_type", "prompt_version"),
+        {"schema": "app"},
+    )
+
+    cache_key = Column(Text, primary_key=True)  # SHA-256 hex
+    extraction_type = Column(Text, nullable=False)  # mentions | facts | coreference
+    model = Column(Text, nullable=False)
+    prompt_version = Column(Text, nullable=False)
+    result = Column(JSONB, nullable=False)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    last_hit_at = Column(DateTime(timezone=True))
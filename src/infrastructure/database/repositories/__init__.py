@@ -3,6 +3,9 @@
 SQLAlchemy-based implementations of domain repository interfaces.
 """
 from src.infrastructure.database.repositories.chat_repository import ChatEventRepository
+from src.infrastructure.database.repositories.consolidation_counter_repository import (
+    PostgresConsolidationCounterRepository,
+)
 from src.infrastructure.database.repositories.domain_database_repository import (
     DomainDatabaseRepository,
 )
@@ -10,6 +13,12 @@ from src.infrastructure.database.repositories.entity_repository import EntityRep
 from src.infrastructure.database.repositories.episodic_memory_repository import (
     EpisodicMemoryRepository,
 )
+from src.infrastructure.database.repositories.extraction_cache_repository import (
+    PostgresExtractionCacheRepository,
+)
+from src.infrastructure.database.repositories.job_queue_repository import (
+    PostgresJobQueueRepository,
+)
 from src.infrastructure.database.repositories.ontology_repository import (
     OntologyRepository,
 )
@@ -22,6 +31,9 @@ from src.infrastructure.database.repositories.semantic_memory_repository import
 from src.infrastructure.database.repositories.summary_repository import (
     SummaryRepository,
 )
+from src.infrastructure.database.repositories.tool_sequence_repository import (
+    PostgresToolSequenceStateRepository,
+)
 from src.infrastructure.database.repositories.tool_usage_repository import (
     PostgresToolUsageRepository,
 )
@@ -32,6 +44,10 @@ __all__ = [
     "EntityRepository",
     "EpisodicMemoryRepository",
     "OntologyRepository",
+    "PostgresConsolidationCounterRepository",
+    "PostgresExtractionCacheRepository",
+    "PostgresJobQueueRepository",
+    "PostgresToolSequenceStateRepository",
     "PostgresToolUsageRepository",
     "ProceduralMemoryRepository",
     "SemanticMemoryRepository",
@@ -2,20 +2,29 @@
 
 Implements IChatEventRepository using SQLAlchemy and PostgreSQL.
 """
+from typing import Any
 from uuid import UUID
 
 import structlog
-from sqlalchemy import desc, select
+from sqlalchemy import Row, desc, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities import ChatMessage
 from src.domain.exceptions import RepositoryError
 from src.domain.ports import IChatEventRepository
+from src.infrastructure.database.instrumentation import instrumented_repository
 from src.infrastructure.database.models import ChatEvent as ChatEventModel
+from src.infrastructure.database.upsert import insert_or_get
 
 logger = structlog.get_logger(__name__)
 
+# Rows per multi-row INSERT; 7 bind parameters per row stays well below
+# asyncpg's limit of 32767 parameters per statement
+INSERT_CHUNK_ROWS = 4000
 
+
+@instrumented_repository
 class ChatEventRepository(IChatEventRepository):
     """SQLAlchemy implementation of IChatEventRepository.
 
@@ -33,6 +42,10 @@ class ChatEventRepository(IChatEventRepository):
     async def create(self, message: ChatMessage) -> ChatMessage:
         """Store a chat message/event.
 
+        Idempotent: if a message with the same session_id + content_hash
+        exists (including one inserted concurrently), that message is
+        returned instead of creating a duplicate.
+
         Args:
             message: Message to store
 
@@ -40,43 +53,37 @@ class ChatEventRepository(IChatEventRepository):
             Stored message (with event_id populated)
 
         Raises:
-            RepositoryError: If message with same session+content_hash exists
+            RepositoryError: If the insert fails
         """
         try:
-            # Check for duplicate (same session + content hash)
-            existing_stmt = select(ChatEventModel).where(
-                ChatEventModel.session_id == message.session_id,
-                ChatEventModel.content_hash == message.content_hash,
+            # Single statement: insert, or return the existing (session, hash) row
+            row, inserted = await insert_or_get(
+                self.session,
+                ChatEventModel.__table__,
+                {
+                    "session_id": message.session_id,
+                    "user_id": message.user_id,
+                    "role": message.role,
+                    "content": message.content,
+                    "content_hash": message.content_hash,
+                    "event_metadata": message.event_metadata,
+                    "created_at": message.created_at,
+                },
+                conflict_columns=("session_id", "content_hash"),
             )
-            result = await self.session.execute(existing_stmt)
-            existing = result.scalar_one_or_none()
 
-            if existing:
+            if not inserted:
                 # Return existing message instead of creating duplicate
                 logger.info(
                     "duplicate_message_detected",
                     session_id=str(message.session_id),
                     content_hash=message.content_hash,
-                    existing_event_id=existing.event_id,
+                    existing_event_id=row.event_id,
                 )
-                return self._to_domain_message(existing)
-
-            # Create new event
-            model = ChatEventModel(
-                session_id=message.session_id,
-                user_id=message.user_id,
-                role=message.role,
-                content=message.content,
-                content_hash=message.content_hash,
-                event_metadata=message.event_metadata,
-                created_at=message.created_at,
-            )
-
-            self.session.add(model)
-            await self.session.flush()
+                return self._to_domain_message(row)
 
             # Update domain object with generated ID
-            message.event_id = model.event_id
+            message.event_id = row.event_id
 
             logger.info(
                 "chat_event_created",
@@ -96,6 +103,102 @@ class ChatEventRepository(IChatEventRepository):
             msg = f"Error creating chat event: {e}"
             raise RepositoryError(msg) from e
 
+    async def create_many(self, messages: list[ChatMessage]) -> list[ChatMessage]:
+        """Store many chat messages with multi-row inserts.
+
+        Uses INSERT ... ON CONFLICT (session_id, content_hash) DO NOTHING
+        RETURNING, so duplicates (already stored, or repeated within the
+        batch) are skipped without a per-message duplicate check.
+
+        Args:
+            messages: Messages to store
+
+        Returns:
+            Newly stored messages (event_id populated), in input order
+        """
+        # First occurrence wins for duplicates within the batch
+        pending: dict[tuple[UUID, str | None], ChatMessage] = {}
+        for message in messages:
+            pending.setdefault((message.session_id, message.content_hash), message)
+        unique = list(pending.values())
+
+        try:
+            for start in range(0, len(unique), INSERT_CHUNK_ROWS):
+                chunk = unique[start : start + INSERT_CHUNK_ROWS]
+                stmt = (
+                    insert(ChatEventModel)
+                    .values(
+                        [
+                            {
+                                "session_id": m.session_id,
+                                "user_id": m.user_id,
+                                "role": m.role,
+                                "content": m.content,
+                                "content_hash": m.content_hash,
+                                "event_metadata": m.event_metadata,
+                                "created_at": m.created_at,
+                            }
+                            for m in chunk
+                        ]
+                    )
+                    .on_conflict_do_nothing(constraint="uq_session_content")
+                    .returning(
+                        ChatEventModel.event_id,
+                        ChatEventModel.session_id,
+                        ChatEventModel.content_hash,
+                    )
+                )
+                result = await self.session.execute(stmt)
+                for event_id, session_id, content_hash in result.all():
+                    pending[(session_id, content_hash)].event_id = event_id
+
+        except Exception as e:
+            logger.error(
+                "create_chat_events_batch_error",
+                message_count=len(messages),
+                error=str(e),
+            )
+            msg = f"Error creating chat events: {e}"
+            raise RepositoryError(msg) from e
+
+        created = [m for m in unique if m.event_id is not None]
+
+        logger.info(
+            "chat_events_batch_created",
+            requested=len(messages),
+            created=len(created),
+            duplicates=len(messages) - len(created),
+        )
+
+        return created
+
+    async def get_by_event_ids(self, event_ids: list[int]) -> list[ChatMessage]:
+        """Get chat messages by event IDs.
+
+        Args:
+            event_ids: Event IDs to retrieve
+
+        Returns:
+            Found messages ordered by event_id (missing IDs are skipped)
+        """
+        if not event_ids:
+            return []
+
+        try:
+            stmt = (
+                select(ChatEventModel)
+                .where(ChatEventModel.event_id.in_(event_ids))
+                .order_by(ChatEventModel.event_id)
+            )
+            result = await self.session.execute(stmt)
+
+            return [self._to_domain_message(model) for model in result.scalars().all()]
+
+        except Exception as e:
+            logger.error("get_by_event_ids_error", count=len(event_ids), error=str(e))
+            msg = f"Error getting chat events: {e}"
+            raise RepositoryError(msg) from e
+
     async def get_by_event_id(self, event_id: int) -> ChatMessage | None:
         """Get a chat message by event ID.
 
@@ -150,6 +253,35 @@ class ChatEventRepository(IChatEventRepository):
             msg = f"Error getting recent messages: {e}"
             raise RepositoryError(msg) from e
 
+    async def get_recent_session_ids(
+        self, user_id: str, limit: int = 5
+    ) -> list[UUID]:
+        """Get a user's most recently active sessions.
+
+        Args:
+            user_id: User ID
+            limit: Maximum number of sessions
+
+        Returns:
+            Session IDs, most recently active first
+        """
+        try:
+            stmt = (
+                select(ChatEventModel.session_id)
+                .where(ChatEventModel.user_id == user_id)
+                .group_by(ChatEventModel.session_id)
+                .order_by(desc(func.max(ChatEventModel.created_at)))
+                .limit(limit)
+            )
+
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
+
+        except Exception as e:
+            logger.error("get_recent_session_ids_error", user_id=user_id, error=str(e))
+            msg = f"Error getting recent sessions: {e}"
+            raise RepositoryError(msg) from e
+
     async def get_recent_for_session(
         self, session_id: UUID, limit: int = 10
     ) -> list[ChatMessage]:
@@ -184,11 +316,11 @@ class ChatEventRepository(IChatEventRepository):
             msg = f"Error getting session messages: {e}"
             raise RepositoryError(msg) from e
 
-    def _to_domain_message(self, model: ChatEventModel) -> ChatMessage:
-        """Convert ORM model to domain entity.
+    def _to_domain_message(self, model: ChatEventModel | Row[Any]) -> ChatMessage:
+        """Convert ORM model (or chat_events row) to domain entity.
 
         Args:
-            model: SQLAlchemy model
+            model: SQLAlchemy model or result row
 
         Returns:
             Domain ChatMessage
@@ -0,0 +1,396 @@
+"""Consolidation counter repository implementation.
+
+Implements IConsolidationCounterRepository on PostgreSQL. The tally reads
+only episodic memories and chat events with ids past a watermark stored in
+app.system_config, and folds them into app.consolidation_counters with
+INSERT ... ON CONFLICT DO UPDATE, so its cost follows new activity rather
+than history.
+"""
+
+import json
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.exceptions import RepositoryError
+from src.domain.ports.consolidation_counter_port import (
+    IConsolidationCounterRepository,
+    PendingConsolidation,
+)
+from src.domain.value_objects.consolidation import ConsolidationScope
+from src.infrastructure.database.instrumentation import instrumented_repository
+
+logger = structlog.get_logger(__name__)
+
+WATERMARK_KEY = "consolidation_counter_watermark"
+
+
+@instrumented_repository
+class PostgresConsolidationCounterRepository(IConsolidationCounterRepository):
+    """PostgreSQL implementation of IConsolidationCounterRepository.
+
+    The watermark row is locked FOR UPDATE for the duration of a tally, so
+    concurrent tallies (several processes) serialize and never double-count.
+    Ids are BIGSERIAL, so a transaction that commits after a tally with a
+    lower id than the new watermark is not counted; counters are a trigger
+    heuristic and tolerate that.
+
+    claim() locks a counter row FOR UPDATE SKIP LOCKED, so schedulers in
+    several processes never consolidate the same scope at once. A tally
+    touching a claimed counter waits until that consolidation commits.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    async def tally(self, session_window: int) -> int:
+        """Add activity written since the previous tally to the counters.
+
+        Args:
+            session_window: Session-window size the session counter belongs to
+
+        Returns:
+            Number of counters updated
+        """
+        try:
+            since = await self._lock_watermark()
+            until = await self._current_high_water()
+
+            updated = 0
+            if until["episodic_memory_id"] > since["episodic_memory_id"]:
+                updated += await self._tally_entities(
+                    since["episodic_memory_id"], until["episodic_memory_id"]
+                )
+            if until["chat_event_id"] > since["chat_event_id"]:
+                updated += await self._tally_sessions(
+                    since["chat_event_id"], until["chat_event_id"], session_window
+                )
+
+            await self.session.execute(
+                text(
+                    """
+                    UPDATE app.system_config
+                    SET config_value = CAST(:watermark AS jsonb), updated_at = NOW()
+                    WHERE config_key = :key
+                    """
+                ),
+                {
+                    "key": WATERMARK_KEY,
+                    "watermark": json.dumps(until),
+                },
+            )
+
+            logger.debug(
+                "consolidation_counters_tallied",
+                since=since,
+                until=until,
+                counters_updated=updated,
+            )
+
+            return updated
+
+        except Exception as e:
+            logger.error("tally_consolidation_counters_error", error=str(e))
+            msg = f"Error tallying consolidation counters: {e}"
+            raise RepositoryError(msg) from e
+
+    async def get_count(self, user_id: str, scope: ConsolidationScope) -> int:
+        """Get the pending count of one scope.
+
+        Args:
+            user_id: User identifier
+            scope: Consolidation scope
+
+        Returns:
+            Activity counted since the scope was last consolidated (0 if none)
+        """
+        try:
+            result = await self.session.execute(
+                text(
+                    """
+                    SELECT pending_count
+                    FROM app.consolidation_counters
+                    WHERE user_id = :user_id
+                      AND scope_type = :scope_type
+                      AND scope_identifier = :scope_identifier
+                    """
+                ),
+                {
+                    "user_id": user_id,
+                    "scope_type": scope.type,
+                    "scope_identifier": scope.identifier,
+                },
+            )
+            return result.scalar_one_or_none() or 0
+
+        except Exception as e:
+            logger.error(
+                "get_consolidation_count_error",
+                user_id=user_id,
+                scope=scope.to_dict(),
+                error=str(e),
+            )
+            msg = f"Error getting consolidation count: {e}"
+            raise RepositoryError(msg) from e
+
+    async def find_pending(
+        self,
+        min_episodic: int,
+        min_sessions: int,
+        user_id: str | None = None,
+        limit: int = 100,
+    ) -> list[PendingConsolidation]:
+        """Find scopes whose counters reached their thresholds.
+
+        Args:
+            min_episodic: Threshold for entity scopes
+            min_sessions: Threshold for the session-window scope
+            user_id: Restrict to one user (default: all users)
+            limit: Maximum number of scopes (largest counts first)
+
+        Returns:
+            Pending consolidations
+        """
+        try:
+            user_filter = "AND user_id = :user_id" if user_id is not None else ""
+            result = await self.session.execute(
+                text(
+                    f"""
+                    SELECT user_id, scope_type, scope_identifier, pending_count
+                    FROM app.consolidation_counters
+                    WHERE ((scope_type = 'entity' AND pending_count >= :min_episodic)
+                        OR (scope_type = 'session_window' AND pending_count >= :min_sessions))
+                      {user_filter}
+                    ORDER BY pending_count DESC
+                    LIMIT :limit
+                    """
+                ),
+                {
+                    "min_episodic": min_episodic,
+                    "min_sessions": min_sessions,
+                    "user_id": user_id,
+                    "limit": limit,
+                },
+            )
+
+            return [
+                PendingConsolidation(
+                    user_id=row.user_id,
+                    scope=ConsolidationScope(type=row.scope_type, identifier=row.scope_identifier),
+                    pending_count=row.pending_count,
+                )
+                for row in result
+            ]
+
+        except Exception as e:
+            logger.error("find_pending_consolidations_error", user_id=user_id, error=str(e))
+            msg = f"Error finding pending consolidations: {e}"
+            raise RepositoryError(msg) from e
+
+    async def claim(
+        self,
+        pending: PendingConsolidation,
+        min_episodic: int,
+        min_sessions: int,
+    ) -> PendingConsolidation | None:
+        """Lock a scope's counter for the rest of the transaction.
+
+        Args:
+            pending: Scope returned by find_pending
+            min_episodic: Threshold for entity scopes
+            min_sessions: Threshold for the session-window scope
+
+        Returns:
+            The scope with its current count, or None if another transaction
+            holds it or it is no longer over its threshold
+        """
+        try:
+            result = await self.session.execute(
+                text(
+                    """
+                    SELECT pending_count
+                    FROM app.consolidation_counters
+                    WHERE user_id = :user_id
+                      AND scope_type = :scope_type
+                      AND scope_identifier = :scope_identifier
+                      AND ((scope_type = 'entity' AND pending_count >= :min_episodic)
+                        OR (scope_type = 'session_window' AND pending_count >= :min_sessions))
+                    FOR UPDATE SKIP LOCKED
+                    """
+                ),
+                {
+                    "user_id": pending.user_id,
+                    "scope_type": pending.scope.type,
+                    "scope_identifier": pending.scope.identifier,
+                    "min_episodic": min_episodic,
+                    "min_sessions": min_sessions,
+                },
+            )
+            pending_count = result.scalar_one_or_none()
+            if pending_count is None:
+                return None
+
+            return PendingConsolidation(
+                user_id=pending.user_id,
+                scope=pending.scope,
+                pending_count=pending_count,
+            )
+
+        except Exception as e:
+            logger.error(
+                "claim_consolidation_error",
+                user_id=pending.user_id,
+                scope=pending.scope.to_dict(),
+                error=str(e),
+            )
+            msg = f"Error claiming consolidation scope: {e}"
+            raise RepositoryError(msg) from e
+
+    async def mark_consolidated(self, pending: PendingConsolidation) -> None:
+        """Subtract the consumed count after a scope was consolidated.
+
+        Args:
+            pending: The consolidation that completed
+        """
+        try:
+            await self.session.execute(
+                text(
+                    """
+                    UPDATE app.consolidation_counters
+                    SET pending_count = GREATEST(pending_count - :consumed, 0),
+                        last_consolidated_at = NOW(),
+                        updated_at = NOW()
+                    WHERE user_id = :user_id
+                      AND scope_type = :scope_type
+                      AND scope_identifier = :scope_identifier
+                    """
+                ),
+                {
+                    "consumed": pending.pending_count,
+                    "user_id": pending.user_id,
+                    "scope_type": pending.scope.type,
+                    "scope_identifier": pending.scope.identifier,
+                },
+            )
+
+        except Exception as e:
+            logger.error(
+                "mark_consolidated_error",
+                user_id=pending.user_id,
+                scope=pending.scope.to_dict(),
+                error=str(e),
+            )
+            msg = f"Error marking scope consolidated: {e}"
+            raise RepositoryError(msg) from e
+
+    async def _lock_watermark(self) -> dict[str, int]:
+        """Lock the watermark row (creating it at zero if missing)."""
+        await self.session.execute(
+            text(
+                """
+                INSERT INTO app.system_config (config_key, config_value, updated_at)
+                VALUES (:key, '{"episodic_memory_id": 0, "chat_event_id": 0}'::jsonb, NOW())
+                ON CONFLICT (config_key) DO NOTHING
+                """
+            ),
+            {"key": WATERMARK_KEY},
+        )
+        result = await self.session.execute(
+            text(
+                """
+                SELECT config_value
+                FROM app.system_config
+                WHERE config_key = :key
+                FOR UPDATE
+                """
+            ),
+            {"key": WATERMARK_KEY},
+        )
+        value = result.scalar_one()
+        return {
+            "episodic_memory_id": int(value.get("episodic_memory_id", 0)),
+            "chat_event_id": int(value.get("chat_event_id", 0)),
+        }
+
+    async def _current_high_water(self) -> dict[str, int]:
+        """Highest episodic memory and chat event ids written so far."""
+        result = await self.session.execute(
+            text(
+                """
+                SELECT
+                    (SELECT COALESCE(MAX(memory_id), 0) FROM app.episodic_memories)
+                        AS episodic_memory_id,
+                    (SELECT COALESCE(MAX(event_id), 0) FROM app.chat_events)
+                        AS chat_event_id
+                """
+            )
+        )
+        row = result.one()
+        return {
+            "episodic_memory_id": int(row.episodic_memory_id),
+            "chat_event_id": int(row.chat_event_id),
+        }
+
+    async def _tally_entities(self, since: int, until: int) -> int:
+        """Count new episodic memories per (user, mentioned entity)."""
+        # entities is {"entities": [{"id": ...}, ...]} (older rows: a bare list)
+        result = await self.session.execute(
+            text(
+                """
+                INSERT INTO app.consolidation_counters
+                    (user_id, scope_type, scope_identifier, pending_count, updated_at)
+                SELECT m.user_id, 'entity', e.value ->> 'id', COUNT(DISTINCT m.memory_id), NOW()
+                FROM app.episodic_memories m
+                CROSS JOIN LATERAL jsonb_array_elements(
+                    CASE jsonb_typeof(m.entities)
+                        WHEN 'array' THEN m.entities
+                        ELSE COALESCE(m.entities -> 'entities', '[]'::jsonb)
+                    END
+                ) AS e(value)
+                WHERE m.memory_id > :since
+                  AND m.memory_id <= :until
+                  AND e.value ->> 'id' IS NOT NULL
+                GROUP BY m.user_id, e.value ->> 'id'
+                ON CONFLICT (user_id, scope_type, scope_identifier) DO UPDATE
+                SET pending_count = app.consolidation_counters.pending_count
+                                    + EXCLUDED.pending_count,
+                    updated_at = NOW()
+                """
+            ),
+            {"since": since, "until": until},
+        )
+        return result.rowcount or 0
+
+    async def _tally_sessions(self, since: int, until: int, session_window: int) -> int:
+        """Count sessions whose first event is new, per user."""
+        result = await self.session.execute(
+            text(
+                """
+                INSERT INTO app.consolidation_counters
+                    (user_id, scope_type, scope_identifier, pending_count, updated_at)
+                SELECT c.user_id, 'session_window', CAST(:session_window AS text), COUNT(DISTINCT c.session_id), NOW()
+                FROM app.chat_events c
+                WHERE c.event_id > :since
+                  AND c.event_id <= :until
+                  AND NOT EXISTS (
+                      SELECT 1
+                      FROM app.chat_events earlier
+                      WHERE earlier.session_id = c.session_id
+                        AND earlier.event_id <= :since
+                  )
+                GROUP BY c.user_id
+                ON CONFLICT (user_id, scope_type, scope_identifier) DO UPDATE
+                SET pending_count = app.consolidation_counters.pending_count
+                                    + EXCLUDED.pending_count,
+                    updated_at = NOW()
+                """
+            ),
+            {"since": since, "until": until, "session_window": str(session_window)},
+        )
+        return result.rowcount or 0
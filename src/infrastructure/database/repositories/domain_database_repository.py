@@ -5,7 +5,7 @@ Executes queries against the external domain schema.
 """
 
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID
 
 import structlog
@@ -14,17 +14,38 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.ports.domain_database_port import DomainDatabasePort
 from src.domain.value_objects.domain_fact import DomainFact
+from src.infrastructure.database.instrumentation import instrumented_repository
 
 logger = structlog.get_logger(__name__)
 
+# Paid amount per invoice ``i``: read from the trigger-maintained rollup, with
+# an exact per-invoice SUM for any invoice the rollup has no row for
+_ROLLUP_PAID_JOIN = """
+    LEFT JOIN domain.invoice_balances b ON b.invoice_id = i.invoice_id
+    LEFT JOIN LATERAL (
+        SELECT COALESCE(SUM(p.amount), 0) AS paid_amount
+        FROM domain.payments p
+        WHERE b.invoice_id IS NULL AND p.invoice_id = i.invoice_id
+    ) exact ON true
+"""
+_ROLLUP_PAID = "COALESCE(b.paid_amount, exact.paid_amount)"
+
 
+@instrumented_repository
 class DomainDatabaseRepository(DomainDatabasePort):
     """SQLAlchemy implementation of DomainDatabasePort.
 
     This adapter contains all SQL queries and database-specific logic.
     The domain layer only knows about the port interface.
+
+    Invoice balances, customer AR and work order progress are read from
+    trigger-maintained rollup tables when they exist (migration
+    e5f6a7b8c9d0), falling back to exact aggregation otherwise.
     """
 
+    # Whether the rollup tables exist; probed once per process
+    _rollups_available: ClassVar[bool | None] = None
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize repository.
 
@@ -48,32 +69,55 @@ class DomainDatabaseRepository(DomainDatabasePort):
         Returns:
             List of invoice facts
         """
-        query_sql = """
-            SELECT
-                i.invoice_id,
-                i.invoice_number,
-                i.amount,
-                i.due_date,
-                i.status,
-                i.issued_at,
-                COALESCE(SUM(p.amount), 0) as paid_amount,
-                i.amount - COALESCE(SUM(p.amount), 0) as balance,
-                c.name as customer_name,
-                c.customer_id
-            FROM domain.invoices i
-            LEFT JOIN domain.payments p ON i.invoice_id = p.invoice_id
-            LEFT JOIN domain.sales_orders so ON i.so_id = so.so_id
-            LEFT JOIN domain.customers c ON so.customer_id = c.customer_id
-        """
-
-        if status_filter:
-            query_sql += " WHERE i.status = :status"
-
-        query_sql += """
-            GROUP BY i.invoice_id, i.invoice_number, i.amount, i.due_date, i.status, i.issued_at, c.name, c.customer_id
-            ORDER BY i.due_date ASC
-            LIMIT :limit
-        """
+        if await self._use_rollups():
+            query_sql = f"""
+                SELECT
+                    i.invoice_id,
+                    i.invoice_number,
+                    i.amount,
+                    i.due_date,
+                    i.status,
+                    i.issued_at,
+                    {_ROLLUP_PAID} as paid_amount,
+                    i.amount - {_ROLLUP_PAID} as balance,
+                    c.name as customer_name,
+                    c.customer_id
+                FROM domain.invoices i
+                {_ROLLUP_PAID_JOIN}
+                LEFT JOIN domain.sales_orders so ON i.so_id = so.so_id
+                LEFT JOIN domain.customers c ON so.customer_id = c.customer_id
+            """
+            if status_filter:
+                query_sql += " WHERE i.status = :status"
+            query_sql += """
+                ORDER BY i.due_date ASC
+                LIMIT :limit
+            """
+        else:
+            query_sql = """
+                SELECT
+                    i.invoice_id,
+                    i.invoice_number,
+                    i.amount,
+                    i.due_date,
+                    i.status,
+                    i.issued_at,
+                    COALESCE(SUM(p.amount), 0) as paid_amount,
+                    i.amount - COALESCE(SUM(p.amount), 0) as balance,
+                    c.name as customer_name,
+                    c.customer_id
+                FROM domain.invoices i
+                LEFT JOIN domain.payments p ON i.invoice_id = p.invoice_id
+                LEFT JOIN domain.sales_orders so ON i.so_id = so.so_id
+                LEFT JOIN domain.customers c ON so.customer_id = c.customer_id
+            """
+            if status_filter:
+                query_sql += " WHERE i.status = :status"
+            query_sql += """
+                GROUP BY i.invoice_id, i.invoice_number, i.amount, i.due_date, i.status, i.issued_at, c.name, c.customer_id
+                ORDER BY i.due_date ASC
+                LIMIT :limit
+            """
 
         query = text(query_sql)
 
@@ -133,24 +177,41 @@ class DomainDatabaseRepository(DomainDatabasePort):
 
     async def get_invoice_status(self, customer_id: str) -> list[DomainFact]:
         """Get all invoices for customer with payment details."""
-        query = text("""
-            SELECT
-                i.invoice_id,
-                i.invoice_number,
-                i.amount,
-                i.due_date,
-                i.status,
-                i.issued_at,
-                COALESCE(SUM(p.amount), 0) as paid_amount,
-                i.amount - COALESCE(SUM(p.amount), 0) as balance
-            FROM domain.invoices i
-            LEFT JOIN domain.payments p ON i.invoice_id = p.invoice_id
-            WHERE i.so_id IN (
-                SELECT so_id FROM domain.sales_orders WHERE customer_id = :customer_id
-            )
-            GROUP BY i.invoice_id, i.invoice_number, i.amount, i.due_date, i.status, i.issued_at
-            ORDER BY i.due_date ASC
-        """)
+        if await self._use_rollups():
+            query = text(f"""
+                SELECT
+                    i.invoice_id,
+                    i.invoice_number,
+                    i.amount,
+                    i.due_date,
+                    i.status,
+                    i.issued_at,
+                    {_ROLLUP_PAID} as paid_amount,
+                    i.amount - {_ROLLUP_PAID} as balance
+                FROM domain.invoices i
+                JOIN domain.sales_orders so ON so.so_id = i.so_id
+                {_ROLLUP_PAID_JOIN}
+                WHERE so.customer_id = :customer_id
+                ORDER BY i.due_date ASC
+            """)
+        else:
+            query = text("""
+                SELECT
+                    i.invoice_id,
+                    i.invoice_number,
+                    i.amount,
+                    i.due_date,
+                    i.status,
+                    i.issued_at,
+                    COALESCE(SUM(p.amount), 0) as paid_amount,
+                    i.amount - COALESCE(SUM(p.amount), 0) as balance
+                FROM domain.invoices i
+                JOIN domain.sales_orders so ON so.so_id = i.so_id
+                LEFT JOIN domain.payments p ON i.invoice_id = p.invoice_id
+                WHERE so.customer_id = :customer_id
+                GROUP BY i.invoice_id, i.invoice_number, i.amount, i.due_date, i.status, i.issued_at
+                ORDER BY i.due_date ASC
+            """)
 
         try:
             result = await self.session.execute(query, {"customer_id": UUID(customer_id)})
@@ -200,32 +261,126 @@ class DomainDatabaseRepository(DomainDatabasePort):
             )
             return []
 
+    async def get_customer_ar_summary(self, customer_id: str) -> list[DomainFact]:
+        """Get open accounts receivable totals for a customer."""
+        row = None
+        try:
+            if await self._use_rollups():
+                result = await self.session.execute(
+                    text("""
+                        SELECT open_invoice_count, open_balance, total_invoiced, total_paid
+                        FROM domain.customer_ar
+                        WHERE customer_id = :customer_id
+                    """),
+                    {"customer_id": UUID(customer_id)},
+                )
+                row = result.fetchone()
+
+            if row is None:
+                # Exact aggregation (no rollup tables, or no rollup row yet)
+                result = await self.session.execute(
+                    text("""
+                        SELECT
+                            COUNT(*) FILTER (WHERE i.status = 'open') as open_invoice_count,
+                            COALESCE(SUM(i.amount - paid.amount) FILTER (WHERE i.status = 'open'), 0)
+                                as open_balance,
+                            COALESCE(SUM(i.amount), 0) as total_invoiced,
+                            COALESCE(SUM(paid.amount), 0) as total_paid
+                        FROM domain.invoices i
+                        JOIN domain.sales_orders so ON so.so_id = i.so_id
+                        LEFT JOIN LATERAL (
+                            SELECT COALESCE(SUM(p.amount), 0) as amount
+                            FROM domain.payments p
+                            WHERE p.invoice_id = i.invoice_id
+                        ) paid ON true
+                        WHERE so.customer_id = :customer_id
+                    """),
+                    {"customer_id": UUID(customer_id)},
+                )
+                row = result.fetchone()
+
+            if row is None or (row.total_invoiced == 0 and row.open_invoice_count == 0):
+                logger.debug("customer_ar_empty", customer_id=customer_id)
+                return []
+
+            content = (
+                f"Open AR: ${float(row.open_balance):.2f} across "
+                f"{row.open_invoice_count} open invoice(s) "
+                f"(lifetime invoiced ${float(row.total_invoiced):.2f}, "
+                f"paid ${float(row.total_paid):.2f})"
+            )
+
+            logger.debug(
+                "customer_ar_query_executed",
+                customer_id=customer_id,
+                open_invoice_count=row.open_invoice_count,
+            )
+
+            return [
+                DomainFact(
+                    fact_type="customer_ar",
+                    entity_id=f"customer:{customer_id}",
+                    content=content,
+                    metadata={
+                        "open_invoice_count": row.open_invoice_count,
+                        "open_balance": float(row.open_balance),
+                        "total_invoiced": float(row.total_invoiced),
+                        "total_paid": float(row.total_paid),
+                    },
+                    source_table="domain.customer_ar",
+                    source_rows=[customer_id],
+                    retrieved_at=datetime.now(UTC),
+                )
+            ]
+
+        except Exception as e:
+            logger.error(
+                "customer_ar_query_failed", customer_id=customer_id, error=str(e)
+            )
+            return []
+
     async def get_order_chain(self, sales_order_number: str) -> list[DomainFact]:
         """Traverse SO → WO → Invoice chain."""
-        query = text("""
+        # Work orders and invoices are aggregated in separate subqueries
+        # (joining both fans out to WO x invoice rows before DISTINCT)
+        if await self._use_rollups():
+            progress_select = "wp.total_wo, wp.done_wo,"
+            progress_join = "LEFT JOIN domain.so_work_order_progress wp ON wp.so_id = so.so_id"
+        else:
+            progress_select = "NULL::int as total_wo, NULL::int as done_wo,"
+            progress_join = ""
+
+        query = text(f"""
             SELECT
                 so.so_id,
                 so.so_number,
                 so.status as so_status,
                 so.title as so_title,
-                json_agg(DISTINCT jsonb_build_object(
-                    'wo_id', wo.wo_id,
-                    'description', wo.description,
-                    'status', wo.status,
-                    'technician', wo.technician,
-                    'scheduled_for', wo.scheduled_for
-                )) FILTER (WHERE wo.wo_id IS NOT NULL) as work_orders,
-                json_agg(DISTINCT jsonb_build_object(
-                    'invoice_id', i.invoice_id,
-                    'invoice_number', i.invoice_number,
-                    'amount', i.amount,
-                    'status', i.status
-                )) FILTER (WHERE i.invoice_id IS NOT NULL) as invoices
+                {progress_select}
+                (
+                    SELECT json_agg(jsonb_build_object(
+                        'wo_id', wo.wo_id,
+                        'description', wo.description,
+                        'status', wo.status,
+                        'technician', wo.technician,
+                        'scheduled_for', wo.scheduled_for
+                    ) ORDER BY wo.scheduled_for NULLS LAST, wo.wo_id)
+                    FROM domain.work_orders wo
+                    WHERE wo.so_id = so.so_id
+                ) as work_orders,
+                (
+                    SELECT json_agg(jsonb_build_object(
+                        'invoice_id', i.invoice_id,
+                        'invoice_number', i.invoice_number,
+                        'amount', i.amount,
+                        'status', i.status
+                    ) ORDER BY i.issued_at, i.invoice_id)
+                    FROM domain.invoices i
+                    WHERE i.so_id = so.so_id
+                ) as invoices
             FROM domain.sales_orders so
-            LEFT JOIN domain.work_orders wo ON so.so_id = wo.so_id
-            LEFT JOIN domain.invoices i ON so.so_id = i.so_id
+            {progress_join}
             WHERE so.so_number = :so_number
-            GROUP BY so.so_id, so.so_number, so.status, so.title
         """)
 
         try:
@@ -242,8 +397,12 @@ class DomainDatabaseRepository(DomainDatabasePort):
             wos = row.work_orders or []
             invoices = row.invoices or []
 
-            total_wo = len(wos)
-            done_wo = sum(1 for wo in wos if wo["status"] == "done")
+            # Progress from the rollup; exact count when it has no row
+            if row.total_wo is not None:
+                total_wo, done_wo = row.total_wo, row.done_wo
+            else:
+                total_wo = len(wos)
+                done_wo = sum(1 for wo in wos if wo["status"] == "done")
 
             # Determine readiness
             if total_wo == 0:
@@ -309,9 +468,9 @@ class DomainDatabaseRepository(DomainDatabasePort):
             FROM domain.tasks t
             JOIN domain.customers c ON t.customer_id = c.customer_id
             WHERE t.customer_id = :customer_id
-              AND t.status != 'done'
-              AND EXTRACT(EPOCH FROM (NOW() - t.created_at)) / 86400 > :threshold
-            ORDER BY age_days DESC
+              AND t.status <> 'done'
+              AND t.created_at < NOW() - CAST(:threshold AS double precision) * INTERVAL '1 day'
+            ORDER BY t.created_at ASC
         """)
 
         try:
@@ -550,7 +709,7 @@ class DomainDatabaseRepository(DomainDatabasePort):
                 industry,
                 notes
             FROM domain.customers
-            WHERE LOWER(name) = LOWER(:name)
+            WHERE lower(name) = lower(:name)  -- ix_domain_customers_lower_name
             LIMIT 1
         """)
 
@@ -608,3 +767,32 @@ class DomainDatabaseRepository(DomainDatabasePort):
         """
         self._custom_queries[query_name] = handler
         logger.debug("custom_query_registered", query_name=query_name)
+
+    async def rebuild_financial_rollups(self) -> None:
+        """Recompute all rollup tables exactly from the base tables.
+
+        Triggers keep the rollups current; this is for repair after bulk
+        loads that bypassed them (e.g. COPY with triggers disabled).
+
+        Raises:
+            Exception: Propagates database errors (caller owns the transaction)
+        """
+        await self.session.execute(text("SELECT domain.rebuild_financial_rollups()"))
+        logger.info("domain_rollups_rebuilt")
+
+    async def _use_rollups(self) -> bool:
+        """Check (once per process) whether the rollup tables are installed."""
+        if DomainDatabaseRepository._rollups_available is None:
+            try:
+                result = await self.session.execute(
+                    text("SELECT to_regclass('domain.invoice_balances') IS NOT NULL")
+                )
+            except Exception as e:
+                logger.warning("domain_rollups_probe_failed", error=str(e))
+                return False
+            DomainDatabaseRepository._rollups_available = bool(result.scalar())
+            logger.info(
+                "domain_rollups_probe",
+                available=DomainDatabaseRepository._rollups_available,
+            )
+        return DomainDatabaseRepository._rollups_available
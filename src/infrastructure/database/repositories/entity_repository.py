@@ -3,24 +3,29 @@
 Implements IEntityRepository using SQLAlchemy and PostgreSQL.
 """
 
+from typing import Any
+
 import structlog
-from sqlalchemy import and_, func, select, text
+from sqlalchemy import Row, and_, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities import CanonicalEntity, EntityAlias
 from src.domain.exceptions import RepositoryError
 from src.domain.ports import IEntityRepository
 from src.domain.value_objects import EntityReference
+from src.infrastructure.database.instrumentation import instrumented_repository
 from src.infrastructure.database.models import (
     CanonicalEntity as CanonicalEntityModel,
 )
 from src.infrastructure.database.models import (
     EntityAlias as EntityAliasModel,
 )
+from src.infrastructure.database.upsert import insert_or_get
 
 logger = structlog.get_logger(__name__)
 
 
+@instrumented_repository
 class EntityRepository(IEntityRepository):
     """SQLAlchemy implementation of IEntityRepository.
 
@@ -419,15 +424,6 @@ class EntityRepository(IEntityRepository):
         try:
             entity_id = f"user_{user_id}"
 
-            # Try to find existing user entity
-            existing = await self.find_by_entity_id(entity_id)
-            if existing:
-                logger.debug("user_entity_found", entity_id=entity_id)
-                return existing
-
-            # Create new user entity
-            from src.domain.value_objects import EntityReference
-
             entity = CanonicalEntity(
                 entity_id=entity_id,
                 entity_type="user",
@@ -441,26 +437,36 @@ class EntityRepository(IEntityRepository):
                 properties={"user_id": user_id},
             )
 
-            created = await self.create(entity)
-
-            logger.info(
-                "user_entity_created",
-                entity_id=entity_id,
-                user_id=user_id,
+            # Single statement: insert, or return the existing row (concurrent
+            # first messages from one user cannot create duplicates)
+            row, inserted = await insert_or_get(
+                self.session,
+                CanonicalEntityModel.__table__,
+                self._to_row_values(entity),
+                conflict_columns=("entity_id",),
             )
 
-            return created
+            if inserted:
+                logger.info(
+                    "user_entity_created",
+                    entity_id=entity_id,
+                    user_id=user_id,
+                )
+            else:
+                logger.debug("user_entity_found", entity_id=entity_id)
+
+            return self._to_domain_entity(row)
 
         except Exception as e:
             logger.error("get_or_create_user_entity_error", user_id=user_id, error=str(e))
             msg = f"Error getting or creating user entity: {e}"
             raise RepositoryError(msg) from e
 
-    def _to_domain_entity(self, model: CanonicalEntityModel) -> CanonicalEntity:
-        """Convert ORM model to domain entity.
+    def _to_domain_entity(self, model: CanonicalEntityModel | Row[Any]) -> CanonicalEntity:
+        """Convert ORM model (or canonical_entities row) to domain entity.
 
         Args:
-            model: SQLAlchemy model
+            model: SQLAlchemy model or result row
 
         Returns:
             Domain entity
@@ -486,15 +492,26 @@ class EntityRepository(IEntityRepository):
         Returns:
             SQLAlchemy model
         """
-        return CanonicalEntityModel(
-            entity_id=entity.entity_id,
-            entity_type=entity.entity_type,
-            canonical_name=entity.canonical_name,
-            external_ref=entity.external_ref.to_dict(),
-            properties=entity.properties,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
+        return CanonicalEntityModel(**self._to_row_values(entity))
+
+    def _to_row_values(self, entity: CanonicalEntity) -> dict[str, Any]:
+        """Convert domain entity to canonical_entities column values.
+
+        Args:
+            entity: Domain entity
+
+        Returns:
+            Column values for INSERT statements
+        """
+        return {
+            "entity_id": entity.entity_id,
+            "entity_type": entity.entity_type,
+            "canonical_name": entity.canonical_name,
+            "external_ref": entity.external_ref.to_dict(),
+            "properties": entity.properties,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        }
 
     def _to_domain_alias(self, model: EntityAliasModel) -> EntityAlias:
         """Convert ORM model to domain alias.
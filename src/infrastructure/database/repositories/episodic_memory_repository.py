@@ -3,6 +3,9 @@
 Implements episodic memory retrieval using SQLAlchemy and PostgreSQL with pgvector.
 """
 
+import json
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 import numpy as np
@@ -13,10 +16,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.exceptions import RepositoryError
 from src.domain.ports.episodic_memory_repository import IEpisodicMemoryRepository
 from src.domain.value_objects.memory_candidate import MemoryCandidate
+from src.infrastructure.database.instrumentation import instrumented_repository
+from src.infrastructure.database.vector import to_vector_literal
 
 logger = structlog.get_logger(__name__)
 
 
+@instrumented_repository
 class EpisodicMemoryRepository(IEpisodicMemoryRepository):
     """SQLAlchemy implementation of episodic memory retrieval.
 
@@ -114,6 +120,99 @@ class EpisodicMemoryRepository(IEpisodicMemoryRepository):
             msg = f"Error finding similar episodic memories: {e}"
             raise RepositoryError(msg) from e
 
+    async def find_similar_batch(
+        self,
+        user_id: str,
+        query_embeddings: list[np.ndarray],
+        limit: int = 50,
+        session_id: UUID | None = None,
+    ) -> list[list[MemoryCandidate]]:
+        """Find similar episodic memories for several queries in one round-trip.
+
+        Args:
+            user_id: User identifier
+            query_embeddings: Query embedding vectors (1536-dim each)
+            limit: Maximum number of results per query
+            session_id: Optional session filter
+
+        Returns:
+            One candidate list per query embedding (same order as input)
+        """
+        if not query_embeddings:
+            return []
+
+        try:
+            session_filter = ""
+            params = {
+                "user_id": user_id,
+                "query_embeddings": [to_vector_literal(e) for e in query_embeddings],
+                "limit": limit,
+            }
+
+            if session_id:
+                session_filter = "AND em.session_id = :session_id"
+                params["session_id"] = str(session_id)
+
+            stmt = text(
+                f"""
+                SELECT
+                    q.ord AS query_index,
+                    m.memory_id, m.content, m.entities,
+                    m.embedding, m.importance, m.created_at,
+                    1 - m.distance AS similarity
+                FROM unnest(CAST(:query_embeddings AS text[])) WITH ORDINALITY AS q(vec, ord)
+                CROSS JOIN LATERAL (
+                    SELECT
+                        em.memory_id, em.summary AS content, em.entities,
+                        em.embedding, em.importance, em.created_at,
+                        em.embedding <=> CAST(q.vec AS vector) AS distance
+                    FROM app.episodic_memories em
+                    WHERE em.user_id = :user_id
+                      AND em.embedding IS NOT NULL
+                      {session_filter}
+                    ORDER BY em.embedding <=> CAST(q.vec AS vector)
+                    LIMIT :limit
+                ) m
+                ORDER BY q.ord, m.distance
+                """
+            )
+
+            result = await self.session.execute(stmt, params)
+
+            candidates: list[list[MemoryCandidate]] = [[] for _ in query_embeddings]
+            for row in result:
+                candidates[row.query_index - 1].append(
+                    MemoryCandidate(
+                        memory_id=row.memory_id,
+                        memory_type="episodic",
+                        content=row.content,
+                        entities=self._extract_entity_ids(row.entities),
+                        embedding=np.array(row.embedding),
+                        created_at=row.created_at,
+                        importance=row.importance,
+                        similarity_score=max(0.0, min(1.0, float(row.similarity))),
+                    )
+                )
+
+            logger.debug(
+                "found_similar_episodic_memories_batch",
+                user_id=user_id,
+                query_count=len(query_embeddings),
+                count=sum(len(c) for c in candidates),
+            )
+
+            return candidates
+
+        except Exception as e:
+            logger.error(
+                "find_similar_episodic_batch_error",
+                user_id=user_id,
+                query_count=len(query_embeddings),
+                error=str(e),
+            )
+            msg = f"Error finding similar episodic memories (batch): {e}"
+            raise RepositoryError(msg) from e
+
     async def find_recent(
         self,
         user_id: str,
@@ -277,6 +376,151 @@ class EpisodicMemoryRepository(IEpisodicMemoryRepository):
             msg = f"Error finding episodic memories by user: {e}"
             raise RepositoryError(msg) from e
 
+    async def find_by_entity(
+        self,
+        user_id: str,
+        entity_id: str,
+        since: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 500,
+    ) -> list[MemoryCandidate]:
+        """Find episodic memories mentioning an entity (one keyset page).
+
+        The entity filter is JSONB containment, served by
+        idx_episodic_entities_gin.
+
+        Args:
+            user_id: User identifier
+            entity_id: Entity identifier the memories must mention
+            since: Optional filter: only memories created after this time
+            after: Keyset cursor, (created_at, memory_id) of the previous page's last row
+            limit: Page size
+
+        Returns:
+            List of memory candidates ordered by (created_at, memory_id) ASC
+        """
+        try:
+            # Same JSONB structure _extract_entity_ids reads
+            return await self._find_page(
+                user_id,
+                "entities @> CAST(:entity_filter AS jsonb)",
+                {"entity_filter": json.dumps({"entities": [{"id": entity_id}]})},
+                since,
+                after,
+                limit,
+            )
+
+        except Exception as e:
+            logger.error(
+                "find_episodic_by_entity_error",
+                user_id=user_id,
+                entity_id=entity_id,
+                error=str(e),
+            )
+            msg = f"Error finding episodic memories by entity: {e}"
+            raise RepositoryError(msg) from e
+
+    async def find_by_sessions(
+        self,
+        user_id: str,
+        session_ids: list[UUID],
+        since: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 500,
+    ) -> list[MemoryCandidate]:
+        """Find episodic memories from any of several sessions (one keyset page).
+
+        Args:
+            user_id: User identifier
+            session_ids: Sessions to include
+            since: Optional filter: only memories created after this time
+            after: Keyset cursor, (created_at, memory_id) of the previous page's last row
+            limit: Page size
+
+        Returns:
+            List of memory candidates ordered by (created_at, memory_id) ASC
+        """
+        if not session_ids:
+            return []
+
+        try:
+            return await self._find_page(
+                user_id,
+                "session_id = ANY(CAST(:session_ids AS uuid[]))",
+                {"session_ids": [str(sid) for sid in session_ids]},
+                since,
+                after,
+                limit,
+            )
+
+        except Exception as e:
+            logger.error(
+                "find_episodic_by_sessions_error",
+                user_id=user_id,
+                session_count=len(session_ids),
+                error=str(e),
+            )
+            msg = f"Error finding episodic memories by sessions: {e}"
+            raise RepositoryError(msg) from e
+
+    async def _find_page(
+        self,
+        user_id: str,
+        scope_filter: str,
+        params: dict[str, Any],
+        since: datetime | None,
+        after: tuple[datetime, int] | None,
+        limit: int,
+    ) -> list[MemoryCandidate]:
+        """Fetch one keyset page of a user's memories matching a scope filter."""
+        filters = ["user_id = :user_id", scope_filter]
+        params = {**params, "user_id": user_id, "limit": limit}
+
+        if since:
+            filters.append("created_at > :since")
+            params["since"] = since
+
+        if after:
+            filters.append("(created_at, memory_id) > (:after_created_at, :after_memory_id)")
+            params["after_created_at"], params["after_memory_id"] = after
+
+        stmt = text(
+            f"""
+            SELECT
+                memory_id, summary as content, entities,
+                embedding, importance, created_at
+            FROM app.episodic_memories
+            WHERE {" AND ".join(filters)}
+            ORDER BY created_at, memory_id
+            LIMIT :limit
+            """
+        )
+
+        result = await self.session.execute(stmt, params)
+
+        candidates = [
+            MemoryCandidate(
+                memory_id=row.memory_id,
+                memory_type="episodic",
+                content=row.content,
+                entities=self._extract_entity_ids(row.entities),
+                embedding=np.array(row.embedding) if row.embedding else None,
+                created_at=row.created_at,
+                importance=row.importance,
+            )
+            for row in result
+        ]
+
+        logger.debug(
+            "found_episodic_memories_page",
+            user_id=user_id,
+            count=len(candidates),
+            since=since,
+            after=after,
+        )
+
+        return candidates
+
     def _extract_entity_ids(self, entities_jsonb: dict) -> list[str]:
         """Extract entity IDs from JSONB entities column.
 
@@ -0,0 +1,167 @@
+"""LLM extraction cache repository implementation.
+
+Implements IExtractionCacheRepository on PostgreSQL.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.exceptions import RepositoryError
+from src.domain.ports import IExtractionCacheRepository
+from src.infrastructure.database.instrumentation import instrumented_repository
+from src.infrastructure.database.models import LLMExtractionCache
+
+logger = structlog.get_logger(__name__)
+
+
+@instrumented_repository
+class PostgresExtractionCacheRepository(IExtractionCacheRepository):
+    """PostgreSQL implementation of IExtractionCacheRepository."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    async def get(self, cache_key: str) -> Any | None:
+        """Look up a cached extraction result.
+
+        A plain primary-key read: hits are counted separately and in batches
+        (record_hits), so a hot key is never a row lock or a WAL write.
+
+        Args:
+            cache_key: Hash of extraction type, model, prompt version and inputs
+
+        Returns:
+            JSON-decoded result, or None on a miss
+        """
+        try:
+            stmt = select(LLMExtractionCache.result).where(
+                LLMExtractionCache.cache_key == cache_key
+            )
+            result = await self.session.execute(stmt)
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            logger.error("get_extraction_cache_error", cache_key=cache_key, error=str(e))
+            msg = f"Error reading extraction cache: {e}"
+            raise RepositoryError(msg) from e
+
+    async def record_hits(self, hits: dict[str, int]) -> None:
+        """Add accumulated hit counts in one statement.
+
+        Args:
+            hits: Hits per cache key since the last flush
+        """
+        if not hits:
+            return
+
+        keys = sorted(hits)
+        try:
+            await self.session.execute(
+                text("""
+                    UPDATE app.llm_extraction_cache AS c
+                    SET hit_count = c.hit_count + h.hits,
+                        last_hit_at = :now
+                    FROM unnest(CAST(:keys AS text[]), CAST(:hits AS integer[]))
+                        AS h(cache_key, hits)
+                    WHERE c.cache_key = h.cache_key
+                """),
+                {"keys": keys, "hits": [hits[k] for k in keys], "now": datetime.now(UTC)},
+            )
+
+        except Exception as e:
+            logger.error("record_extraction_cache_hits_error", keys=len(hits), error=str(e))
+            msg = f"Error recording extraction cache hits: {e}"
+            raise RepositoryError(msg) from e
+
+    async def put(
+        self,
+        cache_key: str,
+        extraction_type: str,
+        model: str,
+        prompt_version: str,
+        result: Any,
+    ) -> None:
+        """Store an extraction result (first writer wins on concurrent puts).
+
+        Args:
+            cache_key: Hash of extraction type, model, prompt version and inputs
+            extraction_type: mentions | facts | coreference
+            model: Model that produced the result
+            prompt_version: Version of the prompt template used
+            result: JSON-serializable extraction output
+        """
+        try:
+            stmt = (
+                insert(LLMExtractionCache)
+                .values(
+                    cache_key=cache_key,
+                    extraction_type=extraction_type,
+                    model=model,
+                    prompt_version=prompt_version,
+                    result=result,
+                    hit_count=0,
+                    created_at=datetime.now(UTC),
+                )
+                .on_conflict_do_nothing(index_elements=[LLMExtractionCache.cache_key])
+            )
+            await self.session.execute(stmt)
+
+        except Exception as e:
+            logger.error(
+                "put_extraction_cache_error",
+                cache_key=cache_key,
+                extraction_type=extraction_type,
+                error=str(e),
+            )
+            msg = f"Error writing extraction cache: {e}"
+            raise RepositoryError(msg) from e
+
+    async def invalidate(
+        self, extraction_type: str, keep_prompt_version: str | None = None
+    ) -> int:
+        """Drop cached results for an extraction type.
+
+        Args:
+            extraction_type: mentions | facts | coreference
+            keep_prompt_version: Keep rows produced by this prompt version
+                (None drops everything for the type)
+
+        Returns:
+            Number of rows removed
+        """
+        try:
+            stmt = delete(LLMExtractionCache).where(
+                LLMExtractionCache.extraction_type == extraction_type
+            )
+            if keep_prompt_version is not None:
+                stmt = stmt.where(LLMExtractionCache.prompt_version != keep_prompt_version)
+
+            result = await self.session.execute(stmt)
+            removed = result.rowcount or 0
+
+            logger.info(
+                "extraction_cache_invalidated",
+                extraction_type=extraction_type,
+                kept_version=keep_prompt_version,
+                removed=removed,
+            )
+            return removed
+
+        except Exception as e:
+            logger.error(
+                "invalidate_extraction_cache_error",
+                extraction_type=extraction_type,
+                error=str(e),
+            )
+            msg = f"Error invalidating extraction cache: {e}"
+            raise RepositoryError(msg) from e
@@ -0,0 +1,303 @@
+"""Background job queue repository implementation.
+
+Implements IJobQueue on PostgreSQL using SELECT ... FOR UPDATE SKIP LOCKED,
+so multiple workers (and processes) can drain the queue concurrently.
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import structlog
+from sqlalchemy import case, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.exceptions import RepositoryError
+from src.domain.ports import BackgroundJob, BackgroundJobType, IJobQueue
+from src.infrastructure.database.instrumentation import instrumented_repository
+from src.infrastructure.database.models import BackgroundJob as BackgroundJobModel
+
+logger = structlog.get_logger(__name__)
+
+
+@instrumented_repository
+class PostgresJobQueueRepository(IJobQueue):
+    """PostgreSQL implementation of IJobQueue.
+
+    Enqueue participates in the caller's transaction (transactional outbox):
+    a job becomes visible to workers only once the request commits.
+    """
+
+    # Retry backoff: base * 2^(attempt-1), capped, with full jitter
+    RETRY_BASE_SECONDS = 2.0
+    RETRY_MAX_SECONDS = 300.0
+
+    def __init__(self, session: AsyncSession, max_attempts: int = 5):
+        """Initialize repository.
+
+        Args:
+            session: SQLAlchemy async session
+            max_attempts: Attempts allowed for newly enqueued jobs
+        """
+        self.session = session
+        self.max_attempts = max_attempts
+
+    async def enqueue(
+        self,
+        job_type: BackgroundJobType,
+        payload: dict[str, Any],
+        idempotency_key: str,
+        run_after: datetime | None = None,
+    ) -> bool:
+        """Enqueue a job (no-op if the idempotency key already exists).
+
+        Args:
+            job_type: Type of work to perform
+            payload: JSON-serializable job arguments
+            idempotency_key: Unique key (e.g. "<job_type>:<event_id>")
+            run_after: Earliest time the job may run (default: now)
+
+        Returns:
+            True if a new job was enqueued, False if it was a duplicate
+        """
+        try:
+            stmt = (
+                insert(BackgroundJobModel)
+                .values(
+                    job_type=job_type.value,
+                    payload=payload,
+                    idempotency_key=idempotency_key,
+                    status="pending",
+                    attempts=0,
+                    max_attempts=self.max_attempts,
+                    run_after=run_after or datetime.now(UTC),
+                )
+                .on_conflict_do_nothing(constraint="uq_background_jobs_idempotency_key")
+                .returning(BackgroundJobModel.job_id)
+            )
+            result = await self.session.execute(stmt)
+            job_id = result.scalar_one_or_none()
+
+            logger.debug(
+                "background_job_enqueued" if job_id else "background_job_duplicate",
+                job_type=job_type.value,
+                idempotency_key=idempotency_key,
+                job_id=job_id,
+            )
+
+            return job_id is not None
+
+        except Exception as e:
+            logger.error(
+                "enqueue_background_job_error",
+                job_type=job_type.value,
+                idempotency_key=idempotency_key,
+                error=str(e),
+            )
+            msg = f"Error enqueuing background job: {e}"
+            raise RepositoryError(msg) from e
+
+    async def claim_batch(self, limit: int = 10) -> list[BackgroundJob]:
+        """Claim pending jobs for execution (skipping rows locked by other workers).
+
+        Args:
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            Claimed jobs (status moved to running, attempts incremented)
+        """
+        try:
+            stmt = text(
+                """
+                UPDATE app.background_jobs AS j
+                SET status = 'running',
+                    attempts = j.attempts + 1,
+                    locked_at = NOW(),
+                    updated_at = NOW()
+                WHERE j.job_id IN (
+                    SELECT job_id
+                    FROM app.background_jobs
+                    WHERE status = 'pending'
+                      AND run_after <= NOW()
+                      AND attempts < max_attempts
+                    ORDER BY job_id
+                    FOR UPDATE SKIP LOCKED
+                    LIMIT :limit
+                )
+                RETURNING j.job_id, j.job_type, j.payload, j.idempotency_key,
+                          j.attempts, j.max_attempts
+                """
+            )
+            result = await self.session.execute(stmt, {"limit": limit})
+
+            jobs = [
+                BackgroundJob(
+                    job_id=row.job_id,
+                    job_type=BackgroundJobType(row.job_type),
+                    payload=row.payload or {},
+                    idempotency_key=row.idempotency_key,
+                    attempts=row.attempts,
+                    max_attempts=row.max_attempts,
+                )
+                for row in result
+            ]
+
+            if jobs:
+                logger.debug("background_jobs_claimed", count=len(jobs))
+
+            return jobs
+
+        except Exception as e:
+            logger.error("claim_background_jobs_error", error=str(e))
+            msg = f"Error claiming background jobs: {e}"
+            raise RepositoryError(msg) from e
+
+    async def mark_succeeded(self, job_id: int) -> None:
+        """Mark a job as successfully completed.
+
+        Args:
+            job_id: Job identifier
+        """
+        try:
+            stmt = (
+                update(BackgroundJobModel)
+                .where(BackgroundJobModel.job_id == job_id)
+                .values(
+                    status="succeeded",
+                    locked_at=None,
+                    last_error=None,
+                    updated_at=datetime.now(UTC),
+                )
+            )
+            await self.session.execute(stmt)
+
+        except Exception as e:
+            logger.error("mark_job_succeeded_error", job_id=job_id, error=str(e))
+            msg = f"Error marking background job succeeded: {e}"
+            raise RepositoryError(msg) from e
+
+    async def mark_failed(self, job: BackgroundJob, error: str) -> None:
+        """Record a failed attempt (retried with backoff until max_attempts).
+
+        Args:
+            job: The job that failed
+            error: Error description
+        """
+        exhausted = job.attempts >= job.max_attempts
+        delay = self.retry_delay_seconds(job.attempts)
+
+        try:
+            stmt = (
+                update(BackgroundJobModel)
+                .where(BackgroundJobModel.job_id == job.job_id)
+                .values(
+                    status="failed" if exhausted else "pending",
+                    locked_at=None,
+                    last_error=error[:2000],
+                    run_after=datetime.now(UTC) + timedelta(seconds=delay),
+                    updated_at=datetime.now(UTC),
+                )
+            )
+            await self.session.execute(stmt)
+
+            log = logger.error if exhausted else logger.warning
+            log(
+                "background_job_failed" if exhausted else "background_job_retry_scheduled",
+                job_id=job.job_id,
+                job_type=job.job_type.value,
+                attempts=job.attempts,
+                retry_in_seconds=None if exhausted else round(delay, 2),
+                error=error,
+            )
+
+        except Exception as e:
+            logger.error("mark_job_failed_error", job_id=job.job_id, error=str(e))
+            msg = f"Error marking background job failed: {e}"
+            raise RepositoryError(msg) from e
+
+    async def heartbeat(self, job_ids: list[int]) -> None:
+        """Refresh the lock of claimed jobs that are still running.
+
+        Args:
+            job_ids: Jobs the caller still holds
+        """
+        if not job_ids:
+            return
+
+        try:
+            stmt = (
+                update(BackgroundJobModel)
+                .where(
+                    BackgroundJobModel.job_id.in_(job_ids),
+                    BackgroundJobModel.status == "running",
+                )
+                .values(locked_at=datetime.now(UTC))
+            )
+            await self.session.execute(stmt)
+
+        except Exception as e:
+            logger.error("background_job_heartbeat_error", job_ids=job_ids, error=str(e))
+            msg = f"Error refreshing background job locks: {e}"
+            raise RepositoryError(msg) from e
+
+    async def requeue_stale(self, older_than_seconds: int) -> int:
+        """Return jobs stuck in running state (crashed worker) to pending.
+
+        A job that keeps killing its worker never reaches mark_failed, so jobs
+        that already used all their attempts are marked failed here instead.
+
+        Args:
+            older_than_seconds: Lock age after which a running job is considered stale
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        try:
+            cutoff = datetime.now(UTC) - timedelta(seconds=older_than_seconds)
+            exhausted = BackgroundJobModel.attempts >= BackgroundJobModel.max_attempts
+            stmt = (
+                update(BackgroundJobModel)
+                .where(
+                    BackgroundJobModel.status == "running",
+                    BackgroundJobModel.locked_at < cutoff,
+                )
+                .values(
+                    status=case((exhausted, "failed"), else_="pending"),
+                    last_error=case(
+                        (exhausted, "Worker lost while running (attempts exhausted)"),
+                        else_=BackgroundJobModel.last_error,
+                    ),
+                    locked_at=None,
+                    updated_at=datetime.now(UTC),
+                )
+                .returning(BackgroundJobModel.status)
+            )
+            result = await self.session.execute(stmt)
+            statuses = [row.status for row in result]
+            failed = statuses.count("failed")
+
+            if len(statuses) > failed:
+                logger.warning("stale_background_jobs_requeued", count=len(statuses) - failed)
+            if failed:
+                logger.error("stale_background_jobs_failed", count=failed)
+
+            return len(statuses)
+
+        except Exception as e:
+            logger.error("requeue_stale_jobs_error", error=str(e))
+            msg = f"Error requeuing stale background jobs: {e}"
+            raise RepositoryError(msg) from e
+
+    @classmethod
+    def retry_delay_seconds(cls, attempt: int) -> float:
+        """Exponential backoff with full jitter.
+
+        Args:
+            attempt: Attempt number that just failed (1-indexed)
+
+        Returns:
+            Delay in seconds before the next attempt
+        """
+        ceiling = min(cls.RETRY_MAX_SECONDS, cls.RETRY_BASE_SECONDS * (2 ** max(0, attempt - 1)))
+        return random.uniform(0, ceiling)  # noqa: S311 - jitter, not crypto
@@ -11,10 +11,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.exceptions import RepositoryError
 from src.domain.ports.ontology_repository import IOntologyRepository
 from src.domain.value_objects.ontology import OntologyRelation
+from src.infrastructure.database.instrumentation import instrumented_repository
 
 logger = structlog.get_logger(__name__)
 
 
+@instrumented_repository
 class OntologyRepository(IOntologyRepository):
     """SQLAlchemy implementation of ontology repository.
 
@@ -3,6 +3,7 @@
 Implements procedural memory storage and retrieval using SQLAlchemy and PostgreSQL with pgvector.
 """
 
+import json
 from datetime import UTC, datetime
 from typing import Any
 
@@ -15,10 +16,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.entities.procedural_memory import ProceduralMemory
 from src.domain.exceptions import RepositoryError
 from src.domain.ports.procedural_memory_repository import IProceduralMemoryRepository
+from src.infrastructure.database.instrumentation import instrumented_repository
 
 logger = structlog.get_logger(__name__)
 
 
+@instrumented_repository
 class ProceduralMemoryRepository(IProceduralMemoryRepository):
     """SQLAlchemy implementation of procedural memory persistence.
 
@@ -375,6 +378,91 @@ class ProceduralMemoryRepository(IProceduralMemoryRepository):
             msg = f"Error updating procedural memory: {e}"
             raise RepositoryError(msg) from e
 
+    async def upsert_mined_patterns(
+        self, memories: list[ProceduralMemory]
+    ) -> list[ProceduralMemory]:
+        """Insert or replace mined tool patterns in one statement.
+
+        Rows are sent as one JSON array and expanded with jsonb_to_recordset;
+        conflicts on the unique (user_id, anchor_tool) index update in place.
+
+        Args:
+            memories: Mined patterns, at most one per (user_id, anchor_tool)
+
+        Returns:
+            Stored ProceduralMemory instances
+        """
+        if not memories:
+            return []
+
+        try:
+            rows = [
+                {
+                    "user_id": memory.user_id,
+                    "trigger_pattern": memory.trigger_pattern,
+                    "trigger_features": memory.trigger_features,
+                    "action_heuristic": memory.action_heuristic,
+                    "action_structure": memory.action_structure,
+                    "observed_count": memory.observed_count,
+                    "confidence": memory.confidence,
+                }
+                for memory in memories
+            ]
+
+            stmt = text(
+                """
+                INSERT INTO app.procedural_memories (
+                    user_id, trigger_pattern, trigger_features,
+                    action_heuristic, action_structure,
+                    observed_count, confidence, created_at, updated_at
+                )
+                SELECT
+                    r.user_id, r.trigger_pattern, r.trigger_features,
+                    r.action_heuristic, r.action_structure,
+                    r.observed_count, r.confidence, NOW(), NOW()
+                FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r(
+                    user_id text,
+                    trigger_pattern text,
+                    trigger_features jsonb,
+                    action_heuristic text,
+                    action_structure jsonb,
+                    observed_count integer,
+                    confidence double precision
+                )
+                ON CONFLICT (user_id, (trigger_features ->> 'anchor_tool'))
+                    WHERE (trigger_features ->> 'anchor_tool') IS NOT NULL
+                DO UPDATE SET
+                    trigger_pattern = EXCLUDED.trigger_pattern,
+                    trigger_features = EXCLUDED.trigger_features,
+                    action_heuristic = EXCLUDED.action_heuristic,
+                    action_structure = EXCLUDED.action_structure,
+                    observed_count = EXCLUDED.observed_count,
+                    confidence = EXCLUDED.confidence,
+                    updated_at = NOW()
+                RETURNING
+                    memory_id, user_id, trigger_pattern, trigger_features,
+                    action_heuristic, action_structure,
+                    observed_count, confidence, embedding,
+                    created_at, updated_at
+                """
+            )
+
+            result = await self.session.execute(stmt, {"rows": json.dumps(rows)})
+            stored = [self._row_to_procedural_memory(row) for row in result]
+
+            logger.info("mined_procedural_memories_upserted", count=len(stored))
+
+            return stored
+
+        except Exception as e:
+            logger.error(
+                "upsert_mined_procedural_memories_error",
+                count=len(memories),
+                error=str(e),
+            )
+            msg = f"Error upserting mined procedural memories: {e}"
+            raise RepositoryError(msg) from e
+
     async def delete(self, memory_id: int, user_id: str) -> bool:
         """Delete a procedural memory.
 
@@ -3,17 +3,25 @@
 Implements entity-tagged natural language memory storage using SQLAlchemy and PostgreSQL with pgvector.
 """
 
+from datetime import datetime
+from typing import Any
+
 import structlog
-from sqlalchemy import and_, select, text
+from sqlalchemy import Row, and_, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.semantic_memory import SemanticMemory
 from src.domain.exceptions import RepositoryError
+from src.infrastructure.cache import note_semantic_memory_write
+from src.infrastructure.database.instrumentation import instrumented_repository
 from src.infrastructure.database.models import SemanticMemory as SemanticMemoryModel
+from src.infrastructure.database.upsert import insert_or_get
+from src.infrastructure.database.vector import to_vector_literal
 
 logger = structlog.get_logger(__name__)
 
 
+@instrumented_repository
 class SemanticMemoryRepository:
     """SQLAlchemy implementation of semantic memory storage.
 
@@ -70,6 +78,61 @@ class SemanticMemoryRepository:
             msg = f"Error creating semantic memory: {e}"
             raise RepositoryError(msg) from e
 
+    async def create_if_absent(self, memory: SemanticMemory) -> tuple[SemanticMemory, bool]:
+        """Store a memory unless the user already has one with its content hash.
+
+        One INSERT ... ON CONFLICT (user_id, content_hash) statement backed by
+        the unique index on the generated content_hash column, so concurrent
+        extractions of the same fact cannot both insert.
+
+        Args:
+            memory: Semantic memory to store (metadata["content_hash"] set)
+
+        Returns:
+            Tuple of (stored or existing memory, whether it was created)
+
+        Raises:
+            RepositoryError: If the insert fails
+        """
+        try:
+            row, inserted = await insert_or_get(
+                self.session,
+                SemanticMemoryModel.__table__,
+                self._to_row_values(memory),
+                conflict_columns=("user_id", "content_hash"),
+            )
+
+            if not inserted:
+                logger.debug(
+                    "found_duplicate_by_content_hash",
+                    content_hash=(row.content_hash or "")[:16],
+                    memory_id=row.memory_id,
+                )
+                return self._to_domain_entity(row), False
+
+            # Core insert bypasses the flush, so report it for cache invalidation
+            note_semantic_memory_write(self.session, memory.user_id)
+            memory.memory_id = row.memory_id
+
+            logger.info(
+                "semantic_memory_created",
+                memory_id=memory.memory_id,
+                entities=memory.entities,
+                content_preview=memory.content[:50],
+                importance=memory.importance,
+            )
+
+            return memory, True
+
+        except Exception as e:
+            logger.error(
+                "create_semantic_memory_error",
+                entities=memory.entities,
+                error=str(e),
+            )
+            msg = f"Error creating semantic memory: {e}"
+            raise RepositoryError(msg) from e
+
     async def find_by_id(self, memory_id: int) -> SemanticMemory | None:
         """Find semantic memory by ID.
 
@@ -175,29 +238,23 @@ class SemanticMemoryRepository:
             List of (memory, similarity_score) tuples, sorted by similarity descending
         """
         try:
-            # Convert embedding to string format for pgvector
-            if isinstance(query_embedding, list):
-                embedding_str = str(query_embedding).replace(" ", "")
-            else:
-                embedding_str = str(query_embedding.tolist()).replace(" ", "")
-
-            # Build raw SQL for pgvector similarity
+            # Vector bound as a parameter: the statement text stays constant
             stmt = text(
-                f"""
+                """
                 SELECT
                     memory_id, user_id, content, entities, memory_metadata,
                     confidence, importance, source_type, source_memory_id,
                     extracted_from_event_id, source_text,
                     status, superseded_by_memory_id, embedding,
                     last_accessed_at, created_at, updated_at,
-                    1 - (embedding <=> '{embedding_str}'::vector) as similarity
+                    1 - (embedding <=> CAST(:query_embedding AS vector)) as similarity
                 FROM app.semantic_memories
                 WHERE user_id = :user_id
                   AND status = 'active'
                   AND confidence >= :min_confidence
                   AND importance >= :min_importance
                   AND embedding IS NOT NULL
-                ORDER BY embedding <=> '{embedding_str}'::vector
+                ORDER BY embedding <=> CAST(:query_embedding AS vector)
                 LIMIT :limit
                 """
             )
@@ -205,6 +262,7 @@ class SemanticMemoryRepository:
             result = await self.session.execute(
                 stmt,
                 {
+                    "query_embedding": to_vector_literal(query_embedding),
                     "user_id": user_id,
                     "min_confidence": min_confidence,
                     "min_importance": min_importance,
@@ -235,6 +293,101 @@ class SemanticMemoryRepository:
             msg = f"Error finding similar memories: {e}"
             raise RepositoryError(msg) from e
 
+    async def find_similar_batch(
+        self,
+        user_id: str,
+        query_embeddings: list[list[float]],
+        limit: int = 50,
+        min_confidence: float | None = 0.3,
+        min_importance: float = 0.3,
+    ) -> list[list[tuple[SemanticMemory, float]]]:
+        """Find similar memories for several query vectors in one round-trip.
+
+        Query vectors are unnested with their ordinal and each one drives a
+        LATERAL top-k ANN scan, so N queries cost one statement instead of N.
+
+        Args:
+            user_id: User ID to filter by
+            query_embeddings: Query vectors (1536 dimensions each)
+            limit: Maximum number of results per query
+            min_confidence: Minimum confidence threshold (default: 0.3)
+            min_importance: Minimum importance threshold (default: 0.3)
+
+        Returns:
+            One list of (memory, similarity_score) tuples per query, in input
+            order, each sorted by similarity descending
+        """
+        if not query_embeddings:
+            return []
+
+        try:
+            stmt = text(
+                """
+                SELECT
+                    q.ord AS query_index,
+                    m.memory_id, m.user_id, m.content, m.entities, m.memory_metadata,
+                    m.confidence, m.importance, m.source_type, m.source_memory_id,
+                    m.extracted_from_event_id, m.source_text,
+                    m.status, m.superseded_by_memory_id, m.embedding,
+                    m.last_accessed_at, m.created_at, m.updated_at,
+                    1 - m.distance AS similarity
+                FROM unnest(CAST(:query_embeddings AS text[])) WITH ORDINALITY AS q(vec, ord)
+                CROSS JOIN LATERAL (
+                    SELECT
+                        sm.*,
+                        sm.embedding <=> CAST(q.vec AS vector) AS distance
+                    FROM app.semantic_memories sm
+                    WHERE sm.user_id = :user_id
+                      AND sm.status = 'active'
+                      AND sm.confidence >= :min_confidence
+                      AND sm.importance >= :min_importance
+                      AND sm.embedding IS NOT NULL
+                    ORDER BY sm.embedding <=> CAST(q.vec AS vector)
+                    LIMIT :limit
+                ) m
+                ORDER BY q.ord, m.distance
+                """
+            )
+
+            result = await self.session.execute(
+                stmt,
+                {
+                    "query_embeddings": [
+                        to_vector_literal(embedding) for embedding in query_embeddings
+                    ],
+                    "user_id": user_id,
+                    "min_confidence": min_confidence if min_confidence is not None else 0.0,
+                    "min_importance": min_importance,
+                    "limit": limit,
+                },
+            )
+
+            matches: list[list[tuple[SemanticMemory, float]]] = [
+                [] for _ in query_embeddings
+            ]
+            for row in result:
+                memory = self._row_to_domain_entity(row)
+                matches[row.query_index - 1].append((memory, float(row.similarity)))
+
+            logger.debug(
+                "found_similar_memories_batch",
+                user_id=user_id,
+                query_count=len(query_embeddings),
+                count=sum(len(m) for m in matches),
+            )
+
+            return matches
+
+        except Exception as e:
+            logger.error(
+                "find_similar_batch_error",
+                user_id=user_id,
+                query_count=len(query_embeddings),
+                error=str(e),
+            )
+            msg = f"Error finding similar memories (batch): {e}"
+            raise RepositoryError(msg) from e
+
     async def update(self, memory: SemanticMemory) -> SemanticMemory:
         """Update an existing semantic memory.
 
@@ -295,6 +448,71 @@ class SemanticMemoryRepository:
             msg = f"Error updating semantic memory: {e}"
             raise RepositoryError(msg) from e
 
+    async def find_by_entity(
+        self,
+        user_id: str,
+        entity_id: str,
+        since: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 500,
+    ) -> list[SemanticMemory]:
+        """Find active semantic memories mentioning an entity (one keyset page).
+
+        The entity filter is array containment, served by idx_semantic_entities_gin.
+
+        Args:
+            user_id: User identifier
+            entity_id: Entity identifier the memories must mention
+            since: Optional filter: only memories created after this time
+            after: Keyset cursor, (created_at, memory_id) of the previous page's last row
+            limit: Page size
+
+        Returns:
+            List of memories ordered by (created_at, memory_id) ASC
+        """
+        try:
+            conditions = [
+                SemanticMemoryModel.user_id == user_id,
+                SemanticMemoryModel.status == "active",
+                SemanticMemoryModel.entities.contains([entity_id]),
+            ]
+            if since:
+                conditions.append(SemanticMemoryModel.created_at > since)
+            if after:
+                conditions.append(
+                    tuple_(SemanticMemoryModel.created_at, SemanticMemoryModel.memory_id)
+                    > tuple_(*after)
+                )
+
+            stmt = (
+                select(SemanticMemoryModel)
+                .where(and_(*conditions))
+                .order_by(SemanticMemoryModel.created_at, SemanticMemoryModel.memory_id)
+                .limit(limit)
+            )
+
+            result = await self.session.execute(stmt)
+            memories = [self._to_domain_entity(model) for model in result.scalars().all()]
+
+            logger.debug(
+                "found_semantic_memories_by_entity",
+                user_id=user_id,
+                entity_id=entity_id,
+                count=len(memories),
+            )
+
+            return memories
+
+        except Exception as e:
+            logger.error(
+                "find_semantic_by_entity_error",
+                user_id=user_id,
+                entity_id=entity_id,
+                error=str(e),
+            )
+            msg = f"Error finding semantic memories by entity: {e}"
+            raise RepositoryError(msg) from e
+
     async def find_aging_memories(
         self,
         user_id: str,
@@ -367,7 +585,7 @@ class SemanticMemoryRepository:
             stmt = select(SemanticMemoryModel).where(
                 and_(
                     SemanticMemoryModel.user_id == user_id,
-                    SemanticMemoryModel.memory_metadata["content_hash"].astext == content_hash,
+                    SemanticMemoryModel.content_hash == content_hash,
                 )
             )
 
@@ -393,11 +611,11 @@ class SemanticMemoryRepository:
             # This allows system to continue if hash lookup fails
             return None
 
-    def _to_domain_entity(self, model: SemanticMemoryModel) -> SemanticMemory:
-        """Convert ORM model to domain entity.
+    def _to_domain_entity(self, model: SemanticMemoryModel | Row[Any]) -> SemanticMemory:
+        """Convert ORM model (or semantic_memories row) to domain entity.
 
         Args:
-            model: SQLAlchemy model
+            model: SQLAlchemy model or result row
 
         Returns:
             Domain entity
@@ -481,30 +699,43 @@ class SemanticMemoryRepository:
         Returns:
             SQLAlchemy model
         """
+        return SemanticMemoryModel(**self._to_row_values(memory))
+
+    def _to_row_values(self, memory: SemanticMemory) -> dict[str, Any]:
+        """Convert domain entity to semantic_memories column values.
+
+        Args:
+            memory: Domain entity
+
+        Returns:
+            Column values (memory_id omitted until assigned)
+        """
         # Get first event ID for extracted_from_event_id
         extracted_from_event_id = (
             memory.source_event_ids[0] if memory.source_event_ids else None
         )
 
-        return SemanticMemoryModel(
-            memory_id=memory.memory_id,
-            user_id=memory.user_id,
-            content=memory.content,
-            entities=memory.entities,
-            memory_metadata=memory.metadata,
-            confidence=memory.confidence,
-            importance=memory.importance,
-            source_type="episodic",  # Phase 1B: all from chat events
-            source_memory_id=None,
-            extracted_from_event_id=extracted_from_event_id,
-            status=self._map_status_to_orm(memory.status),
-            superseded_by_memory_id=None,
-            embedding=memory.embedding,
-            source_text=memory.source_text,
-            last_accessed_at=memory.last_accessed_at,
-            created_at=memory.created_at,
-            updated_at=memory.updated_at,
-        )
+        values: dict[str, Any] = {
+            "user_id": memory.user_id,
+            "content": memory.content,
+            "entities": memory.entities,
+            "memory_metadata": memory.metadata,
+            "confidence": memory.confidence,
+            "importance": memory.importance,
+            "source_type": "episodic",  # Phase 1B: all from chat events
+            "source_memory_id": None,
+            "extracted_from_event_id": extracted_from_event_id,
+            "status": self._map_status_to_orm(memory.status),
+            "superseded_by_memory_id": None,
+            "embedding": memory.embedding,
+            "source_text": memory.source_text,
+            "last_accessed_at": memory.last_accessed_at,
+            "created_at": memory.created_at,
+            "updated_at": memory.updated_at,
+        }
+        if memory.memory_id is not None:
+            values["memory_id"] = memory.memory_id
+        return values
 
     def _map_status_to_orm(self, domain_status: str) -> str:
         """Map domain status to ORM status.
@@ -14,11 +14,14 @@ from src.domain.exceptions import RepositoryError
 from src.domain.ports.embedding_service import IEmbeddingService
 from src.domain.ports.summary_repository import ISummaryRepository
 from src.domain.value_objects.memory_candidate import MemoryCandidate
+from src.infrastructure.database.instrumentation import instrumented_repository
 from src.infrastructure.database.models import MemorySummary as MemorySummaryModel
+from src.infrastructure.database.vector import to_vector_literal
 
 logger = structlog.get_logger(__name__)
 
 
+@instrumented_repository
 class SummaryRepository(ISummaryRepository):
     """SQLAlchemy implementation of memory summary storage and retrieval.
 
@@ -129,6 +132,100 @@ class SummaryRepository(ISummaryRepository):
             msg = f"Error finding similar summaries: {e}"
             raise RepositoryError(msg) from e
 
+    async def find_similar_batch(
+        self,
+        user_id: str,
+        query_embeddings: list[np.ndarray],
+        limit: int = 5,
+        scope_type: str | None = None,
+    ) -> list[list[MemoryCandidate]]:
+        """Find similar memory summaries for several queries in one round-trip.
+
+        Args:
+            user_id: User identifier
+            query_embeddings: Query embedding vectors (1536-dim each)
+            limit: Maximum number of results per query
+            scope_type: Optional scope filter (entity, topic, session_window)
+
+        Returns:
+            One candidate list per query embedding (same order as input)
+        """
+        if not query_embeddings:
+            return []
+
+        try:
+            scope_filter = ""
+            params = {
+                "user_id": user_id,
+                "query_embeddings": [to_vector_literal(e) for e in query_embeddings],
+                "limit": limit,
+            }
+
+            if scope_type:
+                scope_filter = "AND ms.scope_type = :scope_type"
+                params["scope_type"] = scope_type
+
+            stmt = text(
+                f"""
+                SELECT
+                    q.ord AS query_index,
+                    m.memory_id, m.content, m.embedding, m.confidence,
+                    m.created_at, m.key_facts,
+                    1 - m.distance AS similarity
+                FROM unnest(CAST(:query_embeddings AS text[])) WITH ORDINALITY AS q(vec, ord)
+                CROSS JOIN LATERAL (
+                    SELECT
+                        ms.summary_id AS memory_id, ms.summary_text AS content,
+                        ms.embedding, ms.confidence, ms.created_at, ms.key_facts,
+                        ms.embedding <=> CAST(q.vec AS vector) AS distance
+                    FROM app.memory_summaries ms
+                    WHERE ms.user_id = :user_id
+                      AND ms.embedding IS NOT NULL
+                      {scope_filter}
+                    ORDER BY ms.embedding <=> CAST(q.vec AS vector)
+                    LIMIT :limit
+                ) m
+                ORDER BY q.ord, m.distance
+                """
+            )
+
+            result = await self.session.execute(stmt, params)
+
+            candidates: list[list[MemoryCandidate]] = [[] for _ in query_embeddings]
+            for row in result:
+                candidates[row.query_index - 1].append(
+                    MemoryCandidate(
+                        memory_id=row.memory_id,
+                        memory_type="summary",
+                        content=row.content,
+                        entities=self._extract_entity_ids(row.key_facts),
+                        embedding=np.array(row.embedding),
+                        created_at=row.created_at,
+                        importance=0.8,  # Same implicit summary importance as find_similar
+                        similarity_score=max(0.0, min(1.0, float(row.similarity))),
+                        confidence=row.confidence,
+                    )
+                )
+
+            logger.debug(
+                "found_similar_summaries_batch",
+                user_id=user_id,
+                query_count=len(query_embeddings),
+                count=sum(len(c) for c in candidates),
+            )
+
+            return candidates
+
+        except Exception as e:
+            logger.error(
+                "find_similar_summaries_batch_error",
+                user_id=user_id,
+                query_count=len(query_embeddings),
+                error=str(e),
+            )
+            msg = f"Error finding similar summaries (batch): {e}"
+            raise RepositoryError(msg) from e
+
     async def find_by_scope(
         self,
         user_id: str,
@@ -276,6 +373,31 @@ class SummaryRepository(ISummaryRepository):
             msg = f"Error finding summaries with filters: {e}"
             raise RepositoryError(msg) from e
 
+    async def find_latest_by_scope(
+        self,
+        user_id: str,
+        scope_type: str,
+        scope_identifier: str,
+    ) -> MemorySummary | None:
+        """Find the most recent summary of a scope.
+
+        Args:
+            user_id: User identifier
+            scope_type: Scope type (entity, topic, session_window)
+            scope_identifier: Scope identifier
+
+        Returns:
+            Latest memory summary if any, None otherwise
+        """
+        summaries = await self.find_by_scope_with_filters(
+            user_id=user_id,
+            scope_type=scope_type,
+            scope_identifier=scope_identifier,
+            limit=1,
+            min_confidence=0.0,
+        )
+        return summaries[0] if summaries else None
+
     async def create(self, summary: MemorySummary) -> MemorySummary:
         """Create a new memory summary.
 
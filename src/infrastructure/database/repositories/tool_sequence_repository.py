@@ -0,0 +1,231 @@
+"""Tool sequence miner state repository implementation.
+
+Implements IToolSequenceStateRepository on PostgreSQL. The miner reads
+app.tool_usage_log rows with ids past a watermark stored in
+app.system_config and keeps its counts in app.tool_sequence_counts, written
+back with one INSERT ... ON CONFLICT DO UPDATE per batch.
+"""
+
+import json
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.exceptions import RepositoryError
+from src.domain.ports.tool_sequence_port import IToolSequenceStateRepository, ToolUsageBatch
+from src.domain.value_objects.procedural_memory import ToolSequenceCounts
+from src.infrastructure.database.instrumentation import instrumented_repository
+
+logger = structlog.get_logger(__name__)
+
+WATERMARK_KEY = "procedural_miner_watermark"
+
+
+@instrumented_repository
+class PostgresToolSequenceStateRepository(IToolSequenceStateRepository):
+    """PostgreSQL implementation of IToolSequenceStateRepository.
+
+    The watermark row stays locked FOR UPDATE from read_usage_batch() until
+    the transaction ends, so concurrent miners serialize and never count a
+    log twice. Log ids are SERIAL, so a log committed after a batch with a
+    lower id than the new watermark is skipped; patterns are a heuristic and
+    tolerate that.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    async def read_usage_batch(self, limit: int) -> ToolUsageBatch:
+        """Lock the watermark and read the usage logged after it.
+
+        Args:
+            limit: Maximum number of logs
+
+        Returns:
+            Batch of logs in id order
+        """
+        try:
+            since = await self._lock_watermark()
+
+            result = await self.session.execute(
+                text(
+                    """
+                    SELECT id, user_id, conversation_id, tools_called
+                    FROM app.tool_usage_log
+                    WHERE id > :since
+                    ORDER BY id
+                    LIMIT :limit
+                    """
+                ),
+                {"since": since, "limit": limit},
+            )
+            logs = [
+                {
+                    "id": row.id,
+                    "user_id": row.user_id,
+                    "conversation_id": row.conversation_id,
+                    "tools_called": row.tools_called,
+                }
+                for row in result
+            ]
+
+            return ToolUsageBatch(
+                logs=logs,
+                watermark=logs[-1]["id"] if logs else since,
+            )
+
+        except Exception as e:
+            logger.error("read_tool_usage_batch_error", error=str(e))
+            msg = f"Error reading tool usage batch: {e}"
+            raise RepositoryError(msg) from e
+
+    async def load_counts(self, keys: list[tuple[str, str]]) -> list[ToolSequenceCounts]:
+        """Load the persisted counts of (user_id, anchor_tool) keys.
+
+        Args:
+            keys: Keys to load
+
+        Returns:
+            Counts of the keys that have any (missing keys are omitted)
+        """
+        if not keys:
+            return []
+
+        try:
+            result = await self.session.execute(
+                text(
+                    """
+                    SELECT c.user_id, c.anchor_tool, c.support, c.follower_counts,
+                           c.entity_type_counts, c.recent_conversation_ids
+                    FROM app.tool_sequence_counts c
+                    JOIN unnest(CAST(:user_ids AS text[]), CAST(:anchor_tools AS text[]))
+                        AS k(user_id, anchor_tool)
+                      ON k.user_id = c.user_id AND k.anchor_tool = c.anchor_tool
+                    """
+                ),
+                {
+                    "user_ids": [user_id for user_id, _ in keys],
+                    "anchor_tools": [anchor_tool for _, anchor_tool in keys],
+                },
+            )
+
+            return [
+                ToolSequenceCounts(
+                    user_id=row.user_id,
+                    anchor_tool=row.anchor_tool,
+                    support=row.support,
+                    follower_counts=row.follower_counts,
+                    entity_type_counts=row.entity_type_counts,
+                    recent_conversation_ids=row.recent_conversation_ids,
+                )
+                for row in result
+            ]
+
+        except Exception as e:
+            logger.error("load_tool_sequence_counts_error", keys=len(keys), error=str(e))
+            msg = f"Error loading tool sequence counts: {e}"
+            raise RepositoryError(msg) from e
+
+    async def save_counts(self, counts: list[ToolSequenceCounts], watermark: int) -> None:
+        """Store merged counts and advance the watermark.
+
+        Args:
+            counts: Full counts replacing the persisted ones
+            watermark: Highest log id folded into the counts
+        """
+        try:
+            if counts:
+                rows = [
+                    {
+                        "user_id": c.user_id,
+                        "anchor_tool": c.anchor_tool,
+                        "support": c.support,
+                        "follower_counts": c.follower_counts,
+                        "entity_type_counts": c.entity_type_counts,
+                        "recent_conversation_ids": c.recent_conversation_ids,
+                    }
+                    for c in counts
+                ]
+                await self.session.execute(
+                    text(
+                        """
+                        INSERT INTO app.tool_sequence_counts (
+                            user_id, anchor_tool, support, follower_counts,
+                            entity_type_counts, recent_conversation_ids, updated_at
+                        )
+                        SELECT r.user_id, r.anchor_tool, r.support, r.follower_counts,
+                               r.entity_type_counts, r.recent_conversation_ids, NOW()
+                        FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r(
+                            user_id text,
+                            anchor_tool text,
+                            support integer,
+                            follower_counts jsonb,
+                            entity_type_counts jsonb,
+                            recent_conversation_ids jsonb
+                        )
+                        ON CONFLICT (user_id, anchor_tool) DO UPDATE
+                        SET support = EXCLUDED.support,
+                            follower_counts = EXCLUDED.follower_counts,
+                            entity_type_counts = EXCLUDED.entity_type_counts,
+                            recent_conversation_ids = EXCLUDED.recent_conversation_ids,
+                            updated_at = NOW()
+                        """
+                    ),
+                    {"rows": json.dumps(rows)},
+                )
+
+            await self.session.execute(
+                text(
+                    """
+                    UPDATE app.system_config
+                    SET config_value = CAST(:watermark AS jsonb), updated_at = NOW()
+                    WHERE config_key = :key
+                    """
+                ),
+                {
+                    "key": WATERMARK_KEY,
+                    "watermark": json.dumps({"tool_usage_log_id": watermark}),
+                },
+            )
+
+            logger.debug(
+                "tool_sequence_counts_saved",
+                counts=len(counts),
+                watermark=watermark,
+            )
+
+        except Exception as e:
+            logger.error("save_tool_sequence_counts_error", counts=len(counts), error=str(e))
+            msg = f"Error saving tool sequence counts: {e}"
+            raise RepositoryError(msg) from e
+
+    async def _lock_watermark(self) -> int:
+        """Lock the watermark row (creating it at zero if missing)."""
+        await self.session.execute(
+            text(
+                """
+                INSERT INTO app.system_config (config_key, config_value, updated_at)
+                VALUES (:key, '{"tool_usage_log_id": 0}'::jsonb, NOW())
+                ON CONFLICT (config_key) DO NOTHING
+                """
+            ),
+            {"key": WATERMARK_KEY},
+        )
+        result = await self.session.execute(
+            text(
+                """
+                SELECT config_value
+                FROM app.system_config
+                WHERE config_key = :key
+                FOR UPDATE
+                """
+            ),
+            {"key": WATERMARK_KEY},
+        )
+        return int(result.scalar_one().get("tool_usage_log_id", 0))
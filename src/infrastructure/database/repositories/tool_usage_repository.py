@@ -13,11 +13,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.exceptions import RepositoryError
 from src.domain.ports import IToolUsageTracker
+from src.infrastructure.database.instrumentation import instrumented_repository
 from src.infrastructure.database.models import ToolUsageLog
 
 logger = structlog.get_logger(__name__)
 
 
+@instrumented_repository
 class PostgresToolUsageRepository(IToolUsageTracker):
     """PostgreSQL implementation of IToolUsageTracker.
 
@@ -41,6 +43,7 @@ class PostgresToolUsageRepository(IToolUsageTracker):
         query: str,
         tools_called: list[dict[str, Any]],
         facts_count: int,
+        user_id: str | None = None,
     ) -> None:
         """Log tool usage for a query.
 
@@ -49,9 +52,11 @@ class PostgresToolUsageRepository(IToolUsageTracker):
             query: User query text
             tools_called: List of {tool, arguments, iteration}
             facts_count: Number of facts retrieved
+            user_id: User the query came from (patterns are mined per user)
         """
         try:
             stmt = insert(ToolUsageLog).values(
+                user_id=user_id,
                 conversation_id=conversation_id,
                 query=query,
                 tools_called=tools_called,
@@ -63,6 +68,7 @@ class PostgresToolUsageRepository(IToolUsageTracker):
 
             logger.info(
                 "tool_usage_logged",
+                user_id=user_id,
                 conversation_id=conversation_id,
                 tools_count=len(tools_called),
                 facts_count=facts_count,
@@ -129,12 +135,13 @@ class PostgresToolUsageRepository(IToolUsageTracker):
         """Retrieve tool usage logs for pattern mining.
 
         Args:
-            user_id: User identifier (not used in Phase 1, but kept for future)
+            user_id: User identifier
             since: Get logs since this timestamp
             limit: Maximum number of logs to return
 
         Returns:
             List of usage log dictionaries with fields:
+            - id: int
             - conversation_id: str
             - query: str
             - tools_called: list[dict]
@@ -145,6 +152,7 @@ class PostgresToolUsageRepository(IToolUsageTracker):
             # Query logs since timestamp, ordered by most recent
             stmt = (
                 select(ToolUsageLog)
+                .where(ToolUsageLog.user_id == user_id)
                 .where(ToolUsageLog.timestamp >= since)
                 .order_by(ToolUsageLog.timestamp.desc())
                 .limit(limit)
@@ -157,6 +165,7 @@ class PostgresToolUsageRepository(IToolUsageTracker):
             logs = []
             for row in rows:
                 logs.append({
+                    "id": row.id,
                     "conversation_id": row.conversation_id,
                     "query": row.query,
                     "tools_called": row.tools_called,
@@ -13,6 +13,10 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from src.config.settings import Settings
+from src.infrastructure.database.instrumentation import (
+    InstrumentedAsyncQueuePool,
+    instrument_engine,
+)
 
 # Global engine and session factory (initialized on startup)
 engine: AsyncEngine | None = None
@@ -33,6 +37,12 @@ def init_db(settings: Settings) -> None:
         pool_size=settings.db_pool_size,
         max_overflow=settings.db_max_overflow,
         pool_pre_ping=True,
+        poolclass=InstrumentedAsyncQueuePool,
+    )
+    instrument_engine(
+        engine,
+        slow_query_threshold_seconds=settings.db_slow_query_threshold_ms / 1000,
+        pool_capacity=settings.db_pool_size + settings.db_max_overflow,
     )
 
     async_session_factory = async_sessionmaker(
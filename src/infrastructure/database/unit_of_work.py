@@ -0,0 +1,109 @@
+"""Request unit of work: one primary session plus per-branch sessions.
+
+An AsyncSession runs one operation at a time, so pipeline branches that
+overlap (e.g. semantic extraction and domain augmentation) need their own
+sessions, each with its own pooled connection.
+
+Branch sessions see only committed data, so a branch must not read rows the
+primary session wrote in this request. They are committed together at one
+commit point: every session is flushed first (surfacing constraint errors
+while nothing is committed yet), then branches commit, then the request
+session commits in get_db_session. A failure before the commit point rolls
+everything back; branch writes are limited to records that remain valid if
+the primary transaction later fails (e.g. tool usage logs).
+"""
+
+from types import TracebackType
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = structlog.get_logger(__name__)
+
+
+class UnitOfWork:
+    """Sessions of one request with a single commit point.
+
+    Usage:
+        async with UnitOfWork(db, session_factory) as uow:
+            augment_session = uow.branch()
+            ...  # run branches concurrently
+        # branches committed; db is committed by its own context manager
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession] | None,
+    ):
+        """Initialize unit of work.
+
+        Args:
+            session: Primary (request) session, committed by its owner
+            session_factory: Factory for branch sessions (None: branches share
+                the primary session and must not run concurrently)
+        """
+        self.session = session
+        self._session_factory = session_factory
+        self._branches: list[AsyncSession] = []
+
+    @property
+    def supports_parallel_branches(self) -> bool:
+        """Whether branch() returns independent sessions."""
+        return self._session_factory is not None
+
+    def branch(self) -> AsyncSession:
+        """Open a session for one concurrent branch.
+
+        No connection is checked out until the branch first uses it.
+
+        Returns:
+            New session, or the primary session without a factory
+        """
+        if self._session_factory is None:
+            return self.session
+        branch = self._session_factory()
+        self._branches.append(branch)
+        return branch
+
+    async def commit(self) -> None:
+        """Flush every session, then commit the branches.
+
+        The primary session is flushed but committed by its owner.
+        """
+        for session in (*self._branches, self.session):
+            await session.flush()
+        for branch in self._branches:
+            await branch.commit()
+
+    async def rollback(self) -> None:
+        """Roll back all branches (the primary is rolled back by its owner)."""
+        for branch in self._branches:
+            await branch.rollback()
+
+    async def close(self) -> None:
+        """Close branch sessions, returning their connections to the pool."""
+        for branch in self._branches:
+            await branch.close()
+        self._branches.clear()
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                logger.debug("unit_of_work_rollback", branches=len(self._branches))
+                await self.rollback()
+        except Exception:
+            await self.rollback()
+            raise
+        finally:
+            await self.close()
@@ -0,0 +1,53 @@
+"""Single-statement insert-or-get shared by the idempotent repositories."""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Row, Table, and_, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def insert_or_get(
+    session: AsyncSession,
+    table: Table,
+    values: dict[str, Any],
+    conflict_columns: Sequence[str],
+) -> tuple[Row[Any], bool]:
+    """Insert a row unless its unique key exists; return the stored row.
+
+    Runs ``WITH ins AS (INSERT ... ON CONFLICT DO NOTHING RETURNING *)
+    SELECT ins UNION ALL SELECT existing``, so both the new-row and the
+    duplicate path take one round trip, and concurrent duplicates are
+    resolved by the unique index instead of a racy pre-check.
+
+    A conflicting row committed by a concurrent transaction after this
+    statement's snapshot is invisible to the SELECT branch; that case falls
+    back to a second plain SELECT.
+
+    Args:
+        session: Database session
+        table: Target table (must have a unique index on conflict_columns)
+        values: Column values to insert
+        conflict_columns: Columns of the unique key
+
+    Returns:
+        Tuple of (stored row with all table columns, whether it was inserted)
+    """
+    key = and_(*(table.c[column] == values[column] for column in conflict_columns))
+
+    inserted = (
+        insert(table)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=list(conflict_columns))
+        .returning(*table.c, literal(True).label("inserted"))
+        .cte("ins")
+    )
+    existing = select(*table.c, literal(False).label("inserted")).where(key)
+    stmt = union_all(select(inserted), existing).limit(1)
+
+    row = (await session.execute(stmt)).first()
+    if row is None:
+        row = (await session.execute(existing)).one()
+
+    return row, bool(row.inserted)
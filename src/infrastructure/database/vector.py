@@ -0,0 +1,22 @@
+"""pgvector helpers shared by the memory repositories."""
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+
+def to_vector_literal(embedding: npt.NDArray[np.float64] | Sequence[float]) -> str:
+    """Render an embedding as a pgvector text literal ('[x,y,...]').
+
+    Used for batched ANN queries, where query vectors are bound as a single
+    ``text[]`` parameter and cast to ``vector`` server-side.
+
+    Args:
+        embedding: Embedding vector
+
+    Returns:
+        Text literal accepted by ``CAST(... AS vector)``
+    """
+    values = embedding.tolist() if isinstance(embedding, np.ndarray) else embedding
+    return "[" + ",".join(repr(float(v)) for v in values) + "]"
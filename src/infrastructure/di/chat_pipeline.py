@@ -0,0 +1,298 @@
+"""Precompiled chat pipeline graph.
+
+The chat use case graph has two kinds of nodes: process-wide services (LLM,
+embeddings, scorer, reply generator, ...) and objects bound to one database
+session (repositories and the services/use cases that hold them).
+
+Resolving the whole graph through dependency-injector providers on every
+request re-walks the provider tree and re-resolves every singleton. ChatPipeline
+resolves the process-wide services once, and per request only constructs the
+session-bound objects with plain constructor calls from a RequestScope.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.services.adaptive_query_orchestrator import (
+    AdaptiveQueryOrchestrator,
+)
+from src.application.services.post_reply_tasks import PostReplyTaskRunner
+from src.application.services.tool_prefetcher import ToolPrefetcher
+from src.application.use_cases import (
+    AugmentWithDomainUseCase,
+    ExtractSemanticsUseCase,
+    IngestChatEventsUseCase,
+    ProcessChatMessageUseCase,
+    ResolveEntitiesUseCase,
+    ScoreMemoriesUseCase,
+)
+from src.domain.ports import IEmbeddingService, ILLMService
+from src.domain.services import (
+    ConflictDetectionService,
+    ConflictResolutionService,
+    EntityResolutionService,
+    LLMReplyGenerator,
+    MemoryValidationService,
+    MultiSignalScorer,
+    PIIRedactionService,
+)
+from src.domain.services.llm_mention_extractor import LLMMentionExtractor
+from src.infrastructure.database.repositories import (
+    ChatEventRepository,
+    DomainDatabaseRepository,
+    EntityRepository,
+    PostgresJobQueueRepository,
+    PostgresToolUsageRepository,
+    ProceduralMemoryRepository,
+    SemanticMemoryRepository,
+)
+
+
+@dataclass(slots=True)
+class RequestScope:
+    """Per-request state: one session and the repositories bound to it."""
+
+    session: AsyncSession
+    entity_repo: EntityRepository
+    chat_repo: ChatEventRepository
+    semantic_memory_repo: SemanticMemoryRepository
+    domain_db_repo: DomainDatabaseRepository
+    tool_usage_repo: PostgresToolUsageRepository
+
+    @classmethod
+    def bind(cls, session: AsyncSession) -> "RequestScope":
+        """Create the repositories for a session.
+
+        Args:
+            session: Request database session
+
+        Returns:
+            Scope holding the session-bound repositories
+        """
+        return cls(
+            session=session,
+            entity_repo=EntityRepository(session),
+            chat_repo=ChatEventRepository(session),
+            semantic_memory_repo=SemanticMemoryRepository(session),
+            domain_db_repo=DomainDatabaseRepository(session),
+            tool_usage_repo=PostgresToolUsageRepository(session),
+        )
+
+
+class ChatPipeline:
+    """Builds ProcessChatMessageUseCase from pre-resolved process-wide services.
+
+    Created once per process (container singleton). build() only wires the
+    session-bound part of the graph.
+    """
+
+    def __init__(
+        self,
+        llm_service: ILLMService,
+        embedding_service: IEmbeddingService,
+        mention_extractor: LLMMentionExtractor,
+        memory_validation_service: MemoryValidationService,
+        conflict_detection_service: ConflictDetectionService,
+        multi_signal_scorer: MultiSignalScorer,
+        llm_reply_generator: LLMReplyGenerator,
+        pii_redaction_service: PIIRedactionService,
+        enable_background_jobs: bool = False,
+        background_job_max_attempts: int = 5,
+        enable_tool_prefetch: bool = False,
+    ):
+        """Initialize pipeline with process-wide services.
+
+        Args:
+            llm_service: LLM service (extraction, resolution, tool calling)
+            embedding_service: Embedding service
+            mention_extractor: Entity mention extractor
+            memory_validation_service: Memory confirmation/decay service
+            conflict_detection_service: Memory-vs-DB conflict detector
+            multi_signal_scorer: Retrieval scorer
+            llm_reply_generator: Reply generator
+            pii_redaction_service: PII redaction service
+            enable_background_jobs: Defer post-reply stages to the job queue
+            background_job_max_attempts: Attempts before a job is marked failed
+            enable_tool_prefetch: Run tool calls predicted from procedural
+                memory before the LLM tool-selection loop
+        """
+        self.llm_service = llm_service
+        self.embedding_service = embedding_service
+        self.mention_extractor = mention_extractor
+        self.memory_validation_service = memory_validation_service
+        self.conflict_detection_service = conflict_detection_service
+        self.multi_signal_scorer = multi_signal_scorer
+        self.llm_reply_generator = llm_reply_generator
+        self.pii_redaction_service = pii_redaction_service
+        self.enable_background_jobs = enable_background_jobs
+        self.background_job_max_attempts = background_job_max_attempts
+        self.enable_tool_prefetch = enable_tool_prefetch
+
+    def build(
+        self,
+        session: AsyncSession,
+        augment_session: AsyncSession | None = None,
+    ) -> ProcessChatMessageUseCase:
+        """Wire the chat use case for one request.
+
+        Args:
+            session: Request database session
+            augment_session: Branch session for domain augmentation (see
+                UnitOfWork); when given, augmentation overlaps semantic
+                extraction instead of queueing behind it on the request session
+
+        Returns:
+            Use case whose repositories share the session, except the
+            augmentation repositories when augment_session is given
+        """
+        scope = RequestScope.bind(session)
+
+        conflict_resolution_service = ConflictResolutionService(
+            semantic_memory_repository=scope.semantic_memory_repo,
+        )
+        # Augmentation only reads domain.* tables (never written by this
+        # pipeline) and procedural patterns, and logs tool usage, so it can
+        # run on a branch session
+        query_orchestrator = AdaptiveQueryOrchestrator(
+            llm_service=self.llm_service,
+            domain_db=(
+                DomainDatabaseRepository(augment_session)
+                if augment_session is not None
+                else scope.domain_db_repo
+            ),
+            usage_tracker=(
+                PostgresToolUsageRepository(augment_session)
+                if augment_session is not None
+                else scope.tool_usage_repo
+            ),
+            prefetcher=(
+                ToolPrefetcher(
+                    ProceduralMemoryRepository(augment_session or session)
+                )
+                if self.enable_tool_prefetch
+                else None
+            ),
+        )
+
+        return ProcessChatMessageUseCase(
+            chat_repository=scope.chat_repo,
+            resolve_entities_use_case=self._resolve_entities(scope),
+            extract_semantics_use_case=self._extract_semantics(
+                scope, conflict_resolution_service
+            ),
+            augment_with_domain_use_case=AugmentWithDomainUseCase(
+                query_orchestrator=query_orchestrator,
+            ),
+            score_memories_use_case=ScoreMemoriesUseCase(
+                multi_signal_scorer=self.multi_signal_scorer,
+                embedding_service=self.embedding_service,
+                semantic_memory_repository=scope.semantic_memory_repo,
+            ),
+            conflict_detection_service=self.conflict_detection_service,
+            conflict_resolution_service=conflict_resolution_service,
+            llm_reply_generator=self.llm_reply_generator,
+            pii_redaction_service=self.pii_redaction_service,
+            # Post-reply stages: enqueued in the request transaction when
+            # background jobs are enabled, otherwise executed inline
+            post_reply_tasks=self._post_reply_tasks(scope, conflict_resolution_service),
+            job_queue=self._job_queue(session),
+            parallel_augment=augment_session is not None,
+        )
+
+    def build_ingestion(self, session: AsyncSession) -> IngestChatEventsUseCase:
+        """Wire the bulk chat ingestion use case for one request.
+
+        Args:
+            session: Request database session
+
+        Returns:
+            Use case queuing extraction only when background jobs are enabled
+            (PII policy memories are created inline otherwise)
+        """
+        scope = RequestScope.bind(session)
+        return IngestChatEventsUseCase(
+            chat_repository=scope.chat_repo,
+            pii_redaction_service=self.pii_redaction_service,
+            job_queue=self._job_queue(session),
+            post_reply_tasks=self._post_reply_tasks(
+                scope,
+                ConflictResolutionService(semantic_memory_repository=scope.semantic_memory_repo),
+            ),
+        )
+
+    def build_post_reply_tasks(self, session: AsyncSession) -> PostReplyTaskRunner:
+        """Wire a post-reply task runner for a session (background worker).
+
+        The worker runner can also process extraction jobs for bulk-imported
+        chat events.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Task runner using session-bound repositories
+        """
+        scope = RequestScope.bind(session)
+        conflict_resolution_service = ConflictResolutionService(
+            semantic_memory_repository=scope.semantic_memory_repo,
+        )
+        return self._post_reply_tasks(
+            scope,
+            conflict_resolution_service,
+            resolve_entities_use_case=self._resolve_entities(scope),
+            extract_semantics_use_case=self._extract_semantics(
+                scope, conflict_resolution_service
+            ),
+        )
+
+    def _job_queue(self, session: AsyncSession) -> PostgresJobQueueRepository | None:
+        if not self.enable_background_jobs:
+            return None
+        return PostgresJobQueueRepository(
+            session, max_attempts=self.background_job_max_attempts
+        )
+
+    def _resolve_entities(self, scope: RequestScope) -> ResolveEntitiesUseCase:
+        return ResolveEntitiesUseCase(
+            entity_repository=scope.entity_repo,
+            chat_repository=scope.chat_repo,
+            entity_resolution_service=EntityResolutionService(
+                entity_repository=scope.entity_repo,
+                llm_service=self.llm_service,
+                domain_db_port=scope.domain_db_repo,
+            ),
+            mention_extractor=self.mention_extractor,
+        )
+
+    def _extract_semantics(
+        self,
+        scope: RequestScope,
+        conflict_resolution_service: ConflictResolutionService,
+    ) -> ExtractSemanticsUseCase:
+        return ExtractSemanticsUseCase(
+            llm_service=self.llm_service,
+            memory_validation_service=self.memory_validation_service,
+            conflict_detection_service=self.conflict_detection_service,
+            conflict_resolution_service=conflict_resolution_service,
+            semantic_memory_repository=scope.semantic_memory_repo,
+            embedding_service=self.embedding_service,
+            canonical_entity_repository=scope.entity_repo,  # Phase 3.3: system entity
+        )
+
+    def _post_reply_tasks(
+        self,
+        scope: RequestScope,
+        conflict_resolution_service: ConflictResolutionService,
+        resolve_entities_use_case: ResolveEntitiesUseCase | None = None,
+        extract_semantics_use_case: ExtractSemanticsUseCase | None = None,
+    ) -> PostReplyTaskRunner:
+        return PostReplyTaskRunner(
+            semantic_memory_repository=scope.semantic_memory_repo,
+            embedding_service=self.embedding_service,
+            conflict_resolution_service=conflict_resolution_service,
+            canonical_entity_repository=scope.entity_repo,
+            chat_repository=scope.chat_repo,
+            resolve_entities_use_case=resolve_entities_use_case,
+            extract_semantics_use_case=extract_semantics_use_case,
+        )
@@ -2,19 +2,12 @@
 
 Uses dependency-injector to wire all application components.
 """
+import httpx
 from dependency_injector import containers, providers
 
-from src.application.use_cases import (
-    AugmentWithDomainUseCase,
-    ExtractSemanticsUseCase,
-    ProcessChatMessageUseCase,
-    ResolveEntitiesUseCase,
-    ScoreMemoriesUseCase,
-)
 from src.config.settings import Settings
 from src.domain.services import (
     ConflictDetectionService,
-    ConflictResolutionService,
     EntityResolutionService,
     LLMReplyGenerator,
     MemoryValidationService,
@@ -22,54 +15,97 @@ from src.domain.services import (
     PIIRedactionService,
 )
 from src.domain.services.llm_mention_extractor import LLMMentionExtractor
-from src.application.services.adaptive_query_orchestrator import (
-    AdaptiveQueryOrchestrator,
-)
 from src.infrastructure.database.repositories import (
-    ChatEventRepository,
     DomainDatabaseRepository,
     EntityRepository,
-    PostgresToolUsageRepository,
-    SemanticMemoryRepository,
 )
-from src.infrastructure.database.session import async_session_factory
+from src.infrastructure.cache import SemanticQueryCache, register_orm_invalidation
+from src.infrastructure.database.session import get_db_session
+from src.infrastructure.di.chat_pipeline import ChatPipeline
 from src.infrastructure.embedding import OpenAIEmbeddingService
+from src.infrastructure.http import create_shared_http_client
 from src.infrastructure.llm import (
     AnthropicLLMService,
     AnthropicProvider,
+    ExtractionCachingLLMService,
     OpenAILLMService,
     OpenAIProvider,
 )
 
 
-def create_llm_service(settings: Settings) -> OpenAILLMService | AnthropicLLMService:
+def create_llm_service(
+    settings: Settings,
+    http_client: httpx.AsyncClient | None = None,
+) -> OpenAILLMService | AnthropicLLMService | ExtractionCachingLLMService:
     """Factory function to create LLM service based on configuration.
 
     Args:
         settings: Application settings
+        http_client: Shared pooled HTTP client
 
     Returns:
-        Configured LLM service (OpenAI or Anthropic)
+        Configured LLM service (OpenAI or Anthropic), wrapped in the persistent
+        extraction cache when enabled
     """
+    service: OpenAILLMService | AnthropicLLMService
     if settings.llm_provider == "anthropic":
-        return AnthropicLLMService(api_key=settings.anthropic_api_key)
+        service = AnthropicLLMService(
+            api_key=settings.anthropic_api_key,
+            result_cache_ttl_seconds=settings.llm_result_cache_ttl_seconds,
+            http_client=http_client,
+        )
     else:
-        return OpenAILLMService(api_key=settings.openai_api_key)
+        service = OpenAILLMService(
+            api_key=settings.openai_api_key,
+            result_cache_ttl_seconds=settings.llm_result_cache_ttl_seconds,
+            http_client=http_client,
+        )
+
+    if settings.enable_extraction_cache:
+        return ExtractionCachingLLMService(service, session_scope=get_db_session)
+    return service
 
 
-def create_llm_provider(settings: Settings) -> OpenAIProvider | AnthropicProvider:
+def create_llm_provider(
+    settings: Settings,
+    http_client: httpx.AsyncClient | None = None,
+) -> OpenAIProvider | AnthropicProvider:
     """Factory function to create LLM provider for reply generation.
 
     Args:
         settings: Application settings
+        http_client: Shared pooled HTTP client
 
     Returns:
         Configured LLM provider (OpenAI or Anthropic)
     """
     if settings.llm_provider == "anthropic":
-        return AnthropicProvider(api_key=settings.anthropic_api_key)
+        return AnthropicProvider(api_key=settings.anthropic_api_key, http_client=http_client)
     else:
-        return OpenAIProvider(api_key=settings.openai_api_key)
+        return OpenAIProvider(api_key=settings.openai_api_key, http_client=http_client)
+
+
+def create_retrieval_cache(settings: Settings) -> SemanticQueryCache | None:
+    """Factory function for the semantic retrieval query cache.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Process-wide cache invalidated by semantic memory commits, or None
+        when the cache is disabled
+    """
+    if not settings.enable_retrieval_cache:
+        return None
+
+    cache = SemanticQueryCache(
+        similarity_threshold=settings.retrieval_cache_similarity_threshold,
+        max_staleness_seconds=settings.retrieval_cache_max_staleness_seconds,
+        max_entries_per_user=settings.retrieval_cache_max_entries_per_user,
+        max_users=settings.retrieval_cache_max_users,
+    )
+    register_orm_invalidation(cache)
+    return cache
 
 
 def get_llm_model(settings: Settings) -> str:
@@ -103,30 +139,32 @@ class Container(containers.DeclarativeContainer):
     # Settings (loaded from environment)
     settings = providers.Singleton(Settings)
 
+    # Infrastructure - Shared HTTP transport (one connection pool for all SDK clients)
+    http_client = providers.Singleton(
+        create_shared_http_client,
+        settings=settings,
+    )
+
     # Infrastructure - LLM and Embedding Services
     # Conditionally use OpenAI or Anthropic based on configuration
     llm_service = providers.Singleton(
         create_llm_service,
         settings=settings,
+        http_client=http_client,
     )
 
     # LLM Provider for reply generation (conditionally uses OpenAI or Anthropic)
     llm_provider = providers.Singleton(
         create_llm_provider,
         settings=settings,
+        http_client=http_client,
     )
 
     embedding_service = providers.Singleton(
         OpenAIEmbeddingService,
         api_key=settings.provided.openai_api_key,
         dimensions=settings.provided.openai_embedding_dimensions,
-    )
-
-    # Infrastructure - Database Session
-    # Note: Session is created per-request in FastAPI dependency
-    # This is just the factory
-    db_session_factory = providers.Singleton(
-        lambda: async_session_factory
+        http_client=http_client,
     )
 
     # Infrastructure - Repositories
@@ -135,18 +173,6 @@ class Container(containers.DeclarativeContainer):
         EntityRepository,
     )
 
-    chat_repository_factory = providers.Factory(
-        ChatEventRepository,
-    )
-
-    semantic_memory_repository_factory = providers.Factory(
-        SemanticMemoryRepository,
-    )
-
-    tool_usage_repository_factory = providers.Factory(
-        PostgresToolUsageRepository,
-    )
-
     domain_database_repository_factory = providers.Factory(
         DomainDatabaseRepository,
     )
@@ -174,19 +200,6 @@ class Container(containers.DeclarativeContainer):
         ConflictDetectionService,
     )
 
-    # Phase 2.1 Services
-    conflict_resolution_service_factory = providers.Factory(
-        ConflictResolutionService,
-        # semantic_memory_repository provided per-request
-    )
-
-    # Phase 1C Services - LLM Tool Calling
-    adaptive_query_orchestrator_factory = providers.Factory(
-        AdaptiveQueryOrchestrator,
-        llm_service=llm_service,
-        # domain_db and usage_tracker provided per-request
-    )
-
     # LLM Reply Generator (uses configurable provider and model)
     llm_reply_generator = providers.Singleton(
         LLMReplyGenerator,
@@ -203,58 +216,35 @@ class Container(containers.DeclarativeContainer):
         validation_service=memory_validation_service,
     )
 
+    # Semantic query-result cache in front of MemoryRetriever (None when disabled).
+    # Serves the /api/v1/retrieve endpoints only: chat turns score through
+    # ScoreMemoriesUseCase, which is not cached.
+    retrieval_cache = providers.Singleton(
+        create_retrieval_cache,
+        settings=settings,
+    )
+
     # Phase 3.1 Services - PII Detection and Redaction
     pii_redaction_service = providers.Singleton(
         PIIRedactionService,
     )
 
-    # Use Cases
-    # Phase 1A: Entity Resolution
-    resolve_entities_use_case_factory = providers.Factory(
-        ResolveEntitiesUseCase,
-        # Repositories provided per-request
-        entity_resolution_service=entity_resolution_service_factory,
-        mention_extractor=mention_extractor,
-    )
-
-    # Phase 1B: Semantic Extraction (entity-tagged natural language with importance)
-    extract_semantics_use_case_factory = providers.Factory(
-        ExtractSemanticsUseCase,
+    # Precompiled chat pipeline: process-wide services resolved once,
+    # per-request wiring is plain constructor calls (see chat_pipeline.py)
+    chat_pipeline = providers.Singleton(
+        ChatPipeline,
         llm_service=llm_service,
+        embedding_service=embedding_service,
+        mention_extractor=mention_extractor,
         memory_validation_service=memory_validation_service,
         conflict_detection_service=conflict_detection_service,
-        conflict_resolution_service=conflict_resolution_service_factory,
-        embedding_service=embedding_service,
-        # semantic_memory_repository and canonical_entity_repository provided per-request
-    )
-
-    # Phase 1C: Domain Augmentation - LLM Tool Calling
-    augment_with_domain_use_case_factory = providers.Factory(
-        AugmentWithDomainUseCase,
-        query_orchestrator=adaptive_query_orchestrator_factory,
-    )
-
-    # Phase 1D: Memory Scoring
-    score_memories_use_case_factory = providers.Factory(
-        ScoreMemoriesUseCase,
         multi_signal_scorer=multi_signal_scorer,
-        embedding_service=embedding_service,
-        # Repository provided per-request
-    )
-
-    # Orchestrator: Coordinates all phases
-    process_chat_message_use_case_factory = providers.Factory(
-        ProcessChatMessageUseCase,
-        # Repositories provided per-request
-        # Use cases are factories
-        resolve_entities_use_case=resolve_entities_use_case_factory,
-        extract_semantics_use_case=extract_semantics_use_case_factory,
-        augment_with_domain_use_case=augment_with_domain_use_case_factory,
-        score_memories_use_case=score_memories_use_case_factory,
-        conflict_detection_service=conflict_detection_service,
-        conflict_resolution_service=conflict_resolution_service_factory,
         llm_reply_generator=llm_reply_generator,
         pii_redaction_service=pii_redaction_service,
+        enable_background_jobs=settings.provided.enable_background_jobs,
+        background_job_max_attempts=settings.provided.background_job_max_attempts,
+        # Procedural patterns only exist when procedural memory is enabled
+        enable_tool_prefetch=settings.provided.enable_procedural_memory,
     )
 
 
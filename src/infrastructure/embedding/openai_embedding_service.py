@@ -3,11 +3,13 @@
 Implements IEmbeddingService using OpenAI's embedding API.
 """
 
+import httpx
 import structlog
 from openai import AsyncOpenAI
 
 from src.domain.exceptions import EmbeddingError
 from src.domain.ports import IEmbeddingService
+from src.domain.services.span_tracer import SpanKind, span
 
 logger = structlog.get_logger(__name__)
 
@@ -25,14 +27,25 @@ class OpenAIEmbeddingService(IEmbeddingService):
     MODEL = "text-embedding-3-small"
     MAX_BATCH_SIZE = 100  # OpenAI limit
 
-    def __init__(self, api_key: str, dimensions: int = 1536):
+    def __init__(
+        self,
+        api_key: str,
+        dimensions: int = 1536,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize OpenAI embedding service.
 
         Args:
             api_key: OpenAI API key
             dimensions: Embedding vector dimensions (default: 1536)
+            http_client: Shared pooled HTTP client (see src.infrastructure.http);
+                the SDK's own retries are disabled when provided
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        if http_client is not None:
+            # The shared transport retries with jittered backoff; avoid double retries
+            self.client = AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+        else:
+            self.client = AsyncOpenAI(api_key=api_key)
         self.dimensions = dimensions
         self._total_tokens_used = 0
 
@@ -59,11 +72,18 @@ class OpenAIEmbeddingService(IEmbeddingService):
                 model=self.MODEL,
             )
 
-            response = await self.client.embeddings.create(
+            with span(
+                "embedding.generate_embedding",
+                SpanKind.EMBEDDING,
+                provider="openai",
                 model=self.MODEL,
-                input=text,
-                dimensions=self.dimensions,
-            )
+                operation="generate_embedding",
+            ):
+                response = await self.client.embeddings.create(
+                    model=self.MODEL,
+                    input=text,
+                    dimensions=self.dimensions,
+                )
 
             if not response.data:
                 msg = "No embedding data in response"
@@ -134,11 +154,18 @@ class OpenAIEmbeddingService(IEmbeddingService):
                 model=self.MODEL,
             )
 
-            response = await self.client.embeddings.create(
+            with span(
+                "embedding.generate_embeddings_batch",
+                SpanKind.EMBEDDING,
+                provider="openai",
                 model=self.MODEL,
-                input=valid_texts,
-                dimensions=self.dimensions,
-            )
+                operation="generate_embeddings_batch",
+            ):
+                response = await self.client.embeddings.create(
+                    model=self.MODEL,
+                    input=valid_texts,
+                    dimensions=self.dimensions,
+                )
 
             if not response.data or len(response.data) != len(valid_texts):
                 msg = f"Expected {len(valid_texts)} embeddings, got {len(response.data)}"
@@ -0,0 +1,13 @@
+"""Shared HTTP transport.
+
+Process-wide pooled httpx client used by the LLM and embedding SDK clients.
+"""
+from src.infrastructure.http.transport import (
+    PooledRetryTransport,
+    create_shared_http_client,
+)
+
+__all__ = [
+    "PooledRetryTransport",
+    "create_shared_http_client",
+]
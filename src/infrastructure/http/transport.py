@@ -0,0 +1,245 @@
+"""Shared HTTP transport for upstream LLM and embedding APIs.
+
+All SDK clients (OpenAI, Anthropic) share one httpx.AsyncClient so that TCP
+and TLS connections are pooled and kept alive across adapters instead of each
+client paying its own handshakes. The transport adds per-host concurrency
+limits and retries with full-jitter exponential backoff, and exports per-host
+slot wait and saturation metrics. Waiting for a slot is bounded by the
+request's pool timeout, so a saturated host fails fast with PoolTimeout.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator
+
+import httpx
+import structlog
+
+from src.api.metrics import (
+    upstream_http_host_slot_wait_seconds,
+    upstream_http_in_flight,
+    upstream_http_pool_saturation,
+    upstream_http_requests_total,
+    upstream_http_retries_total,
+)
+from src.config.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+# Responses worth retrying: rate limiting, transient gateway errors and
+# Anthropic's 529 "overloaded"
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+
+# Failures where the request never reached the server, so retrying is safe
+# even for non-idempotent POSTs
+RETRYABLE_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+class _SlotReleasingStream(httpx.AsyncByteStream):
+    """Response stream that frees the host concurrency slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: "_HostSlot"):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _HostSlot:
+    """One acquired per-host concurrency slot (idempotent release)."""
+
+    def __init__(self, limiter: "_HostLimiter"):
+        self._limiter = limiter
+        self._released = False
+
+    def __call__(self) -> None:
+        if not self._released:
+            self._released = True
+            self._limiter.release()
+
+
+class _HostLimiter:
+    """Semaphore plus in-flight accounting for one upstream host."""
+
+    def __init__(self, host: str, limit: int):
+        self.host = host
+        self.limit = limit
+        self.in_flight = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self, timeout: float | None) -> _HostSlot:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout)
+        finally:
+            upstream_http_host_slot_wait_seconds.labels(host=self.host).observe(
+                time.perf_counter() - start
+            )
+        self.in_flight += 1
+        self._export()
+        return _HostSlot(self)
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+        self._export()
+
+    def _export(self) -> None:
+        upstream_http_in_flight.labels(host=self.host).set(self.in_flight)
+        upstream_http_pool_saturation.labels(host=self.host).set(
+            self.in_flight / self.limit
+        )
+
+
+class PooledRetryTransport(httpx.AsyncBaseTransport):
+    """httpx transport with per-host concurrency limits and jittered retries.
+
+    Wraps a pooled AsyncHTTPTransport. Each attempt holds a per-host slot from
+    send until the response body is closed, so the saturation gauge reflects
+    real upstream concurrency. Waiting for a slot is bounded by the request's
+    pool timeout (httpx.PoolTimeout, not retried). Retries use full-jitter
+    exponential backoff and honour Retry-After (capped).
+
+    Args:
+        transport: Underlying pooled transport
+        max_retries: Retries after the first attempt
+        backoff_base_seconds: Base delay; attempt n sleeps U(0, base * 2**n)
+        per_host_concurrency: In-flight requests allowed per host
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_retries: int = 2,
+        backoff_base_seconds: float = 0.5,
+        per_host_concurrency: int = 32,
+    ):
+        self._transport = transport
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.per_host_concurrency = per_host_concurrency
+        self._limiters: dict[str, _HostLimiter] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = self._limiters[host] = _HostLimiter(host, self.per_host_concurrency)
+
+        slot_timeout = request.extensions.get("timeout", {}).get("pool")
+
+        attempt = 0
+        while True:
+            try:
+                release = await limiter.acquire(slot_timeout)
+            except TimeoutError as e:
+                upstream_http_requests_total.labels(host=host, outcome="error").inc()
+                msg = f"Timed out waiting for a concurrency slot for {host}"
+                raise httpx.PoolTimeout(msg, request=request) from e
+            try:
+                response = await self._transport.handle_async_request(request)
+            except RETRYABLE_EXCEPTIONS as e:
+                release()
+                if attempt >= self.max_retries:
+                    upstream_http_requests_total.labels(host=host, outcome="error").inc()
+                    raise
+                reason = type(e).__name__
+                delay = self._backoff(attempt)
+            except BaseException:
+                release()
+                upstream_http_requests_total.labels(host=host, outcome="error").inc()
+                raise
+            else:
+                if response.status_code in RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                    await response.aclose()
+                    release()
+                    reason = str(response.status_code)
+                    delay = self._retry_after(response) or self._backoff(attempt)
+                else:
+                    upstream_http_requests_total.labels(
+                        host=host, outcome=f"{response.status_code // 100}xx"
+                    ).inc()
+                    if response.is_closed:
+                        # Body already buffered by the inner transport
+                        release()
+                    else:
+                        response.stream = _SlotReleasingStream(response.stream, release)  # type: ignore[arg-type]
+                    return response
+
+            attempt += 1
+            upstream_http_retries_total.labels(host=host, reason=reason).inc()
+            logger.debug(
+                "upstream_http_retry",
+                host=host,
+                attempt=attempt,
+                reason=reason,
+                delay_seconds=round(delay, 3),
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, self.backoff_base_seconds * (2**attempt))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float | None:
+        value = response.headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return min(max(float(value), 0.0), MAX_RETRY_AFTER_SECONDS)
+        except ValueError:
+            return None
+
+
+def create_shared_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Build the process-wide client injected into every SDK adapter.
+
+    SDK-level retries should be disabled for clients using this transport
+    (max_retries=0) so failed requests are not retried twice.
+
+    Args:
+        settings: Application settings (http_* fields)
+
+    Returns:
+        Pooled, keep-alive AsyncClient
+    """
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    timeout = httpx.Timeout(
+        connect=settings.http_connect_timeout_seconds,
+        read=settings.http_read_timeout_seconds,
+        write=settings.http_read_timeout_seconds,
+        pool=settings.http_pool_timeout_seconds,
+    )
+    transport = PooledRetryTransport(
+        httpx.AsyncHTTPTransport(limits=limits, http2=settings.http2_enabled),
+        max_retries=settings.http_max_retries,
+        backoff_base_seconds=settings.http_retry_backoff_seconds,
+        per_host_concurrency=settings.http_per_host_concurrency,
+    )
+
+    logger.info(
+        "shared_http_client_created",
+        max_connections=settings.http_max_connections,
+        max_keepalive=settings.http_max_keepalive_connections,
+        per_host_concurrency=settings.http_per_host_concurrency,
+        http2=settings.http2_enabled,
+    )
+    return httpx.AsyncClient(transport=transport, timeout=timeout, limits=limits)
@@ -0,0 +1,15 @@
+"""Background job execution.
+
+In-process worker pool draining the Postgres-backed job queue, the
+scheduler consolidating memory scopes whose counters crossed a threshold,
+and the miner folding new tool usage into procedural patterns.
+"""
+from src.infrastructure.jobs.consolidation_scheduler import ConsolidationScheduler
+from src.infrastructure.jobs.procedural_miner import ProceduralMiningScheduler
+from src.infrastructure.jobs.worker import BackgroundJobWorker
+
+__all__ = [
+    "BackgroundJobWorker",
+    "ConsolidationScheduler",
+    "ProceduralMiningScheduler",
+]
@@ -0,0 +1,165 @@
+"""In-process consolidation scheduler.
+
+Each pass tallies new activity into the consolidation counters, then
+consolidates the scopes (across all users) whose counters crossed a
+threshold, a bounded number at a time. Each scope is consolidated in its own
+transaction together with the counter decrement, so a failed consolidation
+stays pending for the next pass. The transaction first claims the scope's
+counter row (skipping rows claimed elsewhere), so schedulers running in
+several processes never consolidate the same scope twice.
+"""
+
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import heuristics
+from src.domain.ports import PendingConsolidation
+from src.domain.services import ConsolidationService
+from src.infrastructure.database.repositories.consolidation_counter_repository import (
+    PostgresConsolidationCounterRepository,
+)
+
+logger = structlog.get_logger(__name__)
+
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+ServiceFactory = Callable[[AsyncSession], ConsolidationService]
+
+
+class ConsolidationScheduler:
+    """Periodic loop consolidating pending scopes with a concurrency limit.
+
+    Args:
+        session_scope: Context manager factory yielding a committed-on-exit session
+        service_factory: Builds a ConsolidationService bound to a session
+        concurrency: Scopes consolidated concurrently
+        batch_size: Pending scopes picked up per pass
+        interval_seconds: Sleep between passes
+    """
+
+    def __init__(
+        self,
+        session_scope: SessionScope,
+        service_factory: ServiceFactory,
+        concurrency: int = 4,
+        batch_size: int = 50,
+        interval_seconds: float = 300.0,
+    ):
+        self._session_scope = session_scope
+        self._service_factory = service_factory
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Start the scheduler loop (idempotent)."""
+        if self._task is not None:
+            return
+
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._loop(), name="consolidation-scheduler")
+        logger.info(
+            "consolidation_scheduler_started",
+            concurrency=self.concurrency,
+            interval_seconds=self.interval_seconds,
+        )
+
+    async def stop(self, timeout_seconds: float = 30.0) -> None:
+        """Stop the loop, letting in-flight consolidations finish within the timeout."""
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        _, pending = await asyncio.wait([self._task], timeout=timeout_seconds)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._task = None
+        logger.info("consolidation_scheduler_stopped", cancelled=len(pending))
+
+    async def run_once(self) -> int:
+        """Tally counters and consolidate one batch of pending scopes.
+
+        Returns:
+            Number of scopes consolidated
+        """
+        async with self._session_scope() as session:
+            counters = PostgresConsolidationCounterRepository(session)
+            await counters.tally(heuristics.CONSOLIDATION_SESSION_WINDOW_DEFAULT)
+
+        async with self._session_scope() as session:
+            pending = await PostgresConsolidationCounterRepository(session).find_pending(
+                min_episodic=heuristics.CONSOLIDATION_MIN_EPISODIC,
+                min_sessions=heuristics.CONSOLIDATION_MIN_SESSIONS,
+                limit=self.batch_size,
+            )
+
+        if not pending:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(item: PendingConsolidation) -> bool:
+            async with semaphore:
+                return await self._consolidate(item)
+
+        results = await asyncio.gather(*(bounded(item) for item in pending))
+        consolidated = sum(results)
+
+        logger.info(
+            "scheduled_consolidations_completed",
+            pending=len(pending),
+            consolidated=consolidated,
+        )
+
+        return consolidated
+
+    async def _loop(self) -> None:
+        """Run passes until stopped."""
+        while not self._stopping.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error("consolidation_scheduler_pass_error", error=str(e))
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval_seconds)
+            except TimeoutError:
+                pass
+
+    async def _consolidate(self, item: PendingConsolidation) -> bool:
+        """Claim, consolidate and consume one scope in the same transaction."""
+        try:
+            async with self._session_scope() as session:
+                counters = PostgresConsolidationCounterRepository(session)
+                claimed = await counters.claim(
+                    item,
+                    min_episodic=heuristics.CONSOLIDATION_MIN_EPISODIC,
+                    min_sessions=heuristics.CONSOLIDATION_MIN_SESSIONS,
+                )
+                if claimed is None:
+                    # Being consolidated by another scheduler, or already done
+                    logger.debug(
+                        "scheduled_consolidation_skipped",
+                        user_id=item.user_id,
+                        scope=item.scope.to_dict(),
+                    )
+                    return False
+
+                await self._service_factory(session).consolidate(item.user_id, item.scope)
+                await counters.mark_consolidated(claimed)
+            return True
+
+        except Exception as e:
+            logger.error(
+                "scheduled_consolidation_failed",
+                user_id=item.user_id,
+                scope=item.scope.to_dict(),
+                error=str(e),
+            )
+            return False
@@ -0,0 +1,94 @@
+"""In-process procedural pattern miner.
+
+Each pass folds the tool usage logged since the previous pass (by any user)
+into the persisted sequence counts and upserts the affected patterns, in one
+transaction holding the watermark lock. Requests only read the mined
+patterns, so no request waits on the miner or mines other users' usage.
+"""
+
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import heuristics
+from src.domain.services import ProceduralMemoryService
+
+logger = structlog.get_logger(__name__)
+
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+ServiceFactory = Callable[[AsyncSession], ProceduralMemoryService]
+
+
+class ProceduralMiningScheduler:
+    """Periodic loop mining new tool usage into procedural patterns.
+
+    Args:
+        session_scope: Context manager factory yielding a committed-on-exit session
+        service_factory: Builds a ProceduralMemoryService bound to a session
+        interval_seconds: Sleep between passes
+        min_support: Minimum anchored sequences for a pattern
+    """
+
+    def __init__(
+        self,
+        session_scope: SessionScope,
+        service_factory: ServiceFactory,
+        interval_seconds: float = 60.0,
+        min_support: int = heuristics.PROCEDURAL_MIN_SUPPORT,
+    ):
+        self._session_scope = session_scope
+        self._service_factory = service_factory
+        self.interval_seconds = interval_seconds
+        self.min_support = min_support
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Start the miner loop (idempotent)."""
+        if self._task is not None:
+            return
+
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._loop(), name="procedural-miner")
+        logger.info("procedural_miner_started", interval_seconds=self.interval_seconds)
+
+    async def stop(self, timeout_seconds: float = 30.0) -> None:
+        """Stop the loop, letting an in-flight pass finish within the timeout."""
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        _, pending = await asyncio.wait([self._task], timeout=timeout_seconds)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._task = None
+        logger.info("procedural_miner_stopped", cancelled=len(pending))
+
+    async def run_once(self) -> int:
+        """Mine the usage logged since the previous pass.
+
+        Returns:
+            Number of patterns created or updated
+        """
+        async with self._session_scope() as session:
+            mined = await self._service_factory(session).mine_tool_usage(
+                min_support=self.min_support
+            )
+        return len(mined)
+
+    async def _loop(self) -> None:
+        """Run passes until stopped."""
+        while not self._stopping.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error("procedural_miner_pass_error", error=str(e))
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval_seconds)
+            except TimeoutError:
+                pass
@@ -0,0 +1,190 @@
+"""In-process background job worker pool.
+
+Drains app.background_jobs with N concurrent loops. Each job runs in its own
+transaction together with its "succeeded" marker, so a crash mid-job leaves
+the job claimable again (at-least-once execution, idempotent tasks). Jobs
+left "running" (crashed handler, failed failure marker) are swept back to
+pending at startup and periodically from the first worker loop; claimed jobs
+that are queued or running keep their lock fresh with a heartbeat, so the
+sweep never takes a job from a live worker.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.services.post_reply_tasks import PostReplyTaskRunner
+from src.domain.ports import BackgroundJob
+from src.infrastructure.database.repositories.job_queue_repository import (
+    PostgresJobQueueRepository,
+)
+
+logger = structlog.get_logger(__name__)
+
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+RunnerFactory = Callable[[AsyncSession], PostReplyTaskRunner]
+
+
+class BackgroundJobWorker:
+    """Pool of asyncio workers executing queued post-reply tasks.
+
+    Args:
+        session_scope: Context manager factory yielding a committed-on-exit session
+        runner_factory: Builds a PostReplyTaskRunner bound to a session
+        concurrency: Number of concurrent worker loops
+        batch_size: Jobs claimed per poll
+        poll_interval_seconds: Sleep between polls when the queue is empty
+        stale_after_seconds: Running jobs older than this are requeued
+        stale_sweep_interval_seconds: Time between stale-job sweeps
+        heartbeat_interval_seconds: Time between lock refreshes of claimed
+            jobs (default: a third of stale_after_seconds)
+    """
+
+    def __init__(
+        self,
+        session_scope: SessionScope,
+        runner_factory: RunnerFactory,
+        concurrency: int = 4,
+        batch_size: int = 10,
+        poll_interval_seconds: float = 1.0,
+        stale_after_seconds: int = 300,
+        stale_sweep_interval_seconds: float = 60.0,
+        heartbeat_interval_seconds: float | None = None,
+    ):
+        self._session_scope = session_scope
+        self._runner_factory = runner_factory
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self.stale_sweep_interval_seconds = stale_sweep_interval_seconds
+        self.heartbeat_interval_seconds = heartbeat_interval_seconds or stale_after_seconds / 3
+        self._next_sweep_at = 0.0
+        self._tasks: list[asyncio.Task[None]] = []
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        """Start worker loops (idempotent)."""
+        if self._tasks:
+            return
+
+        self._stopping.clear()
+        await self._requeue_stale()
+        self._tasks = [
+            asyncio.create_task(self._loop(worker_index), name=f"background-job-worker-{worker_index}")
+            for worker_index in range(self.concurrency)
+        ]
+        logger.info("background_job_workers_started", concurrency=self.concurrency)
+
+    async def stop(self, timeout_seconds: float = 10.0) -> None:
+        """Stop worker loops, letting in-flight jobs finish within the timeout."""
+        if not self._tasks:
+            return
+
+        self._stopping.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout_seconds)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        logger.info("background_job_workers_stopped", cancelled=len(pending))
+
+    async def run_once(self) -> int:
+        """Claim and execute a single batch.
+
+        Returns:
+            Number of jobs processed
+        """
+        async with self._session_scope() as session:
+            jobs = await PostgresJobQueueRepository(session).claim_batch(self.batch_size)
+
+        held = {job.job_id for job in jobs}
+        heartbeat = asyncio.create_task(self._heartbeat(held)) if jobs else None
+        try:
+            for job in jobs:
+                await self._execute(job)
+                held.discard(job.job_id)
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+
+        return len(jobs)
+
+    async def _heartbeat(self, held: set[int]) -> None:
+        """Refresh the locks of the batch's unfinished jobs until cancelled."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval_seconds)
+            try:
+                async with self._session_scope() as session:
+                    await PostgresJobQueueRepository(session).heartbeat(sorted(held))
+            except Exception as e:
+                logger.error("background_job_heartbeat_failed", error=str(e))
+
+    async def _loop(self, worker_index: int) -> None:
+        """Poll the queue until stopped."""
+        while not self._stopping.is_set():
+            if worker_index == 0 and time.monotonic() >= self._next_sweep_at:
+                await self._requeue_stale()
+
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(
+                    "background_job_poll_error",
+                    worker=worker_index,
+                    error=str(e),
+                )
+                processed = 0
+
+            if processed == 0:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.poll_interval_seconds
+                    )
+                except TimeoutError:
+                    pass
+
+    async def _execute(self, job: BackgroundJob) -> None:
+        """Run one job in its own transaction; record failure separately on error."""
+        try:
+            async with self._session_scope() as session:
+                runner = self._runner_factory(session)
+                await runner.run(job.job_type, job.payload)
+                await PostgresJobQueueRepository(session).mark_succeeded(job.job_id)
+
+            logger.debug(
+                "background_job_succeeded",
+                job_id=job.job_id,
+                job_type=job.job_type.value,
+            )
+
+        except Exception as e:
+            try:
+                async with self._session_scope() as session:
+                    await PostgresJobQueueRepository(session).mark_failed(
+                        job, f"{type(e).__name__}: {e}"
+                    )
+            except Exception as mark_error:
+                # Job stays "running" and is picked up by the stale-lock sweep
+                logger.error(
+                    "background_job_mark_failed_error",
+                    job_id=job.job_id,
+                    error=str(mark_error),
+                )
+
+    async def _requeue_stale(self) -> None:
+        """Recover jobs left running by a crashed process or handler."""
+        self._next_sweep_at = time.monotonic() + self.stale_sweep_interval_seconds
+        try:
+            async with self._session_scope() as session:
+                await PostgresJobQueueRepository(session).requeue_stale(
+                    self.stale_after_seconds
+                )
+        except Exception as e:
+            logger.error("requeue_stale_jobs_failed", error=str(e))
+
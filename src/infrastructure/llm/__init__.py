@@ -4,12 +4,16 @@ OpenAI and Anthropic implementations of LLM services.
 """
 from src.infrastructure.llm.anthropic_llm_service import AnthropicLLMService
 from src.infrastructure.llm.anthropic_provider import AnthropicProvider
+from src.infrastructure.llm.cached_extraction_service import (
+    ExtractionCachingLLMService,
+)
 from src.infrastructure.llm.openai_llm_service import OpenAILLMService
 from src.infrastructure.llm.openai_provider import OpenAIProvider
 
 __all__ = [
     "AnthropicLLMService",
     "AnthropicProvider",
+    "ExtractionCachingLLMService",
     "OpenAILLMService",
     "OpenAIProvider",
 ]
@@ -7,6 +7,7 @@ and semantic triple extraction.
 import json
 from typing import Any
 
+import httpx
 import structlog
 from anthropic import AsyncAnthropic
 
@@ -14,12 +15,14 @@ from src.config import heuristics
 from src.domain.exceptions import LLMServiceError
 from src.domain.ports import ILLMService
 from src.domain.ports.llm_service import LLMToolResponse, ToolCall
+from src.domain.services.span_tracer import SpanKind, span
 from src.domain.value_objects import (
     ConversationContext,
     EntityMention,
     ResolutionMethod,
     ResolutionResult,
 )
+from src.infrastructure.llm.single_flight import SingleFlight
 
 logger = structlog.get_logger(__name__)
 
@@ -40,16 +43,67 @@ class AnthropicLLMService(ILLMService):
     TEMPERATURE = 0.0  # Deterministic output for coreference
     TEMPERATURE_EXTRACTION = 0.1  # Slightly higher for extraction
 
-    def __init__(self, api_key: str):
+    # Prompt versions for the persistent extraction cache.
+    # Bump the matching entry whenever a prompt or its output parsing changes.
+    PROMPT_VERSIONS = {"mentions": "1", "facts": "1", "coreference": "1"}
+
+    def __init__(
+        self,
+        api_key: str,
+        result_cache_ttl_seconds: float = 0.0,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize Anthropic LLM service.
 
         Args:
             api_key: Anthropic API key
+            result_cache_ttl_seconds: TTL for caching temperature-0 results
+                (0 disables; identical in-flight calls are always collapsed)
+            http_client: Shared pooled HTTP client (see src.infrastructure.http);
+                the SDK's own retries are disabled when provided
         """
-        self.client = AsyncAnthropic(api_key=api_key)
+        if http_client is not None:
+            # The shared transport retries with jittered backoff; avoid double retries
+            self.client = AsyncAnthropic(api_key=api_key, http_client=http_client, max_retries=0)
+        else:
+            self.client = AsyncAnthropic(api_key=api_key)
+        self._single_flight = SingleFlight(
+            provider="anthropic", cache_ttl_seconds=result_cache_ttl_seconds
+        )
         self._total_tokens_used = 0
         self._total_cost = 0.0
 
+    async def _create_message(self, operation: str, **request: Any) -> Any:
+        """Call the Messages API, collapsing identical concurrent requests.
+
+        Usage is tracked once per upstream call, not per deduplicated caller.
+
+        Args:
+            operation: Calling method name (part of the dedup key)
+            **request: Arguments for client.messages.create
+
+        Returns:
+            Anthropic API response (shared between deduplicated callers)
+        """
+        temperature = request.get("temperature")
+        key = SingleFlight.make_key(operation, request["model"], temperature, request)
+
+        async def call() -> Any:
+            with span(
+                f"llm.{operation}",
+                SpanKind.LLM,
+                provider="anthropic",
+                model=request["model"],
+                operation=operation,
+            ):
+                response = await self.client.messages.create(**request)
+            self._track_usage(response)
+            return response
+
+        return await self._single_flight.do(
+            key, operation, call, cacheable=temperature == 0.0
+        )
+
     async def resolve_coreference(
         self, mention: EntityMention, context: ConversationContext
     ) -> ResolutionResult:
@@ -86,7 +140,8 @@ class AnthropicLLMService(ILLMService):
             )
 
             # Call Anthropic
-            response = await self.client.messages.create(
+            response = await self._create_message(
+                "resolve_coreference",
                 model=self.MODEL,
                 max_tokens=100,  # Short responses (just entity_id)
                 temperature=self.TEMPERATURE,
@@ -95,9 +150,6 @@ class AnthropicLLMService(ILLMService):
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            # Track usage
-            self._track_usage(response)
-
             # Parse response
             result = self._parse_coreference_response(response, mention, context)
 
@@ -158,7 +210,8 @@ class AnthropicLLMService(ILLMService):
             )
 
             # Call Anthropic
-            response = await self.client.messages.create(
+            response = await self._create_message(
+                "extract_entity_mentions",
                 model=self.MODEL,
                 max_tokens=self.MAX_TOKENS,
                 temperature=self.TEMPERATURE_EXTRACTION,
@@ -168,9 +221,6 @@ class AnthropicLLMService(ILLMService):
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            # Track usage
-            self._track_usage(response)
-
             # Parse response
             mentions = self._parse_mention_extraction_response(response, text)
 
@@ -250,7 +300,8 @@ class AnthropicLLMService(ILLMService):
             )
 
             # Call Anthropic
-            response = await self.client.messages.create(
+            response = await self._create_message(
+                "extract_semantic_facts",
                 model=self.MODEL,
                 max_tokens=self.MAX_TOKENS,
                 temperature=self.TEMPERATURE_EXTRACTION,
@@ -260,9 +311,6 @@ class AnthropicLLMService(ILLMService):
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            # Track usage
-            self._track_usage(response)
-
             # Parse response
             facts = self._parse_fact_extraction_response(response, message)
 
@@ -338,15 +386,22 @@ class AnthropicLLMService(ILLMService):
 
             # Call Anthropic
             # Claude excels at following structured instructions without needing special JSON mode
-            response = await self.client.messages.create(
+            with span(
+                "llm.extract_semantic_triples",
+                SpanKind.LLM,
+                provider="anthropic",
                 model=self.MODEL,
-                max_tokens=self.MAX_TOKENS,
-                temperature=self.TEMPERATURE_EXTRACTION,
-                system="You are an expert at extracting structured knowledge from conversations. "
-                "Extract semantic triples (subject-predicate-object) following the exact JSON schema provided. "
-                "Always respond with valid JSON only, no other text.",
-                messages=[{"role": "user", "content": prompt}],
-            )
+                operation="extract_semantic_triples",
+            ):
+                response = await self.client.messages.create(
+                    model=self.MODEL,
+                    max_tokens=self.MAX_TOKENS,
+                    temperature=self.TEMPERATURE_EXTRACTION,
+                    system="You are an expert at extracting structured knowledge from conversations. "
+                    "Extract semantic triples (subject-predicate-object) following the exact JSON schema provided. "
+                    "Always respond with valid JSON only, no other text.",
+                    messages=[{"role": "user", "content": prompt}],
+                )
 
             # Track usage
             self._track_usage(response)
@@ -1097,13 +1152,20 @@ Respond with ONLY the JSON object. If no mentions found, return {{"mentions": []
             if response_format == "json":
                 system_prompt += " Always respond with valid JSON only, no other text."
 
-            response = await self.client.messages.create(
+            with span(
+                "llm.generate_structured_output",
+                SpanKind.LLM,
+                provider="anthropic",
                 model=self.MODEL,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_prompt,
-                messages=[{"role": "user", "content": prompt}],
-            )
+                operation="generate_structured_output",
+            ):
+                response = await self.client.messages.create(
+                    model=self.MODEL,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": prompt}],
+                )
 
             # Track usage
             self._track_usage(response)
@@ -1177,13 +1239,20 @@ Respond with ONLY the JSON object. If no mentions found, return {{"mentions": []
             )
 
             # Call Anthropic Messages API with tools
-            response = await self.client.messages.create(
+            with span(
+                "llm.chat_with_tools",
+                SpanKind.LLM,
+                provider="anthropic",
                 model=model,
-                max_tokens=4096,
-                system=system_prompt,
-                messages=messages,  # type: ignore[arg-type]
-                tools=tools,  # type: ignore[arg-type] # Claude native tool calling
-            )
+                operation="chat_with_tools",
+            ):
+                response = await self.client.messages.create(
+                    model=model,
+                    max_tokens=4096,
+                    system=system_prompt,
+                    messages=messages,  # type: ignore[arg-type]
+                    tools=tools,  # type: ignore[arg-type] # Claude native tool calling
+                )
 
             # Track usage
             self._track_usage(response)
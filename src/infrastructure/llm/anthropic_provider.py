@@ -5,6 +5,7 @@ This adapter implements the LLMProviderPort interface using Anthropic's API.
 Architecture: Infrastructure layer (depends on domain port, not vice versa).
 """
 
+import httpx
 import structlog
 from anthropic import (
     APIConnectionError,
@@ -14,6 +15,7 @@ from anthropic import (
 )
 
 from src.domain.ports.llm_provider_port import LLMProviderPort, LLMResponse
+from src.domain.services.span_tracer import SpanKind, span
 
 logger = structlog.get_logger()
 
@@ -37,11 +39,13 @@ class AnthropicProvider(LLMProviderPort):
         "claude-3-opus-20240229": {"input": 15.00, "output": 75.00},
     }
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: httpx.AsyncClient | None = None):
         """Initialize Anthropic client.
 
         Args:
             api_key: Anthropic API key
+            http_client: Shared pooled HTTP client (see src.infrastructure.http);
+                the SDK's own retries are disabled when provided
 
         Raises:
             ValueError: If API key is empty or invalid format
@@ -50,7 +54,11 @@ class AnthropicProvider(LLMProviderPort):
             msg = "Anthropic API key must be a non-empty string"
             raise ValueError(msg)
 
-        self._client = AsyncAnthropic(api_key=api_key)
+        if http_client is not None:
+            # The shared transport retries with jittered backoff; avoid double retries
+            self._client = AsyncAnthropic(api_key=api_key, http_client=http_client, max_retries=0)
+        else:
+            self._client = AsyncAnthropic(api_key=api_key)
         logger.info("anthropic_provider_initialized", model_support=list(self.PRICING.keys()))
 
     async def generate_completion(
@@ -86,12 +94,19 @@ class AnthropicProvider(LLMProviderPort):
         )
 
         try:
-            response = await self._client.messages.create(
+            with span(
+                "llm.generate_completion",
+                SpanKind.LLM,
+                provider="anthropic",
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+                operation="generate_completion",
+            ):
+                response = await self._client.messages.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
 
             # Extract usage and calculate cost
             input_tokens = response.usage.input_tokens
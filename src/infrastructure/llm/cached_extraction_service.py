@@ -0,0 +1,251 @@
+"""Persistent extraction cache in front of an LLM service.
+
+Mention extraction, semantic fact extraction and coreference resolution are
+deterministic functions of their prompt inputs for a given model and prompt
+version. Replayed or re-sent messages and re-ingestion jobs therefore reuse
+the stored output instead of calling the LLM again.
+
+Cache keys hash the extraction type, model, prompt version and prompt inputs
+(message content hash, resolved entity set, conversation context). Bumping a
+prompt version in the wrapped service's PROMPT_VERSIONS makes old rows
+unreachable; purge_stale_versions() deletes them.
+
+Lookups are plain reads. Hit counts are kept in memory and written in one
+statement per EXTRACTION_CACHE_HIT_FLUSH_SIZE hits (and by flush_hits() at
+shutdown), so hits on a hot key never contend on its row.
+"""
+
+import hashlib
+import json
+from collections import Counter
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import asdict
+from typing import Any
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.metrics import llm_extraction_cache_total
+from src.config import heuristics
+from src.domain.ports import IExtractionCacheRepository, ILLMService
+from src.domain.value_objects import (
+    ConversationContext,
+    EntityMention,
+    ResolutionMethod,
+    ResolutionResult,
+)
+from src.infrastructure.database.repositories.extraction_cache_repository import (
+    PostgresExtractionCacheRepository,
+)
+
+logger = structlog.get_logger(__name__)
+
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+RepositoryFactory = Callable[[AsyncSession], IExtractionCacheRepository]
+
+EXTRACTION_MENTIONS = "mentions"
+EXTRACTION_FACTS = "facts"
+EXTRACTION_COREFERENCE = "coreference"
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of message content (same digest as ChatMessage.content_hash)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ExtractionCachingLLMService:
+    """ILLMService decorator backed by app.llm_extraction_cache.
+
+    Lookups use their own short-lived session (not the request session), so
+    they can run concurrently with other pipeline stages. Cache errors are
+    logged and fall through to the LLM.
+
+    Only informative results are stored: non-empty mention and fact lists and
+    successful coreference decisions. The adapters return empty lists on
+    parse errors, so empty results are never cached.
+
+    Methods other than the three cached extractions are delegated unchanged.
+    """
+
+    def __init__(
+        self,
+        llm_service: ILLMService,
+        session_scope: SessionScope,
+        repository_factory: RepositoryFactory = PostgresExtractionCacheRepository,
+        hit_flush_size: int = heuristics.EXTRACTION_CACHE_HIT_FLUSH_SIZE,
+    ):
+        """Initialize caching decorator.
+
+        Args:
+            llm_service: Wrapped LLM service (must define MODEL and PROMPT_VERSIONS)
+            session_scope: Context manager factory yielding a committed-on-exit session
+            repository_factory: Builds the cache repository for a session
+            hit_flush_size: Buffered hits that trigger a hit-count write
+        """
+        self._inner = llm_service
+        self._session_scope = session_scope
+        self._repository_factory = repository_factory
+        self._hit_flush_size = hit_flush_size
+        self._pending_hits: Counter[str] = Counter()
+        self.model: str = llm_service.MODEL  # type: ignore[attr-defined]
+        self.prompt_versions: dict[str, str] = llm_service.PROMPT_VERSIONS  # type: ignore[attr-defined]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    async def extract_entity_mentions(self, text: str) -> list[EntityMention]:
+        """Extract entity mentions, reusing cached output for identical text."""
+        if not text or not text.strip():
+            return await self._inner.extract_entity_mentions(text)
+
+        key = self._cache_key(EXTRACTION_MENTIONS, {"content_hash": content_hash(text)})
+        cached = await self._get(EXTRACTION_MENTIONS, key)
+        if cached is not None:
+            return [EntityMention(**mention) for mention in cached]
+
+        mentions = await self._inner.extract_entity_mentions(text)
+        if mentions:
+            await self._put(EXTRACTION_MENTIONS, key, [asdict(m) for m in mentions])
+        return mentions
+
+    async def extract_semantic_facts(
+        self,
+        message: str,
+        resolved_entities: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Extract semantic facts, keyed on message content and entity set."""
+        if not message or not message.strip() or not resolved_entities:
+            return await self._inner.extract_semantic_facts(message, resolved_entities)  # type: ignore[attr-defined, no-any-return]
+
+        key = self._cache_key(
+            EXTRACTION_FACTS,
+            {
+                "content_hash": content_hash(message),
+                "entities": sorted(resolved_entities, key=lambda e: str(e.get("entity_id"))),
+            },
+        )
+        cached = await self._get(EXTRACTION_FACTS, key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+
+        facts = await self._inner.extract_semantic_facts(message, resolved_entities)  # type: ignore[attr-defined]
+        if facts:
+            await self._put(EXTRACTION_FACTS, key, facts)
+        return facts  # type: ignore[no-any-return]
+
+    async def resolve_coreference(
+        self, mention: EntityMention, context: ConversationContext
+    ) -> ResolutionResult:
+        """Resolve coreference, keyed on the mention and conversation context."""
+        key = self._cache_key(
+            EXTRACTION_COREFERENCE,
+            {
+                "mention": asdict(mention),
+                "recent_messages": context.recent_messages,
+                "recent_entities": context.recent_entities,
+                "current_message_hash": content_hash(context.current_message),
+            },
+        )
+        cached = await self._get(EXTRACTION_COREFERENCE, key)
+        if cached is not None:
+            return ResolutionResult(
+                entity_id=cached["entity_id"],
+                confidence=cached["confidence"],
+                method=ResolutionMethod(cached["method"]),
+                mention_text=cached["mention_text"],
+                canonical_name=cached["canonical_name"],
+                metadata=cached["metadata"],
+            )
+
+        result = await self._inner.resolve_coreference(mention, context)
+        if result.is_successful:
+            await self._put(
+                EXTRACTION_COREFERENCE,
+                key,
+                {
+                    "entity_id": result.entity_id,
+                    "confidence": result.confidence,
+                    "method": result.method.value,
+                    "mention_text": result.mention_text,
+                    "canonical_name": result.canonical_name,
+                    "metadata": result.metadata,
+                },
+            )
+        return result
+
+    async def purge_stale_versions(self) -> int:
+        """Delete rows produced by prompt versions other than the current ones.
+
+        Returns:
+            Number of rows removed
+        """
+        removed = 0
+        async with self._session_scope() as session:
+            repo = self._repository_factory(session)
+            for extraction_type, version in self.prompt_versions.items():
+                removed += await repo.invalidate(
+                    extraction_type, keep_prompt_version=self._version_tag(version)
+                )
+        return removed
+
+    async def flush_hits(self) -> None:
+        """Write buffered hit counts (best effort: counts are statistics only)."""
+        if not self._pending_hits:
+            return
+
+        # Swapped before the write, so hits arriving meanwhile start a new batch
+        hits, self._pending_hits = dict(self._pending_hits), Counter()
+        try:
+            async with self._session_scope() as session:
+                await self._repository_factory(session).record_hits(hits)
+        except Exception as e:
+            logger.warning("extraction_cache_hit_flush_failed", keys=len(hits), error=str(e))
+
+    def _version_tag(self, prompt_version: str) -> str:
+        return f"{self.model}@{prompt_version}"
+
+    def _cache_key(self, extraction_type: str, inputs: dict[str, Any]) -> str:
+        payload = json.dumps(
+            {
+                "type": extraction_type,
+                "version": self._version_tag(self.prompt_versions[extraction_type]),
+                "inputs": inputs,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _get(self, extraction_type: str, key: str) -> Any | None:
+        try:
+            async with self._session_scope() as session:
+                cached = await self._repository_factory(session).get(key)
+        except Exception as e:
+            llm_extraction_cache_total.labels(
+                extraction_type=extraction_type, outcome="error"
+            ).inc()
+            logger.warning("extraction_cache_read_failed", extraction_type=extraction_type, error=str(e))
+            return None
+
+        outcome = "hit" if cached is not None else "miss"
+        llm_extraction_cache_total.labels(extraction_type=extraction_type, outcome=outcome).inc()
+        if cached is not None:
+            logger.debug("extraction_cache_hit", extraction_type=extraction_type)
+            self._pending_hits[key] += 1
+            if self._pending_hits.total() >= self._hit_flush_size:
+                await self.flush_hits()
+        return cached
+
+    async def _put(self, extraction_type: str, key: str, result: Any) -> None:
+        try:
+            async with self._session_scope() as session:
+                await self._repository_factory(session).put(
+                    cache_key=key,
+                    extraction_type=extraction_type,
+                    model=self.model,
+                    prompt_version=self._version_tag(self.prompt_versions[extraction_type]),
+                    result=result,
+                )
+        except Exception as e:
+            logger.warning("extraction_cache_write_failed", extraction_type=extraction_type, error=str(e))
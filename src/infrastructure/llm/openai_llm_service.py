@@ -7,18 +7,21 @@ and semantic triple extraction.
 import json
 from typing import Any
 
+import httpx
 import structlog
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion
 
 from src.domain.exceptions import LLMServiceError
 from src.domain.ports import ILLMService
+from src.domain.services.span_tracer import SpanKind, span
 from src.domain.value_objects import (
     ConversationContext,
     EntityMention,
     ResolutionMethod,
     ResolutionResult,
 )
+from src.infrastructure.llm.single_flight import SingleFlight
 
 logger = structlog.get_logger(__name__)
 
@@ -37,16 +40,67 @@ class OpenAILLMService(ILLMService):
     MAX_TOKENS = 100  # Short responses (just entity_id)
     TEMPERATURE = 0.0  # Deterministic output
 
-    def __init__(self, api_key: str):
+    # Prompt versions for the persistent extraction cache.
+    # Bump the matching entry whenever a prompt or its output parsing changes.
+    PROMPT_VERSIONS = {"mentions": "1", "facts": "1", "coreference": "1"}
+
+    def __init__(
+        self,
+        api_key: str,
+        result_cache_ttl_seconds: float = 0.0,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize OpenAI LLM service.
 
         Args:
             api_key: OpenAI API key
+            result_cache_ttl_seconds: TTL for caching temperature-0 results
+                (0 disables; identical in-flight calls are always collapsed)
+            http_client: Shared pooled HTTP client (see src.infrastructure.http);
+                the SDK's own retries are disabled when provided
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        if http_client is not None:
+            # The shared transport retries with jittered backoff; avoid double retries
+            self.client = AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+        else:
+            self.client = AsyncOpenAI(api_key=api_key)
+        self._single_flight = SingleFlight(
+            provider="openai", cache_ttl_seconds=result_cache_ttl_seconds
+        )
         self._total_tokens_used = 0
         self._total_cost = 0.0
 
+    async def _create_completion(self, operation: str, **request: Any) -> ChatCompletion:
+        """Call Chat Completions, collapsing identical concurrent requests.
+
+        Usage is tracked once per upstream call, not per deduplicated caller.
+
+        Args:
+            operation: Calling method name (part of the dedup key)
+            **request: Arguments for client.chat.completions.create
+
+        Returns:
+            Completion (shared between deduplicated callers)
+        """
+        temperature = request.get("temperature")
+        key = SingleFlight.make_key(operation, request["model"], temperature, request)
+
+        async def call() -> ChatCompletion:
+            with span(
+                f"llm.{operation}",
+                SpanKind.LLM,
+                provider="openai",
+                model=request["model"],
+                operation=operation,
+            ):
+                response = await self.client.chat.completions.create(**request)
+            self._track_usage(response)
+            return response
+
+        return await self._single_flight.do(
+            key, operation, call, cacheable=temperature == 0.0
+        )
+
     async def resolve_coreference(
         self, mention: EntityMention, context: ConversationContext
     ) -> ResolutionResult:
@@ -83,7 +137,8 @@ class OpenAILLMService(ILLMService):
             )
 
             # Call OpenAI
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
+                "resolve_coreference",
                 model=self.MODEL,
                 messages=[
                     {
@@ -97,9 +152,6 @@ class OpenAILLMService(ILLMService):
                 temperature=self.TEMPERATURE,
             )
 
-            # Track usage
-            self._track_usage(response)
-
             # Parse response
             result = self._parse_coreference_response(response, mention, context)
 
@@ -208,7 +260,8 @@ class OpenAILLMService(ILLMService):
             )
 
             # Call OpenAI with JSON mode for structured output
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
+                "extract_semantic_facts",
                 model=self.MODEL,
                 messages=[
                     {
@@ -223,9 +276,6 @@ class OpenAILLMService(ILLMService):
                 response_format={"type": "json_object"},
             )
 
-            # Track usage
-            self._track_usage(response)
-
             # Parse response
             facts = self._parse_fact_extraction_response(response, message)
 
@@ -305,20 +355,27 @@ class OpenAILLMService(ILLMService):
             )
 
             # Call OpenAI with JSON mode for structured output
-            response = await self.client.chat.completions.create(
+            with span(
+                "llm.extract_semantic_triples",
+                SpanKind.LLM,
+                provider="openai",
                 model=self.MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert at extracting structured knowledge from conversations. "
-                        "Extract semantic triples (subject-predicate-object) following the exact JSON schema provided.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=1000,  # Allow for multiple triples
-                temperature=0.1,  # Low temperature for consistent extraction
-                response_format={"type": "json_object"},
-            )
+                operation="extract_semantic_triples",
+            ):
+                response = await self.client.chat.completions.create(
+                    model=self.MODEL,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are an expert at extracting structured knowledge from conversations. "
+                            "Extract semantic triples (subject-predicate-object) following the exact JSON schema provided.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    max_tokens=1000,  # Allow for multiple triples
+                    temperature=0.1,  # Low temperature for consistent extraction
+                    response_format={"type": "json_object"},
+                )
 
             # Track usage
             self._track_usage(response)
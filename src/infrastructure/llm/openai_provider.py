@@ -6,10 +6,12 @@ Architecture: Infrastructure layer (depends on domain port, not vice versa).
 """
 
 
+import httpx
 import structlog
 from openai import APIConnectionError, APIError, AsyncOpenAI, RateLimitError
 
 from src.domain.ports.llm_provider_port import LLMProviderPort, LLMResponse
+from src.domain.services.span_tracer import SpanKind, span
 
 logger = structlog.get_logger()
 
@@ -29,11 +31,13 @@ class OpenAIProvider(LLMProviderPort):
         "gpt-4": {"input": 0.03, "output": 0.06},  # Fallback for older models
     }
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: httpx.AsyncClient | None = None):
         """Initialize OpenAI client.
 
         Args:
             api_key: OpenAI API key
+            http_client: Shared pooled HTTP client (see src.infrastructure.http);
+                the SDK's own retries are disabled when provided
 
         Raises:
             ValueError: If API key is empty or invalid format
@@ -42,7 +46,11 @@ class OpenAIProvider(LLMProviderPort):
             msg = "OpenAI API key must be a non-empty string"
             raise ValueError(msg)
 
-        self._client = AsyncOpenAI(api_key=api_key)
+        if http_client is not None:
+            # The shared transport retries with jittered backoff; avoid double retries
+            self._client = AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+        else:
+            self._client = AsyncOpenAI(api_key=api_key)
         logger.info("openai_provider_initialized", model_support=list(self.PRICING.keys()))
 
     async def generate_completion(
@@ -78,12 +86,19 @@ class OpenAIProvider(LLMProviderPort):
         )
 
         try:
-            response = await self._client.chat.completions.create(
+            with span(
+                "llm.generate_completion",
+                SpanKind.LLM,
+                provider="openai",
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+                operation="generate_completion",
+            ):
+                response = await self._client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
 
             # Extract usage and calculate cost
             usage = response.usage
@@ -0,0 +1,139 @@
+"""Single-flight deduplication for LLM calls.
+
+Concurrent identical requests (retry storms, double-clicks, several tabs on
+the same session) share one upstream call instead of each paying for it.
+Deterministic (temperature 0) results can additionally be cached for a short
+TTL so near-simultaneous repeats are served without an API round trip.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import structlog
+
+from src.api.metrics import llm_deduplicated_calls_total
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapse identical in-flight async calls onto one execution.
+
+    The first caller for a key (the leader) runs the call; callers arriving
+    while it is in flight await the same future. Followers are shielded, so a
+    cancelled follower never cancels the shared upstream request.
+
+    Args:
+        provider: Provider label for metrics (e.g. "anthropic")
+        cache_ttl_seconds: TTL for cacheable results (0 disables the cache)
+        max_cache_entries: LRU bound on cached results
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        cache_ttl_seconds: float = 0.0,
+        max_cache_entries: int = 1024,
+    ):
+        self.provider = provider
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.max_cache_entries = max_cache_entries
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        self._cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(operation: str, model: str, temperature: float | None, request: Any) -> str:
+        """Build a dedup key from (operation, model, prompt hash, temperature).
+
+        Args:
+            operation: Service method name
+            model: Model identifier
+            temperature: Sampling temperature
+            request: Everything else sent upstream (system prompt, messages, limits)
+
+        Returns:
+            Stable key string
+        """
+        payload = json.dumps(request, sort_keys=True, default=str)
+        prompt_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{operation}:{model}:{temperature}:{prompt_hash}"
+
+    async def do(
+        self,
+        key: str,
+        operation: str,
+        func: Callable[[], Awaitable[T]],
+        cacheable: bool = False,
+    ) -> T:
+        """Run func once per key among concurrent callers.
+
+        Args:
+            key: Dedup key (see make_key)
+            operation: Operation label for metrics
+            func: Zero-argument coroutine factory performing the upstream call
+            cacheable: Whether the result is deterministic and may be cached
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        if cacheable and self.cache_ttl_seconds > 0:
+            cached = self._cache.get(key)
+            if cached is not None:
+                expires_at, value = cached
+                if expires_at > time.monotonic():
+                    self._cache.move_to_end(key)
+                    llm_deduplicated_calls_total.labels(
+                        provider=self.provider, operation=operation, source="cache"
+                    ).inc()
+                    return value  # type: ignore[no-any-return]
+                del self._cache[key]
+
+        while (existing := self._in_flight.get(key)) is not None:
+            llm_deduplicated_calls_total.labels(
+                provider=self.provider, operation=operation, source="in_flight"
+            ).inc()
+            logger.debug("llm_call_deduplicated", operation=operation)
+            try:
+                return await asyncio.shield(existing)  # type: ignore[no-any-return]
+            except asyncio.CancelledError:
+                if not existing.cancelled():
+                    raise  # This caller was cancelled
+                # Leader was cancelled (e.g. client disconnect): retry as leader
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody else awaited isn't logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            if cacheable and self.cache_ttl_seconds > 0:
+                self._store(key, result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+
+    def _store(self, key: str, value: Any) -> None:
+        self._cache[key] = (time.monotonic() + self.cache_ttl_seconds, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
@@ -0,0 +1,10 @@
+"""Span processors.
+
+Prometheus histograms for finished spans; the OpenTelemetry bridge lives in
+otel_exporter and is imported on demand (optional dependency).
+"""
+from src.infrastructure.observability.span_metrics import PrometheusSpanProcessor
+
+__all__ = [
+    "PrometheusSpanProcessor",
+]
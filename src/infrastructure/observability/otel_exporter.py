@@ -0,0 +1,65 @@
+"""OpenTelemetry bridge for span trees.
+
+Optional: only imported when ``otel_tracing_enabled`` is set, and requires
+opentelemetry-api plus an SDK tracer provider configured by the deployment
+(exporter, sampler, resource). Without them spans still feed Prometheus.
+"""
+
+from typing import Any
+
+from src.domain.services.span_tracer import Span, SpanStatus
+
+_ATTRIBUTE_TYPES = (str, bool, int, float)
+
+
+class OpenTelemetrySpanProcessor:
+    """Re-emit finished span trees through an OpenTelemetry tracer.
+
+    Trees are exported when their root finishes, parents before children,
+    with the original start/end timestamps; OTel assigns its own trace and
+    span ids.
+    """
+
+    def __init__(self, tracer: Any | None = None, instrumentation_name: str = "memory-system"):
+        """Initialize the bridge.
+
+        Args:
+            tracer: OTel tracer (default: from the global tracer provider)
+            instrumentation_name: Instrumentation scope for the default tracer
+        """
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer(instrumentation_name)
+
+    def on_end(self, span: Span) -> None:
+        """Export the tree once its root span has finished.
+
+        Args:
+            span: Finished span
+        """
+        if span.parent is None:
+            self._emit(span, parent_context=None)
+
+    def _emit(self, span: Span, parent_context: Any) -> None:
+        attributes = {
+            key: value if isinstance(value, _ATTRIBUTE_TYPES) else str(value)
+            for key, value in span.attributes.items()
+        }
+        attributes["span.kind"] = span.kind.value
+
+        otel_span = self._tracer.start_span(
+            span.name,
+            context=parent_context,
+            attributes=attributes,
+            start_time=span.start_time_ns,
+        )
+        if span.status is SpanStatus.ERROR:
+            otel_span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, span.error)
+            )
+
+        context = self._trace.set_span_in_context(otel_span)
+        for child in span.children:
+            self._emit(child, context)
+        otel_span.end(end_time=span.end_time_ns)
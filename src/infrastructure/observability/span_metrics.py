@@ -0,0 +1,59 @@
+"""Prometheus span processor.
+
+Turns finished spans into histogram observations, so per-stage, per-LLM-call
+and per-retrieval-layer P95/P99 are available without a trace collector.
+"""
+
+from src.api.metrics import (
+    chat_stage_duration_seconds,
+    entity_resolution_duration_seconds,
+    llm_call_duration_seconds,
+    memory_retrieval_duration_seconds,
+)
+from src.api.tenant_metrics import tenant_bucket
+from src.domain.services.span_tracer import Span, SpanKind
+
+_UNKNOWN = "unknown"
+
+
+class PrometheusSpanProcessor:
+    """Observe span durations in the matching latency histogram.
+
+    - PHASE: chat_stage_duration_seconds{stage, status}
+    - LLM / EMBEDDING: llm_call_duration_seconds{provider, model, operation}
+    - ENTITY_RESOLUTION: entity_resolution_duration_seconds{method, success}
+    - MEMORY_RETRIEVAL: memory_retrieval_duration_seconds{layer, tenant_bucket}
+
+    REPOSITORY spans only appear in span trees; their SQL is already measured
+    per statement by the engine instrumentation.
+    """
+
+    def on_end(self, span: Span) -> None:
+        """Record a finished span.
+
+        Args:
+            span: Finished span
+        """
+        seconds = span.duration_seconds
+        attributes = span.attributes
+
+        if span.kind is SpanKind.PHASE:
+            chat_stage_duration_seconds.labels(
+                stage=span.name, status=span.status.value
+            ).observe(seconds)
+        elif span.kind in (SpanKind.LLM, SpanKind.EMBEDDING):
+            llm_call_duration_seconds.labels(
+                provider=attributes.get("provider", _UNKNOWN),
+                model=attributes.get("model", _UNKNOWN),
+                operation=attributes.get("operation", span.name),
+            ).observe(seconds)
+        elif span.kind is SpanKind.ENTITY_RESOLUTION:
+            entity_resolution_duration_seconds.labels(
+                method=attributes.get("method", _UNKNOWN),
+                success=str(bool(attributes.get("success", False))).lower(),
+            ).observe(seconds)
+        elif span.kind is SpanKind.MEMORY_RETRIEVAL:
+            memory_retrieval_duration_seconds.labels(
+                layer=attributes.get("layer", _UNKNOWN),
+                tenant_bucket=tenant_bucket(attributes.get("user_id")),
+            ).observe(seconds)
@@ -107,14 +107,14 @@ async def test_db_session(test_db_engine) -> AsyncGenerator[AsyncSession, None]:
 
     async with async_session() as session:
         # Clean up before test
-        await session.execute(text("TRUNCATE TABLE domain.payments, domain.invoices, domain.work_orders, domain.sales_orders, domain.tasks, domain.customers CASCADE"))
+        await session.execute(text("TRUNCATE TABLE domain.payments, domain.invoices, domain.work_orders, domain.sales_orders, domain.tasks, domain.customers, domain.invoice_balances, domain.customer_ar, domain.so_work_order_progress CASCADE"))
         await session.execute(text("TRUNCATE TABLE app.episodic_memories, app.semantic_memories, app.entity_aliases, app.canonical_entities CASCADE"))
         await session.commit()
 
         yield session
 
         # Clean up after test
-        await session.execute(text("TRUNCATE TABLE domain.payments, domain.invoices, domain.work_orders, domain.sales_orders, domain.tasks, domain.customers CASCADE"))
+        await session.execute(text("TRUNCATE TABLE domain.payments, domain.invoices, domain.work_orders, domain.sales_orders, domain.tasks, domain.customers, domain.invoice_balances, domain.customer_ar, domain.so_work_order_progress CASCADE"))
         await session.execute(text("TRUNCATE TABLE app.episodic_memories, app.semantic_memories, app.entity_aliases, app.canonical_entities CASCADE"))
         await session.commit()
 
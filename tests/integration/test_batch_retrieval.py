@@ -0,0 +1,49 @@
+"""Integration tests for batched (unnest + LATERAL) vector search.
+
+Requires the test database migrated to head with pgvector available.
+"""
+
+import numpy as np
+import pytest
+
+from src.domain.entities.semantic_memory import SemanticMemory
+from src.infrastructure.database.repositories.semantic_memory_repository import (
+    SemanticMemoryRepository,
+)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSemanticFindSimilarBatch:
+    """One batched statement returns what per-query searches return."""
+
+    async def test_batch_matches_per_query_search(self, test_db_session):
+        rng = np.random.default_rng(33)
+        repo = SemanticMemoryRepository(test_db_session)
+        for i in range(12):
+            await repo.create(
+                SemanticMemory(
+                    user_id="batch_user",
+                    content=f"Batch memory {i}",
+                    entities=[f"customer_{i % 3}"],
+                    confidence=0.8,
+                    importance=0.6,
+                    embedding=rng.random(1536).tolist(),
+                )
+            )
+        await test_db_session.commit()
+
+        queries = [rng.random(1536).tolist() for _ in range(3)]
+
+        batch = await repo.find_similar_batch("batch_user", queries, limit=4)
+
+        assert len(batch) == len(queries)
+        for query, matches in zip(queries, batch, strict=True):
+            expected = await repo.find_similar(query, "batch_user", limit=4)
+            assert [m.memory_id for m, _ in matches] == [m.memory_id for m, _ in expected]
+            assert [s for _, s in matches] == pytest.approx([s for _, s in expected])
+
+    async def test_empty_batch_skips_database(self, test_db_session):
+        repo = SemanticMemoryRepository(test_db_session)
+
+        assert await repo.find_similar_batch("batch_user", []) == []
@@ -0,0 +1,51 @@
+"""Integration tests for multi-row chat event ingestion.
+
+Requires the test database migrated to head.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities import ChatMessage
+from src.infrastructure.database.repositories import chat_repository
+from src.infrastructure.database.repositories.chat_repository import ChatEventRepository
+
+
+def _message(session_id, content: str) -> ChatMessage:
+    return ChatMessage(session_id=session_id, user_id="ingest_user", role="user", content=content)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestChatEventCreateMany:
+    """ON CONFLICT DO NOTHING RETURNING skips duplicates across and within batches."""
+
+    async def test_duplicates_are_skipped(self, test_db_session):
+        repo = ChatEventRepository(test_db_session)
+        session_id = uuid4()
+        existing = await repo.create(_message(session_id, "already stored"))
+
+        created = await repo.create_many(
+            [
+                _message(session_id, "already stored"),
+                _message(session_id, "new one"),
+                _message(session_id, "new one"),
+                _message(session_id, "new two"),
+            ]
+        )
+
+        assert [m.content for m in created] == ["new one", "new two"]
+        assert all(m.event_id and m.event_id > existing.event_id for m in created)
+        stored = await repo.get_by_event_ids([existing.event_id, *(m.event_id for m in created)])
+        assert [m.content for m in stored] == ["already stored", "new one", "new two"]
+
+    async def test_large_batches_are_chunked(self, test_db_session, monkeypatch):
+        monkeypatch.setattr(chat_repository, "INSERT_CHUNK_ROWS", 3)
+        repo = ChatEventRepository(test_db_session)
+        session_id = uuid4()
+
+        created = await repo.create_many([_message(session_id, f"m{i}") for i in range(10)])
+
+        assert len(created) == 10
+        assert len({m.event_id for m in created}) == 10
@@ -0,0 +1,166 @@
+"""Plan-regression tests for the domain query tools.
+
+Seeds ERP-sized data, runs each DomainDatabaseRepository tool through a
+session wrapper that EXPLAINs every SELECT it issues, and fails if any
+plan falls back to a sequential scan on a domain table.
+
+Requires the test database migrated to head.
+"""
+
+import json
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.database.repositories.domain_database_repository import (
+    DomainDatabaseRepository,
+)
+
+SEED_SQL = [
+    """
+    INSERT INTO domain.customers (name)
+    SELECT 'Plan Customer ' || g FROM generate_series(1, 5000) g
+    """,
+    """
+    INSERT INTO domain.sales_orders (customer_id, so_number, title, status)
+    SELECT customer_id, 'SO-PLAN-' || row_number() OVER (), 'Plan order', 'approved'
+    FROM domain.customers
+    """,
+    """
+    INSERT INTO domain.invoices (so_id, invoice_number, amount, due_date, status)
+    SELECT so_id, 'INV-PLAN-' || row_number() OVER (), 100,
+           CURRENT_DATE + (row_number() OVER () % 60)::int,
+           CASE WHEN row_number() OVER () % 2 = 0 THEN 'open' ELSE 'paid' END
+    FROM domain.sales_orders
+    """,
+    """
+    INSERT INTO domain.payments (invoice_id, amount)
+    SELECT invoice_id, 10 FROM domain.invoices, generate_series(1, 2)
+    """,
+    """
+    INSERT INTO domain.work_orders (so_id, status)
+    SELECT so_id, CASE WHEN g = 1 THEN 'done' ELSE 'queued' END
+    FROM domain.sales_orders, generate_series(1, 2) g
+    """,
+    """
+    INSERT INTO domain.tasks (customer_id, title, status, created_at)
+    SELECT customer_id, 'Plan task', (ARRAY['todo', 'doing', 'done'])[1 + g % 3],
+           NOW() - (g * 5) * INTERVAL '1 day'
+    FROM domain.customers, generate_series(1, 4) g
+    """,
+    "ANALYZE domain.customers",
+    "ANALYZE domain.sales_orders",
+    "ANALYZE domain.invoices",
+    "ANALYZE domain.payments",
+    "ANALYZE domain.work_orders",
+    "ANALYZE domain.tasks",
+    "ANALYZE domain.invoice_balances",
+    "ANALYZE domain.customer_ar",
+    "ANALYZE domain.so_work_order_progress",
+]
+
+
+class _ExplainingSession:
+    """Session proxy that records the plan of every SELECT before running it."""
+
+    def __init__(self, session: Any):
+        self._session = session
+        self.plans: list[tuple[str, dict[str, Any]]] = []
+
+    async def execute(self, statement: Any, params: Any = None) -> Any:
+        sql = statement.text
+        if sql.lstrip().upper().startswith("SELECT") and "to_regclass" not in sql:
+            result = await self._session.execute(text("EXPLAIN (FORMAT JSON) " + sql), params)
+            plan = result.scalar()
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            self.plans.append((sql, plan[0]["Plan"]))
+        return await self._session.execute(statement, params)
+
+
+def _seq_scans(plan: dict[str, Any]) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+def _index_names(plan: dict[str, Any]) -> set[str]:
+    found = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        found |= _index_names(child)
+    return found
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestDomainQueryPlans:
+    """Customer-scoped tool queries must be index-driven."""
+
+    @pytest.fixture
+    async def seeded(self, test_db_session):
+        for statement in SEED_SQL:
+            await test_db_session.execute(text(statement))
+        await test_db_session.commit()
+
+        row = (
+            await test_db_session.execute(
+                text("""
+                    SELECT c.customer_id, c.name, so.so_number
+                    FROM domain.customers c
+                    JOIN domain.sales_orders so ON so.customer_id = c.customer_id
+                    LIMIT 1
+                """)
+            )
+        ).one()
+        return test_db_session, str(row.customer_id), row.name, row.so_number
+
+    async def test_tool_queries_avoid_sequential_scans(self, seeded):
+        session, customer_id, customer_name, so_number = seeded
+        explaining = _ExplainingSession(session)
+        repo = DomainDatabaseRepository(explaining)  # type: ignore[arg-type]
+
+        assert await repo.find_customer_by_name(customer_name.upper()) is not None
+        await repo.get_sla_risks(customer_id, sla_threshold_days=7)
+        await repo.get_invoice_status(customer_id)
+        await repo.get_customer_ar_summary(customer_id)
+        await repo.get_tasks_for_customer(customer_id)
+        await repo.get_work_orders_for_customer(customer_id)
+        await repo.get_order_chain(so_number)
+
+        assert len(explaining.plans) >= 7
+        # Every relation these tools touch lives in the domain schema
+        offenders = {
+            " ".join(sql.split())[:120]: scans
+            for sql, plan in explaining.plans
+            if (scans := _seq_scans(plan))
+        }
+        assert not offenders, f"Sequential scans in tool queries: {offenders}"
+
+    async def test_sla_cutoff_matches_age_threshold(self, seeded):
+        session, customer_id, _, _ = seeded
+
+        facts = await DomainDatabaseRepository(session).get_sla_risks(
+            customer_id, sla_threshold_days=7
+        )
+
+        # Each customer's tasks are 5 (doing), 10 (done), 15 (todo) and 20 (doing) days old
+        assert len(facts) == 2
+        assert all(fact.metadata["age_days"] > 7 for fact in facts)
+        ages = [fact.metadata["age_days"] for fact in facts]
+        assert ages == sorted(ages, reverse=True)
+
+    async def test_task_queries_use_their_own_index(self, seeded):
+        session, customer_id, _, _ = seeded
+        explaining = _ExplainingSession(session)
+        repo = DomainDatabaseRepository(explaining)  # type: ignore[arg-type]
+
+        await repo.get_sla_risks(customer_id, sla_threshold_days=7)
+        await repo.get_tasks_for_customer(customer_id)
+
+        (_, sla_plan), (_, tasks_plan) = explaining.plans
+        assert "ix_domain_tasks_open_customer_created" in _index_names(sla_plan)
+        # Done tasks are listed too, so the partial index does not apply
+        assert "ix_domain_tasks_customer_created" in _index_names(tasks_plan)
@@ -0,0 +1,145 @@
+"""Integration tests for trigger-maintained domain financial rollups.
+
+Requires the test database migrated to head (rollup tables and triggers).
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.database.repositories.domain_database_repository import (
+    DomainDatabaseRepository,
+)
+
+
+async def _exact_paid(session, invoice_id) -> float:
+    result = await session.execute(
+        text("SELECT COALESCE(SUM(amount), 0) FROM domain.payments WHERE invoice_id = :id"),
+        {"id": invoice_id},
+    )
+    return float(result.scalar())
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestDomainRollups:
+    """Rollups stay equal to exact aggregation under inserts, updates and deletes."""
+
+    @pytest.fixture
+    async def order(self, test_db_session):
+        customer_id, other_customer_id, so_id, invoice_id = uuid4(), uuid4(), uuid4(), uuid4()
+        await test_db_session.execute(
+            text("""
+                INSERT INTO domain.customers (customer_id, name) VALUES
+                    (:c1, 'Rollup Co'), (:c2, 'Other Co')
+            """),
+            {"c1": customer_id, "c2": other_customer_id},
+        )
+        await test_db_session.execute(
+            text("""
+                INSERT INTO domain.sales_orders (so_id, customer_id, so_number, title, status)
+                VALUES (:so, :c, 'SO-ROLLUP', 'Rollup test', 'in_fulfillment')
+            """),
+            {"so": so_id, "c": customer_id},
+        )
+        await test_db_session.execute(
+            text("""
+                INSERT INTO domain.invoices (invoice_id, so_id, invoice_number, amount, due_date, status)
+                VALUES (:i, :so, 'INV-ROLLUP', 1000.00, CURRENT_DATE + 30, 'open')
+            """),
+            {"i": invoice_id, "so": so_id},
+        )
+        await test_db_session.commit()
+        return {
+            "customer_id": customer_id,
+            "other_customer_id": other_customer_id,
+            "so_id": so_id,
+            "invoice_id": invoice_id,
+        }
+
+    async def test_payments_update_invoice_balance_and_customer_ar(self, test_db_session, order):
+        for amount in (100, 250):
+            await test_db_session.execute(
+                text("INSERT INTO domain.payments (invoice_id, amount) VALUES (:i, :a)"),
+                {"i": order["invoice_id"], "a": amount},
+            )
+        await test_db_session.execute(
+            text("UPDATE domain.payments SET amount = 300 WHERE amount = 250 AND invoice_id = :i"),
+            {"i": order["invoice_id"]},
+        )
+        await test_db_session.execute(
+            text("DELETE FROM domain.payments WHERE amount = 100 AND invoice_id = :i"),
+            {"i": order["invoice_id"]},
+        )
+
+        balance = (
+            await test_db_session.execute(
+                text("SELECT paid_amount, balance FROM domain.invoice_balances WHERE invoice_id = :i"),
+                {"i": order["invoice_id"]},
+            )
+        ).one()
+        assert float(balance.paid_amount) == await _exact_paid(test_db_session, order["invoice_id"]) == 300.0
+        assert float(balance.balance) == 700.0
+
+        repo = DomainDatabaseRepository(test_db_session)
+        facts = await repo.get_customer_ar_summary(str(order["customer_id"]))
+        assert facts[0].metadata["open_balance"] == 700.0
+        assert facts[0].metadata["open_invoice_count"] == 1
+
+        invoices = await repo.get_invoice_status(str(order["customer_id"]))
+        assert invoices[0].metadata["balance"] == 700.0
+
+    async def test_status_change_and_customer_move_update_ar(self, test_db_session, order):
+        await test_db_session.execute(
+            text("UPDATE domain.invoices SET status = 'paid' WHERE invoice_id = :i"),
+            {"i": order["invoice_id"]},
+        )
+        await test_db_session.execute(
+            text("UPDATE domain.sales_orders SET customer_id = :c WHERE so_id = :so"),
+            {"c": order["other_customer_id"], "so": order["so_id"]},
+        )
+
+        rows = (
+            await test_db_session.execute(
+                text("""
+                    SELECT customer_id, open_invoice_count, total_invoiced
+                    FROM domain.customer_ar ORDER BY customer_id
+                """)
+            )
+        ).all()
+        by_customer = {r.customer_id: r for r in rows}
+        assert by_customer[order["customer_id"]].total_invoiced == 0
+        assert by_customer[order["other_customer_id"]].total_invoiced == 1000
+        assert by_customer[order["other_customer_id"]].open_invoice_count == 0
+
+    async def test_work_order_progress(self, test_db_session, order):
+        for status in ("done", "queued", "in_progress"):
+            await test_db_session.execute(
+                text("INSERT INTO domain.work_orders (so_id, status) VALUES (:so, :s)"),
+                {"so": order["so_id"], "s": status},
+            )
+        await test_db_session.execute(
+            text("UPDATE domain.work_orders SET status = 'done' WHERE status = 'queued' AND so_id = :so"),
+            {"so": order["so_id"]},
+        )
+
+        facts = await DomainDatabaseRepository(test_db_session).get_order_chain("SO-ROLLUP")
+
+        assert facts[0].metadata["total_wo"] == 3
+        assert facts[0].metadata["done_wo"] == 2
+
+    async def test_rebuild_matches_trigger_maintained_state(self, test_db_session, order):
+        await test_db_session.execute(
+            text("INSERT INTO domain.payments (invoice_id, amount) VALUES (:i, 400)"),
+            {"i": order["invoice_id"]},
+        )
+        snapshot_sql = text("""
+            SELECT customer_id, open_invoice_count, open_balance, total_invoiced, total_paid
+            FROM domain.customer_ar WHERE total_invoiced <> 0 ORDER BY customer_id
+        """)
+        before = (await test_db_session.execute(snapshot_sql)).all()
+
+        await DomainDatabaseRepository(test_db_session).rebuild_financial_rollups()
+
+        assert (await test_db_session.execute(snapshot_sql)).all() == before
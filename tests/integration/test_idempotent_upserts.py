@@ -0,0 +1,104 @@
+"""Concurrency tests for unique-index upserts.
+
+Fires parallel duplicate writes from separate sessions (separate
+connections); the unique indexes must leave exactly one row and every
+caller must get that row back. Requires the test database migrated to head.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities import ChatMessage
+from src.domain.entities.semantic_memory import SemanticMemory
+from src.infrastructure.database.models import CanonicalEntity as CanonicalEntityModel
+from src.infrastructure.database.models import ChatEvent as ChatEventModel
+from src.infrastructure.database.models import SemanticMemory as SemanticMemoryModel
+from src.infrastructure.database.repositories.chat_repository import ChatEventRepository
+from src.infrastructure.database.repositories.entity_repository import EntityRepository
+from src.infrastructure.database.repositories.semantic_memory_repository import (
+    SemanticMemoryRepository,
+)
+
+PARALLEL_REQUESTS = 8
+
+
+async def _concurrently(engine, write):
+    """Run `write(session)` in PARALLEL_REQUESTS sessions, each committing."""
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def one():
+        async with sessions() as session:
+            result = await write(session)
+            await session.commit()
+            return result
+
+    return await asyncio.gather(*(one() for _ in range(PARALLEL_REQUESTS)))
+
+
+async def _count(session, stmt) -> int:
+    return (await session.execute(stmt)).scalar_one()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestConcurrentDuplicateWrites:
+    """Parallel duplicates converge on one row."""
+
+    async def test_chat_event_create(self, test_db_engine, test_db_session):
+        session_id = uuid4()
+
+        results = await _concurrently(
+            test_db_engine,
+            lambda s: ChatEventRepository(s).create(
+                ChatMessage(session_id=session_id, user_id="upsert_user", role="user", content="hi")
+            ),
+        )
+
+        assert len({m.event_id for m in results}) == 1
+        assert await _count(
+            test_db_session,
+            select(func.count()).where(ChatEventModel.session_id == session_id),
+        ) == 1
+
+    async def test_get_or_create_user_entity(self, test_db_engine, test_db_session):
+        results = await _concurrently(
+            test_db_engine,
+            lambda s: EntityRepository(s).get_or_create_user_entity("upsert_user"),
+        )
+
+        assert {e.entity_id for e in results} == {"user_upsert_user"}
+        assert await _count(
+            test_db_session,
+            select(func.count()).where(CanonicalEntityModel.entity_id == "user_upsert_user"),
+        ) == 1
+
+    async def test_semantic_memory_create_if_absent(self, test_db_engine, test_db_session):
+        def memory() -> SemanticMemory:
+            return SemanticMemory(
+                user_id="upsert_user",
+                content="Acme prefers Friday deliveries",
+                entities=["customer_acme"],
+                confidence=0.8,
+                importance=0.6,
+                metadata={"content_hash": "upsert-hash"},
+            )
+
+        results = await _concurrently(
+            test_db_engine,
+            lambda s: SemanticMemoryRepository(s).create_if_absent(memory()),
+        )
+
+        assert len({stored.memory_id for stored, _ in results}) == 1
+        assert sum(created for _, created in results) == 1
+        assert await _count(
+            test_db_session,
+            select(func.count()).where(SemanticMemoryModel.content_hash == "upsert-hash"),
+        ) == 1
+        found = await SemanticMemoryRepository(test_db_session).find_by_content_hash(
+            "upsert-hash", "upsert_user"
+        )
+        assert found is not None
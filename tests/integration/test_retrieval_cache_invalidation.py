@@ -0,0 +1,67 @@
+"""Integration test: semantic memory commits invalidate the retrieval cache.
+
+Requires the test database migrated to head.
+"""
+
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+
+from src.domain.entities.semantic_memory import SemanticMemory
+from src.domain.value_objects.memory_candidate import MemoryCandidate
+from src.domain.value_objects.query_context import QueryContext
+from src.infrastructure.cache import SemanticQueryCache, register_orm_invalidation
+from src.infrastructure.database.repositories.semantic_memory_repository import (
+    SemanticMemoryRepository,
+)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_commit_invalidates_only_the_writing_user(test_db_session):
+    cache = SemanticQueryCache()
+    register_orm_invalidation(cache)
+    embedding = np.random.default_rng(34).random(1536)
+    candidate = MemoryCandidate(
+        memory_id=1,
+        memory_type="summary",
+        content="cached",
+        entities=[],
+        embedding=embedding,
+        created_at=datetime.now(UTC),
+        importance=0.5,
+    )
+    contexts = {
+        user: QueryContext(query_text="q", query_embedding=embedding, entity_ids=[], user_id=user)
+        for user in ("cache_writer", "cache_bystander")
+    }
+    for user, context in contexts.items():
+        cache.store(context, 10, None, [candidate], cache.generation(user))
+
+    repo = SemanticMemoryRepository(test_db_session)
+    memory = await repo.create(
+        SemanticMemory(
+            user_id="cache_writer",
+            content="Acme moved to NET45",
+            entities=["customer_acme"],
+            confidence=0.8,
+            importance=0.6,
+            embedding=embedding.tolist(),
+        )
+    )
+    # Flushed but uncommitted writes do not invalidate yet
+    assert cache.lookup(contexts["cache_writer"], top_k=10) is not None
+
+    await test_db_session.commit()
+
+    assert cache.lookup(contexts["cache_writer"], top_k=10) is None
+    assert cache.lookup(contexts["cache_bystander"], top_k=10) is not None
+
+    # Supersession (status update) invalidates again
+    cache.store(contexts["cache_writer"], 10, None, [candidate], cache.generation("cache_writer"))
+    memory.status = "superseded"
+    await repo.update(memory)
+    await test_db_session.commit()
+
+    assert cache.lookup(contexts["cache_writer"], top_k=10) is None
@@ -0,0 +1,67 @@
+"""Integration test: branch sessions of a unit of work overlap for real.
+
+Requires the test database.
+"""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.unit_of_work import UnitOfWork
+
+SLEEP_SECONDS = 0.3
+
+
+async def _sleep_query(session: AsyncSession) -> None:
+    await session.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": SLEEP_SECONDS})
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_branch_sessions_run_concurrently(test_db_engine):
+    factory = async_sessionmaker(test_db_engine, expire_on_commit=False)
+
+    async with factory() as primary:
+        async with UnitOfWork(primary, factory) as uow:
+            start = time.perf_counter()
+            await asyncio.gather(_sleep_query(uow.branch()), _sleep_query(uow.branch()))
+            parallel = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await _sleep_query(primary)
+        await _sleep_query(primary)
+        serial = time.perf_counter() - start
+
+    # Two pooled connections: both sleeps overlap instead of queueing
+    assert parallel < 1.5 * SLEEP_SECONDS
+    assert serial >= 2 * SLEEP_SECONDS
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_branch_writes_commit_at_the_commit_point(test_db_engine):
+    factory = async_sessionmaker(test_db_engine, expire_on_commit=False)
+    table = "uow_commit_point_probe"
+
+    async with factory() as setup:
+        await setup.execute(text(f"CREATE TABLE IF NOT EXISTS {table} (value int)"))
+        await setup.execute(text(f"TRUNCATE {table}"))
+        await setup.commit()
+
+    try:
+        async with factory() as primary:
+            async with UnitOfWork(primary, factory) as uow:
+                await uow.branch().execute(text(f"INSERT INTO {table} VALUES (1)"))
+                async with factory() as observer:
+                    # Not visible before the commit point
+                    assert (await observer.execute(text(f"SELECT count(*) FROM {table}"))).scalar_one() == 0
+
+            async with factory() as observer:
+                assert (await observer.execute(text(f"SELECT count(*) FROM {table}"))).scalar_one() == 1
+    finally:
+        async with factory() as cleanup:
+            await cleanup.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            await cleanup.commit()
@@ -0,0 +1,138 @@
+"""
+Performance Tests: PII scanning throughput
+
+Compares the throughput (MB/s) of PII redaction with one regex pass per PII
+type (previous behaviour) and with the single-pass combined scanner of
+PIIRedactionService, on two corpora:
+- chat messages: the demo scenario queries, mostly without PII, with a few
+  carrying phone numbers, emails, SSNs and card numbers
+- a large pasted document (invoice lines with contacts), redacted in one
+  call and streamed in 64 KiB chunks
+
+Also checks that scan time stays linear on adversarial input: one long
+unbroken (or dot-separated) word followed by an email address.
+
+No database or network access.
+"""
+import importlib
+import time
+from collections.abc import Callable
+
+import pytest
+
+from src.domain.services.pii_redaction_service import PIIRedactionService, RedactionResult
+from src.domain.services.pii_redaction_service import logger as pii_logger
+
+
+@pytest.fixture
+def message_corpus(monkeypatch) -> list[str]:
+    monkeypatch.setenv("DEMO_MODE_ENABLED", "true")
+    registry = importlib.import_module("src.demo.services.scenario_registry")
+    queries = [s.expected_query for s in registry.ScenarioRegistry.get_all()]
+    with_pii = [
+        "Remember my personal cell: 415-555-0199 for urgent alerts.",
+        "Send the statement to ap@kaimedia.com and cc ops@tcboiler.com.",
+        "Her SSN is 123-45-6789, card on file 4111 1111 1111 1111.",
+    ]
+    return (queries + with_pii) * 200
+
+
+@pytest.fixture
+def pasted_document() -> str:
+    lines = [
+        f"INV-{2200 + i}: ${1000 + 17 * i:,.2f} due 2025-{1 + i % 12:02d}-15, "
+        f"contact billing{i}@example.com or (415) 555-{1000 + i % 9000:04d}. "
+        "Payment terms net 30, deliver on Fridays."
+        for i in range(2_000)
+    ]
+    return "\n".join(lines)
+
+
+def _legacy_redact(service: PIIRedactionService, text: str) -> RedactionResult:
+    """Previous redact_with_metadata: one finditer pass per PII type."""
+    if not text:
+        return RedactionResult(text, text, [], False)
+
+    redacted = text
+    redactions = []
+    for pii_type, pattern in service.PII_PATTERNS.items():
+        for match in list(pattern.finditer(redacted)):
+            original_value = match.group()
+            token = f"[{pii_type.upper()}-REDACTED]"
+            redacted = redacted.replace(original_value, token, 1)
+            redactions.append(
+                {"type": pii_type, "original_length": len(original_value), "token": token}
+            )
+            pii_logger.warning(
+                "pii_redacted", pii_type=pii_type, original_length=len(original_value)
+            )
+    return RedactionResult(text, redacted, redactions, len(redactions) > 0)
+
+
+def _throughput(texts: list[str], redact: Callable[[str], object]) -> float:
+    """Best-of-three throughput in MB/s."""
+    size_mb = sum(len(t.encode()) for t in texts) / 1e6
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for text in texts:
+            redact(text)
+        best = min(best, time.perf_counter() - started)
+    return size_mb / best
+
+
+@pytest.mark.benchmark
+def test_single_pass_scanner_throughput(message_corpus, pasted_document):
+    service = PIIRedactionService()
+
+    # Same redactions on corpora without overlapping PII
+    for text in [*message_corpus[:50], pasted_document[:20_000]]:
+        assert service.redact(text) == _legacy_redact(service, text).redacted_text
+
+    legacy_messages = _throughput(message_corpus, lambda t: _legacy_redact(service, t))
+    scanner_messages = _throughput(message_corpus, service.redact_with_metadata)
+    legacy_document = _throughput([pasted_document], lambda t: _legacy_redact(service, t))
+    scanner_document = _throughput([pasted_document], service.redact_with_metadata)
+
+    chunks = [pasted_document[i : i + 65536] for i in range(0, len(pasted_document), 65536)]
+    streamed = "".join(r.redacted_text for r in service.redact_stream(chunks))
+    assert streamed == service.redact(pasted_document)
+    stream_document = _throughput(
+        [pasted_document],
+        lambda t: list(service.redact_stream(t[i : i + 65536] for i in range(0, len(t), 65536))),
+    )
+
+    print(
+        f"\nPII scan MB/s: messages legacy={legacy_messages:.1f} single-pass={scanner_messages:.1f}"
+        f"; document ({len(pasted_document) / 1e6:.1f} MB) legacy={legacy_document:.1f}"
+        f" single-pass={scanner_document:.1f} streamed={stream_document:.1f}"
+    )
+    assert scanner_messages > legacy_messages
+    assert scanner_document > legacy_document
+
+
+def _best_seconds(redact: Callable[[str], object], text: str) -> float:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        redact(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("word", ["a", "a."], ids=["unbroken", "dotted"])
+def test_long_word_with_email_scans_in_linear_time(word):
+    service = PIIRedactionService()
+
+    def adversarial(length: int) -> str:
+        return word * (length // len(word)) + " contact me@x.com"
+
+    assert service.redact(adversarial(5_000)).endswith(" contact [EMAIL-REDACTED]")
+    small = _best_seconds(service.redact, adversarial(5_000))
+    large = _best_seconds(service.redact, adversarial(40_000))
+
+    print(f"\nPII scan, {word!r} run + email: 5k chars={small:.4f}s, 40k chars={large:.4f}s")
+    # 8x the input: linear is ~8x the time, quadratic ~64x
+    assert large < 0.25
+    assert large < small * 24 + 0.01
@@ -0,0 +1,201 @@
+"""
+Performance Tests: Per-request chat pipeline construction
+
+Compares wiring ProcessChatMessageUseCase through dependency-injector
+factories on every request (the previous get_process_chat_message_use_case
+and the container factories it used, rebuilt here, including its per-request
+ToolRegistry reflection) with the precompiled
+ChatPipeline, which resolves process-wide services once and only constructs
+session-bound objects per request.
+
+No database or network access: repositories only hold the session object.
+"""
+import time
+from unittest.mock import Mock
+
+import pytest
+from dependency_injector import providers
+
+from src.application.services.adaptive_query_orchestrator import (
+    AdaptiveQueryOrchestrator,
+    _port_tools,
+)
+from src.application.services.post_reply_tasks import PostReplyTaskRunner
+from src.application.use_cases import (
+    AugmentWithDomainUseCase,
+    ExtractSemanticsUseCase,
+    ProcessChatMessageUseCase,
+    ResolveEntitiesUseCase,
+    ScoreMemoriesUseCase,
+)
+from src.domain.services import ConflictResolutionService, EntityResolutionService
+from src.infrastructure.database.repositories import (
+    ChatEventRepository,
+    DomainDatabaseRepository,
+    EntityRepository,
+    PostgresToolUsageRepository,
+    SemanticMemoryRepository,
+)
+from src.infrastructure.di.container import container
+
+ITERATIONS = 2000
+
+# The per-request factories the container used to wire chat with, kept here
+# as the baseline; they resolve the container's singletons on every call
+_entity_repository = providers.Factory(EntityRepository)
+_chat_repository = providers.Factory(ChatEventRepository)
+_semantic_memory_repository = providers.Factory(SemanticMemoryRepository)
+_domain_database_repository = providers.Factory(DomainDatabaseRepository)
+_tool_usage_repository = providers.Factory(PostgresToolUsageRepository)
+_entity_resolution_service = providers.Factory(
+    EntityResolutionService, llm_service=container.llm_service
+)
+_conflict_resolution_service = providers.Factory(ConflictResolutionService)
+_query_orchestrator = providers.Factory(
+    AdaptiveQueryOrchestrator, llm_service=container.llm_service
+)
+_post_reply_tasks = providers.Factory(
+    PostReplyTaskRunner, embedding_service=container.embedding_service
+)
+_resolve_entities = providers.Factory(
+    ResolveEntitiesUseCase,
+    entity_resolution_service=_entity_resolution_service,
+    mention_extractor=container.mention_extractor,
+)
+_extract_semantics = providers.Factory(
+    ExtractSemanticsUseCase,
+    llm_service=container.llm_service,
+    memory_validation_service=container.memory_validation_service,
+    conflict_detection_service=container.conflict_detection_service,
+    conflict_resolution_service=_conflict_resolution_service,
+    embedding_service=container.embedding_service,
+)
+_augment_with_domain = providers.Factory(
+    AugmentWithDomainUseCase, query_orchestrator=_query_orchestrator
+)
+_score_memories = providers.Factory(
+    ScoreMemoriesUseCase,
+    multi_signal_scorer=container.multi_signal_scorer,
+    embedding_service=container.embedding_service,
+)
+_process_chat_message = providers.Factory(
+    ProcessChatMessageUseCase,
+    resolve_entities_use_case=_resolve_entities,
+    extract_semantics_use_case=_extract_semantics,
+    augment_with_domain_use_case=_augment_with_domain,
+    score_memories_use_case=_score_memories,
+    conflict_detection_service=container.conflict_detection_service,
+    conflict_resolution_service=_conflict_resolution_service,
+    llm_reply_generator=container.llm_reply_generator,
+    pii_redaction_service=container.pii_redaction_service,
+)
+
+
+@pytest.fixture(autouse=True)
+def offline_services():
+    """Replace network-backed singletons; construction cost is what's measured."""
+    with (
+        container.llm_service.override(Mock()),
+        container.llm_provider.override(Mock()),
+        container.embedding_service.override(Mock()),
+    ):
+        container.reset_singletons()
+        yield
+    container.reset_singletons()
+
+
+def _build_with_factories(db) -> ProcessChatMessageUseCase:
+    """Previous per-request assembly through dependency-injector factories."""
+    entity_repo = _entity_repository(db)
+    chat_repo = _chat_repository(db)
+    semantic_memory_repo = _semantic_memory_repository(db)
+    domain_db_repo = _domain_database_repository(db)
+    tool_usage_repo = _tool_usage_repository(db)
+
+    entity_resolution_service = _entity_resolution_service(
+        entity_repository=entity_repo,
+        domain_db_port=domain_db_repo,
+    )
+    conflict_resolution_service = _conflict_resolution_service(
+        semantic_memory_repository=semantic_memory_repo,
+    )
+    query_orchestrator = _query_orchestrator(
+        domain_db=domain_db_repo,
+        usage_tracker=tool_usage_repo,
+    )
+    _port_tools.__wrapped__()  # Orchestrators used to reflect ToolRegistry per instance
+
+    return _process_chat_message(
+        chat_repository=chat_repo,
+        resolve_entities_use_case=_resolve_entities(
+            entity_repository=entity_repo,
+            chat_repository=chat_repo,
+            entity_resolution_service=entity_resolution_service,
+        ),
+        extract_semantics_use_case=_extract_semantics(
+            semantic_memory_repository=semantic_memory_repo,
+            conflict_resolution_service=conflict_resolution_service,
+            canonical_entity_repository=entity_repo,
+        ),
+        augment_with_domain_use_case=_augment_with_domain(
+            query_orchestrator=query_orchestrator,
+        ),
+        score_memories_use_case=_score_memories(
+            semantic_memory_repository=semantic_memory_repo,
+        ),
+        conflict_resolution_service=conflict_resolution_service,
+        post_reply_tasks=_post_reply_tasks(
+            semantic_memory_repository=semantic_memory_repo,
+            conflict_resolution_service=conflict_resolution_service,
+            canonical_entity_repository=entity_repo,
+        ),
+        job_queue=None,
+    )
+
+
+def _per_request_us(build, session) -> float:
+    build(session)  # Warm up singletons
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        build(session)
+    return (time.perf_counter() - start) / ITERATIONS * 1_000_000
+
+
+@pytest.mark.benchmark
+def test_precompiled_pipeline_construction_overhead():
+    session = object()
+    pipeline = container.chat_pipeline()
+
+    before_us = _per_request_us(_build_with_factories, session)
+    after_us = _per_request_us(pipeline.build, session)
+
+    print(
+        f"\nPer-request construction: factories={before_us:.1f}us "
+        f"pipeline={after_us:.1f}us ({before_us / after_us:.1f}x)"
+    )
+    assert after_us < before_us
+
+
+@pytest.mark.benchmark
+def test_pipeline_binds_one_session_everywhere():
+    session = object()
+
+    use_case = container.chat_pipeline().build(session)
+
+    assert use_case.chat_repo.session is session
+    assert use_case.resolve_entities.entity_repo is use_case.extract_semantics.canonical_entity_repo
+    assert use_case.augment_with_domain.query_orchestrator.tools is _port_tools()
+
+
+@pytest.mark.benchmark
+def test_augmentation_binds_its_branch_session():
+    session, branch = object(), object()
+
+    use_case = container.chat_pipeline().build(session, augment_session=branch)
+
+    orchestrator = use_case.augment_with_domain.query_orchestrator
+    assert use_case.parallel_augment
+    assert orchestrator.domain_db.session is branch
+    assert orchestrator.tracker.session is branch
+    assert use_case.chat_repo.session is session
+    assert use_case.resolve_entities.resolution_service.domain_db.session is session
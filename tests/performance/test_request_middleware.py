@@ -0,0 +1,122 @@
+"""
+Performance Tests: Request logging middleware overhead
+
+Compares request throughput of a small FastAPI app with the request logging
+middleware implemented on BaseHTTPMiddleware (previous behaviour) and as
+plain ASGI (RequestLoggingMiddleware), with all requests logged and with 10%
+log sampling. Requests are driven as in-process ASGI calls, so the numbers
+are framework overhead only.
+
+No database or network access.
+"""
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message
+
+from src.api.middleware.logging import RequestLoggingMiddleware, logger
+
+REQUESTS = 2000
+
+
+class _BaseHTTPRequestLogging(BaseHTTPMiddleware):
+    """Previous RequestLoggingMiddleware: request ID, metrics and two log events."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        request_id = str(uuid.uuid4())
+        start_time = time.time()
+        user_id = request.headers.get("x-user-id", None)
+        logger.info(
+            "http_request_start",
+            request_id=request_id,
+            method=request.method,
+            path=request.url.path,
+            query_params=dict(request.query_params),
+            user_id=user_id,
+            client_host=request.client.host if request.client else None,
+        )
+        response = await call_next(request)
+        duration_seconds = time.time() - start_time
+        RequestLoggingMiddleware._record_metrics(
+            request.scope, response.status_code, duration_seconds, user_id
+        )
+        logger.info(
+            "http_request_complete",
+            request_id=request_id,
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration_ms=round(duration_seconds * 1000, 2),
+            user_id=user_id,
+        )
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+def _app(middleware: type | None, **kwargs) -> ASGIApp:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware, **kwargs)
+
+    @app.get("/bench/items/{item_id}")
+    async def item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    return app
+
+
+async def _requests_per_second(app: ASGIApp) -> float:
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        return None
+
+    def scope(i: int) -> dict:
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/bench/items/{i}",
+            "raw_path": f"/bench/items/{i}".encode(),
+            "query_string": b"verbose=1",
+            "headers": [(b"host", b"testserver"), (b"x-user-id", b"user_1")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+
+    for i in range(100):  # Warm-up
+        await app(scope(i), receive, send)
+
+    started = time.perf_counter()
+    for i in range(REQUESTS):
+        await app(scope(i), receive, send)
+    return REQUESTS / (time.perf_counter() - started)
+
+
+@pytest.mark.benchmark
+def test_asgi_middleware_throughput():
+    async def run() -> dict[str, float]:
+        return {
+            "no middleware": await _requests_per_second(_app(None)),
+            "BaseHTTPMiddleware": await _requests_per_second(_app(_BaseHTTPRequestLogging)),
+            "ASGI": await _requests_per_second(_app(RequestLoggingMiddleware)),
+            "ASGI, 10% logged": await _requests_per_second(
+                _app(RequestLoggingMiddleware, log_sample_rate=0.1)
+            ),
+        }
+
+    rps = asyncio.run(run())
+
+    print("\nRequests/s: " + ", ".join(f"{name}={value:,.0f}" for name, value in rps.items()))
+    assert rps["ASGI"] > rps["BaseHTTPMiddleware"]
+    assert rps["ASGI, 10% logged"] > rps["ASGI"]
@@ -0,0 +1,146 @@
+"""
+Performance Tests: Chat response serialization
+
+Times serializing a chat response with 50 domain facts and 20 retrieved
+memories, through FastAPI's default path (jsonable_encoder copy, then
+json.dumps in JSONResponse) and through ORJSONResponse. Covers the
+simplified endpoint's dict (numpy scores, Decimal amounts, datetimes in
+fact metadata) and the enhanced endpoint's Pydantic model.
+
+No database or network access; skipped without orjson.
+"""
+import json
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.api.models import DomainFactResponse, EnhancedChatResponse, RetrievedMemoryResponse
+from src.api.responses import ORJSONResponse, fast_json_available
+
+pytestmark = pytest.mark.skipif(not fast_json_available(), reason="orjson not installed")
+
+FACTS = 50
+MEMORIES = 20
+ITERATIONS = 500
+NOW = datetime(2025, 10, 18, 16, 0, tzinfo=UTC)
+
+
+def _chat_dict(numpy_scores: bool = True) -> dict[str, Any]:
+    scores = np.linspace(0.99, 0.5, MEMORIES)
+    if not numpy_scores:  # jsonable_encoder has no numpy support
+        scores = scores.tolist()
+    return {
+        "response": "Kai Media has two open invoices totalling $3,450.00. " * 4,
+        "augmentation": {
+            "domain_facts": [
+                {
+                    "fact_type": "invoice_status",
+                    "entity_id": f"customer:{uuid.UUID(int=i)}",
+                    "table": "domain.invoices",
+                    "content": f"Invoice INV-{1000 + i}: ${1200 + i}.50 due (status: open)",
+                    "metadata": {
+                        "invoice_id": uuid.UUID(int=FACTS + i),
+                        "invoice_number": f"INV-{1000 + i}",
+                        "amount": Decimal(f"{1200 + i}.50"),
+                        "balance": Decimal(f"{600 + i}.25"),
+                        "due_date": date(2025, 11, 1) + timedelta(days=i),
+                        "issued_at": NOW - timedelta(days=30 + i),
+                        "line_items": [{"sku": f"SKU-{j}", "qty": j} for j in range(5)],
+                    },
+                }
+                for i in range(FACTS)
+            ],
+            "memories_retrieved": [
+                {
+                    "memory_id": i,
+                    "memory_type": "semantic",
+                    "content": f"Kai Media prefers NET{30 + i} payment terms and Friday deliveries",
+                    "relevance_score": scores[i],
+                    "confidence": scores[-1 - i],
+                    "entities": [f"customer:{i}", f"order:{i}"],
+                }
+                for i in range(MEMORIES)
+            ],
+            "entities_resolved": [],
+        },
+        "memories_created": [
+            {"memory_type": "episodic", "summary": "User said: invoices?", "event_id": 7},
+        ],
+    }
+
+
+def _chat_model() -> EnhancedChatResponse:
+    chat = _chat_dict(numpy_scores=False)["augmentation"]
+    return EnhancedChatResponse(
+        event_id=7,
+        session_id=uuid.UUID(int=0),
+        domain_facts=[
+            DomainFactResponse(
+                fact_type=fact["fact_type"],
+                entity_id=fact["entity_id"],
+                content=fact["content"],
+                metadata=fact["metadata"],
+                source_table=fact["table"],
+                source_rows=[str(fact["metadata"]["invoice_id"])],
+            )
+            for fact in chat["domain_facts"]
+        ],
+        retrieved_memories=[
+            RetrievedMemoryResponse(
+                memory_id=memory["memory_id"],
+                memory_type=memory["memory_type"],
+                content=memory["content"],
+                relevance_score=memory["relevance_score"],
+                confidence=memory["confidence"],
+            )
+            for memory in chat["memories_retrieved"]
+        ],
+        reply="Kai Media has two open invoices.",
+        mention_count=1,
+        memory_count=MEMORIES,
+        created_at=NOW,
+    )
+
+
+def _default_body(content: Any) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def _fast_body(content: Any) -> bytes:
+    return ORJSONResponse(content).body
+
+
+def _ms_per_response(render: Callable[[Any], bytes], content: Any) -> float:
+    for _ in range(20):  # Warm-up
+        render(content)
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        render(content)
+    return (time.perf_counter() - started) * 1000 / ITERATIONS
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(("name", "build"), [("dict", _chat_dict), ("model", _chat_model)])
+def test_fast_response_serialization(name, build):
+    content = build()
+    default_content = _chat_dict(numpy_scores=False) if name == "dict" else content
+
+    assert json.loads(_fast_body(content)) == json.loads(_default_body(default_content))
+
+    default_ms = _ms_per_response(_default_body, default_content)
+    fast_ms = _ms_per_response(_fast_body, content)
+
+    print(
+        f"\n{name} response ({FACTS} facts, {MEMORIES} memories): "
+        f"default={default_ms:.3f} ms, orjson={fast_ms:.3f} ms "
+        f"({default_ms / fast_ms:.1f}x)"
+    )
+    assert fast_ms * 2 < default_ms
@@ -0,0 +1,165 @@
+"""
+Performance Tests: Tool result encoding in the tool-calling loop
+
+Compares the prompt size of the LLM tool-calling loop when tool results are
+sent as JSON-serialized DomainFacts (previous behaviour) and as compact
+tables with per-augmentation deltas (ToolResultEncoder).
+
+Facts are built from the seeded demo scenarios in the shapes the domain
+database repository returns. Each scenario runs a simulated orchestration:
+invoices and work orders per customer, then the order chain per sales order,
+then the invoices again (a repeated call), then a final turn without tools.
+Input tokens are estimated with TOKENS_PER_CHAR and summed over every LLM
+call, since each call re-sends the whole conversation.
+
+No database or network access.
+"""
+import importlib
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from src.application.services.tool_result_encoder import ToolResultEncoder
+from src.config.heuristics import TOKENS_PER_CHAR
+from src.domain.value_objects.domain_fact import DomainFact
+
+
+@pytest.fixture
+def scenarios(monkeypatch):
+    monkeypatch.setenv("DEMO_MODE_ENABLED", "true")
+    registry = importlib.import_module("src.demo.services.scenario_registry")
+    return registry.ScenarioRegistry.get_all()
+
+
+def _id(*parts: object) -> str:
+    return "-".join(str(p).lower().replace(" ", "") for p in parts)
+
+
+def _invoice_facts(setup, customer) -> list[DomainFact]:
+    orders = {so.so_number for so in setup.sales_orders if so.customer_name == customer.name}
+    return [
+        DomainFact(
+            fact_type="invoice_status",
+            entity_id=f"customer:{_id(customer.name)}",
+            content=f"Invoice {inv.invoice_number}: ${inv.amount:,.2f} due {inv.due_date} (status: {inv.status})",
+            metadata={
+                "invoice_number": inv.invoice_number,
+                "amount": float(inv.amount),
+                "paid": 0.0,
+                "balance": float(inv.amount),
+                "due_date": inv.due_date.isoformat(),
+                "status": inv.status,
+                "invoice_id": _id("invoice", inv.invoice_number),
+            },
+            source_table="domain.invoices",
+            source_rows=[_id("invoice", inv.invoice_number)],
+            retrieved_at=datetime.now(UTC),
+        )
+        for inv in setup.invoices
+        if inv.sales_order_number in orders
+    ]
+
+
+def _work_order_facts(setup, customer) -> list[DomainFact]:
+    orders = {so.so_number: so for so in setup.sales_orders if so.customer_name == customer.name}
+    return [
+        DomainFact(
+            fact_type="work_order_status",
+            entity_id=f"customer:{_id(customer.name)}",
+            content=f"Work order: {wo.description} | Status: {wo.status} | Technician: {wo.technician}",
+            metadata={
+                "wo_id": _id("wo", wo.description),
+                "description": wo.description,
+                "status": wo.status,
+                "technician": wo.technician,
+                "scheduled_for": wo.scheduled_for.isoformat() if wo.scheduled_for else None,
+                "so_number": wo.sales_order_number,
+                "so_title": orders[wo.sales_order_number].title,
+                "customer_name": customer.name,
+            },
+            source_table="domain.work_orders",
+            source_rows=[_id("wo", wo.description)],
+            retrieved_at=datetime.now(UTC),
+        )
+        for wo in setup.work_orders
+        if wo.sales_order_number in orders
+    ]
+
+
+def _order_chain_facts(setup, so) -> list[DomainFact]:
+    work_orders = [
+        {"description": wo.description, "status": wo.status, "technician": wo.technician}
+        for wo in setup.work_orders
+        if wo.sales_order_number == so.so_number
+    ]
+    invoices = [
+        {"invoice_number": inv.invoice_number, "amount": float(inv.amount), "status": inv.status}
+        for inv in setup.invoices
+        if inv.sales_order_number == so.so_number
+    ]
+    done = sum(wo["status"] == "done" for wo in work_orders)
+    return [
+        DomainFact(
+            fact_type="order_chain",
+            entity_id=f"sales_order_{_id(so.so_number)}",
+            content=f"{so.so_number} ({so.title}): {done}/{len(work_orders)} work orders done, {len(invoices)} invoices",
+            metadata={
+                "so_number": so.so_number,
+                "so_title": so.title,
+                "so_status": so.status,
+                "work_orders": work_orders,
+                "invoices": invoices,
+                "total_wo": len(work_orders),
+                "done_wo": done,
+                "recommended_action": "generate_invoice" if work_orders and done == len(work_orders) else "none",
+            },
+            source_table="domain.sales_orders,work_orders,invoices",
+            source_rows=[_id("so", so.so_number)],
+            retrieved_at=datetime.now(UTC),
+        )
+    ]
+
+
+def _tool_rounds(setup) -> list[list[list[DomainFact]]]:
+    """Tool results per iteration (one list of facts per tool call)."""
+    invoices = [_invoice_facts(setup, c) for c in setup.customers]
+    return [
+        invoices + [_work_order_facts(setup, c) for c in setup.customers],
+        [_order_chain_facts(setup, so) for so in setup.sales_orders],
+        invoices,
+    ]
+
+
+def _json_encode(result: list[DomainFact]) -> str:
+    return json.dumps([fact.to_api_response() for fact in result], default=str)
+
+
+def _loop_input_tokens(rounds: list[list[list[DomainFact]]], encode) -> int:
+    """Estimated input tokens summed over every LLM call of the loop."""
+    conversation_chars = 0
+    total_chars = 0
+    for round_results in rounds:
+        total_chars += conversation_chars
+        conversation_chars += sum(len(encode(result)) for result in round_results)
+    total_chars += conversation_chars  # Final call without tool use
+    return int(total_chars * TOKENS_PER_CHAR)
+
+
+@pytest.mark.benchmark
+def test_compact_encoding_reduces_tool_loop_tokens(scenarios):
+    json_tokens = 0
+    compact_tokens = 0
+    for scenario in scenarios:
+        rounds = _tool_rounds(scenario.domain_setup)
+        encoder = ToolResultEncoder()
+        json_tokens += _loop_input_tokens(rounds, _json_encode)
+        compact_tokens += _loop_input_tokens(rounds, encoder.encode)
+
+    saved = 1 - compact_tokens / json_tokens
+    print(
+        f"\nTool-loop input tokens over {len(scenarios)} scenarios: "
+        f"json={json_tokens} compact={compact_tokens} ({saved:.0%} saved)"
+    )
+    assert saved > 0.4
@@ -0,0 +1,85 @@
+"""Unit tests for the pure-ASGI request logging middleware."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from structlog.testing import capture_logs
+
+from src.api.middleware.logging import RequestLoggingMiddleware
+
+
+def _app(**middleware_kwargs) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware, **middleware_kwargs)
+
+    @app.get("/mw-test/ok")
+    async def ok() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/mw-test/fail")
+    async def fail() -> None:
+        raise RuntimeError("boom")
+
+    @app.get("/mw-test/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(3):
+                yield f"chunk{i};".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/mw-test/health")
+    async def health() -> dict[str, str]:
+        return {"status": "up"}
+
+    return app
+
+
+def _count(endpoint: str, status_code: str) -> float:
+    labels = {"method": "GET", "endpoint": endpoint, "status_code": status_code}
+    return REGISTRY.get_sample_value("http_requests_total", labels) or 0.0
+
+
+@pytest.mark.unit
+def test_request_id_header_and_streaming_passthrough():
+    client = TestClient(_app())
+
+    with client.stream("GET", "/mw-test/stream") as response:
+        body = list(response.iter_bytes())
+
+    assert response.headers["x-request-id"]
+    assert b"".join(body) == b"chunk0;chunk1;chunk2;"
+    assert client.get("/mw-test/ok").headers["x-request-id"] != response.headers["x-request-id"]
+
+
+@pytest.mark.unit
+def test_excluded_paths_skip_metrics_and_request_id():
+    client = TestClient(_app(exclude_paths=["/mw-test/health"]))
+    before = _count("/mw-test/health", "200")
+
+    response = client.get("/mw-test/health")
+
+    assert response.status_code == 200
+    assert "x-request-id" not in response.headers
+    assert _count("/mw-test/health", "200") == before
+
+
+@pytest.mark.unit
+def test_unsampled_requests_are_counted_but_failures_always_logged():
+    client = TestClient(_app(log_sample_rate=0.0), raise_server_exceptions=False)
+    before = _count("/mw-test/ok", "200"), _count("/mw-test/fail", "500")
+
+    with capture_logs() as logs:
+        client.get("/mw-test/ok")
+        client.get("/mw-test/fail")
+
+    assert (_count("/mw-test/ok", "200"), _count("/mw-test/fail", "500")) == (
+        before[0] + 1,
+        before[1] + 1,
+    )
+    events = [entry["event"] for entry in logs if entry["event"].startswith("http_request")]
+    assert events == ["http_request_error"]
@@ -0,0 +1,56 @@
+"""Unit tests for the opt-in orjson response path."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.api.responses import ORJSONResponse, fast_json_available, json_response
+
+pytestmark = pytest.mark.skipif(not fast_json_available(), reason="orjson not installed")
+
+
+def _app(fast_json_responses: bool) -> FastAPI:
+    app = FastAPI()
+    app.state.fast_json_responses = fast_json_responses
+
+    @app.get("/responses-test")
+    async def body(request: Request):
+        return json_response(
+            request,
+            {
+                "amount": Decimal("12.50"),
+                "count": Decimal("3"),
+                "at": datetime(2025, 10, 18, 16, 0, tzinfo=UTC),
+                "tags": {"a"},
+            },
+            status_code=201,
+        )
+
+    return app
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("fast_json_responses", [False, True])
+def test_fast_and_default_paths_render_the_same_json(fast_json_responses):
+    response = TestClient(_app(fast_json_responses)).get("/responses-test")
+
+    assert response.status_code == 201
+    assert response.json() == {
+        "amount": 12.5,
+        "count": 3,
+        "at": "2025-10-18T16:00:00+00:00",
+        "tags": ["a"],
+    }
+
+
+@pytest.mark.unit
+def test_numpy_values_serialize_and_unknown_types_fail():
+    body = ORJSONResponse({"scores": np.array([0.5, 0.25]), "top": np.float32(0.5)}).body
+
+    assert body == b'{"scores":[0.5,0.25],"top":0.5}'
+    with pytest.raises(TypeError):
+        ORJSONResponse({"value": object()})
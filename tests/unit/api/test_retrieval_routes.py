@@ -0,0 +1,137 @@
+"""API tests for the retrieval routes, served through the application.
+
+The retriever's embedding service and candidate generator are mocked; routing,
+request validation, the retriever and response serialization are real.
+"""
+
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_memory_retriever
+from src.api.main import app
+from src.domain.services.memory_retriever import MemoryRetriever
+from src.domain.services.memory_validation_service import MemoryValidationService
+from src.domain.services.multi_signal_scorer import MultiSignalScorer
+from src.domain.value_objects.memory_candidate import MemoryCandidate
+from src.infrastructure.cache import SemanticQueryCache
+from src.infrastructure.di.container import container
+
+HEADERS = {"X-User-Id": "route_user"}
+RNG = np.random.default_rng(33)
+
+
+def _candidate(memory_id: int) -> MemoryCandidate:
+    return MemoryCandidate(
+        memory_id=memory_id,
+        memory_type="semantic",
+        content=f"memory {memory_id}",
+        entities=["customer_1"],
+        embedding=RNG.random(1536),
+        created_at=datetime.now(UTC) - timedelta(days=memory_id),
+        importance=0.6,
+        confidence=0.8,
+    )
+
+
+@pytest.fixture
+def embedding_service() -> AsyncMock:
+    service = AsyncMock()
+    service.generate_embedding.return_value = RNG.random(1536).tolist()
+    service.generate_embeddings_batch.side_effect = lambda queries: [
+        RNG.random(1536).tolist() for _ in queries
+    ]
+    return service
+
+
+@pytest.fixture
+def candidate_generator() -> AsyncMock:
+    generator = AsyncMock()
+    generator.generate_candidates.return_value = [_candidate(1), _candidate(2)]
+    generator.generate_candidates_batch.side_effect = lambda query_contexts, filters=None: [
+        [_candidate(i + 1)] for i in range(len(query_contexts))
+    ]
+    return generator
+
+
+@pytest.fixture
+def query_cache() -> Iterator[SemanticQueryCache]:
+    cache = SemanticQueryCache()
+    container.retrieval_cache.override(providers.Object(cache))
+    yield cache
+    container.retrieval_cache.reset_override()
+
+
+@pytest.fixture
+def client(embedding_service, candidate_generator, query_cache) -> Iterator[TestClient]:
+    retriever = MemoryRetriever(
+        embedding_service=embedding_service,
+        entity_resolver=AsyncMock(),
+        candidate_generator=candidate_generator,
+        scorer=MultiSignalScorer(Mock(spec=MemoryValidationService)),
+        query_cache=container.retrieval_cache(),
+    )
+    app.dependency_overrides[get_memory_retriever] = lambda: retriever
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_memory_retriever)
+
+
+@pytest.mark.unit
+def test_batch_retrieval_embeds_once_and_returns_results_in_order(
+    client, embedding_service, candidate_generator
+):
+    queries = ["invoice status?", "delivery day?", "open tasks?"]
+
+    response = client.post(
+        "/api/v1/retrieve/batch", json={"queries": queries, "top_k": 5}, headers=HEADERS
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["query_context"]["query_text"] for r in results] == queries
+    assert [r["memories"][0]["memory_id"] for r in results] == [1, 2, 3]
+    embedding_service.generate_embeddings_batch.assert_awaited_once_with(queries)
+    candidate_generator.generate_candidates_batch.assert_awaited_once()
+
+
+@pytest.mark.unit
+def test_batch_retrieval_requires_user_header(client):
+    response = client.post("/api/v1/retrieve/batch", json={"queries": ["status?"]})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.unit
+def test_repeated_query_is_served_from_cache(client, candidate_generator):
+    body = {"query": "what's Acme's status?", "top_k": 5}
+
+    first = client.post("/api/v1/retrieve", json=body, headers=HEADERS)
+    second = client.post("/api/v1/retrieve", json=body, headers=HEADERS)
+
+    assert first.status_code == second.status_code == 200
+    assert first.json()["metadata"]["cache_hit"] is False
+    assert second.json()["metadata"]["cache_hit"] is True
+    assert [m["memory_id"] for m in second.json()["memories"]] == [
+        m["memory_id"] for m in first.json()["memories"]
+    ]
+    candidate_generator.generate_candidates.assert_awaited_once()
+
+
+@pytest.mark.unit
+def test_cache_stats_route_reports_hits_and_misses(client):
+    body = {"query": "what's Acme's status?"}
+    for _ in range(3):
+        client.post("/api/v1/retrieve", json=body, headers=HEADERS)
+
+    response = client.get("/api/v1/retrieve/cache/stats")
+
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["enabled"] is True
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
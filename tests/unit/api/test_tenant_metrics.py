@@ -0,0 +1,98 @@
+"""Unit tests for bounded metric labels and the tenant heavy-hitter sketch."""
+
+import itertools
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from src.api.middleware.logging import RequestLoggingMiddleware
+from src.api.tenant_metrics import (
+    TENANT_BUCKETS,
+    UNMATCHED_ROUTE,
+    SpaceSavingSketch,
+    TenantHeavyHitters,
+    tenant_bucket,
+)
+
+
+@pytest.mark.unit
+class TestTenantBucket:
+    def test_stable_and_bounded(self):
+        buckets = {tenant_bucket(f"user_{i}") for i in range(10_000)}
+
+        assert len(buckets) == TENANT_BUCKETS
+        assert tenant_bucket("user_42") == tenant_bucket("user_42")
+        assert tenant_bucket(None) == "none"
+
+
+@pytest.mark.unit
+class TestSpaceSavingSketch:
+    def test_heavy_keys_survive_a_long_tail(self):
+        sketch = SpaceSavingSketch(capacity=10)
+        heavy = itertools.cycle(["acme", "globex"])
+        true_counts = {"acme": 0, "globex": 0}
+        for i in range(5000):
+            if i % 3 == 0:
+                key = next(heavy)
+                true_counts[key] += 1
+            else:
+                key = f"tail_{i}"
+            sketch.add(key)
+
+        top = sketch.top(2)
+        assert len(sketch) == 10
+        assert {entry.key for entry in top} == {"acme", "globex"}
+        for entry in top:
+            # Never underestimates; error bounds the overestimate
+            assert entry.count - entry.error <= true_counts[entry.key] <= entry.count
+
+    def test_rejects_empty_capacity(self):
+        with pytest.raises(ValueError):
+            SpaceSavingSketch(capacity=0)
+
+
+@pytest.mark.unit
+class TestTenantHeavyHitters:
+    def test_sampled_records_are_scaled(self):
+        draws = itertools.cycle([0.1, 0.6])  # Every other request sampled
+        hitters = TenantHeavyHitters(capacity=5, export_top=1, sample_rate=0.5, rng=lambda: next(draws))
+        for _ in range(10):
+            hitters.record("acme", 0.2)
+        hitters.record(None, 1.0)
+
+        (requests,) = hitters.top_requests(1)
+        (seconds,) = hitters.top_seconds(1)
+        assert (requests.key, requests.count) == ("acme", 10.0)
+        assert seconds.count == pytest.approx(2.0)
+
+        families = {family.name: family for family in hitters.collect()}
+        assert families["tenant_top_requests"].samples[0].labels == {"user_id": "acme"}
+
+
+@pytest.mark.unit
+def test_http_metrics_use_route_templates():
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/tenant-metrics-test/{item_id}")
+    async def item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    def count(endpoint: str, status_code: str) -> float:
+        labels = {"method": "GET", "endpoint": endpoint, "status_code": status_code}
+        return REGISTRY.get_sample_value("http_requests_total", labels) or 0.0
+
+    before = count("/tenant-metrics-test/{item_id}", "200"), count(UNMATCHED_ROUTE, "404")
+
+    client = TestClient(app)
+    for item_id in range(3):
+        client.get(f"/tenant-metrics-test/{item_id}", headers={"X-User-Id": "user_1"})
+    client.get("/no-such-route/123")
+
+    after = count("/tenant-metrics-test/{item_id}", "200"), count(UNMATCHED_ROUTE, "404")
+    assert after == (before[0] + 3, before[1] + 1)
+    assert REGISTRY.get_sample_value(
+        "http_requests_total", {"method": "GET", "endpoint": "/tenant-metrics-test/0", "status_code": "200"}
+    ) is None
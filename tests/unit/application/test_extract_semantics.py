@@ -0,0 +1,69 @@
+"""Unit tests for duplicate handling in semantic extraction."""
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.chat_dtos import ResolvedEntityDTO
+from src.application.use_cases.extract_semantics import ExtractSemanticsUseCase
+from src.domain.entities import ChatMessage, SemanticMemory
+
+FACT = {"content": "Acme prefers Friday deliveries", "entities": ["customer:acme"], "confidence": 0.8}
+
+
+def _use_case(semantic_repo: AsyncMock, embedding_service: AsyncMock) -> ExtractSemanticsUseCase:
+    llm_service = AsyncMock()
+    llm_service.extract_semantic_facts.return_value = [FACT]
+    return ExtractSemanticsUseCase(
+        llm_service=llm_service,
+        memory_validation_service=Mock(),
+        conflict_detection_service=AsyncMock(),
+        conflict_resolution_service=AsyncMock(),
+        semantic_memory_repository=semantic_repo,
+        embedding_service=embedding_service,
+    )
+
+
+async def _extract(use_case: ExtractSemanticsUseCase):
+    message = ChatMessage(
+        session_id=uuid4(), user_id="user_1", role="user",
+        content="Acme wants Friday deliveries", event_id=11,
+    )
+    entity = ResolvedEntityDTO(
+        entity_id="customer:acme", canonical_name="Acme", entity_type="customer",
+        mention_text="Acme", confidence=1.0, method="exact",
+    )
+    return await use_case.execute(message, [entity], user_id="user_1")
+
+
+@pytest.mark.unit
+class TestDuplicateFacts:
+    """Known duplicates skip the embedding; new facts use the race-safe insert."""
+
+    async def test_known_duplicate_skips_embedding_and_insert(self):
+        existing = SemanticMemory(
+            user_id="user_1", content=FACT["content"], entities=FACT["entities"],
+            confidence=0.8, importance=0.78, memory_id=5,
+        )
+        semantic_repo, embedding_service = AsyncMock(), AsyncMock()
+        semantic_repo.find_by_entities.return_value = []
+        semantic_repo.find_by_content_hash.return_value = existing
+
+        result = await _extract(_use_case(semantic_repo, embedding_service))
+
+        embedding_service.generate_embedding.assert_not_awaited()
+        semantic_repo.create_if_absent.assert_not_awaited()
+        assert result.semantic_memory_entities == [existing]
+
+    async def test_new_fact_is_embedded_and_inserted_if_absent(self):
+        semantic_repo, embedding_service = AsyncMock(), AsyncMock()
+        semantic_repo.find_by_entities.return_value = []
+        semantic_repo.find_by_content_hash.return_value = None
+        semantic_repo.create_if_absent.side_effect = lambda memory: (memory, True)
+        embedding_service.generate_embedding.return_value = [0.1] * 1536
+
+        result = await _extract(_use_case(semantic_repo, embedding_service))
+
+        embedding_service.generate_embedding.assert_awaited_once_with(FACT["content"])
+        semantic_repo.create_if_absent.assert_awaited_once()
+        assert [m.content for m in result.semantic_memory_entities] == [FACT["content"]]
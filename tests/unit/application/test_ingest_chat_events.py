@@ -0,0 +1,153 @@
+"""Unit tests for bulk chat event ingestion and its deferred extraction."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.services.post_reply_tasks import PostReplyTaskRunner
+from src.application.use_cases import IngestChatEventsUseCase
+from src.domain.entities import ChatMessage
+from src.domain.exceptions import AmbiguousEntityError
+from src.domain.ports import BackgroundJobType
+from src.domain.services import PIIRedactionService
+
+
+def _messages(count: int, role: str = "user") -> list[ChatMessage]:
+    session_id = uuid4()
+    return [
+        ChatMessage(session_id=session_id, user_id="user_test", role=role, content=f"message {i}")
+        for i in range(count)
+    ]
+
+
+def _stored(messages: list[ChatMessage], first_id: int = 1) -> list[ChatMessage]:
+    for offset, message in enumerate(messages):
+        message.event_id = first_id + offset
+    return messages
+
+
+@pytest.mark.unit
+class TestIngestChatEventsUseCase:
+    """Storage, duplicate counting and batched extraction jobs."""
+
+    async def test_queues_extraction_for_new_user_messages_in_batches(self):
+        user_messages = _messages(5)
+        assistant_messages = _messages(2, role="assistant")
+        chat_repo = AsyncMock()
+        chat_repo.create_many.return_value = _stored(user_messages + assistant_messages)
+        job_queue = AsyncMock()
+        job_queue.enqueue.return_value = True
+        use_case = IngestChatEventsUseCase(
+            chat_repo, PIIRedactionService(), job_queue, extraction_batch_size=2
+        )
+
+        output = await use_case.execute(
+            user_messages + assistant_messages + _messages(3), queue_extraction=True
+        )
+
+        assert output.created_event_ids == [1, 2, 3, 4, 5, 6, 7]
+        assert output.duplicate_count == 3
+        assert output.extraction_jobs_enqueued == 3
+        payloads = [call.kwargs["payload"] for call in job_queue.enqueue.await_args_list]
+        assert payloads == [{"event_ids": [1, 2]}, {"event_ids": [3, 4]}, {"event_ids": [5]}]
+        assert {call.kwargs["job_type"] for call in job_queue.enqueue.await_args_list} == {
+            BackgroundJobType.EXTRACT_CHAT_EVENTS
+        }
+
+    async def test_extraction_requires_job_queue(self):
+        use_case = IngestChatEventsUseCase(AsyncMock(), PIIRedactionService(), job_queue=None)
+
+        with pytest.raises(ValueError, match="background jobs"):
+            await use_case.execute(_messages(1), queue_extraction=True)
+
+    async def test_redacts_pii_before_storage_and_queues_policy_memory(self):
+        session_id = uuid4()
+        raw = [
+            ChatMessage(session_id=session_id, user_id="user_test", role="user",
+                        content="Reach Dana at dana@kaimedia.com or 415-555-0199"),
+            ChatMessage(session_id=session_id, user_id="user_test", role="user",
+                        content="Friday delivery works"),
+        ]
+        chat_repo = AsyncMock()
+        chat_repo.create_many.side_effect = lambda messages: _stored(messages)
+        job_queue = AsyncMock()
+        use_case = IngestChatEventsUseCase(chat_repo, PIIRedactionService(), job_queue)
+
+        await use_case.execute(raw)
+
+        stored = chat_repo.create_many.await_args.args[0]
+        assert stored[0].content == "Reach Dana at [EMAIL-REDACTED] or [PHONE-REDACTED]"
+        assert stored[0].content_hash == ChatMessage(
+            session_id=session_id, user_id="user_test", role="user", content=stored[0].content
+        ).content_hash
+        assert stored[1].content == "Friday delivery works"
+        job_queue.enqueue.assert_awaited_once_with(
+            job_type=BackgroundJobType.PII_POLICY_MEMORY,
+            payload={
+                "user_id": "user_test",
+                "event_id": 1,
+                "pii_types": ["email", "phone"],
+                "redaction_count": 2,
+            },
+            idempotency_key="pii_policy_memory:1",
+        )
+
+    async def test_policy_memory_created_inline_without_job_queue(self):
+        chat_repo = AsyncMock()
+        chat_repo.create_many.side_effect = lambda messages: _stored(messages, first_id=7)
+        post_reply_tasks = AsyncMock()
+        use_case = IngestChatEventsUseCase(
+            chat_repo, PIIRedactionService(), post_reply_tasks=post_reply_tasks
+        )
+
+        await use_case.execute(
+            [ChatMessage(session_id=uuid4(), user_id="user_test", role="user",
+                         content="My SSN is 123-45-6789")]
+        )
+
+        post_reply_tasks.run.assert_awaited_once()
+        job_type, payload = post_reply_tasks.run.await_args.args
+        assert job_type == BackgroundJobType.PII_POLICY_MEMORY
+        assert payload["event_id"] == 7
+        assert payload["pii_types"] == ["ssn"]
+
+
+@pytest.mark.unit
+class TestExtractChatEventsTask:
+    """Deferred entity resolution + semantic extraction for imported events."""
+
+    async def test_processes_events_and_skips_failures(self):
+        messages = _stored(_messages(3))
+        chat_repo = AsyncMock()
+        chat_repo.get_by_event_ids.return_value = messages
+        resolve_entities = AsyncMock()
+        resolve_entities.execute.side_effect = [
+            SimpleNamespace(resolved_entities=[]),
+            AmbiguousEntityError("Acme", []),
+            SimpleNamespace(resolved_entities=[]),
+        ]
+        extract_semantics = AsyncMock()
+        runner = PostReplyTaskRunner(
+            semantic_memory_repository=AsyncMock(),
+            embedding_service=AsyncMock(),
+            conflict_resolution_service=AsyncMock(),
+            chat_repository=chat_repo,
+            resolve_entities_use_case=resolve_entities,
+            extract_semantics_use_case=extract_semantics,
+        )
+
+        processed = await runner.extract_chat_events([1, 2, 3])
+
+        assert processed == 2
+        assert [c.kwargs["message"].event_id for c in extract_semantics.execute.await_args_list] == [1, 3]
+
+    async def test_runner_without_extraction_dependencies_rejects_job(self):
+        runner = PostReplyTaskRunner(
+            semantic_memory_repository=AsyncMock(),
+            embedding_service=AsyncMock(),
+            conflict_resolution_service=AsyncMock(),
+        )
+
+        with pytest.raises(ValueError, match="extraction"):
+            await runner.run(BackgroundJobType.EXTRACT_CHAT_EVENTS, {"event_ids": [1]})
@@ -0,0 +1,124 @@
+"""Unit tests for PostReplyTaskRunner and the background job payloads.
+
+Post-reply tasks run at-least-once (queue retries), so they must be idempotent
+and their payloads must survive a JSON round trip.
+"""
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.services.post_reply_tasks import PostReplyTaskRunner
+from src.domain.entities import SemanticMemory
+from src.domain.ports import BackgroundJobType
+from src.domain.value_objects import ConflictResolution, ConflictType, MemoryConflict
+from src.infrastructure.database.repositories.job_queue_repository import (
+    PostgresJobQueueRepository,
+)
+
+
+def _memory(memory_id: int, status: str = "active") -> SemanticMemory:
+    return SemanticMemory(
+        memory_id=memory_id,
+        user_id="user_test",
+        content="Acme prefers Friday deliveries",
+        entities=["customer:acme"],
+        confidence=0.8,
+        importance=0.5,
+        status=status,
+    )
+
+
+@pytest.fixture
+def semantic_repo():
+    repo = AsyncMock()
+    repo.update.side_effect = lambda memory: memory
+    return repo
+
+
+@pytest.fixture
+def runner(semantic_repo):
+    embedding_service = AsyncMock()
+    embedding_service.generate_embedding.return_value = [0.0] * 1536
+    return PostReplyTaskRunner(
+        semantic_memory_repository=semantic_repo,
+        embedding_service=embedding_service,
+        conflict_resolution_service=AsyncMock(),
+        canonical_entity_repository=None,
+    )
+
+
+@pytest.mark.unit
+class TestPostReplyTaskRunner:
+    """Test task dispatch and idempotency."""
+
+    async def test_validate_memories_is_idempotent_per_event(self, runner, semantic_repo):
+        memory = _memory(1, status="aging")
+        semantic_repo.find_by_id.return_value = memory
+
+        await runner.run(
+            BackgroundJobType.VALIDATE_MEMORIES, {"memory_ids": [1], "event_id": 42}
+        )
+        await runner.run(
+            BackgroundJobType.VALIDATE_MEMORIES, {"memory_ids": [1], "event_id": 42}
+        )
+
+        assert memory.status == "active"
+        assert memory.confirmation_count == 1
+        assert semantic_repo.update.await_count == 1
+
+    async def test_mark_aging_skips_non_active_memories(self, runner, semantic_repo):
+        memories = {1: _memory(1), 2: _memory(2, status="aging"), 3: None}
+        semantic_repo.find_by_id.side_effect = lambda memory_id: memories[memory_id]
+
+        updated = await runner.mark_memories_aging([1, 2, 3])
+
+        assert updated == 1
+        assert memories[1].status == "aging"
+
+    async def test_resolve_db_conflicts_from_json_payload(self, runner):
+        conflict = MemoryConflict(
+            conflict_type=ConflictType.MEMORY_VS_DB,
+            new_memory_id=None,
+            existing_memory_id=7,
+            entities=["customer:acme"],
+            existing_content="Invoice INV-1 is open",
+            new_content="Invoice INV-1 is paid",
+            recommended_resolution=ConflictResolution.TRUST_DB,
+            confidence_diff=0.3,
+            temporal_diff_days=None,
+            semantic_similarity=0.9,
+            metadata={"memory_confidence": 0.7},
+        )
+        payload = json.loads(json.dumps({"conflicts": [conflict.to_dict()]}))
+
+        await runner.run(BackgroundJobType.RESOLVE_DB_CONFLICTS, payload)
+
+        resolved = runner.conflict_resolution_service.resolve_conflict.await_args.kwargs["conflict"]
+        assert resolved == conflict
+
+    async def test_pii_policy_memory_created(self, runner, semantic_repo):
+        await runner.run(
+            BackgroundJobType.PII_POLICY_MEMORY,
+            {"user_id": "user_test", "event_id": 5, "pii_types": ["email"], "redaction_count": 1},
+        )
+
+        stored = semantic_repo.create.await_args.args[0]
+        assert stored.entities == ["system_policy"]
+        assert stored.source_event_ids == [5]
+        assert stored.metadata["policy_data"]["detected_types"] == ["email"]
+
+
+@pytest.mark.unit
+class TestRetryBackoff:
+    """Test job retry delay bounds."""
+
+    @pytest.mark.parametrize("attempt", [1, 2, 5, 20])
+    def test_retry_delay_within_exponential_ceiling(self, attempt):
+        ceiling = min(
+            PostgresJobQueueRepository.RETRY_MAX_SECONDS,
+            PostgresJobQueueRepository.RETRY_BASE_SECONDS * 2 ** (attempt - 1),
+        )
+        for _ in range(50):
+            delay = PostgresJobQueueRepository.retry_delay_seconds(attempt)
+            assert 0.0 <= delay <= ceiling
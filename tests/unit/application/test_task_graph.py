@@ -0,0 +1,67 @@
+"""Unit tests for the TaskGraph dependency executor."""
+import asyncio
+import time
+
+import pytest
+
+from src.application.services.task_graph import TaskGraph
+
+
+@pytest.mark.unit
+class TestTaskGraph:
+    """Test scheduling, result passing and failure handling."""
+
+    async def test_independent_nodes_overlap(self):
+        async def sleep_and_return(value: str) -> str:
+            await asyncio.sleep(0.05)
+            return value
+
+        graph = TaskGraph()
+        graph.add("a", lambda: sleep_and_return("a"))
+        graph.add("b", lambda: sleep_and_return("b"))
+        graph.add("c", lambda a, b: sleep_and_return(a + b), after=("a", "b"))
+
+        start = time.perf_counter()
+        results = await graph.run()
+        elapsed = time.perf_counter() - start
+
+        assert results == {"a": "a", "b": "b", "c": "ab"}
+        # a and b run concurrently: ~2 sleeps on the critical path, not 3
+        assert elapsed < 0.14
+        assert set(graph.timings) == {"a", "b", "c"}
+
+    async def test_failure_cancels_pending_nodes_and_reraises(self):
+        cancelled = asyncio.Event()
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def dependent(failing: None) -> None:
+            pytest.fail("dependent of a failed node must not run")
+
+        graph = TaskGraph()
+        graph.add("slow", slow)
+        graph.add("failing", fail)
+        graph.add("dependent", dependent, after=("failing",))
+
+        with pytest.raises(ValueError, match="boom"):
+            await graph.run()
+        assert cancelled.is_set()
+
+    def test_rejects_unknown_dependency(self):
+        graph = TaskGraph()
+        with pytest.raises(ValueError, match="unknown nodes"):
+            graph.add("b", lambda a: a, after=("a",))
+
+    def test_rejects_duplicate_node(self):
+        graph = TaskGraph()
+        graph.add("a", asyncio.sleep)
+        with pytest.raises(ValueError, match="Duplicate"):
+            graph.add("a", asyncio.sleep)
@@ -0,0 +1,157 @@
+"""Unit tests for procedural-memory tool prefetch in domain augmentation."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.services.adaptive_query_orchestrator import (
+    AdaptiveQueryOrchestrator,
+)
+from src.application.services.tool_prefetcher import PrefetchCall, ToolPrefetcher
+from src.domain.entities.procedural_memory import ProceduralMemory
+from src.domain.services.procedural_memory_service import ProceduralMemoryService
+from src.domain.value_objects.domain_fact import DomainFact
+
+CUSTOMER = {
+    "entity_id": "customer_0a1b",
+    "entity_type": "customer",
+    "canonical_name": "Kai Media",
+}
+ORDER = {
+    "entity_id": "sales_order_42",
+    "entity_type": "sales_order",
+    "canonical_name": "SO-1001",
+}
+
+
+def _pattern(anchor: str, tools: list[str], confidence: float, memory_id: int = 1) -> ProceduralMemory:
+    return ProceduralMemory(
+        user_id="user_1",
+        trigger_pattern=f"When {anchor} is called",
+        trigger_features={"anchor_tool": anchor, "entity_types": ["customer"]},
+        action_heuristic=f"Also call: {', '.join(tools)}",
+        action_structure={"action_type": "call_additional_tools", "tools": tools},
+        observed_count=5,
+        confidence=confidence,
+        created_at=datetime.now(UTC),
+        memory_id=memory_id,
+    )
+
+
+def _fact(entity_id: str) -> DomainFact:
+    return DomainFact(
+        fact_type="invoice_status",
+        entity_id=entity_id,
+        content="Invoice INV-1 open",
+        metadata={},
+        source_table="domain.invoices",
+        source_rows=["1"],
+        retrieved_at=datetime.now(UTC),
+    )
+
+
+def _orchestrator(patterns: list[ProceduralMemory]) -> AdaptiveQueryOrchestrator:
+    procedural_repo = AsyncMock()
+    procedural_repo.find_by_trigger_features.return_value = patterns
+    domain_db = AsyncMock()
+    domain_db.get_invoice_status.return_value = [_fact("customer:0a1b")]
+    domain_db.get_order_chain.return_value = [_fact("sales_order:SO-1001")]
+    llm = AsyncMock()
+    llm.chat_with_tools.return_value = SimpleNamespace(tool_calls=[])
+    return AdaptiveQueryOrchestrator(
+        llm_service=llm,
+        domain_db=domain_db,
+        usage_tracker=AsyncMock(),
+        prefetcher=ToolPrefetcher(procedural_repo),
+    )
+
+
+@pytest.mark.unit
+class TestToolPrefetcher:
+    """Binding predicted tools to resolved entities."""
+
+    async def test_binds_arguments_and_skips_unbindable_tools(self):
+        orchestrator = _orchestrator(
+            [_pattern("get_invoice_status", ["get_order_chain", "get_sla_risks"], 0.9)]
+        )
+
+        plan = await orchestrator.prefetcher.predict(
+            "user_1", [CUSTOMER], orchestrator.tools
+        )
+
+        # get_order_chain needs a sales order, so it is left to the LLM
+        assert plan.calls == [
+            PrefetchCall("get_invoice_status", {"customer_id": "0a1b"}),
+            PrefetchCall("get_sla_risks", {"customer_id": "0a1b"}),
+        ]
+        assert plan.skip_llm is False
+        assert plan.pattern_ids == [1]
+
+    async def test_no_plan_without_user_or_patterns(self):
+        orchestrator = _orchestrator([])
+        prefetcher = orchestrator.prefetcher
+
+        assert await prefetcher.predict(None, [CUSTOMER], orchestrator.tools) is None
+        assert await prefetcher.predict("user_1", [CUSTOMER], orchestrator.tools) is None
+
+    async def test_lookup_failure_falls_back_to_llm(self):
+        orchestrator = _orchestrator([])
+        orchestrator.prefetcher.procedural_repo.find_by_trigger_features.side_effect = (
+            RuntimeError("db down")
+        )
+
+        facts = await orchestrator.augment("Any open invoices?", [CUSTOMER], "conv_1", "user_1")
+
+        assert facts == []
+        orchestrator.llm.chat_with_tools.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestOrchestratorPrefetch:
+    """Prefetched results replace or seed the LLM tool loop."""
+
+    async def test_confident_pattern_skips_llm(self):
+        orchestrator = _orchestrator([_pattern("get_invoice_status", ["get_order_chain"], 0.9)])
+
+        facts = await orchestrator.augment(
+            "Any open invoices?", [CUSTOMER, ORDER], "conv_1", user_id="user_1"
+        )
+
+        assert [f.entity_id for f in facts] == ["customer:0a1b", "sales_order:SO-1001"]
+        orchestrator.llm.chat_with_tools.assert_not_awaited()
+        orchestrator.domain_db.get_order_chain.assert_awaited_once_with(
+            sales_order_number="SO-1001"
+        )
+        tools_called = orchestrator.tracker.log_tool_usage.call_args.kwargs["tools_called"]
+        assert all(call["prefetched"] for call in tools_called)
+
+    async def test_results_injected_into_first_llm_turn(self):
+        orchestrator = _orchestrator([_pattern("get_invoice_status", [], 0.75)])
+
+        facts = await orchestrator.augment(
+            "Any open invoices?", [CUSTOMER], "conv_1", user_id="user_1"
+        )
+
+        assert len(facts) == 1
+        messages = orchestrator.llm.chat_with_tools.call_args.kwargs["messages"]
+        assert [m["role"] for m in messages] == ["user", "assistant", "user"]
+        assert messages[1]["content"][0]["id"] == "prefetch_0"
+        assert messages[2]["content"][0]["tool_use_id"] == "prefetch_0"
+
+
+@pytest.mark.unit
+def test_pattern_mining_ignores_prefetched_calls():
+    service = ProceduralMemoryService(AsyncMock(), AsyncMock())
+
+    sequence = service._extract_tool_sequence(
+        {
+            "tools_called": [
+                {"tool": "get_invoice_status", "arguments": {"customer_id": "0a1b"}, "prefetched": True},
+                {"tool": "get_work_orders_for_customer", "arguments": {"customer_id": "0a1b"}},
+            ]
+        }
+    )
+
+    assert sequence["tools"] == ["get_work_orders_for_customer"]
@@ -0,0 +1,67 @@
+"""Unit tests for the compact tool result encoder."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.application.services.tool_result_encoder import ToolResultEncoder
+from src.domain.value_objects.domain_fact import DomainFact
+
+
+def _invoice(number: int, amount: float, status: str = "open") -> DomainFact:
+    return DomainFact(
+        fact_type="invoice_status",
+        entity_id="customer:0a1b",
+        content=f"Invoice INV-{number}: due 2025-09-30 (status: {status})",
+        metadata={
+            "invoice_number": f"INV-{number}",
+            "amount": amount,
+            "paid": 0.0,
+            "status": status,
+            "note": "line one\nline | two",
+        },
+        source_table="domain.invoices",
+        source_rows=[f"row-{number}"],
+        retrieved_at=datetime.now(UTC),
+    )
+
+
+@pytest.mark.unit
+class TestToolResultEncoder:
+    """Tables, truncation, row caps and deltas."""
+
+    def test_table_hoists_constants_and_drops_content_repeats(self):
+        encoded = ToolResultEncoder().encode([_invoice(1, 1200.0), _invoice(2, 80.5)])
+
+        assert encoded.splitlines() == [
+            "invoice_status: 2 rows | entity_id=customer:0a1b | paid=0 | note=line one line / two",
+            "content|amount",
+            "Invoice INV-1: due 2025-09-30 (status: open)|1200",
+            "Invoice INV-2: due 2025-09-30 (status: open)|80.5",
+        ]
+
+    def test_long_fields_truncated_and_rows_capped(self):
+        encoder = ToolResultEncoder(max_rows=2, max_field_chars=20)
+
+        lines = encoder.encode([_invoice(n, float(n)) for n in range(5)]).splitlines()
+
+        assert lines[2] == "Invoice INV-0: due …|0"
+        assert lines[-1] == "(+3 more)"
+
+    def test_later_calls_only_send_new_rows(self):
+        encoder = ToolResultEncoder()
+        encoder.encode([_invoice(1, 10.0)])
+
+        assert encoder.encode([_invoice(1, 10.0)]) == "invoice_status: 1 row, all sent earlier"
+        assert encoder.encode([_invoice(1, 10.0), _invoice(2, 20.0)]).endswith(
+            "(1 row sent earlier omitted)"
+        )
+
+        encoder.reset()
+        assert encoder.encode([_invoice(1, 10.0)]).startswith("invoice_status: 1 row |")
+
+    def test_non_fact_results_are_compact_json(self):
+        encoder = ToolResultEncoder()
+
+        assert encoder.encode([]) == "[]"
+        assert encoder.encode({"error": "Unknown tool: x"}) == '{"error":"Unknown tool: x"}'
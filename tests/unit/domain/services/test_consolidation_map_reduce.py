@@ -0,0 +1,204 @@
+"""Unit tests for incremental map-reduce consolidation."""
+
+import asyncio
+import json
+import re
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.domain.entities.memory_summary import MemorySummary
+from src.domain.entities.semantic_memory import SemanticMemory
+from src.domain.services.consolidation_service import ConsolidationService
+from src.domain.value_objects.consolidation import ConsolidationScope
+from src.domain.value_objects.memory_candidate import MemoryCandidate
+
+ENTITY = "customer:acme"
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _episodic(memory_id: int) -> MemoryCandidate:
+    return MemoryCandidate(
+        memory_id=memory_id,
+        memory_type="episodic",
+        content=f"Episode {memory_id} about Acme",
+        entities=[ENTITY],
+        embedding=np.zeros(1536),
+        created_at=START + timedelta(hours=memory_id),
+        importance=0.5,
+    )
+
+
+def _semantic(memory_id: int) -> SemanticMemory:
+    return SemanticMemory(
+        user_id="user_1",
+        content=f"Acme fact {memory_id}",
+        entities=[ENTITY],
+        confidence=0.7,
+        importance=0.5,
+        memory_id=memory_id,
+        created_at=START + timedelta(hours=memory_id),
+    )
+
+
+class _FakeLLM:
+    """Answers map prompts with a shared key fact and reduce prompts with a merge."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_structured_output(self, prompt: str, **_: object) -> str:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if prompt.startswith("Merge"):
+            return json.dumps({"summary_text": "Merged summary of Acme history"})
+
+        semantic_ids = [int(i) for i in re.findall(r"memory_id: (\d+)", prompt)]
+        return json.dumps(
+            {
+                "summary_text": "Partial summary of Acme episodes",
+                "key_facts": {
+                    "delivery_day": {
+                        "value": "Friday",
+                        "confidence": 0.8,
+                        "reinforced": 1,
+                        "source_memory_ids": semantic_ids[:1],
+                    }
+                },
+                # 999 is not in any chunk and must not be boosted
+                "confirmed_memory_ids": [*semantic_ids, 999],
+            }
+        )
+
+
+def _service(llm: _FakeLLM, **kwargs) -> ConsolidationService:
+    summary_repo = AsyncMock()
+    summary_repo.create.side_effect = lambda summary: summary
+    semantic_repo = AsyncMock()
+    semantic_repo.find_by_id.return_value = None
+    embedding_service = AsyncMock()
+    embedding_service.generate_embedding.return_value = [0.0] * 1536
+    return ConsolidationService(
+        episodic_repo=AsyncMock(),
+        semantic_repo=semantic_repo,
+        summary_repo=summary_repo,
+        chat_repo=AsyncMock(),
+        llm_service=llm,
+        embedding_service=embedding_service,
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+class TestMapReduceConsolidation:
+    """Chunked synthesis, reduction and incremental updates."""
+
+    async def test_chunks_are_mapped_with_bounded_concurrency_and_reduced(self):
+        llm = _FakeLLM(delay=0.01)
+        service = _service(llm, chunk_size=10, max_concurrency=2)
+        episodic = [_episodic(i) for i in range(1, 31)]
+        semantic = [_semantic(i) for i in range(31, 41)]
+
+        summary = await service._consolidate_memories(
+            "user_1", ConsolidationScope.entity_scope(ENTITY), episodic, semantic, None, max_retries=2
+        )
+
+        map_calls = [p for p in llm.prompts if p.startswith("Synthesize")]
+        assert len(map_calls) == 4
+        assert llm.prompts[-1].startswith("Merge")
+        assert llm.max_in_flight == 2
+        assert summary.summary_text == "Merged summary of Acme history"
+        assert summary.key_facts["delivery_day"]["reinforced"] == 4
+        assert summary.source_data["watermark"] == semantic[-1].created_at.isoformat()
+        # Confirmed ids: union of the chunks' own semantic memories
+        boosted = [c.args[0] for c in service._semantic_repo.find_by_id.call_args_list]
+        assert boosted == list(range(31, 41))
+
+    async def test_hierarchical_reduce_when_partials_exceed_fan_in(self):
+        llm = _FakeLLM()
+        service = _service(llm, chunk_size=2, reduce_fan_in=3)
+
+        await service._consolidate_memories(
+            "user_1",
+            ConsolidationScope.entity_scope(ENTITY),
+            [_episodic(i) for i in range(1, 13)],
+            [],
+            None,
+            max_retries=1,
+        )
+
+        # 6 chunks -> 2 group reduces -> 1 final reduce
+        assert sum(p.startswith("Merge") for p in llm.prompts) == 3
+
+    async def test_incremental_update_only_synthesizes_new_memories(self):
+        base = MemorySummary(
+            user_id="user_1",
+            scope_type="entity",
+            scope_identifier=ENTITY,
+            summary_text="Acme prefers Friday deliveries.",
+            key_facts={"delivery_day": {"value": "Friday", "confidence": 0.9, "reinforced": 3}},
+            source_data={"watermark": (START + timedelta(hours=20)).isoformat()},
+            confidence=0.8,
+            created_at=START + timedelta(days=10),
+            summary_id=7,
+        )
+        llm = _FakeLLM()
+        service = _service(llm)
+        scope = ConsolidationScope.entity_scope(ENTITY)
+
+        summary = await service._consolidate_memories(
+            "user_1", scope, [_episodic(i) for i in range(1, 25)], [], base, max_retries=1
+        )
+
+        (prompt,) = llm.prompts
+        assert "Acme prefers Friday deliveries." in prompt
+        assert "Episode 21 about Acme" in prompt
+        assert "Episode 20 about Acme" not in prompt
+        assert summary.supersedes_summary_id == 7
+        assert summary.key_facts["delivery_day"]["reinforced"] == 4
+
+        llm.prompts.clear()
+        unchanged = await service._consolidate_memories(
+            "user_1", scope, [_episodic(i) for i in range(1, 21)], [], base, max_retries=1
+        )
+        assert unchanged is base
+        assert llm.prompts == []
+
+    async def test_entity_fetch_pushes_watermark_and_pages_by_keyset(self):
+        service = _service(_FakeLLM(), page_size=2)
+        memories = [_episodic(i) for i in range(1, 6)]
+
+        async def find_by_entity(user_id, entity_id, since=None, after=None, limit=500):
+            start = 0 if after is None else next(
+                i + 1 for i, m in enumerate(memories) if (m.created_at, m.memory_id) == after
+            )
+            return memories[start : start + limit]
+
+        service._episodic_repo.find_by_entity.side_effect = find_by_entity
+        service._semantic_repo.find_by_entity.return_value = []
+        since = START
+
+        episodic, semantic = await service._fetch_memories(
+            "user_1", ConsolidationScope.entity_scope(ENTITY), since=since
+        )
+
+        assert [m.memory_id for m in episodic] == [1, 2, 3, 4, 5]
+        assert semantic == []
+        calls = service._episodic_repo.find_by_entity.call_args_list
+        assert [c.kwargs["after"] for c in calls] == [
+            None,
+            (memories[1].created_at, 2),
+            (memories[3].created_at, 4),
+        ]
+        assert all(c.kwargs["since"] == since for c in calls)
@@ -32,6 +32,7 @@ def mock_repos():
     episodic_repo = AsyncMock()
     semantic_repo = AsyncMock()
     summary_repo = AsyncMock()
+    summary_repo.find_latest_by_scope = AsyncMock(return_value=None)  # First consolidation
     chat_repo = AsyncMock()
     return episodic_repo, semantic_repo, summary_repo, chat_repo
 
@@ -125,7 +126,7 @@ class TestConsolidateEntity:
             for i in range(15)
         ]
 
-        episodic_repo.find_recent = AsyncMock(return_value=episodic_memories)
+        episodic_repo.find_by_entity = AsyncMock(return_value=episodic_memories)
         semantic_repo.find_by_entity = AsyncMock(return_value=[])
 
         # Mock summary creation
@@ -151,7 +152,7 @@ class TestConsolidateEntity:
         assert result.confidence == 0.8  # Default LLM success confidence
 
         # Verify repository calls
-        episodic_repo.find_recent.assert_called_once()
+        episodic_repo.find_by_entity.assert_called_once()
         summary_repo.create.assert_called_once()
 
     async def test_consolidate_entity_below_threshold_proceeds(
@@ -179,7 +180,7 @@ class TestConsolidateEntity:
             for i in range(5)
         ]
 
-        episodic_repo.find_recent = AsyncMock(return_value=episodic_memories)
+        episodic_repo.find_by_entity = AsyncMock(return_value=episodic_memories)
         semantic_repo.find_by_entity = AsyncMock(return_value=[])
         summary_repo.create = AsyncMock(
             side_effect=lambda s: type("Summary", (), {**s.__dict__, "summary_id": 1})()
@@ -216,7 +217,7 @@ class TestConsolidateEntity:
             for i in range(12)
         ]
 
-        episodic_repo.find_recent = AsyncMock(return_value=episodic_memories)
+        episodic_repo.find_by_entity = AsyncMock(return_value=episodic_memories)
         summary_repo.create = AsyncMock(
             side_effect=lambda s: type("Summary", (), {**s.__dict__, "summary_id": 1})()
         )
@@ -264,17 +265,10 @@ class TestConsolidateSessionWindow:
         session_2 = uuid4()
         session_3 = uuid4()
 
-        chat_messages = [
-            type("ChatMessage", (), {"session_id": session_3, "created_at": datetime.now(UTC)})(),
-            type("ChatMessage", (), {"session_id": session_3, "created_at": datetime.now(UTC) - timedelta(hours=1)})(),
-            type("ChatMessage", (), {"session_id": session_2, "created_at": datetime.now(UTC) - timedelta(hours=2)})(),
-            type("ChatMessage", (), {"session_id": session_2, "created_at": datetime.now(UTC) - timedelta(hours=3)})(),
-            type("ChatMessage", (), {"session_id": session_1, "created_at": datetime.now(UTC) - timedelta(hours=4)})(),
-            type("ChatMessage", (), {"session_id": session_1, "created_at": datetime.now(UTC) - timedelta(hours=5)})(),
-        ]
-
-        # Mock chat repository to return recent messages
-        chat_repo.get_recent_for_user = AsyncMock(return_value=chat_messages)
+        # Mock chat repository to return recent sessions (most recent first)
+        chat_repo.get_recent_session_ids = AsyncMock(
+            return_value=[session_3, session_2, session_1]
+        )
 
         # Mock episodic memories for each session
         episodic_memories_s1 = [
@@ -314,17 +308,10 @@ class TestConsolidateSessionWindow:
             for i in range(3)
         ]
 
-        # Setup episodic repo to return different memories for each session
-        async def mock_find_recent(user_id, limit, session_id=None):
-            if session_id == session_1:
-                return episodic_memories_s1
-            elif session_id == session_2:
-                return episodic_memories_s2
-            elif session_id == session_3:
-                return episodic_memories_s3
-            return []
-
-        episodic_repo.find_recent = AsyncMock(side_effect=mock_find_recent)
+        # Setup episodic repo to return the memories of all sessions in one query
+        episodic_repo.find_by_sessions = AsyncMock(
+            return_value=episodic_memories_s1 + episodic_memories_s2 + episodic_memories_s3
+        )
 
         # Mock summary creation
         summary_repo.create = AsyncMock(
@@ -343,11 +330,12 @@ class TestConsolidateSessionWindow:
         assert result.scope_identifier == str(num_sessions)
         assert result.confidence == 0.8  # Default LLM success confidence
 
-        # Verify chat repository was called to get recent messages
-        chat_repo.get_recent_for_user.assert_called_once()
+        # Verify chat repository was called to get recent sessions
+        chat_repo.get_recent_session_ids.assert_called_once()
 
-        # Verify episodic repo was called for each session
-        assert episodic_repo.find_recent.call_count == 3
+        # Verify episodic memories of all sessions were fetched in one query
+        episodic_repo.find_by_sessions.assert_called_once()
+        assert episodic_repo.find_by_sessions.call_args.args[1] == [session_3, session_2, session_1]
 
         # Verify summary was created
         summary_repo.create.assert_called_once()
@@ -361,8 +349,8 @@ class TestConsolidateSessionWindow:
         user_id = "test_user"
         num_sessions = 3
 
-        # Mock no chat messages
-        chat_repo.get_recent_for_user = AsyncMock(return_value=[])
+        # Mock no chat sessions
+        chat_repo.get_recent_session_ids = AsyncMock(return_value=[])
 
         # Mock summary creation for fallback
         summary_repo.create = AsyncMock(
@@ -465,7 +453,7 @@ class TestEdgeCases:
         entity_id = "customer:test_123"
 
         # No memories
-        episodic_repo.find_recent = AsyncMock(return_value=[])
+        episodic_repo.find_by_entity = AsyncMock(return_value=[])
         summary_repo.create = AsyncMock(
             side_effect=lambda s: type("Summary", (), {**s.__dict__, "summary_id": 20})(
                 )
@@ -529,7 +517,7 @@ class TestVisionPrinciples:
             for i in range(3)
         ]
 
-        episodic_repo.find_recent = AsyncMock(return_value=episodic_memories)
+        episodic_repo.find_by_entity = AsyncMock(return_value=episodic_memories)
         semantic_repo.find_by_entity = AsyncMock(return_value=semantic_memories)
         summary_repo.create = AsyncMock(
             side_effect=lambda s: type("Summary", (), {**s.__dict__, "summary_id": 30})(
@@ -571,7 +559,7 @@ class TestVisionPrinciples:
             for i in range(15)
         ]
 
-        episodic_repo.find_recent = AsyncMock(return_value=episodic_memories)
+        episodic_repo.find_by_entity = AsyncMock(return_value=episodic_memories)
         semantic_repo.find_by_entity = AsyncMock(return_value=[])
         summary_repo.create = AsyncMock(
             side_effect=lambda s: type("Summary", (), {**s.__dict__, "summary_id": 40})(
@@ -615,7 +603,7 @@ class TestVisionPrinciples:
             for i in range(12)
         ]
 
-        episodic_repo.find_recent = AsyncMock(return_value=episodic_memories)
+        episodic_repo.find_by_entity = AsyncMock(return_value=episodic_memories)
         summary_repo.create = AsyncMock(
             side_effect=lambda s: type("Summary", (), {**s.__dict__, "summary_id": 50})(
                 )
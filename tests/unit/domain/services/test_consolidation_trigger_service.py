@@ -0,0 +1,59 @@
+"""Unit tests for counter-based consolidation triggering."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.config import heuristics
+from src.domain.ports import PendingConsolidation
+from src.domain.services import ConsolidationTriggerService
+from src.domain.value_objects.consolidation import ConsolidationScope
+
+
+def _service(counter_repo=None) -> ConsolidationTriggerService:
+    return ConsolidationTriggerService(
+        episodic_repo=AsyncMock(),
+        chat_repo=AsyncMock(),
+        counter_repo=counter_repo,
+    )
+
+
+@pytest.mark.unit
+class TestConsolidationTriggerService:
+    """Thresholds are read from maintained counters."""
+
+    async def test_entity_threshold_uses_counter(self):
+        counter_repo = AsyncMock()
+        counter_repo.get_count.return_value = heuristics.CONSOLIDATION_MIN_EPISODIC
+        service = _service(counter_repo)
+        scope = ConsolidationScope.entity_scope("customer:acme")
+
+        assert await service.should_consolidate("user_1", scope) is True
+        counter_repo.get_count.assert_awaited_once_with("user_1", scope)
+
+        counter_repo.get_count.return_value = heuristics.CONSOLIDATION_MIN_EPISODIC - 1
+        assert await service.should_consolidate("user_1", scope) is False
+
+    async def test_pending_scopes_come_from_counters(self):
+        scope = ConsolidationScope.session_window_scope(5)
+        counter_repo = AsyncMock()
+        counter_repo.find_pending.return_value = [
+            PendingConsolidation(user_id="user_1", scope=scope, pending_count=4)
+        ]
+
+        pending = await _service(counter_repo).get_pending_consolidations("user_1")
+
+        assert pending == [scope]
+        counter_repo.find_pending.assert_awaited_once_with(
+            min_episodic=heuristics.CONSOLIDATION_MIN_EPISODIC,
+            min_sessions=heuristics.CONSOLIDATION_MIN_SESSIONS,
+            user_id="user_1",
+        )
+
+    async def test_without_counters_consolidation_is_manual(self):
+        service = _service()
+
+        assert await service.get_pending_consolidations("user_1") == []
+        assert not await service.should_consolidate(
+            "user_1", ConsolidationScope.entity_scope("customer:acme")
+        )
@@ -0,0 +1,163 @@
+"""Unit tests for multi-query (batch) memory retrieval.
+
+Covers MemoryRetriever.retrieve_many, CandidateGenerator.generate_candidates_batch
+and MultiSignalScorer.score_candidates_batch with mocked repositories.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from src.domain.entities.semantic_memory import SemanticMemory
+from src.domain.services.candidate_generator import CandidateGenerator
+from src.domain.services.memory_retriever import MemoryRetriever
+from src.domain.services.memory_validation_service import MemoryValidationService
+from src.domain.services.multi_signal_scorer import MultiSignalScorer
+from src.domain.value_objects.memory_candidate import MemoryCandidate
+from src.domain.value_objects.query_context import QueryContext, RetrievalFilters
+
+
+def _candidate(memory_id: int, memory_type: str, rng: np.random.Generator, **kwargs) -> MemoryCandidate:
+    return MemoryCandidate(
+        memory_id=memory_id,
+        memory_type=memory_type,
+        content=f"memory {memory_id}",
+        entities=kwargs.pop("entities", ["customer_1"]),
+        embedding=rng.random(1536),
+        created_at=datetime.now(UTC) - timedelta(days=memory_id),
+        importance=0.6,
+        **kwargs,
+    )
+
+
+def _context(query: str, rng: np.random.Generator, strategy: str = "exploratory") -> QueryContext:
+    return QueryContext(
+        query_text=query,
+        query_embedding=rng.random(1536),
+        entity_ids=["customer_1"],
+        user_id="user_1",
+        strategy=strategy,
+    )
+
+
+@pytest.fixture
+def scorer():
+    return MultiSignalScorer(Mock(spec=MemoryValidationService))
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(7)
+
+
+@pytest.mark.unit
+class TestScoreCandidatesBatch:
+    """Vectorized batch scoring must match per-query scoring."""
+
+    def test_matches_single_query_scoring(self, scorer, rng):
+        contexts = [_context("q1", rng), _context("q2", rng, strategy="temporal")]
+        candidate_lists = [
+            [
+                _candidate(1, "semantic", rng, confidence=0.8, confirmation_count=2,
+                           last_accessed_at=datetime.now(UTC) - timedelta(days=3)),
+                _candidate(2, "episodic", rng, entities=[]),
+            ],
+            [_candidate(3, "summary", rng, confidence=0.9), _candidate(4, "semantic", rng)],
+        ]
+
+        batch = scorer.score_candidates_batch(candidate_lists, contexts)
+
+        for scored, candidates, context in zip(batch, candidate_lists, contexts, strict=True):
+            single = scorer.score_candidates(candidates, context)
+            assert [s.candidate.memory_id for s in scored] == [s.candidate.memory_id for s in single]
+            for b, s in zip(scored, single, strict=True):
+                assert b.relevance_score == pytest.approx(s.relevance_score)
+                for name, value in s.signal_breakdown.to_dict().items():
+                    assert b.signal_breakdown.to_dict()[name] == pytest.approx(value)
+
+    def test_empty_lists_keep_query_positions(self, scorer, rng):
+        contexts = [_context("q1", rng), _context("q2", rng)]
+
+        batch = scorer.score_candidates_batch([[], [_candidate(1, "episodic", rng)]], contexts)
+
+        assert batch[0] == []
+        assert len(batch[1]) == 1
+
+
+@pytest.mark.unit
+class TestGenerateCandidatesBatch:
+    """Each layer is searched once for all queries."""
+
+    async def test_one_batched_search_per_layer(self, rng):
+        contexts = [_context("q1", rng), _context("q2", rng)]
+        memory = SemanticMemory(
+            user_id="user_1",
+            content="Customer prefers Friday delivery",
+            entities=["customer_1"],
+            confidence=0.8,
+            importance=0.5,
+            embedding=rng.random(1536).tolist(),
+            memory_id=10,
+        )
+        semantic_repo, episodic_repo, summary_repo = AsyncMock(), AsyncMock(), AsyncMock()
+        semantic_repo.find_similar_batch.return_value = [[(memory, 0.9)], []]
+        episodic_repo.find_similar_batch.return_value = [[], [_candidate(2, "episodic", rng)]]
+        summary_repo.find_similar_batch.return_value = [[], []]
+        generator = CandidateGenerator(semantic_repo, episodic_repo, summary_repo)
+
+        results = await generator.generate_candidates_batch(contexts)
+
+        for repo in (semantic_repo, episodic_repo, summary_repo):
+            repo.find_similar_batch.assert_awaited_once()
+            assert len(repo.find_similar_batch.await_args.kwargs["query_embeddings"]) == 2
+        semantic_repo.find_similar.assert_not_awaited()
+        assert [c.memory_id for c in results[0]] == [10]
+        assert [c.memory_id for c in results[1]] == [2]
+
+    async def test_respects_memory_type_filter(self, rng):
+        semantic_repo, episodic_repo, summary_repo = AsyncMock(), AsyncMock(), AsyncMock()
+        episodic_repo.find_similar_batch.return_value = [[]]
+        generator = CandidateGenerator(semantic_repo, episodic_repo, summary_repo)
+
+        await generator.generate_candidates_batch(
+            [_context("q1", rng)], RetrievalFilters(memory_types=["episodic"])
+        )
+
+        semantic_repo.find_similar_batch.assert_not_awaited()
+        summary_repo.find_similar_batch.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestRetrieveMany:
+    """retrieve_many embeds once and returns results in query order."""
+
+    async def test_single_embedding_call_and_ordered_results(self, scorer, rng):
+        queries = ["invoice status?", "delivery day?", "open tasks?"]
+        embedding_service = AsyncMock()
+        embedding_service.generate_embeddings_batch.return_value = [
+            rng.random(1536).tolist() for _ in queries
+        ]
+        candidate_generator = AsyncMock()
+        candidate_generator.generate_candidates_batch.return_value = [
+            [_candidate(1, "episodic", rng), _candidate(2, "episodic", rng)],
+            [],
+            [_candidate(3, "summary", rng)],
+        ]
+        retriever = MemoryRetriever(
+            embedding_service=embedding_service,
+            entity_resolver=AsyncMock(),
+            candidate_generator=candidate_generator,
+            scorer=scorer,
+        )
+
+        results = await retriever.retrieve_many(queries, user_id="user_1", top_k=1)
+
+        embedding_service.generate_embeddings_batch.assert_awaited_once_with(queries)
+        embedding_service.generate_embedding.assert_not_awaited()
+        candidate_generator.generate_candidates_batch.assert_awaited_once()
+        assert [r.query_context.query_text for r in results] == queries
+        assert [len(r.memories) for r in results] == [1, 0, 1]
+        assert results[0].metadata.candidates_generated == 2
+        assert results[1].metadata.top_score == 0.0
@@ -0,0 +1,50 @@
+"""Unit tests for the single-pass PII scanner in PIIRedactionService."""
+
+import pytest
+
+from src.domain.services.pii_redaction_service import PIIRedactionService
+
+
+@pytest.mark.unit
+def test_redacts_in_text_order_without_splitting_card_numbers():
+    service = PIIRedactionService()
+
+    result = service.redact_with_metadata(
+        "Card 4111 1111 1111 1111, call 415-555-0199 or ap@kaimedia.com"
+    )
+
+    assert result.redacted_text == (
+        "Card [CREDIT_CARD-REDACTED], call [PHONE-REDACTED] or [EMAIL-REDACTED]"
+    )
+    assert [r["type"] for r in result.redactions] == ["credit_card", "phone", "email"]
+    assert service.validate_no_pii(result.redacted_text)
+    assert not service.validate_no_pii("ssn 123-45-6789")
+
+
+@pytest.mark.unit
+def test_texts_without_digits_or_at_sign_are_unchanged():
+    service = PIIRedactionService()
+
+    result = service.redact_with_metadata("What's the status of TC Boiler's order?")
+
+    assert not result.was_redacted
+    assert result.redacted_text == "What's the status of TC Boiler's order?"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 4096])
+def test_stream_matches_whole_text_across_chunk_boundaries(chunk_size):
+    service = PIIRedactionService()
+    document = "\n".join(
+        f"Line {i}: reach billing{i}@example.com or (415) 555-{1000 + i:04d}; "
+        f"ref ABC{i}123-45-6789 card 4111-1111-1111-{1000 + i}"
+        for i in range(40)
+    )
+    chunks = [document[i : i + chunk_size] for i in range(0, len(document), chunk_size)]
+
+    segments = list(service.redact_stream(chunks))
+
+    whole = service.redact_with_metadata(document)
+    assert "".join(s.original_text for s in segments) == document
+    assert "".join(s.redacted_text for s in segments) == whole.redacted_text
+    assert [r for s in segments for r in s.redactions] == whole.redactions
@@ -0,0 +1,143 @@
+"""Unit tests for the streaming tool-sequence miner in ProceduralMemoryService."""
+
+from dataclasses import replace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.procedural_memory import ProceduralMemory
+from src.domain.ports import IToolSequenceStateRepository, ToolUsageBatch
+from src.domain.services import ProceduralMemoryService
+from src.domain.value_objects import ToolSequenceCounts
+
+
+class _InMemorySequenceState(IToolSequenceStateRepository):
+    """Usage log, watermark and counts kept in memory."""
+
+    def __init__(self, logs: list[dict[str, Any]]):
+        self.logs = logs
+        self.watermark = 0
+        self.counts: dict[tuple[str, str], ToolSequenceCounts] = {}
+
+    async def read_usage_batch(self, limit: int) -> ToolUsageBatch:
+        batch = [log for log in self.logs if log["id"] > self.watermark][:limit]
+        return ToolUsageBatch(logs=batch, watermark=batch[-1]["id"] if batch else self.watermark)
+
+    async def load_counts(self, keys: list[tuple[str, str]]) -> list[ToolSequenceCounts]:
+        return [self.counts[key] for key in keys if key in self.counts]
+
+    async def save_counts(self, counts: list[ToolSequenceCounts], watermark: int) -> None:
+        for c in counts:
+            self.counts[(c.user_id, c.anchor_tool)] = c
+        self.watermark = watermark
+
+
+def _log(log_id: int, user_id: str | None, *tools: str) -> dict[str, Any]:
+    return {
+        "id": log_id,
+        "user_id": user_id,
+        "conversation_id": f"conv_{log_id}",
+        "tools_called": [
+            {"tool": tool, "arguments": {"customer_id": "c1"}} for tool in tools
+        ],
+    }
+
+
+def _procedural_repo() -> AsyncMock:
+    repo = AsyncMock()
+
+    async def upsert(memories: list[ProceduralMemory]) -> list[ProceduralMemory]:
+        return [replace(m, memory_id=i + 1) for i, m in enumerate(memories)]
+
+    repo.upsert_mined_patterns = AsyncMock(side_effect=upsert)
+    return repo
+
+
+@pytest.mark.unit
+async def test_mining_in_batches_matches_single_pass():
+    """Counts folded batch by batch equal counting the whole log at once."""
+    logs = [
+        _log(1, "u1", "get_invoice_status", "get_credit_status"),
+        _log(2, "u1", "get_invoice_status", "get_credit_status", "get_work_orders"),
+        _log(3, None, "get_invoice_status", "get_work_orders"),  # no user: skipped
+        _log(4, "u1", "get_invoice_status"),
+        _log(5, "u2", "get_invoice_status", "get_work_orders"),
+        _log(6, "u1", "get_invoice_status", "get_credit_status"),
+    ]
+
+    batched = _InMemorySequenceState(logs)
+    procedural_repo = _procedural_repo()
+    service = ProceduralMemoryService(AsyncMock(), procedural_repo, batched)
+    mined = await service.mine_tool_usage(min_support=3, batch_size=2)
+
+    single = _InMemorySequenceState(logs)
+    await ProceduralMemoryService(AsyncMock(), _procedural_repo(), single).mine_tool_usage(
+        min_support=3, batch_size=100
+    )
+
+    assert batched.watermark == 6
+    assert batched.counts == single.counts
+    counts = batched.counts[("u1", "get_invoice_status")]
+    assert counts.support == 4
+    assert counts.follower_counts == {"get_credit_status": 3, "get_work_orders": 1}
+    assert counts.entity_type_counts == {"customer": 4}
+
+    # u1's pattern is upserted once enough support accumulated; u2 stays below it
+    assert [m.user_id for m in mined] == ["u1"]
+    assert mined[0].action_structure["tools"] == ["get_credit_status"]
+    assert mined[0].trigger_features["entity_types"] == ["customer"]
+    assert mined[0].observed_count == 4
+
+    # A later run only reads new usage
+    procedural_repo.upsert_mined_patterns.reset_mock()
+    assert await service.mine_tool_usage(min_support=3) == []
+    procedural_repo.upsert_mined_patterns.assert_awaited_once_with([])
+
+
+@pytest.mark.unit
+def test_merge_keeps_newest_distinct_sources():
+    """Merging adds counts and bounds the source conversations."""
+    old = ToolSequenceCounts(
+        user_id="u1",
+        anchor_tool="a",
+        support=2,
+        follower_counts={"b": 2},
+        recent_conversation_ids=["c1", "c2"],
+    )
+    delta = ToolSequenceCounts(
+        user_id="u1",
+        anchor_tool="a",
+        support=1,
+        follower_counts={"b": 1, "c": 1},
+        recent_conversation_ids=["c1", "c3"],
+    )
+
+    merged = old.merge(delta, max_sources=2)
+
+    assert merged.support == 3
+    assert merged.follower_counts == {"b": 3, "c": 1}
+    assert merged.recent_conversation_ids == ["c1", "c3"]
+    assert old.follower_counts == {"b": 2}
+
+
+@pytest.mark.unit
+async def test_detect_patterns_reads_mined_patterns_without_mining():
+    """Requests read the user's mined patterns; new usage waits for the miner."""
+    state = _InMemorySequenceState(
+        [_log(i, "u1", "get_invoice_status", "get_credit_status") for i in range(1, 5)]
+    )
+    procedural_repo = _procedural_repo()
+    service = ProceduralMemoryService(AsyncMock(), procedural_repo, state)
+    mined = await service.mine_tool_usage(min_support=3)
+    procedural_repo.find_by_user.return_value = mined
+
+    state.logs.append(_log(5, "u1", "get_invoice_status", "get_credit_status"))
+    procedural_repo.upsert_mined_patterns.reset_mock()
+
+    patterns = await service.detect_patterns(user_id="u1", min_support=3)
+
+    assert patterns == mined
+    assert state.watermark == 4
+    procedural_repo.upsert_mined_patterns.assert_not_awaited()
+    procedural_repo.find_by_user.assert_awaited_once_with(user_id="u1", min_confidence=0.0)
@@ -0,0 +1,92 @@
+"""Unit tests for contextvar span tracing."""
+
+import asyncio
+
+import pytest
+
+from src.domain.services.debug_trace_service import DebugTraceService
+from src.domain.services.span_tracer import (
+    Span,
+    SpanKind,
+    SpanStatus,
+    add_span_processor,
+    current_span,
+    remove_span_processor,
+    span,
+)
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.finished: list[Span] = []
+
+    def on_end(self, finished: Span) -> None:
+        self.finished.append(finished)
+
+
+class _Failing:
+    def on_end(self, finished: Span) -> None:
+        raise RuntimeError("exporter down")
+
+
+@pytest.fixture
+def collector():
+    processor = _Collector()
+    add_span_processor(processor)
+    yield processor
+    remove_span_processor(processor)
+
+
+@pytest.mark.unit
+class TestSpan:
+    """Nesting, status and processor dispatch."""
+
+    async def test_spans_nest_across_tasks(self, collector):
+        async def child(name: str) -> None:
+            with span(name, SpanKind.LLM):
+                await asyncio.sleep(0)
+
+        with span("root") as root:
+            await asyncio.gather(child("a"), child("b"))
+
+        assert current_span() is None
+        assert [s.name for s in root.children] == ["a", "b"]
+        assert {s.trace_id for s in root.children} == {root.trace_id}
+        assert all(s.parent_span_id == root.span_id for s in root.children)
+        # Children finish (and are processed) before their parent
+        assert [s.name for s in collector.finished] == ["a", "b", "root"]
+        assert root.end_time_ns >= max(s.end_time_ns for s in root.children)
+
+    async def test_error_status_is_recorded_and_reraised(self, collector):
+        with pytest.raises(ValueError), span("failing", SpanKind.REPOSITORY):
+            raise ValueError("boom")
+
+        (finished,) = collector.finished
+        assert finished.status is SpanStatus.ERROR
+        assert finished.error == "ValueError"
+        assert finished.duration_ns is not None
+
+    def test_failing_processor_does_not_break_the_traced_block(self, collector):
+        failing = _Failing()
+        add_span_processor(failing)
+        try:
+            with span("work") as work:
+                work.set_attribute("rows", 3)
+        finally:
+            remove_span_processor(failing)
+
+        assert collector.finished[0].attributes == {"rows": 3}
+
+    def test_root_span_tree_attached_to_debug_trace(self):
+        context = DebugTraceService.start_trace()
+        try:
+            with span("chat.process"), span("resolve"), span("EntityRepository.get", SpanKind.REPOSITORY):
+                pass
+        finally:
+            DebugTraceService.clear_context()
+
+        (tree,) = context.spans
+        assert tree["name"] == "chat.process"
+        assert tree["children"][0]["name"] == "resolve"
+        assert tree["children"][0]["children"][0]["kind"] == "repository"
+        assert context.to_dict()["spans"] == [tree]
@@ -0,0 +1,101 @@
+"""Unit tests for the background job worker pool."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.ports import BackgroundJob, BackgroundJobType
+from src.infrastructure.jobs import worker
+from src.infrastructure.jobs.worker import BackgroundJobWorker
+
+
+class _FakeQueue:
+    """In-memory queue recording sweeps and heartbeats (shared across sessions)."""
+
+    def __init__(self, jobs: list[BackgroundJob] | None = None):
+        self.jobs = jobs or []
+        self.sweeps = 0
+        self.heartbeats: list[list[int]] = []
+        self.succeeded: list[int] = []
+
+    def __call__(self, session):
+        return self
+
+    async def claim_batch(self, limit: int) -> list[BackgroundJob]:
+        claimed, self.jobs = self.jobs[:limit], self.jobs[limit:]
+        return claimed
+
+    async def heartbeat(self, job_ids: list[int]) -> None:
+        self.heartbeats.append(job_ids)
+
+    async def mark_succeeded(self, job_id: int) -> None:
+        self.succeeded.append(job_id)
+
+    async def requeue_stale(self, older_than_seconds: int) -> int:
+        self.sweeps += 1
+        return 0
+
+
+@asynccontextmanager
+async def _session_scope():
+    yield MagicMock()
+
+
+@pytest.mark.unit
+async def test_stale_jobs_are_requeued_periodically_while_polling(monkeypatch):
+    queue = _FakeQueue()
+    monkeypatch.setattr(worker, "PostgresJobQueueRepository", queue)
+    job_worker = BackgroundJobWorker(
+        session_scope=_session_scope,
+        runner_factory=MagicMock(),
+        concurrency=3,
+        poll_interval_seconds=0.01,
+        stale_sweep_interval_seconds=0.03,
+    )
+
+    await job_worker.start()
+    assert queue.sweeps == 1  # At startup
+    await asyncio.sleep(0.2)
+    await job_worker.stop()
+
+    # One loop sweeps on the interval, not every poll of every worker
+    assert 3 <= queue.sweeps <= 12
+
+
+@pytest.mark.unit
+async def test_claimed_jobs_keep_their_lock_until_they_finish(monkeypatch):
+    queue = _FakeQueue([
+        BackgroundJob(
+            job_id=job_id,
+            job_type=BackgroundJobType.EXTRACT_CHAT_EVENTS,
+            payload={},
+            idempotency_key=f"job:{job_id}",
+            attempts=1,
+            max_attempts=5,
+        )
+        for job_id in (1, 2, 3)
+    ])
+    monkeypatch.setattr(worker, "PostgresJobQueueRepository", queue)
+
+    class _SlowRunner:
+        async def run(self, job_type, payload):
+            await asyncio.sleep(0.05)
+
+    job_worker = BackgroundJobWorker(
+        session_scope=_session_scope,
+        runner_factory=lambda session: _SlowRunner(),
+        batch_size=3,
+        heartbeat_interval_seconds=0.02,
+    )
+
+    assert await job_worker.run_once() == 3
+
+    assert queue.succeeded == [1, 2, 3]
+    # Jobs still waiting in the batch are refreshed too; finished ones drop out
+    assert queue.heartbeats[0] == [1, 2, 3]
+    assert [2, 3] in queue.heartbeats and [3] in queue.heartbeats
+    heartbeats = len(queue.heartbeats)
+    await asyncio.sleep(0.05)
+    assert len(queue.heartbeats) == heartbeats  # Stopped with the batch
@@ -0,0 +1,123 @@
+"""Unit tests for the consolidation scheduler."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.ports import PendingConsolidation
+from src.domain.value_objects.consolidation import ConsolidationScope
+from src.infrastructure.jobs import consolidation_scheduler
+from src.infrastructure.jobs.consolidation_scheduler import ConsolidationScheduler
+
+
+class _FakeCounters:
+    """In-memory stand-in for the counter repository (shared across sessions)."""
+
+    def __init__(self, pending: list[PendingConsolidation]):
+        self.pending = pending
+        self.tallies = 0
+        self.claimed: list[PendingConsolidation] = []
+        self.consumed: list[PendingConsolidation] = []
+
+    def __call__(self, session):
+        return self
+
+    async def tally(self, session_window: int) -> int:
+        self.tallies += 1
+        return len(self.pending)
+
+    async def find_pending(self, min_episodic, min_sessions, user_id=None, limit=100):
+        return self.pending[:limit]
+
+    async def claim(self, pending, min_episodic, min_sessions):
+        if pending in self.claimed:  # Row locked (or consumed) by another pass
+            return None
+        self.claimed.append(pending)
+        return pending
+
+    async def mark_consolidated(self, pending: PendingConsolidation) -> None:
+        self.consumed.append(pending)
+
+
+@asynccontextmanager
+async def _session_scope():
+    yield MagicMock()
+
+
+def _pending(user_id: str) -> PendingConsolidation:
+    return PendingConsolidation(
+        user_id=user_id,
+        scope=ConsolidationScope.entity_scope("customer:acme"),
+        pending_count=12,
+    )
+
+
+@pytest.mark.unit
+class TestConsolidationScheduler:
+    """Pending scopes across users, bounded concurrency, failure isolation."""
+
+    async def test_run_once_consolidates_pending_scopes_with_bounded_concurrency(
+        self, monkeypatch
+    ):
+        counters = _FakeCounters([_pending(f"user_{i}") for i in range(6)])
+        monkeypatch.setattr(
+            consolidation_scheduler, "PostgresConsolidationCounterRepository", counters
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        class _Service:
+            async def consolidate(self, user_id, scope):
+                nonlocal in_flight, max_in_flight
+                if user_id == "user_3":
+                    msg = "LLM unavailable"
+                    raise RuntimeError(msg)
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        scheduler = ConsolidationScheduler(
+            session_scope=_session_scope,
+            service_factory=lambda session: _Service(),
+            concurrency=2,
+            batch_size=10,
+        )
+
+        consolidated = await scheduler.run_once()
+
+        assert counters.tallies == 1
+        assert consolidated == 5
+        assert max_in_flight == 2
+        # The failed scope keeps its count for the next pass
+        assert {p.user_id for p in counters.consumed} == {
+            f"user_{i}" for i in range(6) if i != 3
+        }
+
+    async def test_concurrent_schedulers_consolidate_each_scope_once(self, monkeypatch):
+        counters = _FakeCounters([_pending(f"user_{i}") for i in range(4)])
+        monkeypatch.setattr(
+            consolidation_scheduler, "PostgresConsolidationCounterRepository", counters
+        )
+        consolidated: list[str] = []
+
+        class _Service:
+            async def consolidate(self, user_id, scope):
+                await asyncio.sleep(0.01)
+                consolidated.append(user_id)
+
+        schedulers = [
+            ConsolidationScheduler(
+                session_scope=_session_scope,
+                service_factory=lambda session: _Service(),
+                concurrency=2,
+            )
+            for _ in range(3)
+        ]
+
+        results = await asyncio.gather(*(s.run_once() for s in schedulers))
+
+        assert sum(results) == 4
+        assert sorted(consolidated) == [f"user_{i}" for i in range(4)]
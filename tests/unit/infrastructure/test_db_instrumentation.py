@@ -0,0 +1,128 @@
+"""Unit tests for SQL instrumentation (statement labels, timing hooks, pool gauges)."""
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from src.infrastructure.database.instrumentation import (
+    classify_statement,
+    current_operation,
+    instrument_engine,
+    instrumented_repository,
+)
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@instrumented_repository
+class _WidgetRepository:
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def count_widgets(self) -> int:
+        with self.engine.connect() as conn:
+            return conn.execute(text("SELECT count(*) FROM widgets WHERE size > :size"), {"size": 3}).scalar_one()
+
+    async def operation(self) -> str | None:
+        return current_operation()
+
+
+@pytest.mark.unit
+class TestClassifyStatement:
+    """Labels and normalized SQL derived from statement text."""
+
+    @pytest.mark.parametrize(
+        ("statement", "query_type", "table"),
+        [
+            ("SELECT * FROM app.semantic_memories WHERE user_id = $1", "select", "app.semantic_memories"),
+            ("INSERT INTO app.chat_events (content) VALUES (%(content)s)", "insert", "app.chat_events"),
+            ("UPDATE app.background_jobs SET status = 'running'", "update", "app.background_jobs"),
+            ("DELETE FROM app.entity_aliases WHERE alias_id = 4", "delete", "app.entity_aliases"),
+            (
+                "WITH ins AS (INSERT INTO app.chat_events (content) VALUES ($1) RETURNING *) "
+                "SELECT * FROM ins UNION ALL SELECT * FROM app.chat_events",
+                "insert",
+                "app.chat_events",
+            ),
+            (
+                "SELECT q.ord FROM unnest(CAST(:v AS text[])) WITH ORDINALITY AS q(vec, ord) "
+                "CROSS JOIN LATERAL (SELECT 1 FROM app.memory_summaries) s",
+                "select",
+                "app.memory_summaries",
+            ),
+            ("SELECT 1", "select", "none"),
+        ],
+    )
+    def test_labels(self, statement, query_type, table):
+        assert classify_statement(statement)[:2] == (query_type, table)
+
+    def test_normalized_sql_hides_literals_and_parameters(self):
+        _, _, normalized = classify_statement(
+            "SELECT *\n  FROM app.invoices  -- open only\n"
+            "WHERE status = 'open' AND amount > 1200.50 AND customer_id = $1 AND x::text = :name"
+        )
+
+        assert normalized == (
+            "SELECT * FROM app.invoices WHERE status = ? AND amount > ? "
+            "AND customer_id = ? AND x::text = ?"
+        )
+
+    def test_long_literal_is_classified_on_a_bounded_prefix(self):
+        vector = "[" + ",".join(["0.0123456789"] * 1536) + "]"
+        query_type, table, normalized = classify_statement(
+            f"SELECT 1 - (embedding <=> '{vector}'::vector) FROM app.semantic_memories"
+        )
+
+        assert query_type == "select"
+        assert "0.0123456789" not in normalized
+        assert len(normalized) < 100
+
+
+@pytest.mark.unit
+class TestEngineInstrumentation:
+    """Engine hooks observe the DB metrics with the issuing repository method."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", poolclass=QueuePool)
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE widgets (size INTEGER)"))
+        instrument_engine(engine, slow_query_threshold_seconds=0.0, pool_capacity=4)
+        yield engine
+        engine.dispose()
+
+    async def test_records_duration_and_slow_queries_per_operation(self, engine):
+        labels = {"query_type": "select", "table": "widgets", "operation": "_WidgetRepository.count_widgets"}
+        before = _sample("db_query_duration_seconds_count", **labels)
+        slow_before = _sample("db_slow_queries_total", **labels)
+
+        await _WidgetRepository(engine).count_widgets()
+
+        assert _sample("db_query_duration_seconds_count", **labels) == before + 1
+        assert _sample("db_queries_total", status="success", **labels) >= 1
+        assert _sample("db_slow_queries_total", **labels) == slow_before + 1
+
+    def test_failed_statements_are_counted_as_errors(self, engine):
+        labels = {"query_type": "select", "table": "missing_table", "operation": "unknown", "status": "error"}
+        before = _sample("db_queries_total", **labels)
+
+        with engine.connect() as conn, pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+
+        assert _sample("db_queries_total", **labels) == before + 1
+
+    def test_pool_gauges_track_checkouts(self, engine):
+        with engine.connect():
+            assert _sample("db_pool_checked_out_connections") == 1
+            assert _sample("db_pool_saturation_ratio") == 0.25
+
+        assert _sample("db_pool_checked_out_connections") == 0
+
+    async def test_operation_label_is_scoped_to_the_call(self, engine):
+        repo = _WidgetRepository(engine)
+
+        assert await repo.operation() == "_WidgetRepository.operation"
+        assert current_operation() is None
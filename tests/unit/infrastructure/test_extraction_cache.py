@@ -0,0 +1,202 @@
+"""Unit tests for the persistent LLM extraction cache decorator."""
+from contextlib import asynccontextmanager
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from src.domain.ports import IExtractionCacheRepository
+from src.domain.value_objects import (
+    ConversationContext,
+    EntityMention,
+    ResolutionMethod,
+    ResolutionResult,
+)
+from src.infrastructure.llm.cached_extraction_service import ExtractionCachingLLMService
+
+
+class _InMemoryCache(IExtractionCacheRepository):
+    """Dict-backed stand-in for app.llm_extraction_cache."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[str, Any]] = {}
+        self.hit_writes: list[dict[str, int]] = []
+
+    async def get(self, cache_key: str) -> Any | None:
+        row = self.rows.get(cache_key)
+        return row["result"] if row else None
+
+    async def record_hits(self, hits: dict[str, int]) -> None:
+        self.hit_writes.append(hits)
+
+    async def put(self, cache_key, extraction_type, model, prompt_version, result) -> None:
+        self.rows.setdefault(
+            cache_key,
+            {"extraction_type": extraction_type, "prompt_version": prompt_version, "result": result},
+        )
+
+    async def invalidate(self, extraction_type, keep_prompt_version=None) -> int:
+        stale = [
+            key
+            for key, row in self.rows.items()
+            if row["extraction_type"] == extraction_type
+            and row["prompt_version"] != keep_prompt_version
+        ]
+        for key in stale:
+            del self.rows[key]
+        return len(stale)
+
+
+class _FakeLLM:
+    """Counts calls to each extraction method."""
+
+    MODEL = "fake-model"
+
+    def __init__(self) -> None:
+        self.PROMPT_VERSIONS = {"mentions": "1", "facts": "1", "coreference": "1"}
+        self.calls: dict[str, int] = {"mentions": 0, "facts": 0, "coreference": 0}
+        self.mentions: list[EntityMention] = [
+            EntityMention(
+                text="Acme",
+                position=0,
+                context_before="",
+                context_after=" wants",
+                is_pronoun=False,
+                sentence="Acme wants a quote",
+            )
+        ]
+
+    async def extract_entity_mentions(self, text: str) -> list[EntityMention]:
+        self.calls["mentions"] += 1
+        return self.mentions
+
+    async def extract_semantic_facts(self, message, resolved_entities):
+        self.calls["facts"] += 1
+        return [{"subject": resolved_entities[0]["entity_id"], "predicate": "wants"}]
+
+    async def resolve_coreference(self, mention, context) -> ResolutionResult:
+        self.calls["coreference"] += 1
+        return ResolutionResult(
+            entity_id="customer:acme",
+            confidence=0.9,
+            method=ResolutionMethod.COREFERENCE,
+            mention_text=mention.text,
+            canonical_name="Acme Corp",
+            metadata={},
+        )
+
+    async def generate_summary(self, text: str) -> str:
+        return "summary"
+
+
+def _build(llm: _FakeLLM, cache: _InMemoryCache, **kwargs) -> ExtractionCachingLLMService:
+    @asynccontextmanager
+    async def session_scope():
+        yield None
+
+    return ExtractionCachingLLMService(
+        llm, session_scope=session_scope, repository_factory=lambda _session: cache, **kwargs
+    )
+
+
+@pytest.mark.unit
+class TestExtractionCachingLLMService:
+    """Test cache hits, keying and versioned invalidation."""
+
+    async def test_repeated_message_reuses_cached_mentions(self):
+        llm, cache = _FakeLLM(), _InMemoryCache()
+        service = _build(llm, cache)
+
+        first = await service.extract_entity_mentions("Acme wants a quote")
+        second = await service.extract_entity_mentions("Acme wants a quote")
+
+        assert llm.calls["mentions"] == 1
+        assert second == first
+
+    async def test_hit_counts_are_buffered_and_written_in_batches(self):
+        llm, cache = _FakeLLM(), _InMemoryCache()
+        service = _build(llm, cache, hit_flush_size=3)
+
+        await service.extract_entity_mentions("Acme wants a quote")  # miss
+        for _ in range(4):
+            await service.extract_entity_mentions("Acme wants a quote")
+
+        assert [sum(w.values()) for w in cache.hit_writes] == [3]
+        await service.flush_hits()
+        assert [sum(w.values()) for w in cache.hit_writes] == [3, 1]
+        await service.flush_hits()
+        assert len(cache.hit_writes) == 2
+
+    async def test_empty_results_are_not_cached(self):
+        llm, cache = _FakeLLM(), _InMemoryCache()
+        llm.mentions = []
+        service = _build(llm, cache)
+
+        await service.extract_entity_mentions("hello there")
+        await service.extract_entity_mentions("hello there")
+
+        assert llm.calls["mentions"] == 2
+        assert cache.rows == {}
+
+    async def test_facts_key_includes_resolved_entity_set(self):
+        llm, cache = _FakeLLM(), _InMemoryCache()
+        service = _build(llm, cache)
+        acme = [{"entity_id": "customer:acme", "canonical_name": "Acme"}]
+        beta = [{"entity_id": "customer:beta", "canonical_name": "Beta"}]
+
+        await service.extract_semantic_facts("they want a quote", acme)
+        await service.extract_semantic_facts("they want a quote", acme)
+        facts = await service.extract_semantic_facts("they want a quote", beta)
+
+        assert llm.calls["facts"] == 2
+        assert facts[0]["subject"] == "customer:beta"
+
+    async def test_coreference_round_trips_resolution_result(self):
+        llm, cache = _FakeLLM(), _InMemoryCache()
+        service = _build(llm, cache)
+        context = ConversationContext(
+            user_id="u1",
+            session_id=uuid4(),
+            recent_messages=["Acme called"],
+            recent_entities=[("customer:acme", "Acme Corp")],
+            current_message="they want a quote",
+        )
+        mention = llm.mentions[0]
+
+        first = await service.resolve_coreference(mention, context)
+        second = await service.resolve_coreference(mention, context)
+
+        assert llm.calls["coreference"] == 1
+        assert second == first
+        assert second.method is ResolutionMethod.COREFERENCE
+
+    async def test_prompt_version_bump_invalidates_entries(self):
+        llm, cache = _FakeLLM(), _InMemoryCache()
+        await _build(llm, cache).extract_entity_mentions("Acme wants a quote")
+
+        llm.PROMPT_VERSIONS = {**llm.PROMPT_VERSIONS, "mentions": "2"}
+        service = _build(llm, cache)
+        removed = await service.purge_stale_versions()
+        await service.extract_entity_mentions("Acme wants a quote")
+
+        assert removed == 1
+        assert llm.calls["mentions"] == 2
+
+    async def test_cache_errors_fall_through_to_llm(self):
+        llm = _FakeLLM()
+
+        class _Broken(_InMemoryCache):
+            async def get(self, cache_key):
+                raise RuntimeError("db down")
+
+        service = _build(llm, _Broken())
+
+        mentions = await service.extract_entity_mentions("Acme wants a quote")
+
+        assert mentions == llm.mentions
+        assert llm.calls["mentions"] == 1
+
+    async def test_other_methods_are_delegated(self):
+        service = _build(_FakeLLM(), _InMemoryCache())
+
+        assert await service.generate_summary("text") == "summary"
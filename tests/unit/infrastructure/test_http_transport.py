@@ -0,0 +1,130 @@
+"""Unit tests for the shared pooled/retrying HTTP transport."""
+import asyncio
+
+import httpx
+import pytest
+
+from src.infrastructure.http import PooledRetryTransport
+
+
+def _client(handler, **kwargs) -> httpx.AsyncClient:
+    transport = PooledRetryTransport(
+        httpx.MockTransport(handler), backoff_base_seconds=0.0, **kwargs
+    )
+    return httpx.AsyncClient(transport=transport)
+
+
+@pytest.mark.unit
+class TestPooledRetryTransport:
+    """Test retries, backoff inputs and per-host concurrency limits."""
+
+    async def test_retries_transient_status_then_succeeds(self):
+        statuses = iter([503, 429, 200])
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(next(statuses), json={"ok": True})
+
+        async with _client(handler, max_retries=2) as client:
+            response = await client.post("https://api.example.com/v1/messages", json={"a": 1})
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+        assert all(c.content == calls[0].content for c in calls)
+
+    async def test_returns_last_response_when_retries_exhausted(self):
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(503)
+
+        async with _client(handler, max_retries=1) as client:
+            response = await client.get("https://api.example.com/")
+
+        assert response.status_code == 503
+        assert calls == 2
+
+    async def test_does_not_retry_client_errors(self):
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(400)
+
+        async with _client(handler, max_retries=3) as client:
+            response = await client.get("https://api.example.com/")
+
+        assert response.status_code == 400
+        assert calls == 1
+
+    async def test_retries_connect_errors(self):
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200)
+
+        async with _client(handler, max_retries=2) as client:
+            response = await client.get("https://api.example.com/")
+
+        assert response.status_code == 200
+        assert attempts == 2
+
+    async def test_per_host_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200)
+
+        async with _client(handler, per_host_concurrency=2) as client:
+            await asyncio.gather(*(client.get("https://api.example.com/") for _ in range(6)))
+
+        assert peak == 2
+
+    async def test_saturated_host_fails_fast_with_pool_timeout(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.5)
+            return httpx.Response(200)
+
+        async with _client(handler, per_host_concurrency=1) as client:
+            slow = asyncio.create_task(client.get("https://api.example.com/"))
+            await asyncio.sleep(0.01)
+
+            with pytest.raises(httpx.PoolTimeout):
+                await client.get(
+                    "https://api.example.com/", timeout=httpx.Timeout(5.0, pool=0.05)
+                )
+            # Other hosts have their own slots
+            other = await client.get("https://other.example.com/", timeout=1.0)
+
+            assert (await slow).status_code == other.status_code == 200
+
+    async def test_slot_released_when_streamed_response_closed(self):
+        class _Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b"body"
+
+        transport = PooledRetryTransport(
+            httpx.MockTransport(lambda request: httpx.Response(200, stream=_Body())),
+            per_host_concurrency=1,
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(3):
+                response = await asyncio.wait_for(client.get("https://api.example.com/"), 1)
+                assert response.text == "body"
+
+        assert transport._limiters["api.example.com"].in_flight == 0
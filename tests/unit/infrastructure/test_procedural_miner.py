@@ -0,0 +1,51 @@
+"""Unit tests for the background procedural miner."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.jobs import ProceduralMiningScheduler
+
+
+def _scheduler(service: AsyncMock, sessions: list) -> ProceduralMiningScheduler:
+    @asynccontextmanager
+    async def session_scope():
+        session = MagicMock()
+        sessions.append(session)
+        yield session
+
+    return ProceduralMiningScheduler(
+        session_scope=session_scope,
+        service_factory=lambda session: service,
+        interval_seconds=0.01,
+        min_support=4,
+    )
+
+
+@pytest.mark.unit
+class TestProceduralMiningScheduler:
+    """Passes mine on their own session and survive failures."""
+
+    async def test_run_once_mines_in_its_own_session(self):
+        service = AsyncMock()
+        service.mine_tool_usage.return_value = [MagicMock(), MagicMock()]
+        sessions: list = []
+
+        mined = await _scheduler(service, sessions).run_once()
+
+        assert mined == 2
+        assert len(sessions) == 1
+        service.mine_tool_usage.assert_awaited_once_with(min_support=4)
+
+    async def test_loop_keeps_mining_after_a_failed_pass(self):
+        service = AsyncMock()
+        service.mine_tool_usage.side_effect = [RuntimeError("db down"), [], [], [], []]
+        scheduler = _scheduler(service, [])
+
+        await scheduler.start()
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+        assert service.mine_tool_usage.await_count >= 2
@@ -0,0 +1,153 @@
+"""Unit tests for the semantic retrieval query cache."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from src.domain.services.memory_retriever import MemoryRetriever
+from src.domain.services.memory_validation_service import MemoryValidationService
+from src.domain.services.multi_signal_scorer import MultiSignalScorer
+from src.domain.value_objects.memory_candidate import MemoryCandidate
+from src.domain.value_objects.query_context import QueryContext, RetrievalFilters
+from src.infrastructure.cache import SemanticQueryCache
+
+RNG = np.random.default_rng(34)
+BASE = RNG.random(1536)
+
+
+def _context(embedding=BASE, entity_ids=("customer_1",), user_id="user_1") -> QueryContext:
+    return QueryContext(
+        query_text="what's Acme's status?",
+        query_embedding=np.asarray(embedding),
+        entity_ids=list(entity_ids),
+        user_id=user_id,
+    )
+
+
+def _candidate(memory_id: int = 1) -> MemoryCandidate:
+    return MemoryCandidate(
+        memory_id=memory_id,
+        memory_type="semantic",
+        content="Acme is on credit hold",
+        entities=["customer_1"],
+        embedding=RNG.random(1536),
+        created_at=datetime.now(UTC) - timedelta(days=2),
+        importance=0.7,
+        confidence=0.9,
+        last_accessed_at=datetime.now(UTC) - timedelta(days=1),
+    )
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def cache(clock):
+    return SemanticQueryCache(similarity_threshold=0.95, max_staleness_seconds=60, clock=clock)
+
+
+def _store(cache, context=None, top_k=10, filters=None, candidates=None):
+    context = context or _context()
+    cache.store(context, top_k, filters, candidates or [_candidate()], cache.generation(context.user_id))
+
+
+@pytest.mark.unit
+class TestSemanticQueryCache:
+    """Lookup matching, freshness and invalidation."""
+
+    def test_paraphrased_query_hits(self, cache):
+        _store(cache)
+        paraphrase = BASE + RNG.normal(0, 0.01, 1536)
+
+        assert cache.lookup(_context(paraphrase), top_k=10) is not None
+        assert cache.stats()["hit_rate"] == 1.0
+
+    def test_dissimilar_query_misses(self, cache):
+        _store(cache)
+
+        assert cache.lookup(_context(RNG.random(1536) - 0.5), top_k=10) is None
+        assert cache.misses == 1
+
+    def test_requires_equal_entity_sets_filters_and_enough_top_k(self, cache):
+        _store(cache, top_k=5)
+
+        assert cache.lookup(_context(entity_ids=("customer_2",)), top_k=5) is None
+        assert cache.lookup(_context(), top_k=5, filters=RetrievalFilters(min_confidence=0.5)) is None
+        assert cache.lookup(_context(), top_k=10) is None
+        assert cache.lookup(_context(), top_k=3) is not None
+
+    def test_users_are_isolated(self, cache):
+        _store(cache)
+
+        assert cache.lookup(_context(user_id="user_2"), top_k=10) is None
+
+    def test_entries_expire_after_staleness_bound(self, cache, clock):
+        _store(cache)
+        clock.now += 61
+
+        assert cache.lookup(_context(), top_k=10) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_invalidation_drops_entries_and_rejects_in_flight_stores(self, cache):
+        context = _context()
+        generation = cache.generation("user_1")
+        _store(cache)
+
+        cache.invalidate_user("user_1")
+        cache.store(context, 10, None, [_candidate()], generation)
+
+        assert cache.lookup(context, top_k=10) is None
+
+    def test_evicted_generations_still_reject_stale_stores(self, clock):
+        cache = SemanticQueryCache(max_users=1, clock=clock)
+        generation = cache.generation("user_1")
+        cache.invalidate_user("user_1")
+        cache.invalidate_user("user_2")  # Evicts user_1's generation
+
+        cache.store(_context(), 10, None, [_candidate()], generation)
+
+        assert cache.lookup(_context(), top_k=10) is None
+
+
+@pytest.mark.unit
+class TestMemoryRetrieverWithCache:
+    """Repeat questions skip candidate generation but are re-scored."""
+
+    async def test_repeat_query_served_from_cache(self, cache):
+        embedding_service = AsyncMock()
+        embedding_service.generate_embedding.return_value = BASE.tolist()
+        candidate_generator = AsyncMock()
+        candidate_generator.generate_candidates.return_value = [_candidate(1), _candidate(2)]
+        scorer = MultiSignalScorer(Mock(spec=MemoryValidationService))
+        retriever = MemoryRetriever(
+            embedding_service=embedding_service,
+            entity_resolver=AsyncMock(),
+            candidate_generator=candidate_generator,
+            scorer=scorer,
+            query_cache=cache,
+        )
+
+        first = await retriever.retrieve("what's Acme's status?", user_id="user_1", top_k=5)
+        second = await retriever.retrieve("status for Acme?", user_id="user_1", top_k=5)
+
+        candidate_generator.generate_candidates.assert_awaited_once()
+        assert not first.metadata.cache_hit
+        assert second.metadata.cache_hit
+        assert [m.candidate.memory_id for m in second.memories] == [
+            m.candidate.memory_id for m in first.memories
+        ]
+        assert [m.relevance_score for m in second.memories] == pytest.approx(
+            [m.relevance_score for m in first.memories]
+        )
@@ -0,0 +1,95 @@
+"""Unit tests for SingleFlight LLM call deduplication."""
+import asyncio
+
+import pytest
+
+from src.infrastructure.llm.single_flight import SingleFlight
+
+
+class _Upstream:
+    """Fake upstream call that counts invocations."""
+
+    def __init__(self, delay: float = 0.02, fail: bool = False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self) -> dict[str, int]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream error")
+        return {"call": self.calls}
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test collapsing of identical concurrent calls and the TTL cache."""
+
+    def test_key_depends_on_prompt_and_temperature(self):
+        base = SingleFlight.make_key("op", "model", 0.0, {"messages": ["hi"]})
+
+        assert base == SingleFlight.make_key("op", "model", 0.0, {"messages": ["hi"]})
+        assert base != SingleFlight.make_key("op", "model", 0.1, {"messages": ["hi"]})
+        assert base != SingleFlight.make_key("op", "model", 0.0, {"messages": ["bye"]})
+        assert base != SingleFlight.make_key("other", "model", 0.0, {"messages": ["hi"]})
+
+    async def test_concurrent_identical_calls_share_one_upstream_call(self):
+        flight = SingleFlight(provider="test")
+        upstream = _Upstream()
+
+        results = await asyncio.gather(
+            *(flight.do("k", "op", upstream) for _ in range(5))
+        )
+
+        assert upstream.calls == 1
+        assert all(r == {"call": 1} for r in results)
+
+    async def test_errors_propagate_to_all_waiters_and_are_not_cached(self):
+        flight = SingleFlight(provider="test", cache_ttl_seconds=60)
+        upstream = _Upstream(fail=True)
+
+        results = await asyncio.gather(
+            *(flight.do("k", "op", upstream, cacheable=True) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert upstream.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        upstream.fail = False
+        assert await flight.do("k", "op", upstream, cacheable=True) == {"call": 2}
+
+    async def test_cancelled_leader_hands_over_to_follower(self):
+        flight = SingleFlight(provider="test")
+        upstream = _Upstream(delay=0.05)
+
+        leader = asyncio.create_task(flight.do("k", "op", upstream))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(flight.do("k", "op", upstream))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await follower == {"call": 2}
+
+    async def test_ttl_cache_only_for_cacheable_calls(self):
+        flight = SingleFlight(provider="test", cache_ttl_seconds=60)
+        upstream = _Upstream(delay=0)
+
+        await flight.do("det", "op", upstream, cacheable=True)
+        await flight.do("det", "op", upstream, cacheable=True)
+        assert upstream.calls == 1
+
+        await flight.do("sampled", "op", upstream)
+        await flight.do("sampled", "op", upstream)
+        assert upstream.calls == 3
+
+    async def test_cache_is_lru_bounded(self):
+        flight = SingleFlight(provider="test", cache_ttl_seconds=60, max_cache_entries=2)
+        upstream = _Upstream(delay=0)
+
+        for key in ("a", "b", "c"):
+            await flight.do(key, "op", upstream, cacheable=True)
+        await flight.do("a", "op", upstream, cacheable=True)
+
+        assert upstream.calls == 4  # "a" was evicted
@@ -0,0 +1,69 @@
+"""Unit tests for the Prometheus span processor."""
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.api.tenant_metrics import tenant_bucket
+from src.application.services.task_graph import TaskGraph
+from src.domain.services.span_tracer import (
+    SpanKind,
+    add_span_processor,
+    remove_span_processor,
+    span,
+)
+from src.infrastructure.observability import PrometheusSpanProcessor
+
+
+def _count(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(f"{name}_count", labels) or 0.0
+
+
+@pytest.fixture
+def processor():
+    prometheus = PrometheusSpanProcessor()
+    add_span_processor(prometheus)
+    yield prometheus
+    remove_span_processor(prometheus)
+
+
+@pytest.mark.unit
+class TestPrometheusSpanProcessor:
+    """Span kinds feed their latency histograms."""
+
+    async def test_task_graph_nodes_feed_stage_histogram(self, processor):
+        before = _count("chat_stage_duration_seconds", stage="span_test_node", status="ok")
+
+        async def node() -> int:
+            return 1
+
+        graph = TaskGraph()
+        graph.add("span_test_node", node)
+        await graph.run()
+
+        assert _count("chat_stage_duration_seconds", stage="span_test_node", status="ok") == before + 1
+        assert graph.timings["span_test_node"] > 0
+
+    def test_llm_resolution_and_retrieval_spans(self, processor):
+        llm = {"provider": "openai", "model": "span-test-model", "operation": "chat"}
+        resolution = {"method": "fuzzy", "success": "true"}
+        retrieval = {"layer": "episodic", "tenant_bucket": tenant_bucket("span_test_user")}
+        before = (
+            _count("llm_call_duration_seconds", **llm),
+            _count("entity_resolution_duration_seconds", **resolution),
+            _count("memory_retrieval_duration_seconds", **retrieval),
+        )
+
+        with span("llm.chat", SpanKind.LLM, **llm):
+            pass
+        with span("entity_resolution", SpanKind.ENTITY_RESOLUTION) as resolved:
+            resolved.set_attribute("method", "fuzzy")
+            resolved.set_attribute("success", True)
+        with span("memory_retrieval.episodic", SpanKind.MEMORY_RETRIEVAL, layer="episodic", user_id="span_test_user"):
+            pass
+
+        after = (
+            _count("llm_call_duration_seconds", **llm),
+            _count("entity_resolution_duration_seconds", **resolution),
+            _count("memory_retrieval_duration_seconds", **retrieval),
+        )
+        assert after == tuple(value + 1 for value in before)
@@ -0,0 +1,66 @@
+"""Unit tests for the request unit of work (branch sessions, commit point)."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.infrastructure.database.unit_of_work import UnitOfWork
+
+
+def _session(calls: list[str], name: str) -> AsyncMock:
+    session = AsyncMock()
+    for method in ("flush", "commit", "rollback", "close"):
+        getattr(session, method).side_effect = lambda m=method: calls.append(f"{m}:{name}")
+    return session
+
+
+@pytest.mark.unit
+class TestUnitOfWork:
+    async def test_flushes_everything_before_committing_branches(self):
+        calls: list[str] = []
+        primary = _session(calls, "primary")
+        branches = iter([_session(calls, "a"), _session(calls, "b")])
+        factory = Mock(side_effect=lambda: next(branches))
+
+        async with UnitOfWork(primary, factory) as uow:
+            uow.branch()
+            uow.branch()
+
+        assert calls == [
+            "flush:a", "flush:b", "flush:primary",
+            "commit:a", "commit:b",
+            "close:a", "close:b",
+        ]
+        primary.commit.assert_not_awaited()  # Owned by get_db_session
+
+    async def test_failure_rolls_back_branches(self):
+        calls: list[str] = []
+        primary = _session(calls, "primary")
+        factory = Mock(return_value=_session(calls, "a"))
+
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(primary, factory) as uow:
+                uow.branch()
+                raise RuntimeError("pipeline failed")
+
+        assert calls == ["rollback:a", "close:a"]
+
+    async def test_flush_error_commits_nothing(self):
+        calls: list[str] = []
+        primary = _session(calls, "primary")
+        primary.flush.side_effect = ValueError("constraint violation")
+        factory = Mock(return_value=_session(calls, "a"))
+
+        with pytest.raises(ValueError):
+            async with UnitOfWork(primary, factory) as uow:
+                uow.branch()
+
+        assert "commit:a" not in calls
+        assert calls[-2:] == ["rollback:a", "close:a"]
+
+    def test_without_factory_branches_share_the_primary_session(self):
+        primary = AsyncMock()
+        uow = UnitOfWork(primary, None)
+
+        assert not uow.supports_parallel_branches
+        assert uow.branch() is primary